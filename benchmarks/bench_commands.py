@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Per-command benchmarks against the local mock Trello API
+
+Runs every cmd_* entry point from trello_cli.commands against synthetic
+boards of several sizes and records wall time, API request count, response
+bytes and peak RSS. Results are checked against benchmarks/budgets.json;
+any command over budget (e.g. a new N+1 request pattern) fails the run.
+
+Usage:
+    python benchmarks/bench_commands.py                      # check budgets
+    python benchmarks/bench_commands.py --sizes 100,20000    # other board sizes
+    python benchmarks/bench_commands.py --only board_audit   # subset
+    python benchmarks/bench_commands.py --update-budgets     # re-baseline
+    python benchmarks/bench_commands.py --json results.json  # raw results
+
+Each command runs in a fresh interpreter with an empty HOME, so the
+response cache and member directory start cold and RSS is per command.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from trello_cli.mock import generate_board, MockTrello, MockTrelloServer, Latency  # noqa: E402
+
+
+BUDGET_FILE = Path(__file__).resolve().parent / 'budgets.json'
+
+DEFAULT_SIZES = (100, 1000, 10000)
+
+# Headroom applied by --update-budgets. Request counts are deterministic and
+# budgeted exactly; time and memory vary between machines.
+HEADROOM = {'requests': 1.0, 'bytes': 1.25, 'seconds': 3.0, 'rss_mb': 1.5}
+
+METRICS = ('requests', 'bytes', 'seconds', 'rss_mb')
+
+# Command -> positional arguments, in run order (reads first, then writes
+# on the same board, destructive commands last). Placeholders are filled
+# in from the generated board by _fixtures().
+BENCHMARKS = [
+    # Read-only
+    ('cmd_boards', ()),
+    ('cmd_lists', ('{board}',)),
+    ('cmd_cards', ('{list}',)),
+    ('cmd_show_card', ('{card}',)),
+    ('cmd_board_overview', ('{board}',)),
+    ('cmd_board_ids', ('{board}',)),
+    ('cmd_search_cards', ('{board}', 'sync')),
+    ('cmd_cards_by_label', ('{board}', '{label_color}')),
+    ('cmd_cards_due_soon', ('{board}',)),
+    ('cmd_cards_overdue', ('{board}',)),
+    ('cmd_list_metrics', ('{list}',)),
+    ('cmd_board_health', ('{board}',)),
+    ('cmd_my_cards', ('{board}', '{member}')),
+    ('cmd_card_age', ('{list}',)),
+    ('cmd_sprint_status', ('{board}',)),
+    ('cmd_sprint_velocity', ('{board}',)),
+    ('cmd_scrum_check', ('{board}',)),
+    ('cmd_board_audit', ('{board}', None, False, True)),
+    ('cmd_list_audit', ('{list}',)),
+    ('cmd_list_snapshot', ('{list}', '{tmp}/list_snapshot.json')),
+    ('cmd_sprint_audit', ('{board}',)),
+    ('cmd_label_audit', ('{board}',)),
+    ('cmd_audit_all', ('{board}', None, None, None, True)),
+    ('cmd_board_audit_all', (None, None, '4', '{tmp}/board_audit_all.json')),
+    ('cmd_export_board', ('{board}', 'json', '{tmp}/export.json')),
+    ('cmd_label_backup', ('{board}', '{tmp}/label_backup.json')),
+    ('cmd_card_log', ('{card}',)),
+    ('cmd_standardize_lists', ('{board}', 'agile', True)),
+    ('cmd_migrate_board', ('{board}', '{board2}', True)),
+    ('cmd_bulk_relabel', ('{board}', '{label_color}', '{label2_color}', True)),
+    # Single-card writes
+    ('cmd_add_card', ('{list}', 'PF-FEAT-API-001: Benchmark card',
+                      'Card created by the benchmark harness to measure cmd_add_card.')),
+    ('cmd_update_card', ('{card}', 'Updated by the benchmark harness')),
+    ('cmd_rename_card', ('{card}', 'PF-FEAT-API-002: Renamed card')),
+    ('cmd_move_card', ('{card}', '{list2}')),
+    ('cmd_add_checklist', ('{card}', 'Benchmark')),
+    ('cmd_add_checkitem', ('{card}', 'Benchmark', 'Item')),
+    ('cmd_set_due', ('{card}', '2030-01-01')),
+    ('cmd_add_comment', ('{card}', 'Benchmark comment')),
+    ('cmd_add_label', ('{card2}', 'black', 'benchmark')),
+    ('cmd_remove_label', ('{card2}', 'benchmark')),
+    ('cmd_assign_card', ('{card3}', '{assignee}')),
+    ('cmd_unassign_card', ('{card3}', '{assignee}')),
+    ('cmd_quick_start', ('{card}',)),
+    ('cmd_quick_test', ('{card}',)),
+    ('cmd_quick_done', ('{card}',)),
+    ('cmd_create_list', ('{board}', 'Benchmark list')),
+    ('cmd_rename_label', ('{board}', '{label_name}', '{label_name}-renamed')),
+    # Bulk writes (20 cards)
+    ('cmd_bulk_add_label', ('{tmp}/card_ids.txt', 'purple', 'bulk')),
+    ('cmd_bulk_set_due', ('{tmp}/card_ids.txt', '2030-02-01')),
+    ('cmd_bulk_create_cards', ('{list2}', '{tmp}/cards.json')),
+    ('cmd_label_restore', ('{board}', '{tmp}/label_backup.json')),
+    ('cmd_bulk_move_cards', ('{list2}', '{list3}')),
+    ('cmd_migrate_cards', ('{list3}', '{board2}', 'Backlog')),
+    # Interactive commands answer "no" to their prompt
+    ('cmd_sprint_start', ('{board}',)),
+    ('cmd_sprint_close', ('{board}',)),
+    ('cmd_bulk_archive_cards', ('{list2}',)),
+    ('cmd_archive_board', ('{board2}',)),
+    # Destructive
+    ('cmd_delete_label', ('{board}', '{label2_name}')),
+    ('cmd_create_board', ('Benchmark board',)),
+    ('cmd_archive_list', ('{list3}',)),
+    ('cmd_delete_card', ('{card}',)),
+]
+
+# Commands that make no API calls
+NOT_BENCHMARKED = {
+    'cmd_help', 'cmd_help_json', 'cmd_list_templates',
+    'cmd_validation_status', 'cmd_validation_enable', 'cmd_validation_disable',
+    'cmd_validation_config', 'cmd_validation_reload', 'cmd_validation_reset',
+    'cmd_cache_status', 'cmd_cache_clear', 'cmd_stats', 'cmd_batch',
+    'cmd_shell', 'cmd_sync', 'cmd_mirror_status', 'cmd_search',
+    'cmd_webhook_serve', 'cmd_webhook_replay', 'cmd_webhook_register',
+    'cmd_webhook_list', 'cmd_webhook_unregister',
+}
+
+
+def _fixtures(data, target, tmp):
+    """Placeholder values for a generated board"""
+    lists = {lst['name']: lst['id'] for lst in data['lists']}
+    cards = data['cards']
+    cards_with_labels = [c for c in cards if c['idLabels']]
+    card3 = cards[2] if len(cards) > 2 else cards[0]
+    fixtures = {
+        'board': data['board']['id'],
+        'board2': target['board']['id'],
+        'list': lists.get('Backlog', data['lists'][0]['id']),
+        'list2': lists.get('Ready', data['lists'][-1]['id']),
+        'list3': lists.get('Review', data['lists'][-1]['id']),
+        'card': cards[0]['id'],
+        'card2': cards[1]['id'] if len(cards) > 1 else cards[0]['id'],
+        'card3': card3['id'],
+        'label_color': data['labels'][0]['color'],
+        'label_name': data['labels'][0]['name'],
+        'label2_color': data['labels'][1]['color'],
+        'label2_name': data['labels'][1]['name'],
+        'member': data['members'][0]['username'],
+        'assignee': next(m['username'] for m in data['members'] if m['id'] not in card3['idMembers']),
+        'tmp': str(tmp),
+    }
+
+    with open(tmp / 'card_ids.txt', 'w') as f:
+        f.write('\n'.join(c['id'] for c in (cards_with_labels or cards)[:20]))
+    with open(tmp / 'cards.json', 'w') as f:
+        json.dump([{'title': f"PF-FEAT-API-{i:03d}: Bulk card {i}",
+                    'description': 'Created by the benchmark harness to measure bulk card creation.',
+                    'due_date': '2030-03-01', 'labels': ['green:bulk']} for i in range(20)], f)
+    return fixtures
+
+
+def _resolve(args, fixtures):
+    return [arg.format(**fixtures) if isinstance(arg, str) else arg for arg in args]
+
+
+def run_worker(name, args):
+    """
+    Worker mode: run one command in this process and print its wall time
+    and peak RSS as JSON on the last line of stdout
+    """
+    from trello_cli import client
+    client.configure(cache=False)
+    from trello_cli import commands
+
+    real_stdout = sys.stdout
+    error = None
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            getattr(commands, name)(*args)
+    except SystemExit as e:
+        error = f"exit {e.code}" if e.code else None
+    except Exception as e:
+        error = str(e)
+    seconds = time.perf_counter() - start
+
+    # ru_maxrss is KB on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    rss_mb = rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+    print(json.dumps({'seconds': seconds, 'rss_mb': rss_mb, 'error': error}), file=real_stdout)
+
+
+def run_size(size, names, latency, seed):
+    """Benchmark the selected commands against a board with `size` cards"""
+    store = MockTrello()
+    data = generate_board(cards=size, seed=seed)
+    target = generate_board(cards=10, seed=seed + 1, name='Benchmark target')
+    store.add_board(data)
+    store.add_board(target)
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix='trello-bench-') as tmp, \
+            MockTrelloServer(store, latency=latency) as server:
+        tmp = Path(tmp)
+        fixtures = _fixtures(data, target, tmp)
+        for name, args in BENCHMARKS:
+            if name not in names:
+                continue
+            home = tmp / 'home' / name
+            home.mkdir(parents=True)
+            with open(home / '.trello_config.json', 'w') as f:
+                json.dump({'api_key': 'bench-key', 'token': 'bench-token'}, f)
+            env = dict(os.environ, HOME=str(home), TRELLO_BASE_URL=server.base_url,
+                       PYTHONPATH=str(ROOT))
+
+            server.reset_stats()
+            proc = subprocess.run(
+                [sys.executable, __file__, '--worker', name, json.dumps(_resolve(args, fixtures))],
+                input='no\n', capture_output=True, text=True, env=env, cwd=tmp,
+            )
+            stats = server.stats()
+            try:
+                worker = json.loads(proc.stdout.strip().splitlines()[-1])
+            except (ValueError, IndexError):
+                worker = {'seconds': None, 'rss_mb': None, 'error': proc.stderr.strip()[-300:]}
+
+            results[name] = {
+                'requests': stats['requests'],
+                'bytes': stats['bytes'],
+                'seconds': worker['seconds'],
+                'rss_mb': worker['rss_mb'],
+                'errors': stats['errors'],
+                'error': worker['error'],
+            }
+            _print_row(name, size, results[name])
+    return results
+
+
+def _print_row(name, size, result):
+    seconds = f"{result['seconds']:.3f}" if result['seconds'] is not None else '-'
+    rss = f"{result['rss_mb']:.1f}" if result['rss_mb'] is not None else '-'
+    flag = f"  ❌ {result['error']}" if result['error'] else ''
+    print(f"  {name:28} {size:>7}  {result['requests']:>5}  {result['bytes'] // 1024:>9}  "
+          f"{seconds:>8}  {rss:>7}{flag}")
+
+
+def load_budgets(path=BUDGET_FILE):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def check_budgets(results, budgets):
+    """
+    Compare results to budgets
+
+    Returns:
+        List of violation messages (empty when everything is within budget)
+    """
+    violations = []
+    for size, commands in results.items():
+        for name, result in commands.items():
+            if result['error']:
+                violations.append(f"{name} @ {size}: failed ({result['error']})")
+                continue
+            budget = budgets.get(name, {}).get(str(size))
+            if not budget:
+                continue
+            for metric in METRICS:
+                limit = budget.get(metric)
+                value = result.get(metric)
+                if limit is not None and value is not None and value > limit:
+                    violations.append(f"{name} @ {size}: {metric} {_fmt(value)} > budget {_fmt(limit)}")
+    return violations
+
+
+def update_budgets(results, budgets):
+    """Re-baseline budgets from results, with HEADROOM"""
+    for size, commands in results.items():
+        for name, result in commands.items():
+            if result['error']:
+                continue
+            budget = budgets.setdefault(name, {})
+            budget[str(size)] = {
+                'requests': result['requests'],
+                'bytes': int(result['bytes'] * HEADROOM['bytes']),
+                'seconds': round(max(result['seconds'] * HEADROOM['seconds'], 1.0), 2),
+                'rss_mb': round(max(result['rss_mb'] * HEADROOM['rss_mb'], 64.0), 1),
+            }
+    return dict(sorted(budgets.items()))
+
+
+def _fmt(value):
+    return f"{value:.2f}" if isinstance(value, float) else str(value)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Per-command benchmarks against the mock Trello API')
+    parser.add_argument('--sizes', default=','.join(str(s) for s in DEFAULT_SIZES),
+                        help='comma-separated card counts (default %(default)s)')
+    parser.add_argument('--only', help='comma-separated command names (with or without cmd_)')
+    parser.add_argument('--latency-ms', type=float, default=0, help='mock API latency per request')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--budgets', default=str(BUDGET_FILE), help='budget file (default %(default)s)')
+    parser.add_argument('--update-budgets', action='store_true', help='write results as the new budgets')
+    parser.add_argument('--json', dest='json_file', help='also write raw results to this file')
+    parser.add_argument('--worker', nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        run_worker(args.worker[0], json.loads(args.worker[1]))
+        return 0
+
+    from trello_cli import commands
+    names = [name for name, _ in BENCHMARKS]
+    missing = sorted(set(commands.__all__) - set(names) - NOT_BENCHMARKED)
+    if missing:
+        print(f"⚠️  No benchmark arguments for: {', '.join(missing)}")
+    if args.only:
+        wanted = {n if n.startswith('cmd_') else f"cmd_{n}" for n in args.only.split(',')}
+        names = [name for name in names if name in wanted]
+
+    sizes = [int(s) for s in args.sizes.split(',') if s]
+    latency = Latency(args.latency_ms, seed=args.seed)
+
+    print(f"\n{'='*80}")
+    print(f"  {'COMMAND':28} {'CARDS':>7}  {'REQS':>5}  {'KB':>9}  {'SECONDS':>8}  {'RSS MB':>7}")
+    print(f"{'='*80}")
+    results = {}
+    for size in sizes:
+        results[size] = run_size(size, set(names), latency, args.seed)
+        print()
+
+    if args.json_file:
+        with open(args.json_file, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    budgets = load_budgets(args.budgets)
+    if args.update_budgets:
+        with open(args.budgets, 'w') as f:
+            json.dump(update_budgets(results, budgets), f, indent=2)
+            f.write('\n')
+        print(f"✅ Budgets written to {args.budgets}")
+        return 0
+
+    violations = check_budgets(results, budgets)
+    print(f"{'='*80}")
+    if violations:
+        print(f"❌ {len(violations)} budget violation(s):")
+        for violation in violations:
+            print(f"   • {violation}")
+        return 1
+    print("✅ All commands within budget")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
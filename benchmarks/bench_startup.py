@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+CLI startup benchmark
+
+Measures how long `trello <command>` takes to start for commands that make
+no API calls, and which heavy modules each one imports. The baseline is
+the cost of importing every command module up front (what the CLI did
+before the lazy command registry), measured the same way.
+
+Usage:
+    python benchmarks/bench_startup.py              # 20 runs per command
+    python benchmarks/bench_startup.py --runs 50
+
+Fails if a command that needs no API client imports requests or py-trello,
+or if its median startup exceeds STARTUP_BUDGET_MS. Commands that make no
+API calls must also skip the metrics store: no sqlite3 import and no line
+in ~/.trellocli/metrics (`stats` reads the store, so it may import it).
+Commands that call the API record a metrics line on every run, so
+`lists` (a usage error, no request) times that path.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from trello_cli.metrics import PENDING_LOG  # noqa: E402
+from trello_cli.registry import UNMETERED_COMMANDS  # noqa: E402
+
+# argv after `trello`; none of these reach the Trello API
+COMMANDS = [
+    ('version',),
+    ('help',),
+    ('help-json',),
+    ('list-templates',),
+    ('validation-status',),
+    ('stats',),
+    ('lists',),  # usage error; records metrics
+]
+
+# Modules a command without API calls should never import
+HEAVY_MODULES = ('requests', 'trello', 'oauthlib', 'trello_cli.client')
+
+# Modules only recording or reading metrics needs
+METRICS_MODULES = ('sqlite3', 'trello_cli.metrics')
+
+# Median wall time per command, in milliseconds (interpreter start included)
+STARTUP_BUDGET_MS = 150
+
+# Everything the CLI used to import before deciding what to run
+EAGER_IMPORTS = ('import trello_cli.client, trello_cli.plugins, trello_cli.commands.board, '
+                 'trello_cli.commands.list, trello_cli.commands.card, trello_cli.commands.label, '
+                 'trello_cli.commands.help, trello_cli.commands.discovery, trello_cli.commands.bulk, '
+                 'trello_cli.commands.quick, trello_cli.commands.sprint, trello_cli.commands.query, '
+                 'trello_cli.commands.standardize, trello_cli.commands.migrate, '
+                 'trello_cli.commands.audit, trello_cli.commands.members, trello_cli.commands.export, '
+                 'trello_cli.commands.validation, trello_cli.commands.cache, trello_cli.commands.stats')
+
+
+def _env(home):
+    env = dict(os.environ, HOME=str(home), PYTHONPATH=str(ROOT))
+    env.pop('PYTHONPROFILEIMPORTTIME', None)
+    return env
+
+
+def time_runs(argv, env, runs):
+    """Median and best wall time (ms) of `python argv...` over `runs` runs"""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + argv, env=env, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, stdin=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), min(samples)
+
+
+def imported_modules(argv, env):
+    """Top-level import times (ms) per module from -X importtime"""
+    result = subprocess.run([sys.executable, '-X', 'importtime'] + argv, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+                            stdin=subprocess.DEVNULL)
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2].strip()
+        # Cumulative time, counted only for modules imported at top level
+        top_level = len(parts[2]) - len(parts[2].lstrip()) == 1
+        modules[name] = int(parts[1]) / 1000 if top_level else 0.0
+    return modules
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Trello CLI startup benchmark')
+    parser.add_argument('--runs', type=int, default=20, help='runs per command (default %(default)s)')
+    parser.add_argument('--json', dest='json_file', help='also write results to this file')
+    args = parser.parse_args(argv)
+
+    failures = []
+    results = {}
+    with tempfile.TemporaryDirectory() as home:
+        env = _env(home)
+
+        bare, _ = time_runs(['-c', 'pass'], env, args.runs)
+        eager, _ = time_runs(['-c', EAGER_IMPORTS], env, args.runs)
+        eager_modules = imported_modules(['-c', EAGER_IMPORTS], env)
+
+        pending = Path(home) / '.trellocli' / 'metrics' / PENDING_LOG
+
+        print(f"\n{'='*80}")
+        print(f"  {'COMMAND':24} {'MEDIAN ms':>10} {'BEST ms':>9} {'IMPORTS ms':>11} {'METRICS':>8}  HEAVY MODULES")
+        print(f"{'='*80}")
+        print(f"  {'(python -c pass)':24} {bare:>10.1f}")
+        print(f"  {'(eager imports, before)':24} {eager:>10.1f} {'':>9} "
+              f"{sum(eager_modules.values()):>11.1f}")
+
+        for command in COMMANDS:
+            cli = ['-m', 'trello_cli.cli'] + list(command)
+            median, best = time_runs(cli, env, args.runs)
+            logged_before = pending.stat().st_size if pending.exists() else 0
+            modules = imported_modules(cli, env)
+            logged = (pending.stat().st_size if pending.exists() else 0) != logged_before
+            heavy = sorted(m for m in modules if m in HEAVY_MODULES)
+            top_level = sum(modules.values())
+
+            name = ' '.join(command)
+            results[name] = {'median_ms': median, 'best_ms': best, 'import_ms': top_level, 'heavy': heavy,
+                             'metrics': logged}
+            print(f"  {name:24} {median:>10.1f} {best:>9.1f} {top_level:>11.1f} "
+                  f"{'logged' if logged else '-':>8}  {', '.join(heavy) or '-'}")
+
+            if heavy:
+                failures.append(f"{name}: imports {', '.join(heavy)}")
+            if command[0] in UNMETERED_COMMANDS:
+                metrics_modules = sorted(m for m in modules if m in METRICS_MODULES)
+                if logged:
+                    failures.append(f"{name}: records metrics without calling the API")
+                if metrics_modules and command[0] != 'stats':
+                    failures.append(f"{name}: imports {', '.join(metrics_modules)}")
+            elif not logged:
+                failures.append(f"{name}: recorded no metrics")
+            if median > STARTUP_BUDGET_MS:
+                failures.append(f"{name}: median {median:.0f}ms > {STARTUP_BUDGET_MS}ms")
+
+    print(f"\n{'='*80}")
+    fastest = min(r['median_ms'] for r in results.values())
+    print(f"Eager imports cost {eager - bare:.0f}ms over a bare interpreter; "
+          f"the fastest command starts in {fastest - bare:.0f}ms over it")
+
+    if args.json_file:
+        with open(args.json_file, 'w') as f:
+            json.dump({'bare_ms': bare, 'eager_ms': eager, 'commands': results}, f, indent=2)
+
+    if failures:
+        print(f"❌ {len(failures)} startup regression(s):")
+        for failure in failures:
+            print(f"   {failure}")
+        return 1
+    print("✅ Startup within budget")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
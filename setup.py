@@ -36,6 +36,10 @@ setup(
         "py-trello>=0.19.0",
         "python-dateutil>=2.8.0",
     ],
+    extras_require={
+        # Vectorized board metrics (trello_cli/columns.py)
+        "fast": ["numpy>=1.17"],
+    },
     entry_points={
         "console_scripts": [
             "trello-cli=trello_cli.cli:main",
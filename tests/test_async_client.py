@@ -0,0 +1,64 @@
+"""
+Unit tests for the asyncio Trello client
+"""
+
+import asyncio
+import threading
+import time
+
+from test_snapshot import BOARD_JSON
+from trello_cli.async_client import AsyncTrelloClient
+
+
+class FakePyTrello:
+    """Serves board sub-resources from BOARD_JSON and tracks parallelism"""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def fetch_json(self, uri_path, query_params=None, **kwargs):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.02)
+        with self._lock:
+            self.in_flight -= 1
+        resource = uri_path.rsplit('/', 1)[1]
+        if resource in ('lists', 'cards', 'checklists', 'labels'):
+            return BOARD_JSON[resource]
+        return {k: v for k, v in BOARD_JSON.items() if not isinstance(v, list)}
+
+
+class FakeClient:
+    def __init__(self):
+        self.client = FakePyTrello()
+
+    def attach_member_directory(self, snapshot):
+        snapshot.attach_members([])
+
+
+def _snapshot(max_concurrency):
+    fake = FakeClient()
+
+    async def fetch():
+        async with AsyncTrelloClient(fake, max_concurrency=max_concurrency) as client:
+            return await client.get_board_snapshot('b1')
+
+    return fake.client, asyncio.run(fetch())
+
+
+def test_snapshot_fetched_concurrently_matches_nested_snapshot():
+    """Test that sub-resources are fetched in parallel and joined like the nested response"""
+    fake, snapshot = _snapshot(max_concurrency=8)
+    assert fake.max_in_flight > 1
+    assert [c.name for c in snapshot.cards_in('l1')] == ['First', 'Second']
+    assert [cl.name for cl in snapshot.cards_by_id['c1'].checklists] == ['DoD']
+    assert snapshot.date_last_activity == BOARD_JSON['dateLastActivity']
+
+
+def test_concurrency_is_bounded():
+    """Test that no more than max_concurrency requests are in flight"""
+    fake, _ = _snapshot(max_concurrency=2)
+    assert fake.max_in_flight <= 2
@@ -0,0 +1,91 @@
+"""
+Unit tests for the portfolio board audit (trello board-audit --all)
+"""
+
+import json
+
+import pytest
+from trello import Board
+
+from trello_cli import commands
+from trello_cli.client import TrelloClient
+from trello_cli.commands import audit
+from trello_cli.mock import generate_board, MockTrello
+from trello_cli.mock.server import MockError
+from trello_cli.registry import COMMANDS
+
+from test_mirror import StorePyTrello
+
+
+class PortfolioPyTrello(StorePyTrello):
+    """StorePyTrello that lists the member's boards and fails one board's requests"""
+
+    def __init__(self, store, broken=None):
+        super().__init__(store)
+        self.broken = broken
+
+    def fetch_json(self, uri_path, http_method='GET', query_params=None, **kwargs):
+        if self.broken and uri_path.startswith(f'/boards/{self.broken}'):
+            raise MockError(404, 'The requested resource was not found.')
+        return super().fetch_json(uri_path, http_method, query_params)
+
+    def list_boards(self):
+        return [Board.from_json(self, json_obj=obj) for obj in self.fetch_json('/members/me/boards')]
+
+
+def _portfolio(monkeypatch, boards=5, broken=None):
+    store = MockTrello()
+    ids = [store.add_board(generate_board(cards=20 + 10 * i, seed=i, name=f'Board {i}'),
+                           organization_id='org1' if i % 2 else None) for i in range(boards)]
+    client = object.__new__(TrelloClient)
+    client.client = PortfolioPyTrello(store, ids[broken] if broken is not None else None)
+    client.attach_member_directory = lambda snapshot: None
+    monkeypatch.setattr(audit, 'get_client', lambda: client)
+    return store, ids, client
+
+
+def test_board_audit_all_ranks_boards_and_isolates_failures(tmp_path, monkeypatch, capsys):
+    """Test that every board is audited concurrently and one failing board only fails itself"""
+    store, ids, client = _portfolio(monkeypatch, broken=2)
+    output = tmp_path / 'portfolio.json'
+    with pytest.raises(Exception, match='Failed to audit 1 board'):
+        audit.cmd_board_audit_all(pattern=r'^PF-', jobs='3', output_file=str(output))
+
+    combined = json.loads(output.read_text())
+    assert (combined['boards'], combined['audited'], combined['failed']) == (5, 4, 1)
+    assert [failure['board_id'] for failure in combined['failures']] == [ids[2]]
+    scores = [(report['health_score'], report['board_name'].lower()) for report in combined['reports']]
+    assert scores == sorted(scores)
+    assert {report['board_id'] for report in combined['reports']} == set(ids) - {ids[2]}
+    assert combined['average_score'] == round(sum(score for score, _ in scores) / 4)
+
+    # Each entry is the board's own --report-json output
+    capsys.readouterr()
+    single = combined['reports'][0]
+    audit.cmd_board_audit(single['board_id'], r'^PF-', report_json=True)
+    printed = json.loads(capsys.readouterr().out)
+    assert dict(printed, audit_timestamp=None) == dict(single, audit_timestamp=None)
+
+
+def test_board_audit_all_filters_by_organization(tmp_path, monkeypatch, capsys):
+    """Test that --org audits only the organization's boards"""
+    store, ids, client = _portfolio(monkeypatch)
+    output = tmp_path / 'org.json'
+    audit.cmd_board_audit_all(org_id='org1', output_file=str(output))
+    combined = json.loads(output.read_text())
+    assert sorted(report['board_id'] for report in combined['reports']) == sorted([ids[1], ids[3]])
+    assert 'BOARD HEALTH RANKING' in capsys.readouterr().out
+
+    with pytest.raises(ValueError, match='Invalid concurrency'):
+        audit.cmd_board_audit_all(jobs='0', output_file=str(output))
+
+
+def test_board_audit_all_flag_routes_to_the_portfolio_audit(monkeypatch):
+    """Test that board-audit --all parses its own options and plain board-audit is unchanged"""
+    calls = []
+    monkeypatch.setattr(commands, 'cmd_board_audit_all', lambda *args, **kwargs: calls.append(('all', args, kwargs)))
+    monkeypatch.setattr(commands, 'cmd_board_audit', lambda *args, **kwargs: calls.append(('one', args, kwargs)))
+    COMMANDS['board-audit'].run('board-audit', ['--all', 'PF-', '--org', 'org1', '--jobs', '4'])
+    COMMANDS['board-audit'].run('board-audit', ['b1', '--report-json'])
+    assert calls == [('all', ('PF-',), {'org_id': 'org1', 'jobs': '4'}),
+                     ('one', ('b1',), {'report_json': True})]
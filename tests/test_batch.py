@@ -0,0 +1,89 @@
+"""
+Unit tests for trello batch parsing, scheduling and reporting
+"""
+
+import json
+import sys
+
+import pytest
+
+from trello_cli.commands.batch import cmd_batch, parse_batch, plan_batch
+from trello_cli.registry import COMMANDS, Command
+
+CARD_A = 'a' * 24
+CARD_B = 'b' * 24
+LIST_L = 'c' * 24
+
+
+def test_parse_batch_uses_command_line_syntax():
+    """Test quoting, comments, a leading `trello` and unknown or forbidden commands"""
+    lines = parse_batch(f'# comment\n\ntrello add-comment {CARD_A} "two words"  # note\n'
+                        'nope x\ndaemon start\nadd-comment "open\n')
+    assert [(line.number, line.status) for line in lines] == [
+        (3, 'pending'), (4, 'error'), (5, 'error'), (6, 'error')]
+    assert lines[0].command == 'add-comment'
+    assert lines[0].argv == [CARD_A, 'two words']
+    assert 'Unknown command' in lines[1].error
+    assert 'cannot run in a batch' in lines[2].error
+
+
+def test_plan_groups_lines_by_shared_ids_between_barriers():
+    """Test that lines on one card stay in order and board-level commands run alone"""
+    lines = parse_batch(f'set-due {CARD_A} 2025-01-01\n'
+                        f'set-due {CARD_B} 2025-01-01\n'
+                        f'move-card {CARD_A} {LIST_L}\n'
+                        f'cards {LIST_L}\n'
+                        'boards\n'
+                        f'add-comment {CARD_B} hi\n')
+
+    numbers = [[[line.number for line in group] for group in segment]
+               for segment in plan_batch(lines, concurrency=4)]
+    assert numbers == [[[1, 3, 4], [2]], [[5]], [[6]]]
+
+    sequential = [[[line.number for line in group] for group in segment]
+                  for segment in plan_batch(lines, concurrency=1)]
+    assert sequential == [[[n]] for n in range(1, 7)]
+
+
+def test_batch_reports_each_line(tmp_path, monkeypatch, capsys):
+    """Test the JSON summary: output, usage errors and exceptions per line"""
+    def ok(argv):
+        print(f"done {argv[0]}")
+
+    def broken(argv):
+        raise Exception("Failed to do it")
+
+    monkeypatch.setitem(COMMANDS, 'ok-cmd', Command(usage='<card_id>', handler=ok))
+    monkeypatch.setitem(COMMANDS, 'broken-cmd', Command(usage='<card_id>', handler=broken))
+    batch = tmp_path / 'batch.txt'
+    batch.write_text(f'ok-cmd {CARD_A}\nbroken-cmd {CARD_B}\nlists\nok-cmd {CARD_B}\n')
+    summary_file = tmp_path / 'summary.json'
+    streams = sys.stdin, sys.stdout, sys.stderr
+
+    with pytest.raises(SystemExit) as exit_info:
+        cmd_batch(str(batch), concurrency=2, as_json=True, summary_file=str(summary_file))
+    assert exit_info.value.code == 1
+
+    summary = json.loads(capsys.readouterr().out)
+    assert summary == json.loads(summary_file.read_text())
+    assert (summary['total'], summary['succeeded'], summary['failed']) == (4, 2, 2)
+    results = summary['results']
+    assert results[0]['output'] == f"done {CARD_A}\n"
+    assert results[1]['error'] == "Failed to do it"
+    assert results[2]['error'] == "Usage: trello lists <board_id>"
+    assert results[3]['status'] == 'ok'
+    assert (sys.stdin, sys.stdout, sys.stderr) == streams
+
+
+def test_batch_stop_on_error_skips_remaining_lines(tmp_path, monkeypatch, capsys):
+    """Test that --stop-on-error skips everything after the first failure"""
+    monkeypatch.setitem(COMMANDS, 'ok-cmd', Command(usage='<card_id>', handler=lambda argv: None))
+    batch = tmp_path / 'batch.txt'
+    batch.write_text(f'ok-cmd {CARD_A}\nlists\nok-cmd {CARD_B}\n')
+
+    with pytest.raises(SystemExit):
+        cmd_batch(str(batch), stop_on_error=True)
+
+    out = capsys.readouterr().out
+    assert '✅ Succeeded: 1' in out
+    assert 'Skipped:   1' in out
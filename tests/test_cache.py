@@ -0,0 +1,145 @@
+"""
+Unit tests for the on-disk response cache
+"""
+
+import json
+
+from trello_cli.cache import ResponseCache, CachingHTTPService
+
+API = 'https://api.trello.com/1'
+
+
+class FakeResponse:
+    def __init__(self, obj, status_code=200):
+        self.status_code = status_code
+        self.content = json.dumps(obj).encode('utf-8')
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class FakeService:
+    """Records requests and answers from a dict of url -> JSON"""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.calls = []
+
+    def request(self, method, url, params=None, **kwargs):
+        self.calls.append((method, url, dict(params or {})))
+        return FakeResponse(self.routes.get(url, {}))
+
+
+def _service(tmp_path, routes, **kwargs):
+    inner = FakeService(routes)
+    cache = ResponseCache(tmp_path / 'responses.db', **kwargs)
+    return inner, CachingHTTPService(inner, cache)
+
+
+def test_get_is_served_from_cache_ignoring_credentials(tmp_path):
+    """Test that a repeated GET hits the cache even with a different token"""
+    inner, service = _service(tmp_path, {f'{API}/cards/c1': {'id': 'c1'}})
+    service.request('GET', f'{API}/cards/c1', params={'fields': 'all', 'token': 'a'})
+    response = service.request('GET', f'{API}/cards/c1', params={'fields': 'all', 'token': 'b'})
+    assert response.json() == {'id': 'c1'}
+    assert len(inner.calls) == 1
+    assert service.cache.hits == 1
+
+
+def test_write_invalidates_cache(tmp_path):
+    """Test that a successful PUT drops cached reads"""
+    inner, service = _service(tmp_path, {f'{API}/cards/c1': {'id': 'c1'}})
+    service.request('GET', f'{API}/cards/c1')
+    service.request('PUT', f'{API}/cards/c1', params={'name': 'x'})
+    service.request('GET', f'{API}/cards/c1')
+    assert [m for m, _, _ in inner.calls] == ['GET', 'PUT', 'GET']
+
+
+def test_expired_board_entry_revalidated_by_activity_probe(tmp_path):
+    """Test that a stale board response is reused when dateLastActivity is unchanged"""
+    board = {'id': 'b1', 'dateLastActivity': '2025-01-01T00:00:00.000Z', 'cards': []}
+    inner, service = _service(tmp_path, {f'{API}/boards/b1': board})
+    service.request('GET', f'{API}/boards/b1', params={'cards': 'open'})
+    service.cache._db.execute("UPDATE responses SET stored_at = 0")
+
+    response = service.request('GET', f'{API}/boards/b1', params={'cards': 'open'})
+    assert response.json() == board
+    assert inner.calls[-1][2] == {'fields': 'dateLastActivity'}
+    assert len(inner.calls) == 2
+
+
+def test_expired_board_entry_refetched_when_board_changed(tmp_path):
+    """Test that a changed board triggers a full refetch"""
+    routes = {f'{API}/boards/b1': {'id': 'b1', 'dateLastActivity': 'old'}}
+    inner, service = _service(tmp_path, routes)
+    service.request('GET', f'{API}/boards/b1', params={'cards': 'open'})
+    service.cache._db.execute("UPDATE responses SET stored_at = 0")
+    routes[f'{API}/boards/b1'] = {'id': 'b1', 'dateLastActivity': 'new'}
+
+    response = service.request('GET', f'{API}/boards/b1', params={'cards': 'open'})
+    assert response.json()['dateLastActivity'] == 'new'
+    assert len(inner.calls) == 3
+
+
+def test_lru_eviction_respects_size_cap(tmp_path):
+    """Test that least recently used entries are evicted beyond the cap"""
+    routes = {f'{API}/cards/c{i}': {'id': f'c{i}', 'pad': 'x' * 100} for i in range(3)}
+    inner, service = _service(tmp_path, routes, max_bytes=250)
+    for i in range(3):
+        service.request('GET', f'{API}/cards/c{i}')
+    stats = service.cache.stats()
+    assert stats['entries'] == 2
+    assert stats['bytes'] <= 250
+    service.request('GET', f'{API}/cards/c0')
+    assert len(inner.calls) == 4
+
+
+def test_write_drops_only_responses_that_mention_its_objects(tmp_path):
+    """Test that a write to one card keeps another board's responses cached"""
+    card, other_card = 'a' * 24, 'b' * 24
+    routes = {f'{API}/boards/b1': {'id': 'b1', 'cards': [{'id': card}]},
+              f'{API}/boards/b1/actions': [],
+              f'{API}/boards/b2': {'id': 'b2', 'cards': [{'id': other_card}]}}
+    inner, service = _service(tmp_path, routes)
+    for url in routes:
+        service.request('GET', url)
+    service.request('POST', f'{API}/cards/{card}/actions/comments', params={'text': 'hi', 'token': 'f' * 64})
+    for url in routes:
+        service.request('GET', url)
+    refetched = [url for method, url, _ in inner.calls[4:] if method == 'GET']
+    assert refetched == [f'{API}/boards/b1', f'{API}/boards/b1/actions']
+
+
+def test_cache_hits_rewrite_lru_order_only_after_touch_interval(tmp_path):
+    """Test that a hit on a recently used entry does not write to the database"""
+    inner, service = _service(tmp_path, {f'{API}/cards/c1': {'id': 'c1'}})
+    service.request('GET', f'{API}/cards/c1')
+    changes = service.cache._db.total_changes
+    service.request('GET', f'{API}/cards/c1')
+    assert service.cache._db.total_changes == changes
+
+    service.cache._db.execute("UPDATE responses SET accessed_at = accessed_at - 3600")
+    changes = service.cache._db.total_changes
+    service.request('GET', f'{API}/cards/c1')
+    assert service.cache._db.total_changes == changes + 1
+    assert (service.cache.hits, service.cache.misses) == (2, 1)
+
+
+def test_board_probe_is_repeated_once_it_is_older_than_probe_ttl(tmp_path, monkeypatch):
+    """Test that a long-lived wrapper sees a board change once its last probe has expired"""
+    from trello_cli import cache as cache_module
+
+    clock = [1_000_000.0]
+    monkeypatch.setattr(cache_module.time, 'time', lambda: clock[0])
+    routes = {f'{API}/boards/b1': {'id': 'b1', 'dateLastActivity': 'old'}}
+    inner, service = _service(tmp_path, routes)
+    service.request('GET', f'{API}/boards/b1', params={'cards': 'open'})
+    clock[0] += 3600
+    service.request('GET', f'{API}/boards/b1', params={'cards': 'open'})
+    assert len(inner.calls) == 2
+
+    routes[f'{API}/boards/b1'] = {'id': 'b1', 'dateLastActivity': 'new'}
+    clock[0] += 3600
+    response = service.request('GET', f'{API}/boards/b1', params={'cards': 'open'})
+    assert response.json()['dateLastActivity'] == 'new'
+    assert len(inner.calls) == 4
@@ -0,0 +1,119 @@
+"""
+Unit tests for TrelloClient fetch helpers (batching, prefetching)
+"""
+
+from test_snapshot import _card
+from trello_cli import client as client_module
+from trello_cli.client import TrelloClient
+from trello_cli.trace import Tracer, TracingHTTPService
+
+
+class FakePyTrello:
+    """Answers GET /batch from a dict of card JSON"""
+
+    def __init__(self, cards):
+        self.cards = cards
+        self.batches = []
+
+    def fetch_json(self, uri_path, query_params=None, **kwargs):
+        assert uri_path == '/batch'
+        urls = query_params['urls'].split(',')
+        self.batches.append(urls)
+        responses = []
+        for url in urls:
+            card_id = url.rsplit('/', 1)[1]
+            if card_id in self.cards:
+                responses.append({'200': self.cards[card_id]})
+            else:
+                responses.append({'404': 'The requested resource was not found.'})
+        return responses
+
+
+def _client(cards):
+    client = object.__new__(TrelloClient)
+    client.client = FakePyTrello(cards)
+    return client
+
+
+def test_get_cards_batch_groups_ten_ids_per_request():
+    """Test that 25 IDs are fetched with 3 batch requests"""
+    cards = {f'c{i}': _card(f'c{i}', 'l1', f'Card {i}', i) for i in range(25)}
+    client = _client(cards)
+    result = client.get_cards_batch(list(cards))
+    assert [len(batch) for batch in client.client.batches] == [10, 10, 5]
+    assert result['c7'].name == 'Card 7'
+    assert result['c7'].board.id == 'b1'
+
+
+def test_get_cards_batch_skips_missing_and_duplicate_ids():
+    """Test that unknown IDs are left out and duplicates fetched once"""
+    client = _client({'c1': _card('c1', 'l1', 'One', 1)})
+    result = client.get_cards_batch(['c1', 'missing', 'c1'])
+    assert list(result) == ['c1']
+    assert client.client.batches == [['/cards/c1', '/cards/missing']]
+
+
+class RoutedPyTrello:
+    """Answers fetch_json from a dict of path -> JSON and records calls"""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.calls = []
+
+    def fetch_json(self, uri_path, query_params=None, **kwargs):
+        self.calls.append((uri_path, dict(query_params or {})))
+        return self.routes[uri_path]
+
+
+CHECKLIST = {'id': 'cl1', 'idCard': 'c1', 'name': 'DoD', 'pos': 1,
+             'checkItems': [{'id': 'i1', 'name': 'Tests', 'state': 'incomplete', 'pos': 1}]}
+
+
+def test_get_card_prefetches_list_board_and_checklists():
+    """Test that get_card makes one request and never lazily fetches checklists"""
+    card_json = dict(_card('c1', 'l1', 'One', 1, checklists=['cl1']),
+                     checklists=[CHECKLIST],
+                     list={'id': 'l1', 'name': 'Doing', 'closed': False, 'pos': 1},
+                     board={'id': 'b1', 'name': 'Board', 'closed': False, 'url': ''})
+    client = object.__new__(TrelloClient)
+    client.client = RoutedPyTrello({'/cards/c1': card_json})
+
+    card = client.get_card('c1')
+    assert card.trello_list.name == 'Doing'
+    assert [cl.name for cl in card.checklists] == ['DoD']
+    assert len(client.client.calls) == 1
+
+
+def test_get_list_cards_joins_nested_checklists():
+    """Test that list cards fetched with checklists=all carry their checklists"""
+    routes = {
+        '/lists/l1': {'id': 'l1', 'name': 'Doing', 'closed': False, 'pos': 1, 'idBoard': 'b1'},
+        '/lists/l1/cards': [dict(_card('c1', 'l1', 'One', 1, checklists=['cl1']), checklists=[CHECKLIST]),
+                            _card('c2', 'l1', 'Two', 2)],
+    }
+    client = object.__new__(TrelloClient)
+    client.client = RoutedPyTrello(routes)
+
+    lst, cards = client.get_list_cards('l1', checklists=True)
+    assert client.client.calls[1][1]['checklists'] == 'all'
+    assert [len(card.checklists) for card in cards] == [1, 0]
+    assert len(client.client.calls) == 2
+
+
+def test_reconfigured_client_keeps_its_session(monkeypatch):
+    """Test that changing client options rebuilds the wrappers around the same session"""
+    monkeypatch.setattr(TrelloClient, '_instance', None)
+    monkeypatch.setattr(client_module, 'load_config', lambda: {'api_key': 'k', 'token': 't'})
+    monkeypatch.setitem(client_module._options, 'cache', False)
+    monkeypatch.setitem(client_module._options, 'tracer', None)
+
+    client = TrelloClient()
+    session = client.session
+    plain = client.client.http_service
+    assert TrelloClient().client.http_service is plain
+
+    tracer = Tracer('trello lists', call_paths=False)
+    monkeypatch.setitem(client_module._options, 'tracer', tracer)
+    traced = TrelloClient().client.http_service
+    assert isinstance(traced, TracingHTTPService)
+    assert traced.inner.inner.inner is session
@@ -0,0 +1,133 @@
+"""
+Unit tests for the warm daemon and its client shim
+"""
+
+import io
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from trello_cli import daemon
+from trello_cli.mock import generate_board, MockTrello, MockTrelloServer
+
+pytestmark = pytest.mark.skipif(not hasattr(daemon.socket, 'AF_UNIX'), reason='needs Unix sockets')
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def running_daemon(tmp_path):
+    """A daemon serving from a temporary home directory"""
+    path = tmp_path / 'd.sock'
+    env = dict(os.environ, HOME=str(tmp_path), PYTHONPATH=str(ROOT), TRELLO_CLI_METRICS='0')
+    env[daemon.SOCKET_ENV] = str(path)
+    process = subprocess.Popen([sys.executable, '-m', 'trello_cli.cli', 'daemon', 'start', '--foreground'],
+                               env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 10
+    while daemon._control('status', path) is None:
+        assert process.poll() is None and time.monotonic() < deadline, 'daemon did not start'
+        time.sleep(0.05)
+    yield path
+    daemon._control('stop', path)
+    process.wait(timeout=10)
+    assert not path.exists()
+
+
+def _forward(argv, path, stdin=''):
+    out, err = io.StringIO(), io.StringIO()
+    code = daemon.forward(argv, path, stdin=io.StringIO(stdin), stdout=out, stderr=err)
+    return code, out.getvalue(), err.getvalue()
+
+
+def test_forward_streams_output_and_exit_code(running_daemon):
+    """Test that forwarded commands return the same output and exit codes as local runs"""
+    code, out, _ = _forward(['version'], running_daemon)
+    assert code == 0
+    assert out.startswith('Trello CLI v')
+
+    code, out, _ = _forward(['lists'], running_daemon)
+    assert code == 1
+    assert 'Usage: trello lists <board_id>' in out
+
+    code, out, _ = _forward(['--trace-format', 'xml', 'version'], running_daemon)
+    assert code == 1
+
+    # The previous command's flags do not leak into the next one
+    code, out, _ = _forward(['version'], running_daemon)
+    assert code == 0
+
+    assert daemon._control('status', running_daemon)['commands'] == 4
+
+
+def test_forward_relays_environment_and_stdin(running_daemon, tmp_path, monkeypatch):
+    """Test that the caller's TRELLO_BASE_URL and answers to input() reach the command"""
+    (tmp_path / '.trello_config.json').write_text(json.dumps({'api_key': 'k', 'token': 't'}))
+    store = MockTrello()
+    data = generate_board(cards=5, seed=7)
+    store.add_board(data)
+    list_id = data['cards'][0]['idList']
+
+    with MockTrelloServer(store) as server:
+        monkeypatch.setenv('TRELLO_BASE_URL', server.base_url)
+        code, out, _ = _forward(['bulk-archive-cards', list_id], running_daemon, stdin='no\n')
+
+    assert code == 0
+    assert 'Archive these' in out
+    assert 'Operation cancelled' in out
+    assert not any(card['closed'] for card in store.cards.values())
+
+
+def test_forward_revalidates_against_current_board_activity(running_daemon, tmp_path, monkeypatch):
+    """Test that a change made elsewhere between two commands is not hidden by a remembered probe"""
+    (tmp_path / '.trello_config.json').write_text(json.dumps({'api_key': 'k', 'token': 't'}))
+    store = MockTrello()
+    data = generate_board(cards=5, seed=7)
+    store.add_board(data)
+    board_id = data['board']['id']
+    database = tmp_path / '.trellocli' / 'cache' / 'responses.db'
+
+    def expire_cache():
+        with sqlite3.connect(database) as connection:
+            connection.execute("UPDATE responses SET stored_at = 0")
+
+    # Without a tracer nothing else rebuilds the client's HTTP wrappers
+    monkeypatch.setenv('TRELLO_CLI_METRICS', '0')
+    with MockTrelloServer(store) as server:
+        monkeypatch.setenv('TRELLO_BASE_URL', server.base_url)
+        assert _forward(['lists', board_id], running_daemon)[0] == 0
+        expire_cache()
+        assert _forward(['lists', board_id], running_daemon)[0] == 0
+
+        store.create_list({'name': 'Added elsewhere', 'idBoard': board_id})
+        expire_cache()
+        code, out, _ = _forward(['lists', board_id], running_daemon)
+
+    assert code == 0
+    assert 'Added elsewhere' in out
+
+
+def test_forward_without_daemon_runs_locally(tmp_path):
+    """Test that a missing or stale socket makes the shim fall back to a local run"""
+    assert daemon.forward(['version'], tmp_path / 'missing.sock') is None
+
+    stale = tmp_path / 'stale.sock'
+    listener = daemon.socket.socket(daemon.socket.AF_UNIX)
+    listener.bind(str(stale))
+    listener.close()
+    assert daemon.forward(['version'], stale) is None
+
+
+def test_only_the_command_word_keeps_a_command_local():
+    """Test that a local command's name elsewhere in argv doesn't bypass the daemon"""
+    from trello_cli.cli import _command_word
+
+    assert _command_word(['--offline', '--trace-format', 'json', 'shell']) == 'shell'
+    assert _command_word(['add-card', 'l1', 'shell']) == 'add-card'
+    assert _command_word(['search', 'config']) == 'search'
+    assert _command_word(['--trace']) is None
@@ -0,0 +1,33 @@
+"""
+Unit tests for the on-disk member directory
+"""
+
+import time
+
+from test_snapshot import BOARD_JSON, _card
+from trello_cli.directory import MemberDirectory
+from trello_cli.records import CardRecord
+
+
+def test_directory_round_trips_through_disk(tmp_path):
+    """Test that a saved directory loads back while fresh"""
+    MemberDirectory('b1', BOARD_JSON['members']).save(tmp_path)
+    loaded = MemberDirectory.load('b1', directory=tmp_path)
+    assert loaded.from_disk
+    assert loaded.find('ada').full_name == 'Ada Lovelace'
+    assert loaded.find('Ada Lovelace').id == 'm1'
+
+
+def test_expired_directory_is_not_loaded(tmp_path):
+    """Test that entries older than the TTL are ignored"""
+    MemberDirectory('b1', BOARD_JSON['members'], fetched_at=time.time() - 100).save(tmp_path)
+    assert MemberDirectory.load('b1', ttl=50, directory=tmp_path) is None
+    assert MemberDirectory.load('missing', directory=tmp_path) is None
+
+
+def test_members_of_joins_card_member_ids():
+    """Test that card members resolve in memory and unknown IDs are detected"""
+    directory = MemberDirectory('b1', BOARD_JSON['members'])
+    card = CardRecord.from_json(_card('c1', 'l1', 'One', 1, members=['m1', 'm2']))
+    assert [m.username for m in directory.members_of(card)] == ['ada']
+    assert not directory.knows_all(card.idMembers)
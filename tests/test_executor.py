@@ -0,0 +1,49 @@
+"""
+Unit tests for the concurrent bulk executor
+"""
+
+import threading
+import time
+
+import pytest
+
+from trello_cli.executor import run_tasks, parse_concurrency, MAX_CONCURRENCY
+
+
+def test_results_come_back_in_input_order():
+    """Test that results keep input order even when tasks finish out of order"""
+    def task(n):
+        time.sleep(0.01 * (5 - n))
+        return n * 10
+
+    results = list(run_tasks(range(5), task, concurrency=5))
+    assert [(item, result) for item, result, _ in results] == [(n, n * 10) for n in range(5)]
+
+
+def test_errors_are_reported_per_item():
+    """Test that one failing item does not stop the rest"""
+    def task(n):
+        if n == 2:
+            raise ValueError("boom")
+        return n
+
+    results = list(run_tasks(range(4), task, concurrency=2))
+    assert [error is None for _, _, error in results] == [True, True, False, True]
+    assert str(results[2][2]) == "boom"
+
+
+def test_runs_tasks_concurrently():
+    """Test that tasks overlap when concurrency > 1"""
+    barrier = threading.Barrier(3, timeout=2)
+    results = list(run_tasks(range(3), lambda n: barrier.wait(), concurrency=3))
+    assert all(error is None for _, _, error in results)
+
+
+def test_parse_concurrency():
+    """Test that --concurrency is validated and clamped"""
+    assert parse_concurrency('4') == 4
+    assert parse_concurrency('1000') == MAX_CONCURRENCY
+    with pytest.raises(ValueError):
+        parse_concurrency('0')
+    with pytest.raises(ValueError):
+        parse_concurrency('many')
@@ -0,0 +1,38 @@
+"""
+Unit tests for per-command card field sets
+"""
+
+import pytest
+
+from trello_cli.fields import card_fields_for
+from trello_cli.snapshot import BoardSnapshot
+
+
+def test_command_field_set_includes_required_fields():
+    """Test that declared fields are returned with id/idList first"""
+    assert card_fields_for('cards-due-soon') == ['id', 'idList', 'name', 'due']
+
+
+def test_override_and_all():
+    """Test that --fields adds to the declared set and 'all' disables projection"""
+    assert card_fields_for('cards', 'name, due') == ['id', 'idList', 'name', 'due']
+    assert card_fields_for('cards-overdue', 'id,name') == ['id', 'idList', 'name', 'due']
+    assert card_fields_for('cards-by-label', 'url') == ['id', 'idList', 'url', 'name', 'labels']
+    assert card_fields_for('search-cards', 'name')[:3] == ['id', 'idList', 'name']
+    assert 'desc' in card_fields_for('search-cards', 'name')
+    assert card_fields_for('cards', 'all') is None
+    assert card_fields_for('board-health') is None
+    with pytest.raises(ValueError):
+        card_fields_for('cards', ',')
+
+
+def test_snapshot_accepts_projected_cards():
+    """Test that cards fetched with only a few fields still decode"""
+    snapshot = BoardSnapshot.from_json(None, {
+        'id': 'b1', 'name': 'Board', 'closed': False, 'url': '',
+        'lists': [{'id': 'l1', 'name': 'To Do', 'closed': False, 'pos': 1}],
+        'cards': [{'id': 'c1', 'idList': 'l1', 'name': 'Ship it', 'due': '2025-01-01T00:00:00.000Z'}],
+        'labels': [],
+    })
+    card = snapshot.cards_in('l1')[0]
+    assert (card.name, card.due, card.desc, card.labels) == ('Ship it', '2025-01-01T00:00:00.000Z', '', ())
@@ -0,0 +1,118 @@
+"""
+Unit tests for the persistent latency statistics store
+"""
+
+from trello_cli.metrics import Histogram, MetricsStore, bucket_index, bucket_bounds, parse_window
+from trello_cli.trace import Tracer, Span
+
+
+def _span(path, seconds, status=200, cache_hit=False, attempts=None):
+    span = Span('GET', path, [], 0.0)
+    span.end = seconds
+    span.status = status
+    span.cache_hit = cache_hit
+    span.attempts = attempts if attempts is not None else [(path, status)]
+    return span
+
+
+def test_histogram_buckets_are_within_a_few_percent():
+    """Test that every value lands in a bucket that brackets it tightly"""
+    for micros in (0, 7, 31, 32, 33, 1000, 123456, 9876543):
+        lower, upper = bucket_bounds(bucket_index(micros))
+        assert lower <= micros < upper
+        assert upper - lower <= max(1, micros * 0.04)
+
+
+def test_histogram_percentiles():
+    """Test p50/p99 against a known distribution"""
+    histogram = Histogram()
+    for ms in range(1, 101):
+        histogram.record(ms / 1000)
+    assert abs(histogram.percentile(50) - 0.050) < 0.002
+    assert abs(histogram.percentile(99) - 0.099) < 0.004
+    assert Histogram.from_json(histogram.to_json()).counts == histogram.counts
+    assert Histogram().percentile(50) is None
+
+
+def test_store_aggregates_runs_in_window(tmp_path):
+    """Test that runs add up per endpoint and command, and old slots drop out of the window"""
+    store = MetricsStore(tmp_path / 'metrics.db')
+    now = 1_700_000_000
+
+    tracer = Tracer('trello show-card', call_paths=False)
+    tracer.spans = [
+        _span('/cards/5f1e2d3c4b5a697887766554', 0.120),
+        _span('/cards/5f1e2d3c4b5a697887766555', 0.080, cache_hit=True, attempts=[]),
+        _span('/cards/5f1e2d3c4b5a697887766556', 0.900,
+              attempts=[('/cards/5f1e2d3c4b5a697887766556', 429)] * 2),
+    ]
+    tracer.end = tracer.start + 1.5
+    store.record_run('show-card', tracer, now=now)
+    store.record_run('show-card', tracer, failed=True, now=now)
+    store.record_run('show-card', tracer, now=now - 3 * 86400)
+
+    report = store.report(86400, now=now)
+    assert report['totals']['runs'] == 2
+    assert report['totals']['failures'] == 1
+    endpoint = report['endpoints'][0]
+    assert endpoint['endpoint'] == 'GET /cards/{id}'
+    assert endpoint['requests'] == 6
+    assert endpoint['cache_hits'] == 2
+    assert endpoint['throttled'] == 2
+    assert report['commands'][0]['p50'] > 1.4
+
+    assert store.report(7 * 86400, now=now)['totals']['runs'] == 3
+    store.close()
+
+
+def test_parse_window():
+    """Test window parsing in minutes, hours and days"""
+    assert parse_window('90m') == 5400
+    assert parse_window('24h') == 86400
+    assert parse_window('7d') == 7 * 86400
+    assert parse_window('2') == 7200
+
+
+def test_logged_runs_are_ingested_in_one_batch(tmp_path, monkeypatch):
+    """Test that runs append to the pending log and reach the database on ingest"""
+    from trello_cli import metrics
+
+    db = tmp_path / 'metrics.db'
+    now = 1_700_000_000
+    tracer = Tracer('trello show-card', call_paths=False)
+    tracer.spans = [_span('/cards/5f1e2d3c4b5a697887766554', 0.120)]
+    tracer.end = tracer.start + 0.5
+    for _ in range(3):
+        metrics.log_run('show-card', tracer, path=db, now=now)
+    assert not db.exists()
+    with open(db.with_name(metrics.PENDING_LOG), 'a') as f:
+        f.write('{"truncated\n')
+
+    store = MetricsStore(db)
+    assert store.ingest() == 3
+    assert store.ingest() == 0
+    report = store.report(86400, now=now)
+    assert (report['totals']['runs'], report['totals']['requests']) == (3, 3)
+    store.close()
+
+    # A log past the size cap is folded in by the run that grew it
+    monkeypatch.setattr(metrics, 'MAX_PENDING_BYTES', 0)
+    metrics.log_run('show-card', tracer, path=db, now=now)
+    store = MetricsStore(db)
+    assert store.report(86400, now=now)['totals']['runs'] == 4
+    assert db.with_name(metrics.PENDING_LOG).stat().st_size == 0
+    store.close()
+
+
+def test_commands_without_api_calls_start_no_tracer(monkeypatch):
+    """Test that help, stats and other local commands skip the tracer and metrics"""
+    from trello_cli import cli
+
+    monkeypatch.setattr(cli, 'configure_client', lambda **options: None)
+    monkeypatch.delenv('TRELLO_CLI_METRICS', raising=False)
+    for command in ('help', 'version', 'config', 'stats'):
+        assert cli._start_trace(command, None) is None
+    assert cli._start_trace('help', 'text') is not None
+    assert cli._start_trace('boards', None) is not None
+    monkeypatch.setenv('TRELLO_CLI_METRICS', '0')
+    assert cli._start_trace('boards', None) is None
@@ -0,0 +1,217 @@
+"""
+Unit tests for the local board mirror, incremental sync and --offline reads
+"""
+
+import sqlite3
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from trello_cli import client as client_module
+from trello_cli.client import TrelloClient
+from trello_cli.commands.query import _list_metrics
+from trello_cli.commands.quick import _card_ages
+from trello_cli.mirror import Mirror, classify_actions, fts_query, sync_board
+from trello_cli.mock import generate_board, MockTrello
+from trello_cli.rules import BoardFrame, BoardHealthRule, evaluate
+from trello_cli.snapshot import BoardSnapshot, SNAPSHOT_PARAMS
+
+
+class StorePyTrello:
+    """Answers fetch_json from a MockTrello store and records the paths"""
+
+    def __init__(self, store):
+        self.store = store
+        self.paths = []
+
+    def fetch_json(self, uri_path, http_method='GET', query_params=None, **kwargs):
+        self.paths.append(uri_path)
+        _, payload = self.store.dispatch(http_method, uri_path, dict(query_params or {}))
+        return payload
+
+
+class NoNetwork:
+    def fetch_json(self, *args, **kwargs):
+        raise AssertionError('offline reads must not fetch')
+
+
+def _setup(tmp_path, cards=40):
+    store = MockTrello()
+    data = generate_board(cards=cards, seed=5)
+    board_id = store.add_board(data)
+    client = object.__new__(TrelloClient)
+    client.client = StorePyTrello(store)
+    return store, data, board_id, client, Mirror(tmp_path / 'mirror.db')
+
+
+def _api_snapshot(store, board_id):
+    _, board_json = store.dispatch('GET', f'/boards/{board_id}', dict(SNAPSHOT_PARAMS))
+    return BoardSnapshot.from_json(None, board_json)
+
+
+def test_classify_actions_separates_cards_from_board_resources():
+    """Test that card actions name cards and other actions name what to refetch"""
+    card_ids, resources = classify_actions([
+        {'type': 'updateCard', 'data': {'card': {'id': 'c1'}, 'list': {'id': 'l1'}}},
+        {'type': 'commentCard', 'data': {'card': {'id': 'c2'}}},
+        {'type': 'updateList', 'data': {'list': {'id': 'l1'}}},
+        {'type': 'createLabel', 'data': {'label': {'id': 'x'}}},
+    ])
+    assert card_ids == {'c1', 'c2'}
+    assert resources == {'lists', 'labels'}
+    assert classify_actions([{'type': 'enablePlugin', 'data': {}}])[1] == {'board', 'lists', 'labels', 'members'}
+
+
+def test_incremental_sync_applies_only_new_actions(tmp_path):
+    """Test that after a full copy, a sync fetches actions and the changed cards only"""
+    store, data, board_id, client, mirror = _setup(tmp_path)
+    result = sync_board(client, mirror, board_id)
+    assert (result['mode'], result['cards']) == ('full', 40)
+
+    cards = data['cards']
+    target = data['lists'][-1]['id']
+    store.dispatch('PUT', f"/cards/{cards[0]['id']}/idList", {'value': target})
+    store.dispatch('PUT', f"/cards/{cards[1]['id']}/closed", {'value': 'true'})
+    store.dispatch('DELETE', f"/cards/{cards[2]['id']}")
+    store.dispatch('POST', '/cards', {'idList': target, 'name': 'Brand new'})
+    store.dispatch('POST', '/labels', {'idBoard': board_id, 'name': 'Fresh', 'color': 'lime'})
+    client.client.paths.clear()
+
+    result = sync_board(client, mirror, board_id)
+    assert (result['mode'], result['actions'], result['deleted']) == ('incremental', 5, 1)
+    assert client.client.paths == [f'/boards/{board_id}/actions', f'/boards/{board_id}/labels', '/batch']
+
+    mirrored = mirror.load_snapshot(board_id)
+    fresh = _api_snapshot(store, board_id)
+    assert mirrored.cards_by_id == fresh.cards_by_id
+    assert sorted(label.name for label in mirrored.labels) == sorted(label.name for label in fresh.labels)
+    assert mirror.load_snapshot(board_id, card_filter='closed').cards[0].id == cards[1]['id']
+
+    client.client.paths.clear()
+    assert sync_board(client, mirror, board_id)['actions'] == 0
+    assert client.client.paths == [f'/boards/{board_id}/actions']
+
+
+def test_offline_client_reads_the_mirror(tmp_path, monkeypatch):
+    """Test that --offline serves snapshots, lists and cards without requests"""
+    store, data, board_id, client, mirror = _setup(tmp_path, cards=10)
+    sync_board(client, mirror, board_id)
+
+    monkeypatch.setitem(client_module._options, 'offline', True)
+    client.client = NoNetwork()
+    client._mirror = mirror
+    client.pinned_snapshots = None
+
+    snapshot = client.get_board_snapshot(board_id)
+    assert snapshot.cards_by_id == _api_snapshot(store, board_id).cards_by_id
+    assert {member.id for member in snapshot.members} == set(store.board_members[board_id])
+
+    card = data['cards'][0]
+    lst, cards = client.get_list_cards(card['idList'])
+    assert card['id'] in {c.id for c in cards}
+    assert client.get_card(card['id']).trello_list.id == card['idList']
+    assert [board.id for board in client.list_boards()] == [board_id]
+
+    with pytest.raises(Exception, match='not in the local mirror'):
+        client.get_board_snapshot('f' * 24)
+
+
+def test_fts_query_quotes_words_and_keeps_operators():
+    """Test that punctuation is quoted and prefixes, phrases and operators survive"""
+    assert fts_query('PF-WEB-1') == '"PF-WEB-1"'
+    assert fts_query('log* "fix the bug"') == '"log"* "fix the bug"'
+    assert fts_query('login OR signup NOT') == '"login" OR "signup"'
+    assert fts_query('log in', prefix=True) == '"log"* "in"*'
+    assert fts_query('OR *') == ''
+
+
+def test_search_ranks_cards_across_boards_and_follows_syncs(tmp_path):
+    """Test cross-board ranked search over names, comments and checklists, kept current by sync"""
+    store, data, board_id, client, mirror = _setup(tmp_path, cards=20)
+    other_id = store.add_board(generate_board(cards=5, seed=9, name='Other'))
+    first, second = data['cards'][0], data['cards'][1]
+    other_card = next(iter(store._board_cards(other_id, 'open')))
+    store.dispatch('PUT', f"/cards/{first['id']}/name", {'value': 'Quasar telemetry pipeline'})
+    store.dispatch('PUT', f"/cards/{other_card['id']}/desc", {'value': 'notes about quasar'})
+    sync_board(client, mirror, board_id)
+    sync_board(client, mirror, other_id)
+
+    results = mirror.search('quasar')
+    assert [r['id'] for r in results] == [first['id'], other_card['id']]
+    assert results[0]['board_id'] == board_id and results[1]['board_name'] == 'Other'
+    assert [r['id'] for r in mirror.search('quas*', [other_id])] == [other_card['id']]
+    assert mirror.search('"telemetry quasar"') == []
+
+    checklist = next(cl for cl in data['checklists'] if cl['checkItems'])
+    item = checklist['checkItems'][0]['name'].split()[0]
+    assert checklist['idCard'] in {r['id'] for r in mirror.search(item, limit=None)}
+
+    # A comment and an archive reach the index on the next incremental sync
+    store.dispatch('POST', f"/cards/{second['id']}/actions/comments", {'text': 'blocked on zephyrine'})
+    store.dispatch('PUT', f"/cards/{first['id']}/closed", {'value': 'true'})
+    assert sync_board(client, mirror, board_id)['mode'] == 'incremental'
+    assert [r['id'] for r in mirror.search('zephyrine')] == [second['id']]
+    assert [r['id'] for r in mirror.search('quasar')] == [other_card['id']]
+
+
+def test_offline_queries_match_the_board_walk(tmp_path):
+    """Test that the SQL answers of the query commands equal the snapshot walks"""
+    store, data, board_id, client, mirror = _setup(tmp_path, cards=120)
+    sync_board(client, mirror, board_id)
+    board = _api_snapshot(store, board_id)
+    now = datetime.now(timezone.utc)
+
+    walked = evaluate(BoardFrame(board, now), [BoardHealthRule()])['board-health']
+    assert dict(mirror.board_health(board_id, now), score=walked['score']) == walked
+
+    label = next(label for label in board.labels if label.color)
+    walked = [card.id for lst in board.open_lists() for card in board.cards_in(lst.id)
+              if any(l.color == label.color for l in card.labels)]
+    assert [card.id for card, _ in mirror.cards_with_label(board_id, label.color)] == walked
+
+    overdue = [card.id for lst in board.open_lists() for card in board.cards_in(lst.id)
+               if card.due and card.due_date < now]
+    assert overdue and [card.id for card, _ in mirror.cards_due(board_id, end=now)] == overdue
+
+    member = mirror.members_json(board_id)[0]
+    mine = [card.id for lst in board.open_lists() for card in board.cards_in(lst.id)
+            if member['id'] in card.idMembers]
+    assert mine and [card.id for card, _ in mirror.member_cards(board_id, member['fullName'].upper())] == mine
+
+    lst = max(board.open_lists(), key=lambda lst: len(board.cards_in(lst.id)))
+    cards = board.cards_in(lst.id)
+    walked = _list_metrics(SimpleNamespace(name=lst.name, list_cards=lambda: cards))
+    assert mirror.list_metrics(lst.id, time.time()) == dict(walked, labels=[tuple(row) for row in walked['labels']])
+    _, ages = mirror.card_ages(lst.id, time.time())
+    assert [row[:3] for row in ages] == [row[:3] for row in _card_ages(cards)]
+
+
+def test_mirror_from_an_older_version_is_backfilled(tmp_path):
+    """Test that opening a mirror without the derived card columns adds and fills them"""
+    store, data, board_id, client, mirror = _setup(tmp_path, cards=20)
+    sync_board(client, mirror, board_id)
+    color = next(label['color'] for label in data['labels'] if label['color'])
+    expected = mirror.cards_with_label(board_id, color)
+    mirror.close()
+
+    db = sqlite3.connect(str(tmp_path / 'mirror.db'))
+    db.executescript("ALTER TABLE cards DROP COLUMN created; DELETE FROM card_labels; PRAGMA user_version = 0;")
+    db.close()
+
+    mirror = Mirror(tmp_path / 'mirror.db')
+    assert expected and [card.id for card, _ in mirror.cards_with_label(board_id, color)] == [card.id for card, _ in expected]
+    assert mirror.card_ages(data['lists'][0]['id'], time.time())[1][0][2] is not None
+    word = data['cards'][0]['name'].split()[0]
+    assert mirror.search(word)
+    mirror.close()
+
+    # The search index is backfilled by the version 2 upgrade, not on every open
+    for version in (2, 1):
+        db = sqlite3.connect(str(tmp_path / 'mirror.db'))
+        db.executescript(f"DELETE FROM search_docs; DELETE FROM search_index; PRAGMA user_version = {version};")
+        db.close()
+        mirror = Mirror(tmp_path / 'mirror.db')
+        assert bool(mirror.search(word)) == (version == 1)
+        mirror.close()
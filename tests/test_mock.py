@@ -0,0 +1,76 @@
+"""
+Unit tests for the mock Trello server and synthetic board generator
+"""
+
+from datetime import datetime, timezone
+
+import requests
+
+from trello_cli.client import BaseURLHTTPService
+from trello_cli.config import API_BASE_URL
+from trello_cli.mock import generate_board, MockTrello, MockTrelloServer
+from trello_cli.snapshot import BoardSnapshot, SNAPSHOT_PARAMS
+
+
+def _store(cards=50):
+    store = MockTrello()
+    data = generate_board(cards=cards, seed=7)
+    return store, data, store.add_board(data)
+
+
+def test_generator_is_deterministic_and_sized():
+    """Test that a seed always builds the same board with the requested counts"""
+    now = datetime(2025, 6, 1, tzinfo=timezone.utc)
+    first = generate_board(cards=200, members=4, seed=3, now=now)
+    second = generate_board(cards=200, members=4, seed=3, now=now)
+    assert [c['id'] for c in first['cards']] == [c['id'] for c in second['cards']]
+    assert len(first['cards']) == 200 and len(first['members']) == 4
+    list_ids = {lst['id'] for lst in first['lists']}
+    assert all(card['idList'] in list_ids for card in first['cards'])
+
+
+def test_nested_board_request_builds_a_snapshot():
+    """Test that GET /boards/{id} with SNAPSHOT_PARAMS serves everything BoardSnapshot needs"""
+    store, data, board_id = _store()
+    _, board_json = store.dispatch('GET', f'/boards/{board_id}', dict(SNAPSHOT_PARAMS))
+    snapshot = BoardSnapshot.from_json(None, board_json)
+    assert len(snapshot.cards) == 50
+    assert sum(len(card.checklists) for card in snapshot.cards) == len(data['checklists'])
+
+    _, projected = store.dispatch('GET', f'/boards/{board_id}/cards', {'fields': 'name'})
+    assert set(projected[0]) == {'id', 'name'}
+
+
+def test_writes_are_recorded_as_actions():
+    """Test that a card move bumps board activity and shows up in /actions?since="""
+    store, data, board_id = _store()
+    before = store.boards[board_id]['dateLastActivity']
+    card, target = data['cards'][0], data['lists'][-1]
+    store.dispatch('PUT', f"/cards/{card['id']}/idList", {'value': target['id']})
+
+    _, actions = store.dispatch('GET', f'/boards/{board_id}/actions', {'since': before})
+    assert actions[0]['type'] == 'updateCard'
+    assert actions[0]['data']['old'] == {'idList': card['idList']}
+    assert store.cards[card['id']]['idList'] == target['id']
+
+    _, batch = store.dispatch('GET', '/batch', {'urls': f"/cards/{card['id']},/cards/{'0' * 24}"})
+    assert batch[0]['200']['idList'] == target['id']
+    assert batch[1]['statusCode'] == 404
+
+
+def test_server_authenticates_counts_and_rate_limits():
+    """Test the HTTP layer: credentials required, stats counted, 429 past the token limit"""
+    store, _, board_id = _store(cards=5)
+    with MockTrelloServer(store, rate_limit=True) as server:
+        service = BaseURLHTTPService(requests.Session(), server.base_url)
+        url = f"{API_BASE_URL}/boards/{board_id}"
+
+        assert service.request('GET', url, params={}).status_code == 401
+        response = service.request('GET', url, params={'key': 'k', 'token': 't'})
+        assert response.json()['id'] == board_id
+        assert response.headers['X-Rate-Limit-Api-Token-Remaining'] == '99'
+
+        statuses = [service.request('GET', url, params={'key': 'k', 'token': 't'}).status_code
+                    for _ in range(100)]
+        assert statuses[-1] == 429
+        assert server.stats()['endpoints']['GET /boards/{board_id}'] == 100
@@ -0,0 +1,71 @@
+"""
+Unit tests for the client-side rate limiter
+"""
+
+from trello_cli import ratelimit
+from trello_cli.ratelimit import TokenBucket, RateLimiter, RateLimitedHTTPService
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class FakeService:
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.calls = 0
+
+    def request(self, method, url, **kwargs):
+        self.calls += 1
+        return FakeResponse(self.statuses.pop(0))
+
+
+def _no_sleep(monkeypatch):
+    """Replace sleeping with a fake clock that jumps forward instead"""
+    clock = [1000.0]
+
+    def sleep(seconds):
+        clock[0] += seconds
+
+    monkeypatch.setattr(ratelimit.time, 'sleep', sleep)
+    monkeypatch.setattr(ratelimit.time, 'monotonic', lambda: clock[0])
+
+
+def test_token_bucket_waits_when_empty(monkeypatch):
+    """Test that an empty bucket reports the time needed for a refill"""
+    _no_sleep(monkeypatch)
+    bucket = TokenBucket(2, 10)
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    assert bucket.acquire() > 0
+
+
+def test_headers_lower_remaining_tokens():
+    """Test that server-reported remaining quota overrides the local estimate"""
+    limiter = RateLimiter('key-headers', 'token-headers')
+    limiter.observe({'x-rate-limit-api-token-remaining': '3'})
+    assert limiter.token_bucket.tokens <= 3
+
+
+def test_retries_429_then_succeeds(monkeypatch):
+    """Test that throttled responses are retried and counted"""
+    _no_sleep(monkeypatch)
+    limiter = RateLimiter('key-429', 'token-429')
+    inner = FakeService([429, 503, 200])
+    response = RateLimitedHTTPService(inner, limiter).request('GET', 'https://api.trello.com/1/cards/c1')
+    assert response.status_code == 200
+    assert inner.calls == 3
+    assert limiter.retries == 2
+    assert 'retries' in limiter.summary()
+
+
+def test_server_errors_not_retried_for_post(monkeypatch):
+    """Test that a POST hitting a 5xx is not replayed"""
+    _no_sleep(monkeypatch)
+    limiter = RateLimiter('key-post', 'token-post')
+    inner = FakeService([502, 200])
+    response = RateLimitedHTTPService(inner, limiter).request('POST', 'https://api.trello.com/1/cards')
+    assert response.status_code == 502
+    assert inner.calls == 1
@@ -0,0 +1,35 @@
+"""
+Unit tests for the compact card/list/label records
+"""
+
+import pytest
+
+from test_snapshot import BOARD_JSON, _card
+from trello_cli.records import CardRecord, ListRecord, LabelRecord
+from trello_cli.snapshot import BoardSnapshot
+
+
+def test_records_are_read_only():
+    """Test that records reject attribute writes and have no instance dict"""
+    card = CardRecord.from_json(_card('c1', 'l1', 'One', 1))
+    with pytest.raises(AttributeError):
+        card.name = 'Other'
+    assert not hasattr(card, '__dict__')
+    assert ListRecord.from_json(BOARD_JSON['lists'][0], 'b1').board_id == 'b1'
+
+
+def test_projected_card_json_gets_defaults():
+    """Test that cards fetched with a few fields decode with py-trello style defaults"""
+    card = CardRecord.from_json({'id': 'c1', 'idList': 'l1'}, board_id='b1')
+    assert (card.name, card.desc, card.due, card.labels, card.checklists) == ('', '', None, (), ())
+    assert card.board_id == 'b1' and card.member_id == ()
+    assert card.field('dueComplete') is False
+    assert card.field('due') == ''
+
+
+def test_snapshot_cards_share_board_label_records():
+    """Test that card labels reuse the board's LabelRecords instead of copies"""
+    snapshot = BoardSnapshot.from_json(None, BOARD_JSON)
+    card_label = snapshot.cards_by_id['c1'].labels[0]
+    assert card_label is snapshot.labels_by_id['lb1']
+    assert card_label == LabelRecord(id='lb1', name='P0', color='red')
@@ -0,0 +1,58 @@
+"""
+Unit tests for the lazy command registry
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from trello_cli import commands
+from trello_cli.registry import COMMANDS, Command, UsageError
+
+
+def test_every_command_resolves():
+    """Test that each registry entry names a real cmd_* function"""
+    for name, entry in COMMANDS.items():
+        if entry.handler is None:
+            assert entry.function in commands.__all__, name
+            assert callable(getattr(commands, entry.function))
+
+
+def test_parse_options_flags_and_optional_arguments():
+    """Test that options and flags are pulled out wherever they appear"""
+    entry = COMMANDS['cards-due-soon']
+    args, kwargs = entry.parse(['--fields', 'id,name', 'b1', '14'])
+    assert args == ['b1', 14]
+    assert kwargs == {'fields': 'id,name'}
+
+    args, kwargs = COMMANDS['bulk-relabel'].parse(['b1', 'red', 'blue', '--dry-run', '--concurrency', '4'])
+    assert args == ['b1', 'red', 'blue']
+    assert kwargs == {'dry_run': True, 'concurrency': 4}
+
+    with pytest.raises(UsageError):
+        Command('cmd_lists', '<board_id>', 1).parse([])
+
+
+def test_arguments_after_double_dash_are_not_flags(monkeypatch):
+    """Test that -- ends flag parsing for global flags and command options alike"""
+    from trello_cli import cli
+    monkeypatch.setattr(cli, 'configure_client', lambda **options: calls.append(options))
+    calls = []
+    monkeypatch.setattr(sys, 'argv', ['trello', '--offline', 'add-comment', 'c1', '--', '--offline'])
+    cli._apply_global_flags()
+    assert sys.argv == ['trello', 'add-comment', 'c1', '--', '--offline']
+    assert calls == [{'offline': True}]
+
+    assert COMMANDS['add-comment'].parse(sys.argv[2:]) == (['c1', '--offline'], {})
+    args, kwargs = COMMANDS['search-cards'].parse(['b1', '--fields', 'id', '--', '--fields'])
+    assert (args, kwargs) == (['b1', '--fields'], {'fields': 'id'})
+
+
+def test_cli_import_skips_api_client():
+    """Test that importing the CLI loads neither command modules nor py-trello"""
+    code = ("import sys, trello_cli.cli; "
+            "print(any(m in sys.modules for m in ('trello', 'requests', 'trello_cli.client', "
+            "'trello_cli.commands.card')))")
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == 'False'
@@ -0,0 +1,146 @@
+"""
+Unit tests for the audit rule engine and its card columns
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from trello_cli import columns as columns_module
+from trello_cli.columns import age_distribution, card_columns
+from trello_cli.mock import generate_board, MockTrello
+from trello_cli.rules import (BoardAuditRule, BoardFrame, RULES, Rule, audit_summary, evaluate,
+                              make_rules)
+
+from test_mirror import _api_snapshot
+
+
+NOW = datetime(2026, 6, 1, tzinfo=timezone.utc)
+
+
+def _board(cards=120, edit=None):
+    store = MockTrello()
+    data = generate_board(cards=cards, seed=3)
+    if edit:
+        edit(data)
+    board_id = store.add_board(data)
+    return _api_snapshot(store, board_id)
+
+
+class CountingRule(Rule):
+    name = 'counting'
+
+    def __init__(self):
+        self.rows = []
+
+    def visit_card(self, frame, i):
+        self.rows.append(i)
+
+    def report(self):
+        return {'rows': self.rows, 'score': 100}
+
+
+def test_all_rules_in_one_pass_match_each_rule_alone():
+    """Test that evaluating every rule together visits each card once and reports as each rule alone"""
+    board = _board()
+    frame = BoardFrame(board, NOW)
+    rules = make_rules() + [CountingRule()]
+    reports = evaluate(frame, rules)
+
+    assert list(reports) == list(RULES) + ['counting']
+    assert reports['counting']['rows'] == list(range(len(frame)))
+    open_cards = sum(len(board.cards_in(lst.id)) for lst in board.lists if not lst.closed)
+    assert len(frame) == open_cards
+    for name in RULES:
+        assert evaluate(BoardFrame(board, NOW), make_rules([name]))[name] == reports[name]
+
+    summary = audit_summary(frame, rules[:-1], reports)
+    assert summary['cards'] == open_cards and list(summary['audits']) == list(RULES)
+    assert summary['score'] == round(sum(reports[name]['score'] for name in RULES) / len(RULES))
+
+
+def test_board_audit_flags_overdue_cards_outside_done():
+    """Test that timezone-aware due dates in the past are reported as overdue"""
+    late = []
+
+    def edit(data):
+        late.append(data['cards'][0]['name'])
+        in_progress = next(lst['id'] for lst in data['lists'] if lst['name'] == 'In Progress')
+        done = next(lst['id'] for lst in data['lists'] if lst['name'] == 'Done')
+        for card in data['cards']:
+            card['due'] = None
+        data['cards'][0].update(idList=in_progress, due='2026-05-20T12:00:00.000Z')
+        data['cards'][1].update(idList=done, due='2026-05-20T12:00:00.000Z')
+        data['cards'][2].update(idList=in_progress, due='2026-06-20T12:00:00.000Z')
+
+    board = _board(edit=edit)
+    report = evaluate(BoardFrame(board, NOW), [BoardAuditRule()])['board-audit']
+    overdue = report['overdue']
+    assert [(item['card'].name, item['days_overdue']) for item in overdue] == [(late[0], 11)]
+    assert overdue[0]['due_date'] == datetime(2026, 5, 20, 12, tzinfo=timezone.utc)
+
+
+def test_make_rules_rejects_unknown_audits():
+    """Test that an unknown audit name is a ValueError naming the choices"""
+    assert [rule.pattern for rule in make_rules(['board-audit'], pattern='^X')] == ['^X']
+    with pytest.raises(ValueError, match='Unknown audit.*nope'):
+        make_rules(['board-health', 'nope'])
+
+
+def test_age_distribution_buckets_and_summary():
+    """Test the age summary of a list of ages, including an empty one"""
+    ages = age_distribution([0, 6, 7, 45, 200, 400, 400])
+    assert dict(ages['buckets']) == {'< 1 week': 2, '1-4 weeks': 1, '1-3 months': 1, '3-6 months': 0,
+                                     '6-12 months': 1, '1 year +': 2}
+    assert (ages['cards'], ages['median'], ages['oldest'], ages['newest']) == (7, 45.0, 400, 0)
+    assert ages['average'] == pytest.approx(1058 / 7)
+    empty = age_distribution([])
+    assert empty['average'] is None and empty['median'] is None and sum(n for _, n in empty['buckets']) == 0
+
+
+def test_columns_agree_with_the_per_card_facts():
+    """Test the Python column metrics against the frame's per-card columns"""
+    board = _board()
+    frame = BoardFrame(board, NOW, use_numpy=False)
+    columns = frame.columns
+    assert columns.backend == 'python'
+    selected = ['done' not in lst.lower for lst in frame.lists]
+    picked = [i for i in range(len(frame)) if 'done' not in frame.card_lists[i].lower]
+
+    assert columns.stale(selected, 30) == ([i for i in picked if frame.age[i] > 30],
+                                           [frame.age[i] for i in picked if frame.age[i] > 30])
+    assert columns.overdue(selected) == ([i for i in picked if frame.overdue_days[i] is not None],
+                                         [frame.overdue_days[i] for i in picked if frame.overdue_days[i] is not None])
+    assert columns.list_sizes() == [0 if lst.closed else lst.size for lst in frame.lists]
+    assert columns.age_distribution(selected) == age_distribution([frame.age[i] for i in picked])
+    assert columns.label_usage() == [sum(label in card.labels for card in frame.cards) for label in frame.labels]
+    incomplete = [i for i in picked if frame.completed[i] < frame.items[i]]
+    assert incomplete and columns.incomplete_checklists(selected) == (
+        incomplete, [frame.items[i] for i in incomplete], [frame.completed[i] for i in incomplete])
+
+
+def test_numpy_columns_match_the_python_fallback():
+    """Test that both backends give the same metrics and reports"""
+    pytest.importorskip('numpy')
+
+    def edit(data):
+        data['cards'][0]['id'] = 'zz' + data['cards'][0]['id'][2:]
+
+    board = _board(cards=400, edit=edit)
+    frames = [BoardFrame(board, NOW, use_numpy=use) for use in (False, True)]
+    assert [frame.columns.backend for frame in frames] == ['python', 'numpy']
+    selected = ['done' not in lst.lower for lst in frames[0].lists]
+    python, fast = ((frame.columns.stale(selected, 30), frame.columns.overdue(selected),
+                     frame.columns.list_sizes(), frame.columns.age_distribution(selected),
+                     frame.columns.label_usage(), frame.columns.incomplete_checklists(selected))
+                    for frame in frames)
+    assert fast == python
+    assert evaluate(frames[1], make_rules()) == evaluate(frames[0], make_rules())
+
+
+def test_numpy_backend_needs_numpy(monkeypatch):
+    """Test that asking for NumPy without it installed is a ValueError"""
+    monkeypatch.setattr(columns_module, 'numpy', None)
+    assert card_columns(BoardFrame(_board(cards=5), NOW)).backend == 'python'
+    with pytest.raises(ValueError, match='NumPy is not installed'):
+        card_columns(BoardFrame(_board(cards=5), NOW), use_numpy=True)
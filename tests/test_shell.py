@@ -0,0 +1,112 @@
+"""
+Unit tests for trello shell: name resolution, completion and incremental refresh
+"""
+
+from trello_cli.client import TrelloClient
+from trello_cli.commands.shell import TrelloShell, usage_arguments
+from trello_cli.mock import generate_board, MockTrello
+from trello_cli.registry import COMMANDS
+from trello_cli.snapshot import BoardSnapshot, SNAPSHOT_PARAMS
+
+
+class StorePyTrello:
+    """Answers fetch_json from a MockTrello store and records the paths"""
+
+    def __init__(self, store):
+        self.store = store
+        self.paths = []
+
+    def fetch_json(self, uri_path, http_method='GET', query_params=None, **kwargs):
+        self.paths.append(uri_path)
+        _, payload = self.store.dispatch(http_method, uri_path, dict(query_params or {}))
+        return payload
+
+
+def _board(cards=30):
+    store = MockTrello()
+    data = generate_board(cards=cards, seed=11)
+    board_id = store.add_board(data)
+    _, board_json = store.dispatch('GET', f'/boards/{board_id}', dict(SNAPSHOT_PARAMS))
+    return store, BoardSnapshot.from_json(None, board_json)
+
+
+def _shell(snapshot):
+    shell = TrelloShell()
+    shell.snapshot = snapshot
+    shell._boards = [(snapshot.id, snapshot.name), ('f' * 24, 'Other board')]
+    return shell
+
+
+def test_usage_arguments_reads_angle_and_quoted_names():
+    """Test that placeholders are read from registry usage strings"""
+    assert usage_arguments('<card_id> <list_id>') == ['card_id', 'list_id']
+    assert usage_arguments('<card_id> "color" ["name"]') == ['card_id', 'color', 'name']
+
+
+def test_arguments_default_to_the_loaded_board_and_accept_names():
+    """Test that board IDs are filled in and card/list names become IDs"""
+    _, snapshot = _board()
+    shell = _shell(snapshot)
+    card, target = snapshot.cards[0], snapshot.open_lists()[-1]
+
+    assert shell.resolve_arguments(COMMANDS['board-overview'], []) == [snapshot.id]
+    assert shell.resolve_arguments(COMMANDS['cards-overdue'], ['--fields', 'all']) == \
+        [snapshot.id, '--fields', 'all']
+    assert shell.resolve_arguments(COMMANDS['move-card'], [card.name.upper(), target.name]) == \
+        [card.id, target.id]
+    assert shell.resolve_arguments(COMMANDS['show-card'], [f'#{card.idShort}']) == [card.id]
+    # Unknown names and explicit IDs pass through for the command to report
+    assert shell.resolve_arguments(COMMANDS['show-card'], ['no such card']) == ['no such card']
+    assert shell.resolve_arguments(COMMANDS['show-card'], ['a' * 24]) == ['a' * 24]
+    assert shell.resolve_arguments(COMMANDS['migrate-cards'], [target.name, 'Other board']) == \
+        [target.id, 'f' * 24]
+
+
+def test_completion_offers_names_from_the_loaded_board():
+    """Test completion of commands, options, list/card/label names and quoted names"""
+    _, snapshot = _board()
+    shell = _shell(snapshot)
+    lst = snapshot.open_lists()[0]
+    card = next(card for card in snapshot.cards if ' ' in card.name)
+
+    assert 'move-card ' in shell.completenames('move-')
+    assert shell.completedefault('--dr', 'bulk-relabel --dr', 18, 22) == ['--dry-run']
+
+    line = f'move-card {card.id} {lst.name[:2]}'
+    matches = shell.completedefault(lst.name[:2], line, line.rindex(' ') + 1, len(line))
+    assert f'"{lst.name}" ' in matches or f'{lst.name} ' in matches
+
+    first_word, rest = card.name.split(' ', 1)
+    line = f'show-card "{first_word} {rest[:1]}'
+    begidx = line.rindex(' ') + 1
+    matches = shell.completedefault(rest[:1], line, begidx, len(line))
+    assert f'{rest}" ' in matches
+
+    label = next(label for label in snapshot.labels if label.name)
+    line = f'remove-label {card.id} {label.name[:1]}'
+    matches = shell.completedefault(label.name[:1], line, line.rindex(' ') + 1, len(line))
+    assert any(match.strip('" ') == label.name for match in matches)
+
+
+def test_update_board_snapshot_applies_only_changed_cards():
+    """Test that a refresh refetches just the cards named by new actions"""
+    store, snapshot = _board()
+    client = object.__new__(TrelloClient)
+    client.client = StorePyTrello(store)
+
+    assert client.update_board_snapshot(snapshot) == (snapshot, 0)
+
+    moved, archived = snapshot.cards[0], snapshot.cards[1]
+    target = snapshot.open_lists()[-1]
+    store.dispatch('PUT', f'/cards/{moved.id}/idList', {'value': target.id})
+    store.dispatch('PUT', f'/cards/{archived.id}/closed', {'value': 'true'})
+    client.client.paths.clear()
+
+    updated, changes = client.update_board_snapshot(snapshot)
+    assert changes == 2
+    assert client.client.paths == [f'/boards/{snapshot.id}/actions', '/batch']
+    assert updated.cards_by_id[moved.id].idList == target.id
+    assert archived.id not in updated.cards_by_id
+    assert len(updated.cards) == len(snapshot.cards) - 1
+    assert updated.date_last_activity == store.boards[snapshot.id]['dateLastActivity']
+    assert client.update_board_snapshot(updated)[1] == 0
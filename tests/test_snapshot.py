@@ -0,0 +1,68 @@
+"""
+Unit tests for the single-request board snapshot
+"""
+
+from trello_cli.snapshot import BoardSnapshot
+
+
+def _card(card_id, list_id, name, pos, members=None, labels=None, checklists=None):
+    return {
+        'id': card_id, 'name': name, 'desc': '', 'due': None, 'dueComplete': False,
+        'closed': False, 'url': f'https://trello.com/c/{card_id}', 'pos': pos,
+        'shortUrl': f'https://trello.com/c/{card_id}', 'idMembers': members or [],
+        'idLabels': [l['id'] for l in labels or []], 'labels': labels or [],
+        'idBoard': 'b1', 'idList': list_id, 'idShort': 1,
+        'badges': {'checkItems': 0, 'comments': 0, 'attachments': 0},
+        'idChecklists': checklists or [],
+        'dateLastActivity': '2025-01-01T00:00:00.000Z',
+    }
+
+
+BOARD_JSON = {
+    'id': 'b1', 'name': 'Board', 'desc': '', 'closed': False,
+    'url': 'https://trello.com/b/b1', 'dateLastActivity': '2025-01-02T00:00:00.000Z',
+    'lists': [
+        {'id': 'l1', 'name': 'To Do', 'closed': False, 'pos': 1},
+        {'id': 'l2', 'name': 'Old', 'closed': True, 'pos': 2},
+    ],
+    'cards': [
+        _card('c2', 'l1', 'Second', 20, members=['m1']),
+        _card('c1', 'l1', 'First', 10, labels=[{'id': 'lb1', 'name': 'P0', 'color': 'red'}],
+              checklists=['cl1']),
+        _card('c3', 'l2', 'Archived list card', 5),
+    ],
+    'checklists': [
+        {'id': 'cl1', 'idCard': 'c1', 'name': 'DoD', 'pos': 1,
+         'checkItems': [{'id': 'i1', 'name': 'Tests', 'state': 'complete', 'pos': 1}]},
+    ],
+    'labels': [{'id': 'lb1', 'name': 'P0', 'color': 'red'}],
+    'members': [{'id': 'm1', 'fullName': 'Ada Lovelace', 'username': 'ada'}],
+}
+
+
+def test_snapshot_indexes_resources():
+    """Test that every resource is indexed by ID"""
+    snapshot = BoardSnapshot.from_json(None, BOARD_JSON)
+    assert snapshot.name == 'Board'
+    assert set(snapshot.lists_by_id) == {'l1', 'l2'}
+    assert set(snapshot.cards_by_id) == {'c1', 'c2', 'c3'}
+    assert snapshot.labels_by_id['lb1'].color == 'red'
+    assert snapshot.members_by_id['m1'].username == 'ada'
+
+
+def test_snapshot_groups_cards_by_list_in_order():
+    """Test that cards are grouped per list and sorted by position"""
+    snapshot = BoardSnapshot.from_json(None, BOARD_JSON)
+    assert [c.name for c in snapshot.cards_in('l1')] == ['First', 'Second']
+    assert snapshot.cards_in('missing') == []
+    assert [lst.id for lst in snapshot.open_lists()] == ['l1']
+
+
+def test_snapshot_joins_checklists_and_members():
+    """Test that checklists and members are resolved without extra requests"""
+    snapshot = BoardSnapshot.from_json(None, BOARD_JSON)
+    first = snapshot.cards_by_id['c1']
+    assert [cl.name for cl in first.checklists] == ['DoD']
+    assert first.checklists[0].items[0]['checked'] is True
+    assert snapshot.cards_by_id['c2'].checklists == ()
+    assert [m.full_name for m in snapshot.members_of(snapshot.cards_by_id['c2'])] == ['Ada Lovelace']
@@ -0,0 +1,73 @@
+"""
+Unit tests for --trace request tracing
+"""
+
+import json
+
+from trello_cli.ratelimit import RateLimiter, RateLimitedHTTPService
+from trello_cli.trace import Tracer, TracingHTTPService, AttemptRecorder, endpoint_template
+
+from test_ratelimit import FakeService, _no_sleep
+
+
+CARD_ID = '5f1e2d3c4b5a697887766554'
+
+
+def _traced(statuses, tracer, limiter):
+    """Tracing -> rate limiter -> attempt recorder -> fake session, like the client"""
+    inner = AttemptRecorder(FakeService(statuses), tracer)
+    return TracingHTTPService(RateLimitedHTTPService(inner, limiter), tracer)
+
+
+# Stands in for a command function in trello_cli.commands issuing two requests
+_FAKE_COMMAND = """
+def cmd_fake(service, card_id):
+    service.request('GET', 'https://api.trello.com/1/cards/' + card_id)
+    service.request('GET', 'https://api.trello.com/1/cards/' + card_id + '/actions')
+"""
+_namespace = {'__name__': 'trello_cli.commands.fake'}
+exec(_FAKE_COMMAND, _namespace)
+cmd_fake = _namespace['cmd_fake']
+
+
+def test_endpoint_template_collapses_ids():
+    """Test that object IDs are collapsed so totals group by endpoint"""
+    assert endpoint_template(f'/cards/{CARD_ID}/actions') == '/cards/{id}/actions'
+    assert endpoint_template('/members/me/boards') == '/members/me/boards'
+
+
+def test_span_records_status_and_retries(monkeypatch):
+    """Test that one span covers a request and its 429 retry"""
+    _no_sleep(monkeypatch)
+    tracer = Tracer('trello show-card')
+    service = _traced([429, 200], tracer, RateLimiter('key-trace', 'token-trace'))
+    service.request('GET', f'https://api.trello.com/1/cards/{CARD_ID}')
+
+    assert len(tracer.spans) == 1
+    span = tracer.spans[0]
+    assert span.status == 200
+    assert span.retries == 1
+    assert span.endpoint == 'GET /cards/{id}'
+    totals = tracer.totals()
+    assert totals['requests'] == 1
+    assert totals['network_requests'] == 2
+
+
+def test_tree_groups_requests_by_caller(monkeypatch):
+    """Test that requests hang under the function that issued them"""
+    _no_sleep(monkeypatch)
+    tracer = Tracer('trello card-log')
+    cmd_fake(_traced([200, 200], tracer, RateLimiter('key-tree', 'token-tree')), CARD_ID)
+
+    tree = tracer.tree()
+    assert len(tree['children']) == 1
+    node = tree['children'][0]
+    assert node['name'] == 'commands.fake.cmd_fake'
+    assert len(node['spans']) == 2
+
+    exported = tracer.to_json()
+    assert exported['tree'][0]['requests'] == 2
+    chrome = tracer.to_chrome()
+    assert {event['cat'] for event in chrome['traceEvents']} == {'command', 'call', 'http'}
+    json.dumps(chrome)
+    assert 'GET /cards/{id}/actions' in tracer.format_text()
@@ -0,0 +1,175 @@
+"""
+Unit tests for the webhook receiver, driven by replayed payloads
+"""
+
+import json
+
+import pytest
+import requests
+
+from trello_cli.cache import ResponseCache
+from trello_cli.client import TrelloClient
+from trello_cli.mirror import Mirror, sync_board
+from trello_cli.mock import generate_board, MockTrello
+from trello_cli.webhooks import SIGNATURE_HEADER, WebhookReceiver, WebhookServer, affected_ids, signature
+
+from test_mirror import StorePyTrello, _api_snapshot
+
+
+class WritingPyTrello(StorePyTrello):
+    """StorePyTrello that also passes post_args, as py-trello sends them"""
+
+    resource_owner_key = 'token'
+
+    def fetch_json(self, uri_path, http_method='GET', query_params=None, post_args=None, **kwargs):
+        return super().fetch_json(uri_path, http_method, dict(query_params or {}, **(post_args or {})))
+
+
+def _setup(tmp_path, cards=30):
+    store = MockTrello()
+    data = generate_board(cards=cards, seed=11)
+    board_id = store.add_board(data)
+    client = object.__new__(TrelloClient)
+    client.client = WritingPyTrello(store)
+    mirror = Mirror(tmp_path / 'mirror.db')
+    sync_board(client, mirror, board_id)
+    return store, data, board_id, client, mirror
+
+
+def _payloads(store, board_id, since):
+    """Webhook deliveries for the store's actions after the first `since`"""
+    return [{'action': action, 'model': {'id': board_id}} for action in store.actions[board_id][since:]]
+
+
+def test_affected_ids_lists_cards_and_lists_first():
+    """Test that a card move names the card, its list and both ends of the move"""
+    action = {'type': 'updateCard', 'data': {
+        'board': {'id': 'b'}, 'card': {'id': 'c', 'idList': 'l2'},
+        'listBefore': {'id': 'l1'}, 'listAfter': {'id': 'l2'}}}
+    assert affected_ids(action) == ['c', 'l2', 'l1']
+    assert affected_ids({'type': 'updateBoard', 'data': {'board': {'id': 'b'}}}) == []
+
+
+def test_cache_invalidation_drops_only_the_affected_responses(tmp_path):
+    """Test that a card action drops responses mentioning the card and the board's actions only"""
+    cache = ResponseCache(tmp_path / 'responses.db')
+    base = 'https://api.trello.com/1'
+    cache.put('card', f'{base}/cards/c1', b'{"id": "c1"}')
+    cache.put('list', f'{base}/lists/l1/cards', b'[{"id": "c1"}, {"id": "c2"}]')
+    cache.put('other', f'{base}/lists/l2/cards', b'[{"id": "c3"}]')
+    cache.put('actions', f'{base}/boards/b1/actions', b'[]')
+    cache.put('board', f'{base}/boards/b1', b'{"id": "b1"}')
+
+    receiver = WebhookReceiver(cache=cache)
+    result = receiver.apply({'action': {'id': 'a1', 'type': 'commentCard', 'data': {
+        'board': {'id': 'b1'}, 'card': {'id': 'c1'}, 'text': 'hi'}}})
+    assert result['invalidated'] == 3
+    assert [key for key in ('card', 'list', 'other', 'actions', 'board') if cache.get(key)] == ['other', 'board']
+
+    # A board rename names no card or list, so the whole board goes
+    receiver.apply({'action': {'id': 'a2', 'type': 'updateBoard', 'data': {'board': {'id': 'b1', 'name': 'X'}}}})
+    assert cache.get('board') is None and cache.get('other') is not None
+
+
+def test_replayed_payloads_patch_the_mirror_like_a_sync(tmp_path):
+    """Test that card edits, moves, archives, labels and comments reach the mirror without fetching"""
+    store, data, board_id, client, mirror = _setup(tmp_path)
+    cards = data['cards']
+    since = len(store.actions[board_id])
+    label = next(label for label in data['labels'] if label['id'] not in cards[3]['idLabels'])
+    store.dispatch('PUT', f"/cards/{cards[0]['id']}/idList", {'value': data['lists'][-1]['id']})
+    store.dispatch('PUT', f"/cards/{cards[1]['id']}/closed", {'value': 'true'})
+    store.dispatch('PUT', f"/cards/{cards[2]['id']}/name", {'value': 'Renamed by webhook'})
+    store.dispatch('POST', f"/cards/{cards[3]['id']}/idLabels", {'value': label['id']})
+    store.dispatch('POST', f"/cards/{cards[4]['id']}/actions/comments", {'text': 'heliotrope'})
+    store.dispatch('DELETE', f"/cards/{cards[5]['id']}")
+    new = store.dispatch('POST', '/cards', {'idList': data['lists'][0]['id'], 'name': 'Made elsewhere'})[1]
+
+    receiver = WebhookReceiver(mirror=mirror)
+    results = [receiver.apply(payload) for payload in _payloads(store, board_id, since)]
+    assert [result['mirror'] for result in results] == ['applied'] * 7
+
+    mirrored = mirror.load_snapshot(board_id)
+    fresh = _api_snapshot(store, board_id)
+    edited = [card['id'] for card in cards[:5]]
+    assert {i: mirrored.cards_by_id.get(i) for i in edited} == {i: fresh.cards_by_id.get(i) for i in edited}
+    assert cards[5]['id'] not in mirrored.cards_by_id
+    assert mirrored.cards_by_id[new['id']].name == 'Made elsewhere'
+    assert [r['id'] for r in mirror.search('heliotrope')] == [cards[4]['id']]
+
+    # Redelivered actions are skipped
+    assert receiver.apply(_payloads(store, board_id, since)[0])['mirror'] == 'duplicate'
+    assert receiver.stats() == {'received': 8, 'invalidated': 0, 'mirrored': 7, 'pending': 0}
+
+
+def test_actions_only_a_sync_can_apply_are_left_pending(tmp_path):
+    """Test that a checklist change is reported pending and leaves the sync position alone"""
+    store, data, board_id, client, mirror = _setup(tmp_path, cards=5)
+    position = mirror.sync_position(board_id)
+    receiver = WebhookReceiver(mirror=mirror)
+    result = receiver.apply({'action': {'id': 'a1', 'type': 'updateCheckItemStateOnCard', 'data': {
+        'board': {'id': board_id}, 'card': {'id': data['cards'][0]['id']},
+        'checklist': {'id': 'cl'}, 'checkItem': {'id': 'ci', 'state': 'complete'}}}})
+    assert result['mirror'] == 'pending' and receiver.stats()['pending'] == 1
+    assert mirror.sync_position(board_id) == position
+
+    other = WebhookReceiver(mirror=mirror).apply({'action': {'type': 'updateBoard', 'data': {'board': {'id': 'x'}}}})
+    assert other['mirror'] == 'not mirrored'
+    with pytest.raises(ValueError):
+        receiver.apply({'model': {'id': board_id}})
+
+
+def test_server_verifies_signatures_and_applies_posts(tmp_path):
+    """Test the HTTP receiver: HEAD for registration, signed POSTs, stats on GET"""
+    cache = ResponseCache(tmp_path / 'responses.db')
+    cache.put('card', 'https://api.trello.com/1/cards/c1', b'{"id": "c1"}')
+    callback = 'https://example.test/trello'
+    receiver = WebhookReceiver(cache=cache, secret='s3cret', callback_url=callback)
+    seen = []
+    with WebhookServer(receiver, port=0, on_result=seen.append) as server:
+        assert requests.head(server.url).status_code == 200
+
+        body = json.dumps({'action': {'id': 'a1', 'type': 'updateCard', 'data': {
+            'board': {'id': 'b1'}, 'card': {'id': 'c1', 'name': 'x'}, 'old': {'name': 'y'}}}}).encode()
+        assert requests.post(server.url, data=body, headers={SIGNATURE_HEADER: 'forged'}).status_code == 401
+        response = requests.post(server.url, data=body,
+                                 headers={SIGNATURE_HEADER: signature('s3cret', body, callback)})
+        assert response.status_code == 200 and response.json()['invalidated'] == 1
+        assert requests.post(server.url, data=b'not json', headers={
+            SIGNATURE_HEADER: signature('s3cret', b'not json', callback)}).status_code == 400
+        assert requests.get(server.url).json()['received'] == 1
+    assert [result['objects'] for result in seen] == [['c1']]
+    assert cache.get('card') is None
+
+
+def test_serve_requires_a_secret_unless_verification_is_turned_off(monkeypatch, capsys):
+    """Test that webhook serve refuses unsigned deliveries without an explicit --no-verify"""
+    from trello_cli import commands
+    from trello_cli.registry import COMMANDS
+
+    with pytest.raises(ValueError):
+        commands.cmd_webhook_serve(port=0)
+
+    monkeypatch.delenv('TRELLO_WEBHOOK_SECRET', raising=False)
+    served = []
+    monkeypatch.setattr(commands, 'cmd_webhook_serve', lambda **kwargs: served.append(kwargs))
+    for argv in (['serve'], ['serve', '--callback-url', 'https://example.test/trello'],
+                 ['serve', '--secret', 's3cret', '--callback-url', 'https://example.test/trello', '--no-verify']):
+        with pytest.raises(SystemExit):
+            COMMANDS['webhook'].run('webhook', argv)
+    assert '--no-verify' in capsys.readouterr().out
+
+    COMMANDS['webhook'].run('webhook', ['serve', '--no-verify'])
+    COMMANDS['webhook'].run('webhook', ['serve', '--secret', 's3cret', '--callback-url', 'https://example.test/trello'])
+    assert [(kwargs['secret'], kwargs['verify']) for kwargs in served] == [(None, False), ('s3cret', True)]
+
+
+def test_client_registers_lists_and_removes_webhooks(tmp_path):
+    """Test the webhook registration helpers against the mock API"""
+    store, data, board_id, client, mirror = _setup(tmp_path, cards=1)
+    webhook = client.create_webhook(board_id, 'https://example.test/hook', 'cli')
+    assert [(w['idModel'], w['callbackURL']) for w in client.list_webhooks()] == [(board_id, 'https://example.test/hook')]
+    client.delete_webhook(webhook['id'])
+    assert client.list_webhooks() == []
+    with pytest.raises(Exception, match='Failed to delete webhook'):
+        client.delete_webhook(webhook['id'])
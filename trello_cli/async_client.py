@@ -0,0 +1,137 @@
+"""
+Asyncio Trello API client for fetching independent resources concurrently
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from trello import Board, List, Card
+
+from .client import get_client
+from .snapshot import BoardSnapshot, SNAPSHOT_PARAMS
+
+
+# Default number of requests in flight at once
+DEFAULT_CONCURRENCY = 8
+
+
+class AsyncTrelloClient:
+    """
+    Async counterpart of TrelloClient with the same get_board / get_list /
+    get_card / list_boards surface.
+
+    Requests run on the synchronous client's transport (keep-alive session
+    pool, rate limiter and response cache) in worker threads, with at most
+    `max_concurrency` in flight. Use as an async context manager:
+
+        async with AsyncTrelloClient() as client:
+            board, cards = await asyncio.gather(client.get_board(a), client.get_card(b))
+    """
+
+    def __init__(self, client=None, max_concurrency=DEFAULT_CONCURRENCY):
+        self.sync_client = client or get_client()
+        self.max_concurrency = max_concurrency
+        self._semaphore = None
+        self._executor = None
+
+    async def __aenter__(self):
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._executor.shutdown(wait=True)
+        self._executor = None
+
+    @property
+    def _py_client(self):
+        return self.sync_client.client
+
+    async def _run(self, func):
+        """Run a blocking call in the worker pool, waiting for a free slot first"""
+        if self._executor is None:
+            raise RuntimeError("AsyncTrelloClient must be used with 'async with'")
+        loop = asyncio.get_running_loop()
+        async with self._semaphore:
+            return await loop.run_in_executor(self._executor, func)
+
+    async def fetch_json(self, uri_path, query_params=None):
+        """GET an API path"""
+        return await self._run(
+            lambda: self._py_client.fetch_json(uri_path, query_params=query_params or {}))
+
+    async def get_board(self, board_id):
+        """Get board by ID"""
+        try:
+            json_obj = await self.fetch_json('/boards/' + board_id)
+            return Board.from_json(self._py_client, json_obj=json_obj)
+        except Exception as e:
+            raise Exception(f"Failed to get board {board_id}: {str(e)}")
+
+    async def get_list(self, list_id):
+        """Get list by ID"""
+        try:
+            list_json = await self.fetch_json('/lists/' + list_id)
+            board = await self.get_board(list_json['idBoard'])
+            return List.from_json(board, list_json)
+        except Exception as e:
+            raise Exception(f"Failed to get list {list_id}: {str(e)}")
+
+    async def get_card(self, card_id):
+        """Get card by ID (its list and board are fetched concurrently)"""
+        try:
+            card_json = await self.fetch_json('/cards/' + card_id, {'customFieldItems': 'true'})
+            list_json, board = await asyncio.gather(
+                self.fetch_json('/lists/' + card_json['idList']),
+                self.get_board(card_json['idBoard'])
+            )
+            return Card.from_json(List.from_json(board, list_json), card_json)
+        except Exception as e:
+            raise Exception(f"Failed to get card {card_id}: {str(e)}")
+
+    async def list_boards(self):
+        """List all boards"""
+        try:
+            json_obj = await self.fetch_json('/members/me/boards', {'filter': 'all'})
+            return [Board.from_json(self._py_client, json_obj=obj) for obj in json_obj]
+        except Exception as e:
+            raise Exception(f"Failed to list boards: {str(e)}")
+
+    async def get_board_snapshot(self, board_id, card_filter='open', card_fields=None):
+        """
+        Get the same BoardSnapshot as TrelloClient.get_board_snapshot(), but
+        with lists, cards, checklists and labels fetched as concurrent
+        requests instead of one large nested response. Members come from
+        the board's member directory, as in the sync client.
+        """
+        base = '/boards/' + board_id
+        fields = ','.join(card_fields) if card_fields else 'all'
+        try:
+            board_json, lists, cards, checklists, labels = await asyncio.gather(
+                self.fetch_json(base, {'fields': SNAPSHOT_PARAMS['fields']}),
+                self.fetch_json(base + '/lists', {'filter': SNAPSHOT_PARAMS['lists']}),
+                self.fetch_json(base + '/cards', {'filter': card_filter, 'fields': fields}),
+                self.fetch_json(base + '/checklists'),
+                self.fetch_json(base + '/labels', {'limit': SNAPSHOT_PARAMS['labels_limit']}),
+            )
+        except Exception as e:
+            raise Exception(f"Failed to get board {board_id}: {str(e)}")
+
+        json_obj = dict(board_json, lists=lists, cards=cards, checklists=checklists, labels=labels)
+        snapshot = BoardSnapshot.from_json(self._py_client, json_obj)
+        if not card_fields:
+            await self._run(lambda: self.sync_client.attach_member_directory(snapshot))
+        return snapshot
+
+
+def get_board_snapshot_concurrently(board_id, card_filter='open', card_fields=None):
+    """Blocking helper for commands: fetch a board snapshot via AsyncTrelloClient"""
+    if get_client().offline:
+        # Nothing to fetch concurrently: the board comes from the local mirror
+        return get_client().get_board_snapshot(board_id, card_filter, card_fields)
+
+    async def fetch():
+        async with AsyncTrelloClient() as client:
+            return await client.get_board_snapshot(board_id, card_filter, card_fields)
+
+    return asyncio.run(fetch())
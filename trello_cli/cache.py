@@ -0,0 +1,368 @@
+"""
+Persistent HTTP response cache for Trello API reads
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+
+CACHE_DIR = Path.home() / '.trellocli' / 'cache'
+CACHE_DB = CACHE_DIR / 'responses.db'
+
+# Size cap for stored response bodies; least recently used entries are evicted
+MAX_CACHE_BYTES = 64 * 1024 * 1024
+
+# Seconds a cached response is served without contacting Trello, by the
+# first path segment of the endpoint. Board-scoped entries are revalidated
+# with a cheap dateLastActivity probe once their TTL runs out.
+RESOURCE_TTLS = {
+    'boards': 30,
+    'lists': 120,
+    'cards': 60,
+    'checklists': 60,
+    'labels': 300,
+    'members': 3600,
+    'organizations': 3600,
+    'actions': 30,
+}
+DEFAULT_TTL = 60
+
+# A board's dateLastActivity probe is reused for this many seconds (the
+# shortest TTL), so long-lived callers (daemon, shell, batch) re-probe
+PROBE_TTL = min(RESOURCE_TTLS.values())
+
+# Query parameters that identify the caller, not the resource
+_AUTH_PARAMS = ('key', 'token')
+
+# A cache hit only rewrites accessed_at (the LRU order) once it is this many
+# seconds old, so repeated reads don't each pay for a write transaction
+TOUCH_INTERVAL = 60
+
+# Trello object IDs: 24 hex digits
+_OBJECT_ID = re.compile(r'[0-9a-fA-F]{24}')
+
+
+class CachedResponse:
+    """Minimal stand-in for requests.Response served from the cache"""
+
+    status_code = 200
+
+    def __init__(self, body, url):
+        self.content = body
+        self.url = url
+        self.headers = {'X-Trello-CLI-Cache': 'hit'}
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8')
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class ResponseCache:
+    """
+    SQLite-backed store of GET response bodies keyed by endpoint + params.
+
+    Safe to share between threads.
+    """
+
+    def __init__(self, path=None, max_bytes=MAX_CACHE_BYTES):
+        self.path = Path(path) if path else CACHE_DB
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                board_id TEXT,
+                board_activity TEXT,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS responses_lru ON responses (accessed_at);
+            CREATE TABLE IF NOT EXISTS board_activity (
+                board_id TEXT PRIMARY KEY,
+                activity TEXT NOT NULL
+            );
+        """)
+
+    @staticmethod
+    def make_key(url, params):
+        """Cache key for a GET request, ignoring credentials"""
+        items = sorted((str(k), str(v)) for k, v in (params or {}).items()
+                       if k not in _AUTH_PARAMS)
+        return hashlib.sha256(json.dumps([url, items]).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def resource_of(url):
+        """Return (resource_type, board_id) for an API URL"""
+        parts = [p for p in urlsplit(url).path.split('/') if p]
+        if parts and parts[0] == '1':
+            parts = parts[1:]
+        if not parts:
+            return None, None
+        board_id = parts[1] if parts[0] == 'boards' and len(parts) > 1 else None
+        return parts[0], board_id
+
+    def get(self, key):
+        """Return the cached row (dict) for a key, or None"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT url, board_id, board_activity, body, stored_at, accessed_at "
+                "FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+        if not row:
+            return None
+        return {
+            'url': row[0], 'board_id': row[1], 'board_activity': row[2],
+            'body': row[3], 'stored_at': row[4], 'accessed_at': row[5]
+        }
+
+    def record_lookup(self, hit):
+        """Count a cache hit or miss (callable from any thread)"""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def touch(self, key, revalidated=False, accessed_at=None):
+        """
+        Mark an entry as recently used (and optionally fresh again)
+
+        Args:
+            accessed_at: The entry's last use; unless revalidated, nothing is
+                         written while it is less than TOUCH_INTERVAL old
+        """
+        now = time.time()
+        if not revalidated and accessed_at is not None and now - accessed_at < TOUCH_INTERVAL:
+            return
+        with self._lock:
+            if revalidated:
+                self._db.execute(
+                    "UPDATE responses SET accessed_at = ?, stored_at = ? WHERE key = ?",
+                    (now, now, key))
+            else:
+                self._db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self._db.commit()
+
+    def put(self, key, url, body):
+        """Store a response body and evict old entries beyond the size cap"""
+        resource, board_id = self.resource_of(url)
+        activity = None
+        if board_id:
+            activity = self._activity_from_body(board_id, body) or self.board_activity(board_id)
+
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, board_id, activity, body, len(body), now, now))
+            if board_id and activity:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO board_activity VALUES (?, ?)", (board_id, activity))
+            self._evict()
+            self._db.commit()
+
+    def delete(self, key):
+        with self._lock:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._db.commit()
+
+    def clear(self):
+        """Drop every cached response"""
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.execute("DELETE FROM board_activity")
+            self._db.commit()
+
+    def invalidate(self, object_ids, board_id=None, whole_board=False):
+        """
+        Drop the responses whose URL or body mentions any of object_ids
+        (cards, lists, ...), plus the action listings of board_id, or every
+        response scoped to board_id with whole_board. Without board_id, the
+        action listings of the boards those responses belonged to are dropped.
+
+        Returns:
+            Number of responses dropped
+        """
+        with self._lock:
+            before = self._db.total_changes
+            boards = set()
+            for object_id in object_ids:
+                if board_id is None:
+                    boards.update(row[0] for row in self._db.execute(
+                        "SELECT DISTINCT board_id FROM responses WHERE board_id IS NOT NULL "
+                        "AND (instr(url, ?) > 0 OR instr(body, ?) > 0)",
+                        (object_id, object_id.encode('utf-8'))))
+                self._db.execute("DELETE FROM responses WHERE instr(url, ?) > 0 OR instr(body, ?) > 0",
+                                 (object_id, object_id.encode('utf-8')))
+            if board_id and whole_board:
+                self._db.execute("DELETE FROM responses WHERE board_id = ?", (board_id,))
+            else:
+                for board in filter(None, boards | {board_id}):
+                    self._db.execute("DELETE FROM responses WHERE instr(url, ?) > 0",
+                                     (f"/boards/{board}/actions",))
+            self._db.commit()
+            return self._db.total_changes - before
+
+    def board_activity(self, board_id):
+        """Last known dateLastActivity for a board"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT activity FROM board_activity WHERE board_id = ?", (board_id,)).fetchone()
+        return row[0] if row else None
+
+    def set_board_activity(self, board_id, activity):
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO board_activity VALUES (?, ?)", (board_id, activity))
+            self._db.commit()
+
+    def stats(self):
+        """Return entry count and total size in bytes"""
+        with self._lock:
+            count, size = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return {'entries': count, 'bytes': size, 'max_bytes': self.max_bytes, 'path': str(self.path)}
+
+    def _evict(self):
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        while total > self.max_bytes:
+            row = self._db.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at LIMIT 1").fetchone()
+            if not row:
+                break
+            self._db.execute("DELETE FROM responses WHERE key = ?", (row[0],))
+            total -= row[1]
+
+    @staticmethod
+    def _activity_from_body(board_id, body):
+        try:
+            obj = json.loads(body)
+        except ValueError:
+            return None
+        if isinstance(obj, dict) and obj.get('id') == board_id:
+            return obj.get('dateLastActivity')
+        return None
+
+
+def written_ids(url, params):
+    """
+    IDs of the objects a write request names: in its path (the card, list or
+    board written) and in its parameters (idList, idBoard, value, ...)
+    """
+    values = [p for p in urlsplit(url).path.split('/') if p]
+    for name, value in (params or {}).items():
+        if name not in _AUTH_PARAMS and isinstance(value, str):
+            values.extend(value.split(','))
+    return list(dict.fromkeys(v for v in values if _OBJECT_ID.fullmatch(v)))
+
+
+class CachingHTTPService:
+    """
+    Wraps the HTTP service handed to py-trello (anything with a requests-style
+    request() method) and serves GET responses from a ResponseCache.
+
+    A successful write (POST/PUT/DELETE) drops the cached responses that
+    mention the objects it names, so a read after a write from this CLI is
+    never stale; writes that name no object drop the whole cache.
+    """
+
+    def __init__(self, inner, cache, refresh=False):
+        self.inner = inner
+        self.cache = cache
+        self.refresh = refresh
+        self._probed = {}
+
+    def request(self, method, url, params=None, **kwargs):
+        if method != 'GET':
+            response = self.inner.request(method, url, params=params, **kwargs)
+            if response.status_code < 400:
+                self._invalidate(url, params)
+            return response
+
+        key = self.cache.make_key(url, params)
+
+        if not self.refresh:
+            entry = self.cache.get(key)
+            if entry and self._is_fresh(entry, url, params, kwargs):
+                self.cache.record_lookup(hit=True)
+                return CachedResponse(entry['body'], url)
+
+        self.cache.record_lookup(hit=False)
+        response = self.inner.request(method, url, params=params, **kwargs)
+        if response.status_code == 200:
+            self.cache.put(key, url, response.content)
+        return response
+
+    def _is_fresh(self, entry, url, params, kwargs):
+        resource, _ = self.cache.resource_of(url)
+        age = time.time() - entry['stored_at']
+        key = self.cache.make_key(url, params)
+
+        if age <= RESOURCE_TTLS.get(resource, DEFAULT_TTL):
+            self.cache.touch(key, accessed_at=entry['accessed_at'])
+            return True
+
+        board_id = entry['board_id']
+        if board_id and entry['board_activity']:
+            current = self._probe_board(board_id, url, params, kwargs)
+            if current and current == entry['board_activity']:
+                self.cache.touch(key, revalidated=True)
+                return True
+
+        self.cache.delete(key)
+        return False
+
+    def _invalidate(self, url, params):
+        """Drop what a successful write to url may have changed"""
+        resource, board_id = self.cache.resource_of(url)
+        object_ids = written_ids(url, params)
+        if object_ids:
+            self.cache.invalidate(object_ids, board_id, whole_board=resource == 'boards')
+        else:
+            self.cache.clear()
+        if board_id:
+            self._probed.pop(board_id, None)
+        else:
+            self._probed.clear()
+
+    def _probe_board(self, board_id, url, params, kwargs):
+        """Fetch only the board's dateLastActivity (at most once per board every PROBE_TTL seconds)"""
+        if board_id in self._probed:
+            activity, probed_at = self._probed[board_id]
+            if time.time() - probed_at < PROBE_TTL:
+                return activity
+
+        base = url.split('/boards/')[0]
+        probe_params = {k: v for k, v in (params or {}).items() if k in _AUTH_PARAMS}
+        probe_params['fields'] = 'dateLastActivity'
+
+        activity = None
+        try:
+            response = self.inner.request('GET', f"{base}/boards/{board_id}", params=probe_params, **kwargs)
+            if response.status_code == 200:
+                activity = response.json().get('dateLastActivity')
+        except Exception:
+            activity = None
+
+        if activity:
+            self.cache.set_board_activity(board_id, activity)
+        self._probed[board_id] = (activity, time.time())
+        return activity
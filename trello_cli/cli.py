@@ -11,51 +11,32 @@ import warnings
 warnings.filterwarnings('ignore', message='.*urllib3 v2 only supports OpenSSL.*')
 
 from . import __version__
-from .config import configure_interactive
-from .plugins import cmd_plugin_list, cmd_plugin_info, cmd_plugin_run
-from .commands import (
-    # Basic commands
-    cmd_boards, cmd_create_board,
-    cmd_lists, cmd_create_list, cmd_archive_list,
-    cmd_cards, cmd_add_card, cmd_show_card,
-    cmd_update_card, cmd_move_card, cmd_rename_card,
-    cmd_add_checklist, cmd_add_checkitem,
-    cmd_set_due, cmd_add_comment, cmd_delete_card,
-    cmd_add_label, cmd_remove_label, cmd_delete_label, cmd_rename_label,
-    # Help & Discovery
-    cmd_help, cmd_help_json,
-    cmd_board_overview, cmd_board_ids, cmd_search_cards,
-    # Bulk operations
-    cmd_bulk_move_cards, cmd_bulk_add_label, cmd_bulk_set_due,
-    cmd_bulk_archive_cards, cmd_bulk_create_cards,
-    cmd_bulk_relabel, cmd_label_backup, cmd_label_restore,
-    # Quick commands
-    cmd_quick_start, cmd_quick_test, cmd_quick_done,
-    cmd_my_cards, cmd_card_age,
-    # Sprint planning
-    cmd_sprint_start, cmd_sprint_status, cmd_sprint_close, cmd_sprint_velocity,
-    # Advanced queries
-    cmd_cards_by_label, cmd_cards_due_soon, cmd_cards_overdue,
-    cmd_list_metrics, cmd_board_health,
-    # Board standardization
-    cmd_standardize_lists, cmd_scrum_check, cmd_migrate_cards, cmd_list_templates,
-    # Board migration
-    cmd_migrate_board, cmd_archive_board,
-    # Audit commands
-    cmd_board_audit, cmd_list_audit, cmd_list_snapshot, cmd_sprint_audit, cmd_label_audit,
-    # Member management
-    cmd_assign_card, cmd_unassign_card, cmd_card_log,
-    # Export
-    cmd_export_board,
-    # Validation
-    cmd_validation_status, cmd_validation_enable, cmd_validation_disable,
-    cmd_validation_config, cmd_validation_reload, cmd_validation_reset
-)
+from .config import configure_client, metrics_enabled
+from .daemon import LOCAL_COMMANDS, forward as forward_to_daemon
+from .registry import COMMANDS, ALIASES, QUIET_COMMANDS, UNMETERED_COMMANDS, pop_flag, pop_option
+from .trace import Tracer, TRACE_FORMATS
 
 HELP_TEXT = """
 Trello CLI v{version} - Official Python command-line interface for Trello
 
-Usage: trello <command> [arguments]
+Usage: trello [--no-cache|--refresh|--offline] [--trace] [--debug] <command> [arguments]
+
+GLOBAL OPTIONS:
+  --no-cache                  Bypass the on-disk response cache entirely
+  --refresh                   Ignore cached responses and store fresh ones
+  --offline, --mirror         Read boards from the local mirror (trello sync)
+                              without any network request
+  --trace                     Print every API request (span tree, status,
+                              latency, size, retries) to stderr when done
+  --trace-format FMT          text (default), json or chrome (chrome://tracing)
+  --trace-out FILE            Write the trace to FILE instead of stderr
+  --debug                     Show tracebacks, and report metrics that could
+                              not be recorded
+  --                          Stop reading flags: later arguments are passed
+                              as they are (e.g. a comment text of "--offline")
+
+  Card listing and query commands fetch only the card fields they print;
+  pass --fields f1,f2 to fetch more fields (or --fields all for every field).
 
 HELP & CONFIGURATION:
   config                      Configure API credentials
@@ -66,6 +47,8 @@ DISCOVERY COMMANDS (for exploration):
   board-overview <board_id>   Complete board structure with card counts
   board-ids <board_id>        Quick reference of all IDs in a board
   search-cards <board_id> "query"   Search cards across all lists
+  search "query" [--board <board_id>] [--limit N] [--json]
+                              Ranked full-text search across synced boards
 
 QUICK COMMANDS (shortcuts):
   quick-start <card_id>       Move to "In Progress" + add comment
@@ -87,6 +70,7 @@ BULK OPERATIONS:
   bulk-archive-cards <list_id> ["filter"]
   bulk-create-cards <list_id> <csv/json_file>
   bulk-relabel <board_id> <from_label> <to_label> [--dry-run]
+                              Bulk writes accept --concurrency N (default 1)
 
 LABEL BACKUP & RECOVERY:
   label-backup <board_id> [output_file]         Backup all label assignments
@@ -122,13 +106,22 @@ AUDIT & ANALYSIS (Expose Structural Chaos):
                                         - Pattern violations & missing descriptions
                                         Flags: --report-json (JSON output)
                                                --fix-labels (auto-fix duplicates)
+  board-audit --all ["pattern"] [--org ID] [--jobs N] [--output FILE]
+                                        Audit every open board (or an organization's)
+                                        N at a time; combined JSON report and a
+                                        ranking of health scores
   list-audit <list_id> ["pattern"]      Detailed list audit
   list-snapshot <list_id> ["file.json"] Export list to JSON snapshot
   sprint-audit <board_id> ["sprint"]    Sprint-specific audit (dates, overdue)
   label-audit <board_id>                Label audit (duplicates, unused, typos)
+  audit-all <board_id> ["pattern"] [--sprint-label L] [--only a,b] [--json]
+                                        Every board audit above plus board-health and
+                                        scrum-check from one walk of the board
 
 EXPORT & REPORTING:
   export-board <board_id> <format> ["file"]  Export board (json/csv/md)
+                                             board-overview, board-health, label-audit and
+                                             export-board accept --async (concurrent fetch)
 
 PLUGINS (EXTENSIBILITY):
   plugin list [--plugin-dir DIR]             List available plugins
@@ -143,10 +136,65 @@ VALIDATION RULES (ENFORCE SCRUM PRACTICES):
   validation-reload                Reload config from file
   validation-reset                 Reset to default rules
 
+CACHE:
+  cache-status                     Show response cache location and size
+  cache-clear                      Delete all cached responses
+
+STATISTICS:
+  stats [--since 24h] [--command NAME] [--json]
+                                   Latency percentiles, error/throttle rates and
+                                   cache hit ratio recorded in ~/.trellocli/metrics
+                                   (set TRELLO_CLI_METRICS=0 to stop recording)
+
+BATCH (MANY COMMANDS, ONE PROCESS):
+  batch <file|-> [--concurrency N] [--json] [--summary FILE] [--stop-on-error]
+                                   Run one command per line (same syntax as the
+                                   command line, # comments allowed) sharing one
+                                   client and cache; with --concurrency N, lines
+                                   on different cards/lists run in parallel
+
+INTERACTIVE SHELL:
+  shell [board_id]                 Load a board once and run commands against it;
+                                   card/list/label names complete with Tab and
+                                   only changed cards are refetched between
+                                   commands (`use <board>` switches boards)
+
+LOCAL MIRROR (OFFLINE READS):
+  sync [<board_id>...] [--full] [--concurrency N]
+                                   Copy boards into a local SQLite mirror; later
+                                   syncs fetch only the actions since the last
+                                   one (no IDs: re-sync every mirrored board)
+  mirror-status                    Show mirrored boards and when they were synced
+  --offline <read command>         Run query, audit, discovery and export
+                                   commands against the mirror; cards-by-label,
+                                   cards-due-soon, cards-overdue, list-metrics,
+                                   board-health, my-cards and card-age answer
+                                   straight from SQL
+
+WEBHOOKS (LIVE UPDATES):
+  webhook serve [--port N] [--host ADDR] (--secret S --callback-url URL | --no-verify)
+                                   Receive Trello webhooks; each delivery drops
+                                   the cached responses for the cards and lists
+                                   it changed and patches the local mirror.
+                                   Signatures are required unless --no-verify
+  webhook register <board_id> <callback_url> ["description"]
+  webhook list
+  webhook unregister <webhook_id> [<webhook_id>...]
+  webhook replay <payload.json>... Apply saved payloads without a server
+
+DAEMON (FAST REPEATED INVOCATIONS):
+  daemon start [--foreground] [--idle-timeout SECONDS]
+                                   Keep the API client, connection pool and caches
+                                   warm in a background process; while it runs,
+                                   every `trello <command>` is answered by it
+  daemon stop                      Stop the daemon
+  daemon status                    Show pid, uptime and commands served
+                                   (set TRELLO_NO_DAEMON=1 to run a command locally)
+
 BASIC BOARD/LIST/CARD COMMANDS:
   boards                      List all boards
   lists <board_id>            List all lists
-  cards <list_id>             List cards in list
+  cards <list_id> [--fields id,name,due]  List cards in list
   add-card <list_id> "title" ["desc"]
   show-card <card_id>
   update-card <card_id> "desc"
@@ -166,530 +214,160 @@ For more information, see: README.md and CLAUDE.md
 """.format(version=__version__)
 
 
+GLOBAL_FLAGS = {
+    '--no-cache': {'cache': False},
+    '--refresh': {'refresh_cache': True},
+    '--offline': {'offline': True},
+    '--mirror': {'offline': True},
+}
+
+
+# Global options that take a value (the command name never follows them directly)
+GLOBAL_VALUE_OPTIONS = ('--trace-format', '--trace-out')
+
+
+def _command_word(argv):
+    """The command name in the arguments after `trello`: the first one that isn't a flag"""
+    args = iter(argv)
+    for arg in args:
+        if arg in GLOBAL_VALUE_OPTIONS:
+            next(args, None)
+        elif not arg.startswith('-'):
+            return arg
+    return None
+
+
+def _apply_global_flags():
+    """Strip global flags (up to any --) from sys.argv and configure the API client"""
+    options = {}
+    for flag, flag_options in GLOBAL_FLAGS.items():
+        if pop_flag(sys.argv, flag):
+            options.update(flag_options)
+    configure_client(**options)
+
+
+def _trace_options():
+    """
+    Strip --trace/--trace-format/--trace-out from sys.argv. Returns
+    (format, path); format is None without any of them.
+    """
+    fmt = pop_option(sys.argv, '--trace-format')
+    path = pop_option(sys.argv, '--trace-out')
+    if not (pop_flag(sys.argv, '--trace') or fmt is not None or path is not None):
+        return None, None
+    fmt = fmt or 'text'
+    if fmt not in TRACE_FORMATS:
+        raise ValueError(f"Unknown trace format: {fmt}. Use one of: {', '.join(TRACE_FORMATS)}")
+    return fmt, path
+
+
+def _records_metrics(command):
+    return metrics_enabled() and command not in UNMETERED_COMMANDS
+
+
+def _start_trace(command, fmt):
+    """
+    Hook a tracer into the client when tracing (fmt) or recording metrics
+    for this command. Returns the tracer, or None when neither is on.
+    """
+    if fmt is None and not _records_metrics(command):
+        return None
+    tracer = Tracer('trello ' + ' '.join(sys.argv[1:]), call_paths=fmt is not None)
+    configure_client(tracer=tracer)
+    return tracer
+
+
+def _throttled_seconds():
+    """Seconds spent waiting on rate limits so far in this process"""
+    # Only ask the client about rate limiting if a command created one
+    client = sys.modules.get('trello_cli.client')
+    return client.throttled_seconds() if client else 0.0
+
+
+def _record_metrics(tracer, command, throttled, debug=False):
+    """
+    Add this invocation to ~/.trellocli/metrics. Never fails the command;
+    with --debug, a metrics store that can't be written is reported.
+    """
+    exc = sys.exc_info()[1]
+    if isinstance(exc, SystemExit):
+        failed = exc.code not in (None, 0)
+    else:
+        failed = exc is not None
+    try:
+        from .metrics import log_run
+        log_run(command, tracer, failed=failed, throttled_seconds=throttled)
+    except Exception as e:
+        if debug:
+            print(f"⚠️  Could not record metrics: {type(e).__name__}: {e}", file=sys.stderr)
+
+
+def _finish_trace(tracer, fmt, path):
+    """Write the trace collected for this command"""
+    try:
+        tracer.write(fmt, path)
+    except OSError as e:
+        print(f"❌ Could not write trace to {path}: {e}", file=sys.stderr)
+        return
+    if path:
+        print(f"📈 Trace written to {path} ({len(tracer.spans)} request(s))", file=sys.stderr)
+
+
 def main():
     """Main CLI entry point"""
+    if _command_word(sys.argv[1:]) not in LOCAL_COMMANDS:
+        # A running `trello daemon` answers without importing anything else
+        exit_code = forward_to_daemon(sys.argv[1:])
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    _apply_global_flags()
+    debug = pop_flag(sys.argv, '--debug')
+    # The daemon runs many commands in one process: count only this one's waits
+    throttled_before = _throttled_seconds()
+    try:
+        trace_format, trace_path = _trace_options()
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
     if len(sys.argv) < 2:
         print(HELP_TEXT)
         sys.exit(1)
 
-    command = sys.argv[1]
+    command = ALIASES.get(sys.argv[1], sys.argv[1])
+    entry = COMMANDS.get(command)
+    if entry is None:
+        print(f"❌ Unknown command: {command}")
+        print()
+        print(HELP_TEXT)
+        sys.exit(1)
 
+    tracer = _start_trace(command, trace_format)
     try:
-        if command == 'config':
-            configure_interactive()
-
-        elif command in ['-h', '--help', 'help']:
-            cmd_help()
-
-        elif command == 'help-json':
-            cmd_help_json()
-
-        elif command == 'board-overview':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello board-overview <board_id>")
-                sys.exit(1)
-            cmd_board_overview(sys.argv[2])
-
-        elif command == 'board-ids':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello board-ids <board_id>")
-                sys.exit(1)
-            cmd_board_ids(sys.argv[2])
-
-        elif command == 'search-cards':
-            if len(sys.argv) < 4:
-                print("❌ Usage: trello search-cards <board_id> \"query\"")
-                sys.exit(1)
-            cmd_search_cards(sys.argv[2], sys.argv[3])
-
-        elif command == 'boards':
-            cmd_boards()
-
-        elif command == 'create-board':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello create-board \"name\"")
-                sys.exit(1)
-            cmd_create_board(sys.argv[2])
-
-        elif command == 'lists':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello lists <board_id>")
-                sys.exit(1)
-            cmd_lists(sys.argv[2])
-
-        elif command == 'create-list':
-            if len(sys.argv) < 4:
-                print("❌ Usage: trello create-list <board_id> \"name\"")
-                sys.exit(1)
-            cmd_create_list(sys.argv[2], sys.argv[3])
-
-        elif command == 'archive-list':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello archive-list <list_id>")
-                sys.exit(1)
-            cmd_archive_list(sys.argv[2])
-
-        elif command == 'cards':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello cards <list_id>")
-                sys.exit(1)
-            cmd_cards(sys.argv[2])
-
-        elif command == 'add-card':
-            if len(sys.argv) < 4:
-                print("❌ Usage: trello add-card <list_id> \"title\" [--description \"description\"]")
-                sys.exit(1)
-
-            # Parse description - support both positional and --description flag
-            description = ""
-            if len(sys.argv) > 4:
-                if sys.argv[4] == '--description' and len(sys.argv) > 5:
-                    description = sys.argv[5]
-                else:
-                    # Legacy support: positional description argument
-                    description = sys.argv[4]
-
-            cmd_add_card(sys.argv[2], sys.argv[3], description)
-
-        elif command == 'show-card':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello show-card <card_id>")
-                sys.exit(1)
-            cmd_show_card(sys.argv[2])
-
-        elif command == 'update-card':
-            if len(sys.argv) < 4:
-                print("❌ Usage: trello update-card <card_id> [--description] \"description\"")
-                sys.exit(1)
-
-            # Parse description - support both positional and --description flag
-            description = ""
-            if sys.argv[3] == '--description' and len(sys.argv) > 4:
-                description = sys.argv[4]
-            else:
-                # Legacy support: positional description argument
-                description = sys.argv[3]
-
-            cmd_update_card(sys.argv[2], description)
-
-        elif command == 'rename-card':
-            if len(sys.argv) < 4:
-                print("❌ Usage: trello rename-card <card_id> \"new_title\"")
-                sys.exit(1)
-            cmd_rename_card(sys.argv[2], sys.argv[3])
-
-        elif command == 'move-card':
-            if len(sys.argv) < 4:
-                print("❌ Usage: trello move-card <card_id> <list_id> [--done]")
-                sys.exit(1)
-            explicit_done = '--done' in sys.argv
-            cmd_move_card(sys.argv[2], sys.argv[3], explicit_done)
-
-        elif command == 'add-label':
-            if len(sys.argv) < 4:
-                print("❌ Usage: trello add-label <card_id> \"color\" [\"name\"]")
-                sys.exit(1)
-            label_name = sys.argv[4] if len(sys.argv) > 4 else ""
-            cmd_add_label(sys.argv[2], sys.argv[3], label_name)
-
-        elif command == 'remove-label':
-            if len(sys.argv) < 4:
-                print("❌ Usage: trello remove-label <card_id> \"label_name|color|id\"")
-                sys.exit(1)
-            cmd_remove_label(sys.argv[2], sys.argv[3])
-
-        elif command == 'delete-label':
-            if len(sys.argv) < 4:
-                print("❌ Usage: trello delete-label <board_id> \"label_name|color|id\"")
-                sys.exit(1)
-            cmd_delete_label(sys.argv[2], sys.argv[3])
-
-        elif command == 'rename-label':
-            if len(sys.argv) < 5:
-                print("❌ Usage: trello rename-label <board_id> \"current_label\" \"new_name\"")
-                sys.exit(1)
-            cmd_rename_label(sys.argv[2], sys.argv[3], sys.argv[4])
-
-        elif command == 'add-checklist':
-            if len(sys.argv) < 4:
-                print("❌ Usage: trello add-checklist <card_id> \"name\"")
-                sys.exit(1)
-            cmd_add_checklist(sys.argv[2], sys.argv[3])
-
-        elif command == 'add-checkitem':
-            if len(sys.argv) < 5:
-                print("❌ Usage: trello add-checkitem <card_id> \"checklist\" \"item\"")
-                sys.exit(1)
-            cmd_add_checkitem(sys.argv[2], sys.argv[3], sys.argv[4])
-
-        elif command == 'set-due':
-            if len(sys.argv) < 4:
-                print("❌ Usage: trello set-due <card_id> \"YYYY-MM-DD\"")
-                sys.exit(1)
-            cmd_set_due(sys.argv[2], sys.argv[3])
-
-        elif command == 'add-comment':
-            if len(sys.argv) < 4:
-                print("❌ Usage: trello add-comment <card_id> \"comment\"")
-                sys.exit(1)
-            cmd_add_comment(sys.argv[2], sys.argv[3])
-
-        elif command == 'delete-card':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello delete-card <card_id>")
-                sys.exit(1)
-            cmd_delete_card(sys.argv[2])
-
-        # Quick Commands
-        elif command == 'quick-start':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello quick-start <card_id> [\"comment\"]")
-                sys.exit(1)
-            comment = sys.argv[3] if len(sys.argv) > 3 else "Started working on this"
-            cmd_quick_start(sys.argv[2], comment)
-
-        elif command == 'quick-test':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello quick-test <card_id> [\"comment\"]")
-                sys.exit(1)
-            comment = sys.argv[3] if len(sys.argv) > 3 else "Ready for testing"
-            cmd_quick_test(sys.argv[2], comment)
-
-        elif command == 'quick-done':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello quick-done <card_id> [\"comment\"]")
-                sys.exit(1)
-            comment = sys.argv[3] if len(sys.argv) > 3 else "Completed and verified"
-            cmd_quick_done(sys.argv[2], comment)
-
-        elif command == 'my-cards':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello my-cards <board_id> [\"member_name\"]")
-                sys.exit(1)
-            member_name = sys.argv[3] if len(sys.argv) > 3 else ""
-            cmd_my_cards(sys.argv[2], member_name)
-
-        elif command == 'card-age':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello card-age <list_id>")
-                sys.exit(1)
-            cmd_card_age(sys.argv[2])
-
-        # Sprint Planning Commands
-        elif command == 'sprint-start':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello sprint-start <board_id>")
-                sys.exit(1)
-            cmd_sprint_start(sys.argv[2])
-
-        elif command == 'sprint-status':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello sprint-status <board_id>")
-                sys.exit(1)
-            cmd_sprint_status(sys.argv[2])
-
-        elif command == 'sprint-close':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello sprint-close <board_id>")
-                sys.exit(1)
-            cmd_sprint_close(sys.argv[2])
-
-        elif command == 'sprint-velocity':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello sprint-velocity <board_id> [num_sprints]")
-                sys.exit(1)
-            num_sprints = int(sys.argv[3]) if len(sys.argv) > 3 else 3
-            cmd_sprint_velocity(sys.argv[2], num_sprints)
-
-        # Bulk Operations
-        elif command == 'bulk-move-cards':
-            if len(sys.argv) < 4:
-                print("❌ Usage: trello bulk-move-cards <source_list_id> <target_list_id> [\"filter\"]")
-                sys.exit(1)
-            filter_query = sys.argv[4] if len(sys.argv) > 4 else ""
-            cmd_bulk_move_cards(sys.argv[2], sys.argv[3], filter_query)
-
-        elif command == 'bulk-add-label':
-            if len(sys.argv) < 4:
-                print("❌ Usage: trello bulk-add-label <card_ids_file> <color> [\"name\"]")
-                sys.exit(1)
-            label_name = sys.argv[4] if len(sys.argv) > 4 else ""
-            cmd_bulk_add_label(sys.argv[2], sys.argv[3], label_name)
-
-        elif command == 'bulk-set-due':
-            if len(sys.argv) < 4:
-                print("❌ Usage: trello bulk-set-due <card_ids_file> <date>")
-                sys.exit(1)
-            cmd_bulk_set_due(sys.argv[2], sys.argv[3])
-
-        elif command == 'bulk-archive-cards':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello bulk-archive-cards <list_id> [\"filter\"]")
-                sys.exit(1)
-            filter_query = sys.argv[3] if len(sys.argv) > 3 else ""
-            cmd_bulk_archive_cards(sys.argv[2], filter_query)
-
-        elif command == 'bulk-create-cards':
-            if len(sys.argv) < 4:
-                print("❌ Usage: trello bulk-create-cards <list_id> <csv/json_file>")
-                sys.exit(1)
-            cmd_bulk_create_cards(sys.argv[2], sys.argv[3])
-
-        elif command == 'bulk-relabel':
-            if len(sys.argv) < 5:
-                print("❌ Usage: trello bulk-relabel <board_id> <from_label> <to_label> [--dry-run]")
-                sys.exit(1)
-            dry_run = '--dry-run' in sys.argv
-            cmd_bulk_relabel(sys.argv[2], sys.argv[3], sys.argv[4], dry_run)
-
-        elif command == 'label-backup':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello label-backup <board_id> [output_file]")
-                sys.exit(1)
-            output_file = sys.argv[3] if len(sys.argv) > 3 else "label_backup.json"
-            cmd_label_backup(sys.argv[2], output_file)
-
-        elif command == 'label-restore':
-            if len(sys.argv) < 4:
-                print("❌ Usage: trello label-restore <board_id> <backup_file>")
-                sys.exit(1)
-            cmd_label_restore(sys.argv[2], sys.argv[3])
-
-        # Advanced Query Commands
-        elif command == 'cards-by-label':
-            if len(sys.argv) < 4:
-                print("❌ Usage: trello cards-by-label <board_id> <color> [\"name\"]")
-                sys.exit(1)
-            label_name = sys.argv[4] if len(sys.argv) > 4 else ""
-            cmd_cards_by_label(sys.argv[2], sys.argv[3], label_name)
-
-        elif command == 'cards-due-soon':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello cards-due-soon <board_id> [days]")
-                sys.exit(1)
-            days = int(sys.argv[3]) if len(sys.argv) > 3 else 7
-            cmd_cards_due_soon(sys.argv[2], days)
-
-        elif command == 'cards-overdue':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello cards-overdue <board_id>")
-                sys.exit(1)
-            cmd_cards_overdue(sys.argv[2])
-
-        elif command == 'list-metrics':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello list-metrics <list_id>")
-                sys.exit(1)
-            cmd_list_metrics(sys.argv[2])
-
-        elif command == 'board-health':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello board-health <board_id>")
-                sys.exit(1)
-            cmd_board_health(sys.argv[2])
-
-        # Board Standardization Commands
-        elif command == 'list-templates':
-            cmd_list_templates()
-
-        elif command == 'standardize-lists':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello standardize-lists <board_id> [template] [--dry-run]")
-                sys.exit(1)
-            template = sys.argv[3] if len(sys.argv) > 3 else "agile"
-            dry_run = "--dry-run" in sys.argv or "-n" in sys.argv
-            cmd_standardize_lists(sys.argv[2], template, dry_run)
-
-        elif command == 'scrum-check':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello scrum-check <board_id>")
-                sys.exit(1)
-            cmd_scrum_check(sys.argv[2])
-
-        elif command == 'migrate-cards':
-            if len(sys.argv) < 4:
-                print("❌ Usage: trello migrate-cards <source_list_id> <target_board_id> [\"target_list\"]")
-                sys.exit(1)
-            target_list = sys.argv[4] if len(sys.argv) > 4 else ""
-            cmd_migrate_cards(sys.argv[2], sys.argv[3], target_list)
-
-        elif command == 'migrate-board':
-            if len(sys.argv) < 4:
-                print("❌ Usage: trello migrate-board <source_board_id> <target_board_id> [--dry-run]")
-                sys.exit(1)
-            dry_run = '--dry-run' in sys.argv
-            cmd_migrate_board(sys.argv[2], sys.argv[3], dry_run)
-
-        elif command == 'archive-board':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello archive-board <board_id>")
-                sys.exit(1)
-            cmd_archive_board(sys.argv[2])
-
-        # Audit Commands
-        elif command == 'board-audit':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello board-audit <board_id> [\"pattern\"] [--report-json] [--fix-labels]")
-                print("\nFlags:")
-                print("  --report-json    Output audit results in JSON format")
-                print("  --fix-labels     Automatically fix duplicate labels")
-                sys.exit(1)
-
-            # Parse arguments and flags
-            board_id = sys.argv[2]
-            pattern = None
-            report_json = False
-            fix_labels = False
-
-            for i in range(3, len(sys.argv)):
-                arg = sys.argv[i]
-                if arg == '--report-json':
-                    report_json = True
-                elif arg == '--fix-labels':
-                    fix_labels = True
-                elif not pattern and not arg.startswith('--'):
-                    pattern = arg
-
-            cmd_board_audit(board_id, pattern, fix_labels, report_json)
-
-        elif command == 'list-audit':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello list-audit <list_id> [\"pattern\"]")
-                sys.exit(1)
-            pattern = sys.argv[3] if len(sys.argv) > 3 else None
-            cmd_list_audit(sys.argv[2], pattern)
-
-        elif command == 'list-snapshot':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello list-snapshot <list_id> [\"output_file.json\"]")
-                sys.exit(1)
-            output_file = sys.argv[3] if len(sys.argv) > 3 else None
-            cmd_list_snapshot(sys.argv[2], output_file)
-
-        elif command == 'sprint-audit':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello sprint-audit <board_id> [\"sprint_label\"]")
-                sys.exit(1)
-            sprint_label = sys.argv[3] if len(sys.argv) > 3 else None
-            cmd_sprint_audit(sys.argv[2], sprint_label)
-
-        elif command == 'label-audit':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello label-audit <board_id>")
-                sys.exit(1)
-            cmd_label_audit(sys.argv[2])
-
-        # Member Management Commands
-        elif command == 'assign-card':
-            if len(sys.argv) < 4:
-                print("❌ Usage: trello assign-card <card_id> <member_username|name|'me'>")
-                sys.exit(1)
-            cmd_assign_card(sys.argv[2], sys.argv[3])
-
-        elif command == 'unassign-card':
-            if len(sys.argv) < 4:
-                print("❌ Usage: trello unassign-card <card_id> <member_username|name|'me'>")
-                sys.exit(1)
-            cmd_unassign_card(sys.argv[2], sys.argv[3])
-
-        elif command == 'card-log':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello card-log <card_id> [limit]")
-                sys.exit(1)
-            limit = int(sys.argv[3]) if len(sys.argv) > 3 else 50
-            cmd_card_log(sys.argv[2], limit)
-
-        # Export Commands
-        elif command == 'export-board':
-            if len(sys.argv) < 4:
-                print("❌ Usage: trello export-board <board_id> <json|csv|md> [\"output_file\"]")
-                sys.exit(1)
-            output_file = sys.argv[4] if len(sys.argv) > 4 else None
-            cmd_export_board(sys.argv[2], sys.argv[3], output_file)
-
-        # Validation Commands
-        elif command == 'validation-status':
-            cmd_validation_status()
-
-        elif command == 'validation-enable':
-            cmd_validation_enable()
-
-        elif command == 'validation-disable':
-            cmd_validation_disable()
-
-        elif command == 'validation-config':
-            cmd_validation_config()
-
-        elif command == 'validation-reload':
-            cmd_validation_reload()
-
-        elif command == 'validation-reset':
-            cmd_validation_reset()
-
-        # Plugin Commands
-        elif command == 'plugin':
-            if len(sys.argv) < 3:
-                print("❌ Usage: trello plugin <list|info|run> [args]")
-                print("\n  plugin list                    - List all plugins")
-                print("  plugin info <name>             - Show plugin details")
-                print("  plugin run <name> [args]       - Execute a plugin")
-                print("\n  Optional: --plugin-dir <path>  - Use custom plugin directory")
-                sys.exit(1)
-
-            subcommand = sys.argv[2]
-
-            # Extract --plugin-dir if present
-            plugin_dir = None
-            if '--plugin-dir' in sys.argv:
-                idx = sys.argv.index('--plugin-dir')
-                if idx + 1 < len(sys.argv):
-                    plugin_dir = sys.argv[idx + 1]
-                    # Remove --plugin-dir and its value from argv
-                    sys.argv.pop(idx)
-                    sys.argv.pop(idx)
-
-            if subcommand == 'list':
-                cmd_plugin_list(plugin_dir)
-
-            elif subcommand == 'info':
-                if len(sys.argv) < 4:
-                    print("❌ Usage: trello plugin info <name>")
-                    sys.exit(1)
-                cmd_plugin_info(sys.argv[3], plugin_dir)
-
-            elif subcommand == 'run':
-                if len(sys.argv) < 4:
-                    print("❌ Usage: trello plugin run <name> [args]")
-                    sys.exit(1)
-                plugin_name = sys.argv[3]
-                plugin_args = sys.argv[4:]
-                cmd_plugin_run(plugin_name, plugin_args, plugin_dir)
-
-            else:
-                print(f"❌ Unknown plugin subcommand: {subcommand}")
-                print("   Valid subcommands: list, info, run")
-                sys.exit(1)
-
-        elif command in ['-v', '--version', 'version']:
-            print(f"Trello CLI v{__version__}")
-
-        else:
-            print(f"❌ Unknown command: {command}")
-            print()
-            print(HELP_TEXT)
-            sys.exit(1)
+        entry.run(command, sys.argv[2:])
 
         # Show help reminder after successful command execution
         # (only for non-help, non-version commands)
-        if command not in ['help', '-h', '--help', 'help-json', 'version', '-v', '--version']:
+        if command not in QUIET_COMMANDS:
             print("\n💡 Run 'trello help' to see all capabilities")
 
     except KeyboardInterrupt:
         print("\n⚠️  Operation cancelled by user")
         sys.exit(130)
     except Exception as e:
+        if debug:
+            import traceback
+            traceback.print_exc()
         print(f"❌ Error: {str(e)}")
         sys.exit(1)
+    finally:
+        if tracer is not None:
+            tracer.finish()
+            if trace_format:
+                _finish_trace(tracer, trace_format, trace_path)
+            if _records_metrics(command):
+                _record_metrics(tracer, command, _throttled_seconds() - throttled_before, debug)
 
 
 if __name__ == '__main__':
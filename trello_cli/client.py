@@ -2,8 +2,44 @@
 Trello API client wrapper
 """
 
-from trello import TrelloClient as PyTrelloClient
-from .config import load_config
+import requests
+from trello import TrelloClient as PyTrelloClient, Board, List, Card
+from .cache import ResponseCache, CachingHTTPService
+from .config import load_config, get_base_url, API_BASE_URL, CONFIG_FILE
+from .config import CLIENT_OPTIONS as _options, configure_client as configure
+from .directory import MemberDirectory
+from .executor import MAX_CONCURRENCY
+from .mirror import Mirror, MIRROR_DB, classify_actions
+from .ratelimit import RateLimiter, RateLimitedHTTPService
+from .snapshot import BoardSnapshot, SNAPSHOT_PARAMS, attach_checklists, card_records
+from .records import ListRecord
+from .trace import TracingHTTPService, AttemptRecorder
+
+
+# Maximum number of URLs Trello accepts in one GET /batch call
+BATCH_LIMIT = 10
+
+# More changed cards than this and update_board_snapshot refetches the board
+MAX_INCREMENTAL_CARDS = 5 * BATCH_LIMIT
+
+class BaseURLHTTPService:
+    """Send py-trello's api.trello.com requests to another base URL"""
+
+    def __init__(self, inner, base_url):
+        self.inner = inner
+        self.base_url = base_url
+
+    def request(self, method, url, **kwargs):
+        if url.startswith(API_BASE_URL):
+            url = self.base_url + url[len(API_BASE_URL):]
+        return self.inner.request(method, url, **kwargs)
+
+
+class OfflineHTTPService:
+    """Stands in for the network under --offline: every request fails"""
+
+    def request(self, method, url, **kwargs):
+        raise Exception("not available offline (only synced boards can be read with --offline)")
 
 
 class TrelloClient:
@@ -11,6 +47,10 @@ class TrelloClient:
 
     _instance = None
 
+    # board_id -> BoardSnapshot served by get_board_snapshot() instead of
+    # fetching (trello shell keeps its board here between commands)
+    pinned_snapshots = None
+
     def __new__(cls):
         """Singleton pattern to reuse client instance"""
         if cls._instance is None:
@@ -21,15 +61,97 @@ class TrelloClient:
     def __init__(self):
         """Initialize Trello client with credentials from config"""
         if self._initialized:
+            # A long-lived process (trello daemon) reconfigures the client
+            # for every command: keep the session, rebuild the wrappers
+            if self._transport != self._transport_key():
+                self.client.http_service = self._build_http_service()
             return
 
-        config = load_config()
+        if _options['offline'] and not CONFIG_FILE.exists():
+            # Reading the mirror needs no credentials (e.g. a CI sandbox)
+            config = {'api_key': '', 'token': ''}
+        else:
+            config = load_config()
+        self.cache = None
+        self._mirror = None
+        self.session = self._build_session()
+        self.rate_limiter = RateLimiter(config['api_key'], config['token'])
         self.client = PyTrelloClient(
             api_key=config['api_key'],
-            token=config['token']
+            token=config['token'],
+            http_service=self._build_http_service()
         )
         self._initialized = True
 
+    @staticmethod
+    def _build_session():
+        """Keep-alive session with one pooled connection per concurrent bulk worker"""
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=MAX_CONCURRENCY)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    @staticmethod
+    def _transport_key():
+        """Everything _build_http_service() depends on besides the session"""
+        return (_options['cache'], _options['refresh_cache'], _options['tracer'], get_base_url(),
+                _options['offline'])
+
+    def _build_http_service(self):
+        """
+        Keep-alive session behind the rate limiter, wrapped in the response
+        cache unless disabled (cache hits never consume rate-limit tokens).
+        Requests go to get_base_url() (api.trello.com unless overridden).
+        With a tracer, every py-trello request and every request actually
+        sent (retries, cache probes) is recorded. Offline, nothing is sent.
+        """
+        self._transport = self._transport_key()
+        if _options['offline']:
+            return OfflineHTTPService()
+        tracer = _options['tracer']
+        session = self.session
+        http_service = session if tracer is None else AttemptRecorder(session, tracer)
+        http_service = RateLimitedHTTPService(http_service, self.rate_limiter)
+        if not _options['cache']:
+            self.cache = None
+        elif self.cache is None:
+            try:
+                self.cache = ResponseCache()
+            except Exception:
+                # Unwritable home directory or broken DB: run uncached
+                self.cache = None
+        if self.cache is not None:
+            http_service = CachingHTTPService(http_service, self.cache,
+                                              refresh=_options['refresh_cache'])
+        base_url = get_base_url()
+        if base_url != API_BASE_URL:
+            http_service = BaseURLHTTPService(http_service, base_url)
+        if tracer is not None:
+            http_service = TracingHTTPService(http_service, tracer)
+        return http_service
+
+    @property
+    def offline(self):
+        """Whether reads are served from the local mirror (--offline)"""
+        return _options['offline']
+
+    def mirror(self):
+        """The local board mirror (see `trello sync`), opened on first use"""
+        if self._mirror is None:
+            self._mirror = Mirror()
+        return self._mirror
+
+    def is_mirrored(self, board_id):
+        """Whether a board is in the local mirror (never creates the mirror)"""
+        if self._mirror is None and not MIRROR_DB.exists():
+            return False
+        return self.mirror().sync_position(board_id) is not None
+
+    def throttle_summary(self):
+        """Report of time spent waiting on rate limits, or None"""
+        return self.rate_limiter.summary()
+
     def get_board(self, board_id):
         """Get board by ID"""
         try:
@@ -37,6 +159,138 @@ class TrelloClient:
         except Exception as e:
             raise Exception(f"Failed to get board {board_id}: {str(e)}")
 
+    def get_board_snapshot(self, board_id, card_filter='open', card_fields=None):
+        """
+        Get board with lists, cards, checklists, labels and members in one request
+
+        Args:
+            card_filter: Trello card filter (open, closed, all)
+            card_fields: Only fetch these card fields (skips checklists and
+                         members); None fetches everything
+        """
+        pinned = self.pinned_snapshots.get(board_id) if self.pinned_snapshots else None
+        if pinned is not None and card_filter == 'open':
+            # Every field is loaded, so this also answers card_fields requests
+            return pinned
+        if self.offline:
+            return self.mirror().load_snapshot(board_id, card_filter, self.client)
+
+        query_params = dict(SNAPSHOT_PARAMS, cards=card_filter)
+        if card_fields:
+            query_params.update(card_fields=','.join(card_fields), checklists='none')
+        try:
+            json_obj = self.client.fetch_json('/boards/' + board_id, query_params=query_params)
+            snapshot = BoardSnapshot.from_json(self.client, json_obj)
+        except Exception as e:
+            raise Exception(f"Failed to get board {board_id}: {str(e)}")
+
+        if not card_fields:
+            self.attach_member_directory(snapshot)
+        return snapshot
+
+    def pin_snapshot(self, snapshot):
+        """Serve this (full, open-cards) snapshot for its board until unpinned"""
+        if self.pinned_snapshots is None:
+            self.pinned_snapshots = {}
+        self.pinned_snapshots[snapshot.id] = snapshot
+
+    def unpin_snapshot(self, board_id):
+        if self.pinned_snapshots:
+            self.pinned_snapshots.pop(board_id, None)
+
+    def update_board_snapshot(self, snapshot):
+        """
+        Bring a full snapshot up to date from the board's actions since it
+        was taken, instead of fetching the whole board again
+
+        Cards named by new actions are refetched BATCH_LIMIT per request and
+        list changes refetch the lists. Any other board-level action (board
+        or label edits, members joining), or more than MAX_INCREMENTAL_CARDS
+        changed cards, refetches the board.
+
+        Returns:
+            (snapshot, number of new actions); the snapshot is a new object
+            if anything changed
+        """
+        since = snapshot.date_last_activity
+        if not since:
+            self.unpin_snapshot(snapshot.id)
+            return self.get_board_snapshot(snapshot.id), None
+        try:
+            actions = self.client.fetch_json(
+                f'/boards/{snapshot.id}/actions',
+                query_params={'since': since, 'limit': 1000, 'fields': 'type,date,data'})
+        except Exception as e:
+            raise Exception(f"Failed to get actions of board {snapshot.id}: {str(e)}")
+        actions = [action for action in actions if action['date'] > since]
+        if not actions:
+            return snapshot, 0
+
+        card_ids, resources = classify_actions(actions)
+        if resources - {'lists'} or len(card_ids) > MAX_INCREMENTAL_CARDS:
+            self.unpin_snapshot(snapshot.id)
+            return self.get_board_snapshot(snapshot.id), len(actions)
+
+        lists = snapshot.lists
+        if 'lists' in resources:
+            try:
+                lists_json = self.client.fetch_json(
+                    f'/boards/{snapshot.id}/lists',
+                    query_params={'filter': 'all', 'fields': 'name,closed,pos,idBoard'})
+            except Exception as e:
+                raise Exception(f"Failed to get lists of board {snapshot.id}: {str(e)}")
+            lists = [ListRecord.from_json(obj, snapshot.id) for obj in lists_json]
+
+        cards_by_id = dict(snapshot.cards_by_id)
+        ordered_ids = sorted(card_ids)
+        results = self.batch_get([f'/cards/{card_id}?checklists=all' for card_id in ordered_ids])
+        fetched = [body for status, body in results
+                   if status == 200 and isinstance(body, dict)
+                   and body.get('idBoard') == snapshot.id and not body.get('closed')]
+        for card_id in ordered_ids:
+            # Deleted, archived or moved to another board
+            cards_by_id.pop(card_id, None)
+        checklists_json = [cl for obj in fetched for cl in obj.get('checklists', [])]
+        for card in card_records(fetched, checklists_json, snapshot.id, snapshot.labels_by_id):
+            cards_by_id[card.id] = card
+
+        cards = sorted(cards_by_id.values(), key=lambda card: card.pos or 0)
+        updated = BoardSnapshot(snapshot.board, lists, cards, snapshot.labels, snapshot.members)
+        updated.date_last_activity = max(action['date'] for action in actions)
+        return updated, len(actions)
+
+    def get_member_directory(self, board_id, refresh=False):
+        """
+        Get a board's member directory, read from disk while fresh
+
+        Args:
+            refresh: Refetch even if a fresh copy is on disk
+        """
+        if self.offline:
+            return MemberDirectory(board_id, self.mirror().members_json(board_id), trello_client=self.client)
+        if _options['cache'] and not _options['refresh_cache'] and not refresh:
+            directory = MemberDirectory.load(board_id, self.client)
+            if directory is not None:
+                return directory
+
+        try:
+            directory = MemberDirectory.fetch(self.client, board_id)
+        except Exception as e:
+            raise Exception(f"Failed to get members of board {board_id}: {str(e)}")
+        if _options['cache']:
+            directory.save()
+        return directory
+
+    def attach_member_directory(self, snapshot):
+        """Resolve snapshot card members from the board's member directory"""
+        directory = self.get_member_directory(snapshot.id)
+        member_ids = {member_id for card in snapshot.cards for member_id in card.idMembers}
+        if directory.from_disk and not directory.knows_all(member_ids):
+            # Someone joined the board since the directory was saved
+            directory = self.get_member_directory(snapshot.id, refresh=True)
+        snapshot.attach_members(directory.members)
+        return directory
+
     def get_list(self, list_id):
         """Get list by ID"""
         try:
@@ -44,16 +298,128 @@ class TrelloClient:
         except Exception as e:
             raise Exception(f"Failed to get list {list_id}: {str(e)}")
 
+    def get_list_cards(self, list_id, card_fields=None, card_filter='open', checklists=False):
+        """
+        Get a list and its cards with two requests
+
+        Args:
+            card_fields: Only fetch these card fields; None fetches everything
+            card_filter: Trello card filter (open, closed, all)
+            checklists: Prefetch every card's checklists in the same request
+
+        Returns:
+            (ListRecord, [CardRecord])
+        """
+        if self.offline:
+            return self.mirror().list_cards(list_id, card_filter)
+
+        query_params = {'filter': card_filter,
+                        'fields': ','.join(card_fields) if card_fields else 'all'}
+        if checklists:
+            query_params['checklists'] = 'all'
+        try:
+            list_json = self.client.fetch_json(
+                '/lists/' + list_id, query_params={'fields': 'name,closed,pos,idBoard'})
+            lst = ListRecord.from_json(list_json)
+            cards_json = self.client.fetch_json('/lists/' + list_id + '/cards', query_params=query_params)
+            checklists_json = [cl for obj in cards_json for cl in obj.get('checklists', [])]
+            return lst, card_records(cards_json, checklists_json, lst.idBoard)
+        except Exception as e:
+            raise Exception(f"Failed to get list {list_id}: {str(e)}")
+
     def get_card(self, card_id):
-        """Get card by ID"""
+        """Get card by ID, with its list, board and checklists, in one request"""
+        query_params = {
+            'customFieldItems': 'true',
+            'checklists': 'all',
+            'list': 'true',
+            'board': 'true',
+            'board_fields': 'name,desc,closed,url',
+        }
         try:
-            return self.client.get_card(card_id)
+            if self.offline:
+                card_json = self.mirror().card_json(card_id)
+            else:
+                card_json = self.client.fetch_json('/cards/' + card_id, query_params=query_params)
+            board = Board.from_json(self.client, json_obj=card_json['board'])
+            card = Card.from_json(List.from_json(board, card_json['list']), card_json)
+            attach_checklists(self.client, [card], card_json.get('checklists', []))
+            return card
         except Exception as e:
             raise Exception(f"Failed to get card {card_id}: {str(e)}")
 
-    def list_boards(self):
-        """List all boards"""
+    def card_ref(self, card):
+        """
+        Writable py-trello Card for a CardRecord, without fetching it. Enough for change_list(), comment(), add_label() and
+        other writes; the card is bound to an ID-only Board.
+        """
+        return Card(Board(client=self.client, board_id=card.idBoard), card.id, name=card.name)
+
+    def batch_get(self, urls):
+        """
+        Fetch several GET endpoints through /batch, BATCH_LIMIT per request
+
+        Args:
+            urls: API paths such as '/cards/<id>'
+
+        Returns:
+            List of (status_code, body) tuples in the same order as urls
+        """
+        results = []
+        for start in range(0, len(urls), BATCH_LIMIT):
+            chunk = urls[start:start + BATCH_LIMIT]
+            try:
+                responses = self.client.fetch_json('/batch', query_params={'urls': ','.join(chunk)})
+            except Exception as e:
+                raise Exception(f"Failed to fetch batch: {str(e)}")
+            for response in responses:
+                if '200' in response:
+                    results.append((200, response['200']))
+                else:
+                    status, body = next(iter(response.items()), ('unknown', None))
+                    results.append((response.get('statusCode', status), body))
+        return results
+
+    def get_cards_batch(self, card_ids):
+        """
+        Get many cards with one request per BATCH_LIMIT IDs
+
+        Cards are bound to a lightweight Board (ID only), which is enough for
+        card writes and board label lookups.
+
+        Returns:
+            Dict of card_id -> Card for every ID that could be fetched
+        """
+        unique_ids = list(dict.fromkeys(card_ids))
+        results = self.batch_get(['/cards/' + card_id for card_id in unique_ids])
+
+        cards = {}
+        boards = {}
+        for card_id, (status, body) in zip(unique_ids, results):
+            if status != 200 or not isinstance(body, dict):
+                continue
+            board_id = body['idBoard']
+            if board_id not in boards:
+                boards[board_id] = Board(client=self.client, board_id=board_id)
+            cards[card_id] = Card.from_json(boards[board_id], body)
+        return cards
+
+    def list_boards(self, organization_id=None):
+        """
+        List all boards (offline: the mirrored ones)
+
+        Args:
+            organization_id: Only the boards of this organization (ID or name)
+        """
+        if self.offline:
+            if organization_id:
+                raise ValueError("The local mirror does not record organizations; drop --offline to filter by one")
+            return [Board.from_json(self.client, json_obj=self.mirror().board_json(board['id']))
+                    for board in self.mirror().boards()]
         try:
+            if organization_id:
+                return [Board.from_json(self.client, json_obj=obj)
+                        for obj in self.client.fetch_json(f'/organizations/{organization_id}/boards')]
             return self.client.list_boards()
         except Exception as e:
             raise Exception(f"Failed to list boards: {str(e)}")
@@ -65,7 +431,43 @@ class TrelloClient:
         except Exception as e:
             raise Exception(f"Failed to create board '{name}': {str(e)}")
 
+    def create_webhook(self, id_model, callback_url, description=''):
+        """
+        Register a webhook; Trello sends a HEAD request to callback_url
+        first and refuses the webhook unless it answers 200
+
+        Returns:
+            Webhook JSON (id, idModel, callbackURL, description, active)
+        """
+        try:
+            return self.client.fetch_json('/webhooks', http_method='POST', post_args={
+                'idModel': id_model, 'callbackURL': callback_url, 'description': description})
+        except Exception as e:
+            raise Exception(f"Failed to create webhook for {id_model}: {str(e)}")
+
+    def list_webhooks(self):
+        """Webhooks registered with this token, as JSON"""
+        try:
+            return self.client.fetch_json(f'/tokens/{self.client.resource_owner_key}/webhooks')
+        except Exception as e:
+            raise Exception(f"Failed to list webhooks: {str(e)}")
+
+    def delete_webhook(self, webhook_id):
+        """Unregister a webhook"""
+        try:
+            self.client.fetch_json(f'/webhooks/{webhook_id}', http_method='DELETE')
+        except Exception as e:
+            raise Exception(f"Failed to delete webhook {webhook_id}: {str(e)}")
+
 
 def get_client():
     """Get singleton TrelloClient instance"""
     return TrelloClient()
+
+
+def throttled_seconds():
+    """Seconds this process waited on rate limits (0 if no client was created)"""
+    instance = TrelloClient._instance
+    if instance is None or not instance._initialized:
+        return 0.0
+    return instance.rate_limiter.throttled_seconds
@@ -0,0 +1,333 @@
+"""
+Columnar card data for board metrics, backed by NumPy when it is installed
+
+card_columns(frame) turns the rows of a BoardFrame into numeric columns:
+creation timestamps decoded from the card IDs, due timestamps, the index
+of each card's list, label bitsets and checklist totals. The stale,
+overdue, congestion, checklist-completion, label-usage and age-distribution
+metrics are then whole-column operations instead of per-card Python, which
+matters on boards with tens of thousands of cards.
+
+NumPy is optional (pip install "trello-cli-python[fast]"). Without it the
+same columns are Python lists and the metrics plain loops; both backends
+return the same values, as Python ints and lists.
+"""
+
+from bisect import bisect_right
+from functools import cached_property
+from statistics import median
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+DAY = 86400
+
+# Age distribution buckets: upper bounds in days (exclusive) and names
+AGE_EDGES = (7, 30, 90, 180, 365)
+AGE_BUCKETS = ('< 1 week', '1-4 weeks', '1-3 months', '3-6 months', '6-12 months', '1 year +')
+
+
+def age_distribution(ages):
+    """
+    Summary of card ages in whole days (a list or a NumPy integer array)
+
+    Returns:
+        Dict of 'cards', 'average', 'median', 'oldest', 'newest' (None
+        without cards) and 'buckets' [(bucket name, cards)] over AGE_BUCKETS
+    """
+    if numpy is not None and isinstance(ages, numpy.ndarray):
+        counts = numpy.bincount(numpy.searchsorted(AGE_EDGES, ages, side='right'),
+                                minlength=len(AGE_BUCKETS)).tolist()
+        total = int(ages.sum()) if len(ages) else 0
+        middle = float(numpy.median(ages)) if len(ages) else None
+        oldest, newest = (int(ages.max()), int(ages.min())) if len(ages) else (None, None)
+    else:
+        counts = [0] * len(AGE_BUCKETS)
+        for age in ages:
+            counts[bisect_right(AGE_EDGES, age)] += 1
+        total = sum(ages)
+        middle = float(median(ages)) if ages else None
+        oldest, newest = max(ages, default=None), min(ages, default=None)
+    return {
+        'cards': len(ages),
+        'average': total / len(ages) if len(ages) else None,
+        'median': middle,
+        'oldest': oldest,
+        'newest': newest,
+        'buckets': list(zip(AGE_BUCKETS, counts)),
+    }
+
+
+def card_created(card_id):
+    """Creation time of a card (Unix seconds) from the timestamp in its ID, or None"""
+    try:
+        return int(card_id[:8], 16)
+    except (TypeError, ValueError):
+        return None
+
+
+def _label_positions(frame):
+    """Bit position of each board label, by label ID"""
+    return {label.id: bit for bit, label in enumerate(frame.labels)}
+
+
+class PythonColumns:
+    """
+    The columns as Python lists, one value per frame row (None for a
+    missing timestamp). Label bitsets are Python ints. Each column is
+    built the first time a metric reads it.
+    """
+
+    backend = 'python'
+
+    def __init__(self, frame):
+        self.frame = frame
+        self.now = frame.timestamp
+        self.lists = len(frame.lists)
+        self.labels = len(frame.labels)
+        self.list_index = []
+        for index, lst in enumerate(frame.lists):
+            self.list_index.extend([index] * (lst.stop - lst.start))
+
+    @cached_property
+    def created(self):
+        return [card_created(card.id) for card in self.frame.cards]
+
+    @property
+    def due(self):
+        return self.frame.due_ts
+
+    @cached_property
+    def label_bits(self):
+        positions = _label_positions(self.frame)
+        label_bits = []
+        for card in self.frame.cards:
+            bits = 0
+            for label in card.labels:
+                if label.id in positions:
+                    bits |= 1 << positions[label.id]
+            label_bits.append(bits)
+        return label_bits
+
+    @property
+    def items(self):
+        return self.frame.items
+
+    @property
+    def completed(self):
+        return self.frame.completed
+
+    @cached_property
+    def ages(self):
+        """Whole days since each card was created (None if its ID has no timestamp)"""
+        now = self.now
+        return [None if created is None else int((now - created) // DAY) for created in self.created]
+
+    def stale(self, lists, days):
+        """
+        Cards of the selected lists (a flag per frame list) created more
+        than `days` days ago
+
+        Returns:
+            (rows, ages) in row order
+        """
+        rows, ages = [], []
+        for row, (index, age) in enumerate(zip(self.list_index, self.ages)):
+            if lists[index] and age is not None and age > days:
+                rows.append(row)
+                ages.append(age)
+        return rows, ages
+
+    def overdue(self, lists):
+        """
+        Cards of the selected lists whose due date has passed
+
+        Returns:
+            (rows, whole days overdue) in row order
+        """
+        now = self.now
+        rows, days = [], []
+        for row, (index, due) in enumerate(zip(self.list_index, self.due)):
+            if lists[index] and due is not None and due < now:
+                rows.append(row)
+                days.append(int((now - due) // DAY))
+        return rows, days
+
+    def list_sizes(self):
+        """Open cards per frame list"""
+        sizes = [0] * self.lists
+        for index in self.list_index:
+            sizes[index] += 1
+        return sizes
+
+    def incomplete_checklists(self, lists):
+        """
+        Cards of the selected lists with unchecked checklist items
+
+        Returns:
+            (rows, checklist items, checked items) in row order
+        """
+        rows, items, completed = [], [], []
+        for row, (index, total, checked) in enumerate(zip(self.list_index, self.items, self.completed)):
+            if lists[index] and checked < total:
+                rows.append(row)
+                items.append(total)
+                completed.append(checked)
+        return rows, items, completed
+
+    def age_distribution(self, lists):
+        """age_distribution() of the cards of the selected lists"""
+        return age_distribution([age for index, age in zip(self.list_index, self.ages)
+                                 if lists[index] and age is not None])
+
+    def label_usage(self):
+        """Cards carrying each board label, in frame.labels order"""
+        usage = [0] * self.labels
+        for bits in self.label_bits:
+            while bits:
+                low = bits & -bits
+                usage[low.bit_length() - 1] += 1
+                bits ^= low
+        return usage
+
+
+# Hex digit values by ASCII code (-1 for anything else)
+if numpy is not None:
+    _HEX = numpy.full(256, -1, dtype=numpy.int64)
+    for _digit, _char in enumerate('0123456789abcdef'):
+        _HEX[ord(_char)] = _HEX[ord(_char.upper())] = _digit
+
+
+class NumpyColumns:
+    """
+    The columns as NumPy arrays: float timestamps (NaN when missing),
+    integer list indexes and checklist totals, and label bitsets as a
+    (rows, words) uint64 array with label b at bit b % 64 of word b // 64.
+    The metrics are those of PythonColumns, with the same results; columns
+    are likewise built on first use.
+    """
+
+    backend = 'numpy'
+
+    def __init__(self, frame):
+        self.frame = frame
+        self.now = frame.timestamp
+        self.lists = len(frame.lists)
+        self.labels = len(frame.labels)
+        self.list_index = numpy.repeat(numpy.arange(self.lists), numpy.array(
+            [lst.stop - lst.start for lst in frame.lists], dtype=numpy.intp))
+
+    @cached_property
+    def created(self):
+        return self._decode_created([card.id for card in self.frame.cards])
+
+    @cached_property
+    def due(self):
+        return self._decode_due(self.frame)
+
+    @cached_property
+    def label_bits(self):
+        frame = self.frame
+        # One (row, bit) pair per label on a card; labels not on the board get bit -1
+        positions = _label_positions(frame)
+        bits = numpy.array([positions.get(label.id, -1) for card in frame.cards for label in card.labels],
+                           dtype=numpy.int64)
+        rows = numpy.repeat(numpy.arange(len(frame.cards)),
+                            numpy.array([len(card.labels) for card in frame.cards], dtype=numpy.intp))
+        rows, bits = rows[bits >= 0], bits[bits >= 0].astype(numpy.uint64)
+        label_bits = numpy.zeros((len(frame.cards), max(1, -(-self.labels // 64))), dtype=numpy.uint64)
+        numpy.bitwise_or.at(label_bits, (rows, (bits // 64).astype(numpy.intp)),
+                            numpy.left_shift(numpy.uint64(1), bits % 64))
+        return label_bits
+
+    @cached_property
+    def items(self):
+        return numpy.array(self.frame.items, dtype=numpy.int64)
+
+    @cached_property
+    def completed(self):
+        return numpy.array(self.frame.completed, dtype=numpy.int64)
+
+    @staticmethod
+    def _decode_created(ids):
+        """Timestamps from the first 8 hex digits of each ID, decoded as one array"""
+        if set(map(len, ids)) != {24} or not all(map(str.isascii, ids)):
+            # IDs of other lengths or non-ASCII IDs: decode one at a time
+            return numpy.array([numpy.nan if created is None else created
+                                for created in map(card_created, ids)], dtype=numpy.float64)
+        head = numpy.frombuffer(''.join(ids).encode('ascii'), dtype=numpy.uint8).reshape(-1, 24)[:, :8]
+        digits = _HEX[head]
+        created = (digits @ (16 ** numpy.arange(7, -1, -1))).astype(numpy.float64)
+        created[(digits < 0).any(axis=1)] = numpy.nan
+        return created
+
+    @staticmethod
+    def _decode_due(frame):
+        """Due timestamps, parsed as datetime64 when every due date is Trello's UTC format"""
+        dues = [card.due for card in frame.cards]
+        present = [due for due in dues if due]
+        if not all(isinstance(due, str) and len(due) == 24 and due.endswith('Z') for due in present):
+            return numpy.array([numpy.nan if due is None else due for due in frame.due_ts], dtype=numpy.float64)
+        due = numpy.full(len(dues), numpy.nan)
+        mask = numpy.array([bool(due) for due in dues], dtype=bool)
+        try:
+            parsed = numpy.array([due[:-1] for due in present], dtype='datetime64[ms]')
+        except ValueError:
+            return numpy.array([numpy.nan if due is None else due for due in frame.due_ts], dtype=numpy.float64)
+        due[mask] = parsed.astype(numpy.int64) / 1000
+        return due
+
+    @cached_property
+    def ages(self):
+        """Whole days since each card was created (NaN if its ID has no timestamp)"""
+        return numpy.floor_divide(self.now - self.created, DAY)
+
+    def _selected(self, lists):
+        return numpy.asarray(lists, dtype=bool)[self.list_index]
+
+    def stale(self, lists, days):
+        ages = self.ages
+        with numpy.errstate(invalid='ignore'):
+            rows = numpy.flatnonzero(self._selected(lists) & (ages > days))
+        return rows.tolist(), ages[rows].astype(numpy.int64).tolist()
+
+    def overdue(self, lists):
+        with numpy.errstate(invalid='ignore'):
+            rows = numpy.flatnonzero(self._selected(lists) & (self.due < self.now))
+        days = numpy.floor_divide(self.now - self.due[rows], DAY)
+        return rows.tolist(), days.astype(numpy.int64).tolist()
+
+    def list_sizes(self):
+        return numpy.bincount(self.list_index, minlength=self.lists).tolist()
+
+    def incomplete_checklists(self, lists):
+        rows = numpy.flatnonzero(self._selected(lists) & (self.completed < self.items))
+        return rows.tolist(), self.items[rows].tolist(), self.completed[rows].tolist()
+
+    def age_distribution(self, lists):
+        ages = self.ages
+        ages = ages[self._selected(lists) & ~numpy.isnan(ages)]
+        return age_distribution(ages.astype(numpy.int64))
+
+    def label_usage(self):
+        bits = numpy.arange(self.labels)
+        words = self.label_bits[:, bits // 64]
+        return ((words >> (bits % 64).astype(numpy.uint64)) & numpy.uint64(1)).sum(axis=0).astype(numpy.int64).tolist()
+
+
+def card_columns(frame, use_numpy=None):
+    """
+    The columns of a BoardFrame's rows
+
+    Args:
+        use_numpy: True or False to pick the backend; by default NumPy
+                   when it is installed
+    """
+    if use_numpy is None:
+        use_numpy = numpy is not None
+    if use_numpy and numpy is None:
+        raise ValueError("NumPy is not installed (pip install numpy)")
+    return NumpyColumns(frame) if use_numpy else PythonColumns(frame)
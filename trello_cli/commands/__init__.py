@@ -1,45 +1,121 @@
 """
 Command modules for Trello CLI
+
+Command functions are imported on first access, so running one command
+only loads the module it lives in (and the API client only if it uses it).
 """
 
-from .board import cmd_boards, cmd_create_board
-from .list import cmd_lists, cmd_create_list, cmd_archive_list
-from .card import (
-    cmd_cards, cmd_add_card, cmd_show_card,
-    cmd_update_card, cmd_move_card,
-    cmd_add_checklist, cmd_add_checkitem,
-    cmd_set_due, cmd_add_comment, cmd_delete_card, cmd_rename_card
-)
-from .label import cmd_add_label, cmd_remove_label, cmd_delete_label, cmd_rename_label
-from .help import cmd_help, cmd_help_json
-from .discovery import cmd_board_overview, cmd_board_ids, cmd_search_cards
-from .bulk import (
-    cmd_bulk_move_cards, cmd_bulk_add_label, cmd_bulk_set_due,
-    cmd_bulk_archive_cards, cmd_bulk_create_cards,
-    cmd_bulk_relabel, cmd_label_backup, cmd_label_restore
-)
-from .quick import (
-    cmd_quick_start, cmd_quick_test, cmd_quick_done,
-    cmd_my_cards, cmd_card_age
-)
-from .sprint import (
-    cmd_sprint_start, cmd_sprint_status, cmd_sprint_close, cmd_sprint_velocity
-)
-from .query import (
-    cmd_cards_by_label, cmd_cards_due_soon, cmd_cards_overdue,
-    cmd_list_metrics, cmd_board_health
-)
-from .standardize import (
-    cmd_standardize_lists, cmd_scrum_check, cmd_migrate_cards, cmd_list_templates
-)
-from .migrate import cmd_migrate_board, cmd_archive_board
-from .audit import cmd_board_audit, cmd_list_audit, cmd_list_snapshot, cmd_sprint_audit, cmd_label_audit
-from .members import cmd_assign_card, cmd_unassign_card, cmd_card_log
-from .export import cmd_export_board
-from .validation import (
-    cmd_validation_status, cmd_validation_enable, cmd_validation_disable,
-    cmd_validation_config, cmd_validation_reload, cmd_validation_reset
-)
+import importlib
+
+
+# Command function -> module in this package
+COMMAND_MODULES = {
+    # board.py
+    'cmd_boards': 'board',
+    'cmd_create_board': 'board',
+    # list.py
+    'cmd_lists': 'list',
+    'cmd_create_list': 'list',
+    'cmd_archive_list': 'list',
+    # card.py
+    'cmd_cards': 'card',
+    'cmd_add_card': 'card',
+    'cmd_show_card': 'card',
+    'cmd_update_card': 'card',
+    'cmd_move_card': 'card',
+    'cmd_add_checklist': 'card',
+    'cmd_add_checkitem': 'card',
+    'cmd_set_due': 'card',
+    'cmd_add_comment': 'card',
+    'cmd_delete_card': 'card',
+    'cmd_rename_card': 'card',
+    # label.py
+    'cmd_add_label': 'label',
+    'cmd_remove_label': 'label',
+    'cmd_delete_label': 'label',
+    'cmd_rename_label': 'label',
+    # help.py
+    'cmd_help': 'help',
+    'cmd_help_json': 'help',
+    # discovery.py
+    'cmd_board_overview': 'discovery',
+    'cmd_board_ids': 'discovery',
+    'cmd_search_cards': 'discovery',
+    'cmd_search': 'discovery',
+    # bulk.py
+    'cmd_bulk_move_cards': 'bulk',
+    'cmd_bulk_add_label': 'bulk',
+    'cmd_bulk_set_due': 'bulk',
+    'cmd_bulk_archive_cards': 'bulk',
+    'cmd_bulk_create_cards': 'bulk',
+    'cmd_bulk_relabel': 'bulk',
+    'cmd_label_backup': 'bulk',
+    'cmd_label_restore': 'bulk',
+    # quick.py
+    'cmd_quick_start': 'quick',
+    'cmd_quick_test': 'quick',
+    'cmd_quick_done': 'quick',
+    'cmd_my_cards': 'quick',
+    'cmd_card_age': 'quick',
+    # sprint.py
+    'cmd_sprint_start': 'sprint',
+    'cmd_sprint_status': 'sprint',
+    'cmd_sprint_close': 'sprint',
+    'cmd_sprint_velocity': 'sprint',
+    # query.py
+    'cmd_cards_by_label': 'query',
+    'cmd_cards_due_soon': 'query',
+    'cmd_cards_overdue': 'query',
+    'cmd_list_metrics': 'query',
+    'cmd_board_health': 'query',
+    # standardize.py
+    'cmd_standardize_lists': 'standardize',
+    'cmd_scrum_check': 'standardize',
+    'cmd_migrate_cards': 'standardize',
+    'cmd_list_templates': 'standardize',
+    # migrate.py
+    'cmd_migrate_board': 'migrate',
+    'cmd_archive_board': 'migrate',
+    # audit.py
+    'cmd_board_audit': 'audit',
+    'cmd_board_audit_all': 'audit',
+    'cmd_list_audit': 'audit',
+    'cmd_list_snapshot': 'audit',
+    'cmd_sprint_audit': 'audit',
+    'cmd_label_audit': 'audit',
+    'cmd_audit_all': 'audit',
+    # members.py
+    'cmd_assign_card': 'members',
+    'cmd_unassign_card': 'members',
+    'cmd_card_log': 'members',
+    # export.py
+    'cmd_export_board': 'export',
+    # validation.py
+    'cmd_validation_status': 'validation',
+    'cmd_validation_enable': 'validation',
+    'cmd_validation_disable': 'validation',
+    'cmd_validation_config': 'validation',
+    'cmd_validation_reload': 'validation',
+    'cmd_validation_reset': 'validation',
+    # cache.py
+    'cmd_cache_status': 'cache',
+    'cmd_cache_clear': 'cache',
+    # stats.py
+    'cmd_stats': 'stats',
+    # batch.py
+    'cmd_batch': 'batch',
+    # shell.py
+    'cmd_shell': 'shell',
+    # sync.py
+    'cmd_sync': 'sync',
+    'cmd_mirror_status': 'sync',
+    # webhook.py
+    'cmd_webhook_serve': 'webhook',
+    'cmd_webhook_replay': 'webhook',
+    'cmd_webhook_register': 'webhook',
+    'cmd_webhook_list': 'webhook',
+    'cmd_webhook_unregister': 'webhook',
+}
 
 __all__ = [
     # Basic commands
@@ -52,7 +128,7 @@ __all__ = [
     'cmd_add_label', 'cmd_remove_label', 'cmd_delete_label', 'cmd_rename_label',
     # Help & Discovery
     'cmd_help', 'cmd_help_json',
-    'cmd_board_overview', 'cmd_board_ids', 'cmd_search_cards',
+    'cmd_board_overview', 'cmd_board_ids', 'cmd_search_cards', 'cmd_search',
     # Bulk operations
     'cmd_bulk_move_cards', 'cmd_bulk_add_label', 'cmd_bulk_set_due',
     'cmd_bulk_archive_cards', 'cmd_bulk_create_cards',
@@ -71,11 +147,37 @@ __all__ = [
     'cmd_migrate_board', 'cmd_archive_board',
     # Audit commands
     'cmd_board_audit', 'cmd_list_audit', 'cmd_list_snapshot', 'cmd_sprint_audit', 'cmd_label_audit',
+    'cmd_board_audit_all', 'cmd_audit_all',
     # Member management
     'cmd_assign_card', 'cmd_unassign_card', 'cmd_card_log',
     # Export
     'cmd_export_board',
     # Validation
     'cmd_validation_status', 'cmd_validation_enable', 'cmd_validation_disable',
-    'cmd_validation_config', 'cmd_validation_reload', 'cmd_validation_reset'
+    'cmd_validation_config', 'cmd_validation_reload', 'cmd_validation_reset',
+    # Cache
+    'cmd_cache_status', 'cmd_cache_clear',
+    # Metrics
+    'cmd_stats',
+    # Batch and shell
+    'cmd_batch', 'cmd_shell',
+    # Local mirror
+    'cmd_sync', 'cmd_mirror_status',
+    # Webhooks
+    'cmd_webhook_serve', 'cmd_webhook_replay', 'cmd_webhook_register',
+    'cmd_webhook_list', 'cmd_webhook_unregister',
 ]
+
+
+def __getattr__(name):
+    """Import a command's module the first time the command is looked up"""
+    module = COMMAND_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    function = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = function
+    return function
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
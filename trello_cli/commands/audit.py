@@ -4,9 +4,14 @@ Audit commands for board and list analysis
 
 import json
 import re
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 from collections import defaultdict, Counter
 from ..client import get_client
+from ..async_client import get_board_snapshot_concurrently
+from ..executor import parse_concurrency, run_tasks
+from ..rules import (BoardAuditRule, BoardFrame, LabelAuditRule, SprintAuditRule, audit_summary,
+                     evaluate, make_rules, score_status)
 
 
 def cmd_board_audit(board_id, pattern=None, fix_labels=False, report_json=False):
@@ -24,247 +29,35 @@ def cmd_board_audit(board_id, pattern=None, fix_labels=False, report_json=False)
     8. Cards without descriptions in critical lists
     9. Naming pattern violations (inconsistent nomenclature)
     """
-    client = get_client()
-    board = client.get_board(board_id)
-    lists = board.list_lists()
-
-    # Compile pattern if provided
-    id_pattern = re.compile(pattern) if pattern else None
-
-    # Initialize critical issue trackers
-    done_cards_no_due = []
-    done_cards_incomplete_checklist = []
-    active_cards_no_due = []
-    overdue_not_complete = []
-    execution_cards_no_members = []
-    empty_checklists = []
-    cards_without_pattern = []
-    cards_without_description_critical = []
-
-    # Additional trackers
-    cards_without_labels = []
-    empty_lists = []
-    stale_lists = []
-
-    total_cards = 0
-    total_active_lists = 0
-
-    # Define list categories
-    DONE_KEYWORDS = ['done', 'completed', 'finished', 'closed', 'archive']
-    ACTIVE_KEYWORDS = ['sprint', 'doing', 'in progress', 'testing', 'ready', 'wip', 'development']
-    EXECUTION_KEYWORDS = ['sprint', 'doing', 'in progress', 'testing', 'development']
-    CRITICAL_KEYWORDS = ['sprint', 'testing', 'in progress', 'doing', 'review']
-
-    for lst in lists:
-        if lst.closed:
-            continue
-
-        total_active_lists += 1
-        cards = lst.list_cards()
-
-        # Check for empty lists
-        if len(cards) == 0:
-            empty_lists.append(lst.name)
-            continue
-
-        total_cards += len(cards)
-
-        # Categorize list
-        list_name_lower = lst.name.lower()
-        is_done_list = any(keyword in list_name_lower for keyword in DONE_KEYWORDS)
-        is_active_list = any(keyword in list_name_lower for keyword in ACTIVE_KEYWORDS)
-        is_execution_list = any(keyword in list_name_lower for keyword in EXECUTION_KEYWORDS)
-        is_critical_list = any(keyword in list_name_lower for keyword in CRITICAL_KEYWORDS)
-
-        # Check if list is stale
-        is_stale = True
-        newest_card_age = None
-
-        for card in cards:
-            try:
-                timestamp = int(card.id[:8], 16)
-                created_date = datetime.fromtimestamp(timestamp)
-                age_days = (datetime.now() - created_date).days
-
-                if newest_card_age is None or age_days < newest_card_age:
-                    newest_card_age = age_days
-
-                if age_days < 30:
-                    is_stale = False
-            except:
-                pass
-
-        if is_stale and newest_card_age and not is_done_list:
-            stale_lists.append((lst.name, newest_card_age))
-
-        # Audit each card
-        for card in cards:
-            # Get card age
-            try:
-                timestamp = int(card.id[:8], 16)
-                created_date = datetime.fromtimestamp(timestamp)
-                age_days = (datetime.now() - created_date).days
-            except:
-                age_days = None
-
-            # Parse due date
-            due_date = None
-            is_overdue = False
-            days_overdue = 0
-            if card.due:
-                try:
-                    if isinstance(card.due, str):
-                        due_date = datetime.fromisoformat(card.due.replace('Z', '+00:00'))
-                    else:
-                        due_date = card.due
-
-                    if due_date < datetime.now():
-                        is_overdue = True
-                        days_overdue = (datetime.now() - due_date).days
-                except:
-                    pass
-
-            # Get checklist status
-            has_checklist = len(card.checklists) > 0
-            checklist_complete = True
-            checklist_empty = False
-            total_items = 0
-            completed_items = 0
-
-            if has_checklist:
-                for checklist in card.checklists:
-                    items = checklist.items
-                    if len(items) == 0:
-                        checklist_empty = True
-
-                    for item in items:
-                        total_items += 1
-                        if item.get('state', 'incomplete') == 'complete':
-                            completed_items += 1
-
-                if total_items > 0 and completed_items < total_items:
-                    checklist_complete = False
-
-            # Get member status
-            has_members = False
-            if hasattr(card, 'idMembers') and card.idMembers:
-                has_members = True
-            elif hasattr(card, 'member_id') and card.member_id:
-                has_members = True
-
-            # CRITICAL VALIDATION 1: Cards in Done without due date
-            if is_done_list and not card.due:
-                done_cards_no_due.append({
-                    'card': card,
-                    'list': lst.name,
-                    'age': age_days
-                })
-
-            # CRITICAL VALIDATION 2: Cards in Done with incomplete checklists
-            if is_done_list and has_checklist and not checklist_complete:
-                done_cards_incomplete_checklist.append({
-                    'card': card,
-                    'list': lst.name,
-                    'total': total_items,
-                    'completed': completed_items
-                })
-
-            # CRITICAL VALIDATION 3: Active cards without due dates
-            if is_active_list and not card.due:
-                active_cards_no_due.append({
-                    'card': card,
-                    'list': lst.name
-                })
-
-            # CRITICAL VALIDATION 4: Overdue cards not marked complete
-            if is_overdue and not is_done_list:
-                overdue_not_complete.append({
-                    'card': card,
-                    'list': lst.name,
-                    'due_date': due_date,
-                    'days_overdue': days_overdue
-                })
-
-            # CRITICAL VALIDATION 5: Execution cards without members
-            if is_execution_list and not has_members:
-                execution_cards_no_members.append({
-                    'card': card,
-                    'list': lst.name
-                })
-
-            # CRITICAL VALIDATION 7: Empty checklists
-            if checklist_empty:
-                empty_checklists.append({
-                    'card': card,
-                    'list': lst.name
-                })
-
-            # Additional validations
-            if id_pattern and not id_pattern.search(card.name):
-                cards_without_pattern.append({
-                    'card': card,
-                    'list': lst.name
-                })
-
-            if is_critical_list and (not card.desc or card.desc.strip() == ""):
-                cards_without_description_critical.append({
-                    'card': card,
-                    'list': lst.name
-                })
-
-            if not card.labels or len(card.labels) == 0:
-                cards_without_labels.append({
-                    'card': card,
-                    'list': lst.name
-                })
-
-    # Calculate severity scores
-    critical_issues = 0
-    high_issues = 0
-    medium_issues = 0
-
-    if done_cards_no_due: critical_issues += 1
-    if done_cards_incomplete_checklist: critical_issues += 1
-    if active_cards_no_due: high_issues += 1
-    if overdue_not_complete: critical_issues += 1
-    if execution_cards_no_members: high_issues += 1
-    if empty_checklists: medium_issues += 1
-    if cards_without_pattern and id_pattern: medium_issues += 1
-    if cards_without_description_critical: medium_issues += 1
-
-    total_issues = critical_issues + high_issues + medium_issues
+    board = get_client().get_board_snapshot(board_id)
+    report = evaluate(BoardFrame(board), [BoardAuditRule(pattern)])['board-audit']
+    _print_board_audit(board, report, report_json)
+
+
+def _print_board_audit(board, report, report_json=False):
+    """Print a BoardAuditRule report, as JSON with report_json"""
+    board_id = board.id
+    pattern = report['pattern']
+    done_cards_no_due = report['done_no_due']
+    done_cards_incomplete_checklist = report['done_incomplete_checklist']
+    active_cards_no_due = report['active_no_due']
+    overdue_not_complete = report['overdue']
+    execution_cards_no_members = report['execution_no_members']
+    empty_checklists = report['empty_checklists']
+    cards_without_pattern = report['pattern_violations']
+    cards_without_description_critical = report['critical_no_description']
+
+    total_active_lists = report['lists']
+    total_cards = report['cards']
+    critical_issues = report['critical']
+    high_issues = report['high']
+    medium_issues = report['medium']
+    total_issues = report['total']
+    health_score = report['score']
 
     # If JSON report requested
     if report_json:
-        report = {
-            "board_id": board_id,
-            "board_name": board.name,
-            "audit_timestamp": datetime.now().isoformat(),
-            "summary": {
-                "total_lists": total_active_lists,
-                "total_cards": total_cards,
-                "critical_issues": critical_issues,
-                "high_issues": high_issues,
-                "medium_issues": medium_issues,
-                "total_issues": total_issues
-            },
-            "critical_findings": {
-                "done_no_due": len(done_cards_no_due),
-                "done_incomplete_checklist": len(done_cards_incomplete_checklist),
-                "overdue_not_complete": len(overdue_not_complete)
-            },
-            "high_findings": {
-                "active_no_due": len(active_cards_no_due),
-                "execution_no_members": len(execution_cards_no_members)
-            },
-            "medium_findings": {
-                "empty_checklists": len(empty_checklists),
-                "pattern_violations": len(cards_without_pattern),
-                "critical_no_description": len(cards_without_description_critical)
-            },
-            "health_score": max(0, 100 - (critical_issues * 20) - (high_issues * 10) - (medium_issues * 5))
-        }
-        print(json.dumps(report, indent=2))
+        print(json.dumps(_board_audit_json(board, report), indent=2))
         return
 
     # Human-readable output
@@ -434,7 +227,7 @@ def cmd_board_audit(board_id, pattern=None, fix_labels=False, report_json=False)
         print(f"✅ No empty checklists found\n")
 
     # Pattern violations
-    if id_pattern and cards_without_pattern:
+    if pattern and cards_without_pattern:
         print(f"⚠️  NAMING PATTERN VIOLATIONS: {len(cards_without_pattern)} card(s)")
         print(f"   Pattern: {pattern}")
         print(f"   Problem: Inconsistent nomenclature")
@@ -469,8 +262,6 @@ def cmd_board_audit(board_id, pattern=None, fix_labels=False, report_json=False)
     print(f"📊 BOARD HEALTH SCORE")
     print(f"{'='*80}\n")
 
-    health_score = max(0, 100 - (critical_issues * 20) - (high_issues * 10) - (medium_issues * 5))
-
     if health_score >= 90:
         status = "🟢 EXCELLENT"
         message = "Your board is well-maintained and ready for production"
@@ -531,14 +322,124 @@ def cmd_board_audit(board_id, pattern=None, fix_labels=False, report_json=False)
     print(f"{'='*80}\n")
 
 
+def _board_audit_json(board, report):
+    """board-audit --report-json output for a BoardAuditRule report"""
+    return {
+        "board_id": board.id,
+        "board_name": board.name,
+        "audit_timestamp": datetime.now().isoformat(),
+        "summary": {
+            "total_lists": report['lists'],
+            "total_cards": report['cards'],
+            "critical_issues": report['critical'],
+            "high_issues": report['high'],
+            "medium_issues": report['medium'],
+            "total_issues": report['total']
+        },
+        "critical_findings": {
+            "done_no_due": len(report['done_no_due']),
+            "done_incomplete_checklist": len(report['done_incomplete_checklist']),
+            "overdue_not_complete": len(report['overdue'])
+        },
+        "high_findings": {
+            "active_no_due": len(report['active_no_due']),
+            "execution_no_members": len(report['execution_no_members'])
+        },
+        "medium_findings": {
+            "empty_checklists": len(report['empty_checklists']),
+            "pattern_violations": len(report['pattern_violations']),
+            "critical_no_description": len(report['critical_no_description'])
+        },
+        "health_score": report['score']
+    }
+
+
+def cmd_board_audit_all(pattern=None, org_id=None, jobs=1, output_file=None):
+    """
+    board-audit every open board, several at a time
+
+    Boards come from list_boards() (only the organization's with org_id).
+    Each worker fetches and audits one board; all of them share the
+    client's rate limiter, and a board that fails is reported without
+    stopping the others. The per-board reports (as --report-json prints
+    them) go to one JSON file, and the boards are printed ranked by
+    health score, lowest first.
+
+    Args:
+        pattern: Naming pattern checked on every board
+        org_id: Organization ID or name to audit instead of all boards
+        jobs: Number of boards audited at the same time
+        output_file: Combined JSON report (default: board-audit-YYYYMMDD.json)
+    """
+    jobs = parse_concurrency(jobs)
+    output_file = output_file or f"board-audit-{datetime.now():%Y%m%d}.json"
+    client = get_client()
+    boards = [board for board in client.list_boards(org_id) if not board.closed]
+    if not boards:
+        print(f"No open boards{f' in organization {org_id}' if org_id else ''} to audit")
+        return
+
+    def audit(board):
+        snapshot = client.get_board_snapshot(board.id)
+        report = evaluate(BoardFrame(snapshot), [BoardAuditRule(pattern)])['board-audit']
+        return _board_audit_json(snapshot, report)
+
+    start = time.perf_counter()
+    reports, failures = [], []
+    print(f"\n🔍 Auditing {len(boards)} board(s), {jobs} at a time")
+    print(f"{'='*80}")
+    for board, report, error in run_tasks(boards, audit, jobs):
+        if error is not None:
+            failures.append({"board_id": board.id, "board_name": board.name, "error": str(error)})
+            print(f"❌ {board.name[:40]:<40} {error}")
+            continue
+        reports.append(report)
+        print(f"✅ {board.name[:40]:<40} {report['summary']['total_cards']:>6} cards  "
+              f"score {report['health_score']:>3}/100")
+
+    reports.sort(key=lambda report: (report['health_score'], report['board_name'].lower()))
+    scores = [report['health_score'] for report in reports]
+    combined = {
+        "audit_timestamp": datetime.now().isoformat(),
+        "organization": org_id,
+        "pattern": pattern,
+        "boards": len(boards),
+        "audited": len(reports),
+        "failed": len(failures),
+        "average_score": round(sum(scores) / len(scores)) if scores else None,
+        "reports": reports,
+        "failures": failures,
+    }
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(combined, f, indent=2, ensure_ascii=False)
+
+    if reports:
+        print(f"\n📋 BOARD HEALTH RANKING (lowest score first)")
+        print(f"{'='*80}")
+        print(f"{'#':>3}  {'Board':<32}{'Cards':>7}{'Crit':>6}{'High':>6}{'Med':>6}{'Score':>7}  Status")
+        print("-" * 80)
+        for rank, report in enumerate(reports, 1):
+            summary = report['summary']
+            print(f"{rank:>3}  {report['board_name'][:30]:<32}{summary['total_cards']:>7}"
+                  f"{summary['critical_issues']:>6}{summary['high_issues']:>6}{summary['medium_issues']:>6}"
+                  f"{report['health_score']:>7}  {score_status(report['health_score'])}")
+        print("-" * 80)
+        print(f"Average score: {combined['average_score']}/100")
+    print(f"{'='*80}")
+    print(f"Audited {len(reports)}/{len(boards)} board(s) in {time.perf_counter() - start:.2f}s")
+    print(f"✅ Combined report written to: {output_file}")
+
+    if failures:
+        raise Exception(f"Failed to audit {len(failures)} board(s)")
+
+
 def cmd_list_snapshot(list_id, output_file=None):
     """
     Export complete snapshot of a list to JSON.
     Includes all card details: ID, name, description, labels, members, checklists, etc.
     """
     client = get_client()
-    lst = client.get_list(list_id)
-    cards = lst.list_cards()
+    lst, cards = client.get_list_cards(list_id, checklists=True)
 
     snapshot = {
         "list_id": lst.id,
@@ -798,9 +699,21 @@ def cmd_sprint_audit(board_id, sprint_label=None):
     - Cards in sprint lists without sprint labels
     - Due date consistency within sprints
     """
-    client = get_client()
-    board = client.get_board(board_id)
-    lists = board.list_lists()
+    board = get_client().get_board_snapshot(board_id)
+    report = evaluate(BoardFrame(board), [SprintAuditRule(sprint_label)])['sprint-audit']
+    _print_sprint_audit(board, report)
+
+
+def _print_sprint_audit(board, report):
+    """Print a SprintAuditRule report"""
+    board_id = board.id
+    sprint_label = report['sprint_label']
+    sprint_cards = report['cards']
+    sprint_cards_without_dates = report['without_dates']
+    overdue_sprint_cards = report['overdue']
+    cards_in_sprint_list_without_label = report['unlabeled']
+    cards_by_sprint = report['by_sprint']
+    sprint_labels_found = cards_by_sprint.keys()
 
     print(f"\n{'='*80}")
     print(f"SPRINT AUDIT REPORT - {board.name}")
@@ -809,78 +722,6 @@ def cmd_sprint_audit(board_id, sprint_label=None):
         print(f"Filtering by label: {sprint_label}")
     print(f"{'='*80}\n")
 
-    # Initialize trackers
-    sprint_cards = []
-    sprint_cards_without_dates = []
-    overdue_sprint_cards = []
-    cards_in_sprint_list_without_label = []
-    sprint_labels_found = set()
-
-    # Track cards by sprint label
-    cards_by_sprint = defaultdict(list)
-
-    # Keywords for sprint-related lists
-    sprint_list_keywords = ['sprint', 'doing', 'in progress', 'testing', 'ready']
-
-    for lst in lists:
-        if lst.closed:
-            continue
-
-        cards = lst.list_cards()
-        is_sprint_list = any(keyword in lst.name.lower() for keyword in sprint_list_keywords)
-
-        for card in cards:
-            # Find sprint labels
-            card_sprint_labels = []
-            for label in card.labels:
-                label_name = (label.name or "").lower()
-
-                # Check if it's a sprint label
-                is_sprint_label = False
-                if sprint_label:
-                    # User specified a specific sprint label
-                    if sprint_label.lower() in label_name:
-                        is_sprint_label = True
-                else:
-                    # Auto-detect sprint labels (containing "sprint", "s1", "s2", etc)
-                    if 'sprint' in label_name or re.match(r's\d+', label_name):
-                        is_sprint_label = True
-
-                if is_sprint_label:
-                    card_sprint_labels.append(label.name or label.color)
-                    sprint_labels_found.add(label.name or label.color)
-
-            # Card has sprint label
-            if card_sprint_labels:
-                sprint_cards.append((card, lst.name, card_sprint_labels))
-
-                # Group by sprint
-                for sprint in card_sprint_labels:
-                    cards_by_sprint[sprint].append((card, lst.name))
-
-                # Check if has due date
-                if not card.due:
-                    sprint_cards_without_dates.append((card, lst.name, card_sprint_labels))
-                else:
-                    # Check if overdue
-                    try:
-                        if isinstance(card.due, str):
-                            due_date = datetime.fromisoformat(card.due.replace('Z', '+00:00'))
-                        else:
-                            due_date = card.due
-
-                        if due_date < datetime.now():
-                            days_overdue = (datetime.now() - due_date).days
-                            overdue_sprint_cards.append((card, lst.name, card_sprint_labels, due_date, days_overdue))
-                    except:
-                        pass
-
-            # Card in sprint list but no sprint label
-            elif is_sprint_list:
-                # Skip Done lists
-                if 'done' not in lst.name.lower():
-                    cards_in_sprint_list_without_label.append((card, lst.name))
-
     # Print summary
     print(f"📊 SPRINT SUMMARY:")
     print(f"   Sprint labels found: {len(sprint_labels_found)}")
@@ -929,9 +770,6 @@ def cmd_sprint_audit(board_id, sprint_label=None):
         print(f"🔴 OVERDUE SPRINT CARDS: {len(overdue_sprint_cards)} card(s)")
         print(f"   These cards are past their due date and need attention\n")
 
-        # Sort by most overdue
-        overdue_sprint_cards.sort(key=lambda x: x[4], reverse=True)
-
         for card, list_name, sprints, due_date, days_overdue in overdue_sprint_cards[:15]:
             sprint_str = ", ".join(sprints)
             due_str = due_date.strftime('%Y-%m-%d')
@@ -987,31 +825,11 @@ def cmd_sprint_audit(board_id, sprint_label=None):
         cards_info = cards_by_sprint[sprint]
         total = len(cards_info)
 
-        # Calculate stats
-        with_dates = 0
-        overdue = 0
-        due_soon = 0
-        on_track = 0
-
-        for card, list_name in cards_info:
-            if card.due:
-                with_dates += 1
-                try:
-                    if isinstance(card.due, str):
-                        due_date = datetime.fromisoformat(card.due.replace('Z', '+00:00'))
-                    else:
-                        due_date = card.due
-
-                    days_until = (due_date - datetime.now()).days
-
-                    if days_until < 0:
-                        overdue += 1
-                    elif days_until <= 3:
-                        due_soon += 1
-                    else:
-                        on_track += 1
-                except:
-                    pass
+        stats = report['health'][sprint]
+        with_dates = stats['with_dates']
+        overdue = stats['overdue']
+        due_soon = stats['due_soon']
+        on_track = stats['on_track']
 
         without_dates = total - with_dates
         completion_rate = (with_dates / total * 100) if total > 0 else 0
@@ -1038,7 +856,7 @@ def cmd_sprint_audit(board_id, sprint_label=None):
 
     # Audit score
     print(f"{'='*80}")
-    audit_score = max(0, 100 - (issues * 25) - (len(overdue_sprint_cards) * 2))
+    audit_score = report['score']
 
     if audit_score >= 90:
         status = "🟢 EXCELLENT"
@@ -1055,7 +873,7 @@ def cmd_sprint_audit(board_id, sprint_label=None):
     print(f"{'='*80}\n")
 
 
-def cmd_label_audit(board_id):
+def cmd_label_audit(board_id, use_async=False):
     """
     Label audit:
     - Detect duplicate labels (same name, different color)
@@ -1063,64 +881,38 @@ def cmd_label_audit(board_id):
     - Unused labels (defined but not used on any card)
     - Label usage statistics
     - Naming inconsistencies
+
+    use_async: Fetch labels and cards as concurrent requests
     """
-    client = get_client()
-    board = client.get_board(board_id)
+    if use_async:
+        board = get_board_snapshot_concurrently(board_id)
+    else:
+        board = get_client().get_board_snapshot(board_id)
 
-    # Get all board labels
-    board_labels = board.get_labels()
+    report = evaluate(BoardFrame(board), [LabelAuditRule()])['label-audit']
+    _print_label_audit(board, report)
 
-    # Get all lists and cards
-    lists = board.list_lists()
+
+def _print_label_audit(board, report):
+    """Print a LabelAuditRule report"""
+    board_id = board.id
+    board_labels = report['labels']
+    total_cards = report['cards']
+    label_details = {label.id: {'id': label.id, 'name': label.name, 'color': label.color,
+                                'count': report['usage'][label.id]}
+                     for label in board_labels}
 
     print(f"\n{'='*80}")
     print(f"LABEL AUDIT REPORT - {board.name}")
     print(f"Board ID: {board_id}")
     print(f"{'='*80}\n")
 
-    # Track label usage
-    label_usage = defaultdict(int)
-    label_details = {}  # id -> {name, color, count}
-
-    # Initialize all board labels
-    for label in board_labels:
-        label_id = label.id
-        label_name = label.name or f"[{label.color}]"
-        label_details[label_id] = {
-            'id': label_id,
-            'name': label.name,
-            'color': label.color,
-            'count': 0
-        }
-
-    # Count label usage
-    total_cards = 0
-    for lst in lists:
-        if lst.closed:
-            continue
-
-        cards = lst.list_cards()
-        total_cards += len(cards)
-
-        for card in cards:
-            for label in card.labels:
-                if label.id in label_details:
-                    label_details[label.id]['count'] += 1
-                    label_usage[label.id] += 1
-
     # Analysis
     print(f"📊 LABEL SUMMARY:")
     print(f"   Total labels defined: {len(board_labels)}")
     print(f"   Total cards: {total_cards}")
     print()
 
-    # Group labels by name (case-insensitive)
-    labels_by_name = defaultdict(list)
-    for label in board_labels:
-        name_key = (label.name or "").lower().strip()
-        if name_key:
-            labels_by_name[name_key].append(label)
-
     # Detect issues
     print(f"{'='*80}")
     print(f"LABEL AUDIT FINDINGS:")
@@ -1129,7 +921,7 @@ def cmd_label_audit(board_id):
     issues = 0
 
     # 1. Duplicate names (same name, different colors)
-    duplicates = {name: labels for name, labels in labels_by_name.items() if len(labels) > 1}
+    duplicates = report['duplicates']
 
     if duplicates:
         issues += 1
@@ -1146,21 +938,7 @@ def cmd_label_audit(board_id):
         print(f"✅ No duplicate label names\n")
 
     # 2. Similar labels (potential typos)
-    similar_labels = []
-    label_names = [(label.name.lower().strip(), label) for label in board_labels if label.name]
-
-    for i, (name1, label1) in enumerate(label_names):
-        for name2, label2 in label_names[i+1:]:
-            # Check for very similar names (edit distance, common prefixes, etc.)
-            if name1 != name2:
-                # Simple similarity: same words in different order, or one contains the other
-                words1 = set(name1.split())
-                words2 = set(name2.split())
-
-                # Check if one contains the other or significant overlap
-                if (words1.issubset(words2) or words2.issubset(words1) or
-                    len(words1.intersection(words2)) >= min(len(words1), len(words2)) * 0.7):
-                    similar_labels.append((label1, label2))
+    similar_labels = report['similar']
 
     if similar_labels:
         issues += 1
@@ -1181,8 +959,7 @@ def cmd_label_audit(board_id):
         print(f"✅ No similar label names detected\n")
 
     # 3. Unused labels
-    unused_labels = [label for label in board_labels
-                    if label_details.get(label.id, {}).get('count', 0) == 0]
+    unused_labels = report['unused']
 
     if unused_labels:
         issues += 1
@@ -1199,7 +976,7 @@ def cmd_label_audit(board_id):
         print(f"✅ All labels are in use\n")
 
     # 4. Unnamed labels
-    unnamed_labels = [label for label in board_labels if not label.name or label.name.strip() == ""]
+    unnamed_labels = report['unnamed']
 
     if unnamed_labels:
         issues += 1
@@ -1271,8 +1048,7 @@ def cmd_label_audit(board_id):
 
     # Audit score
     print(f"{'='*80}")
-    audit_score = max(0, 100 - (len(duplicates) * 10) - (len(unused_labels) * 2) -
-                     (len(unnamed_labels) * 5) - (len(similar_labels) * 5))
+    audit_score = report['score']
 
     if audit_score >= 90:
         status = "🟢 EXCELLENT"
@@ -1290,3 +1066,55 @@ def cmd_label_audit(board_id):
     print(f"Unnamed labels: {len(unnamed_labels)}")
     print(f"Similar labels: {len(similar_labels)} pairs")
     print(f"{'='*80}\n")
+
+
+def cmd_audit_all(board_id, pattern=None, sprint_label=None, only=None, as_json=False, use_async=False):
+    """
+    Run board-audit, board-health, scrum-check, sprint-audit and
+    label-audit in one pass over the board
+
+    Each report is the one its own command prints; the board is fetched
+    once and every card is visited once for all of them.
+
+    Args:
+        pattern: Naming pattern for board-audit
+        sprint_label: Sprint label for sprint-audit (default: auto-detect)
+        only: Comma-separated audits to run instead of all of them
+        as_json: Print each audit's finding counts and score as JSON
+        use_async: Fetch the board as concurrent requests
+    """
+    from .query import _print_board_health
+    from .standardize import _print_scrum_check
+
+    rules = make_rules(only.split(',') if only else None, pattern=pattern, sprint_label=sprint_label)
+    board = get_board_snapshot_concurrently(board_id) if use_async else get_client().get_board_snapshot(board_id)
+
+    start = time.perf_counter()
+    frame = BoardFrame(board)
+    reports = evaluate(frame, rules)
+    seconds = time.perf_counter() - start
+    summary = audit_summary(frame, rules, reports)
+
+    if as_json:
+        print(json.dumps(summary, indent=2))
+        return
+
+    renderers = {
+        'board-audit': lambda report: _print_board_audit(board, report),
+        'board-health': lambda report: _print_board_health(board.name, report),
+        'scrum-check': lambda report: _print_scrum_check(board, report),
+        'sprint-audit': lambda report: _print_sprint_audit(board, report),
+        'label-audit': lambda report: _print_label_audit(board, report),
+    }
+    for name, report in reports.items():
+        renderers[name](report)
+
+    print(f"{'='*70}")
+    print(f"📋 AUDIT SUMMARY - {board.name}")
+    print(f"{'='*70}")
+    for name, audit in summary['audits'].items():
+        print(f"   {name:<14} {audit['score']:>3}/100  {score_status(audit['score'])}")
+    print(f"   {'-'*40}")
+    print(f"   {'overall':<14} {summary['score']:>3}/100  {score_status(summary['score'])}")
+    print(f"\n{len(rules)} audit(s) of {summary['cards']} card(s) in one pass ({seconds * 1000:.1f} ms)")
+    print(f"{'='*70}\n")
@@ -0,0 +1,348 @@
+"""
+Batch command: run many CLI commands in one process
+"""
+
+import io
+import json
+import re
+import shlex
+import sys
+import threading
+import time
+
+from ..executor import run_tasks
+from ..registry import COMMANDS, ALIASES
+
+
+# Commands a batch line may not run (they manage processes, prompt for
+# credentials, hand the terminal to a subprocess or prompt, or serve until
+# interrupted)
+NOT_BATCHABLE = ('batch', 'daemon', 'config', 'plugin', 'shell', 'webhook')
+
+# Lines whose first argument is one of these only touch that card or list
+# (plus any other IDs on the line). Every other command is a barrier when
+# lines run concurrently: it waits for the lines before it, and the lines
+# after it wait for it.
+SCOPED_USAGES = ('<card_id>', '<list_id>')
+
+TRELLO_ID = re.compile(r'^[0-9a-fA-F]{24}$')
+
+
+class BatchLine:
+    """One command of a batch and, once run, its outcome"""
+
+    __slots__ = ('number', 'text', 'command', 'argv', 'entry', 'status', 'exit_code',
+                 'error', 'output', 'seconds')
+
+    def __init__(self, number, text, command, argv, entry):
+        self.number = number
+        self.text = text
+        self.command = command
+        self.argv = argv
+        self.entry = entry
+        self.status = 'pending'
+        self.exit_code = None
+        self.error = None
+        self.output = ''
+        self.seconds = 0.0
+
+    @property
+    def keys(self):
+        """IDs this line reads or writes, for grouping dependent lines"""
+        keys = {arg for arg in self.argv if TRELLO_ID.match(arg)}
+        positional = [arg for arg in self.argv if not arg.startswith('--')]
+        if positional:
+            keys.add(positional[0])
+        return keys
+
+    @property
+    def is_barrier(self):
+        return self.entry is None or not self.entry.usage.startswith(SCOPED_USAGES)
+
+    def to_json(self, include_output=True):
+        result = {
+            'line': self.number,
+            'command': self.command,
+            'argv': self.argv,
+            'status': self.status,
+            'exit_code': self.exit_code,
+            'error': self.error,
+            'seconds': round(self.seconds, 4),
+        }
+        if include_output:
+            result['output'] = self.output
+        return result
+
+
+def parse_batch(text):
+    """
+    Parse batch text into BatchLines, one command per line
+
+    Lines use the same syntax as the command line (shell quoting, optional
+    leading `trello`); blank lines and # comments are skipped. Lines that
+    cannot be parsed or name an unknown command are returned already failed.
+    """
+    lines = []
+    for number, raw in enumerate(text.splitlines(), 1):
+        try:
+            argv = shlex.split(raw, comments=True)
+        except ValueError as e:
+            line = BatchLine(number, raw.strip(), None, [], None)
+            line.status, line.exit_code, line.error = 'error', 2, f"Cannot parse line: {e}"
+            lines.append(line)
+            continue
+        if argv and argv[0] == 'trello':
+            argv = argv[1:]
+        if not argv:
+            continue
+
+        command = ALIASES.get(argv[0], argv[0])
+        entry = COMMANDS.get(command)
+        line = BatchLine(number, raw.strip(), command, argv[1:], entry)
+        if entry is None:
+            line.status, line.exit_code, line.error = 'error', 2, f"Unknown command: {command}"
+        elif command in NOT_BATCHABLE:
+            line.status, line.exit_code, line.error = 'error', 2, f"'{command}' cannot run in a batch"
+        lines.append(line)
+    return lines
+
+
+def plan_batch(lines, concurrency=1):
+    """
+    Split runnable lines into segments of groups for run_tasks()
+
+    Segments run one after another. Within a segment, each group is a list
+    of lines that share an ID and so run in file order in one worker;
+    different groups run concurrently. With concurrency 1 every line is its
+    own segment, so the batch runs strictly in file order.
+    """
+    runnable = [line for line in lines if line.status == 'pending']
+    if concurrency <= 1:
+        return [[[line]] for line in runnable]
+
+    segments = []
+    groups = None
+    owner = {}
+    for line in runnable:
+        if line.is_barrier:
+            segments.append([[line]])
+            groups = None
+            continue
+        if groups is None:
+            groups = []
+            owner = {}
+            segments.append(groups)
+
+        # Merge every group this line shares a key with into one
+        joined = []
+        for key in line.keys:
+            group = owner.get(key)
+            if group is not None and not any(group is g for g in joined):
+                joined.append(group)
+        if not joined:
+            group = [line]
+            groups.append(group)
+        else:
+            group = joined[0]
+            for other in joined[1:]:
+                group.extend(other)
+                groups.remove(other)
+            group.sort(key=lambda l: l.number)
+            group.append(line)
+        for member in group:
+            for key in member.keys:
+                owner[key] = group
+    return segments
+
+
+class _LineOutput:
+    """
+    sys.stdout/sys.stderr stand-in that sends each thread's writes to the
+    output buffer of the line it is running. Threads that are not running a
+    line (workers started by a command) write to the fallback stream.
+    """
+
+    def __init__(self, fallback):
+        self.fallback = fallback
+        self._local = threading.local()
+
+    def capture(self, buffer):
+        self._local.buffer = buffer
+
+    def _target(self):
+        return getattr(self._local, 'buffer', None) or self.fallback
+
+    def write(self, text):
+        return self._target().write(text)
+
+    def flush(self):
+        self._target().flush()
+
+    @property
+    def encoding(self):
+        return getattr(self.fallback, 'encoding', 'utf-8')
+
+    def isatty(self):
+        return False
+
+
+def _run_line(line, output, stop):
+    """Run one batch line, recording status, output and timing on it"""
+    if stop.is_set():
+        line.status = 'skipped'
+        return
+    buffer = io.StringIO()
+    output.capture(buffer)
+    start = time.perf_counter()
+    try:
+        line.entry.run(line.command, list(line.argv))
+        line.exit_code = 0
+    except SystemExit as e:
+        line.exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        if line.exit_code and not isinstance(e.code, int):
+            line.error = str(e.code)
+    except EOFError:
+        line.exit_code = 1
+        line.error = "Command asked for confirmation, which batch mode cannot give"
+    except Exception as e:
+        line.exit_code = 1
+        line.error = str(e)
+    finally:
+        line.seconds = time.perf_counter() - start
+        output.capture(None)
+        line.output = buffer.getvalue()
+
+    if line.exit_code:
+        line.status = 'error'
+        if line.error is None:
+            # Usage errors and the like print their reason and exit
+            messages = [l.strip() for l in line.output.splitlines() if l.strip().startswith('❌')]
+            line.error = messages[-1].lstrip('❌ ') if messages else f"Exit code {line.exit_code}"
+        if stop.stop_on_error:
+            stop.set()
+    else:
+        line.status = 'ok'
+
+
+def _run_group(group, output, stop):
+    for line in group:
+        _run_line(line, output, stop)
+
+
+class _StopFlag(threading.Event):
+    def __init__(self, stop_on_error):
+        super().__init__()
+        self.stop_on_error = stop_on_error
+
+
+def _print_line(index, line, total):
+    icons = {'ok': '✅', 'error': '❌', 'skipped': '⏭️ '}
+    print(f"[{index:>{len(str(total))}}/{total}] {icons[line.status]} {line.text}  "
+          f"({line.seconds:.2f}s)")
+    for text in line.output.rstrip('\n').splitlines():
+        print(f"    {text}")
+    if line.status == 'error' and line.error and line.error not in line.output:
+        print(f"    ❌ {line.error}")
+
+
+def batch_summary(lines, seconds, concurrency, include_output=True):
+    """Machine-readable summary of a finished batch"""
+    counts = {status: sum(1 for line in lines if line.status == status)
+              for status in ('ok', 'error', 'skipped')}
+    return {
+        'total': len(lines),
+        'succeeded': counts['ok'],
+        'failed': counts['error'],
+        'skipped': counts['skipped'],
+        'seconds': round(seconds, 4),
+        'concurrency': concurrency,
+        'results': [line.to_json(include_output) for line in lines],
+    }
+
+
+def cmd_batch(source, concurrency=1, as_json=False, summary_file=None, stop_on_error=False):
+    """
+    Run the commands in a file (or stdin with '-') in this process
+
+    All lines share one API client, its connection pool, rate limiter and
+    response cache. Lines that touch different cards or lists run
+    concurrently with --concurrency N; board-level and file commands run
+    on their own, in file order.
+
+    Args:
+        source: Batch file path, or '-' for stdin
+        concurrency: Number of independent lines run in parallel
+        as_json: Print the summary (with each line's output) as JSON
+        summary_file: Also write the JSON summary to this file
+        stop_on_error: Skip the remaining lines after the first failure
+    """
+    try:
+        if source == '-':
+            text = sys.stdin.read()
+        else:
+            with open(source) as f:
+                text = f.read()
+    except OSError as e:
+        raise Exception(f"Failed to read batch file {source}: {str(e)}")
+
+    lines = parse_batch(text)
+    if not lines:
+        print("No commands to run")
+        return
+
+    stop = _StopFlag(stop_on_error)
+    if stop_on_error and any(line.status == 'error' for line in lines):
+        stop.set()
+
+    real_stdin, real_stdout, real_stderr = sys.stdin, sys.stdout, sys.stderr
+    output = _LineOutput(real_stderr if as_json else real_stdout)
+    total = len(lines)
+    start = time.perf_counter()
+    # Confirmation prompts read EOF instead of waiting on an invisible prompt
+    sys.stdin = io.StringIO()
+    sys.stdout = sys.stderr = output
+    try:
+        # Lines that failed to parse are reported where they appear
+        reported = 0
+        for segment in plan_batch(lines, concurrency):
+            for _ in run_tasks(segment, lambda group: _run_group(group, output, stop), concurrency):
+                pass
+            if not as_json:
+                last = max(line.number for group in segment for line in group)
+                while reported < total and lines[reported].number <= last:
+                    reported += 1
+                    _print_line(reported, lines[reported - 1], total)
+                real_stdout.flush()
+    finally:
+        sys.stdin, sys.stdout, sys.stderr = real_stdin, real_stdout, real_stderr
+
+    for line in lines:
+        if line.status == 'pending':
+            line.status = 'skipped'
+    seconds = time.perf_counter() - start
+    summary = batch_summary(lines, seconds, concurrency)
+
+    if summary_file:
+        with open(summary_file, 'w') as f:
+            json.dump(summary, f, indent=2)
+
+    if as_json:
+        print(json.dumps(summary, indent=2))
+    else:
+        for index, line in enumerate(lines[reported:], reported + 1):
+            _print_line(index, line, total)
+        print(f"\n{'='*70}")
+        print(f"📦 BATCH: {summary['total']} line(s) in {seconds:.2f}s (concurrency {concurrency})")
+        print(f"   ✅ Succeeded: {summary['succeeded']}")
+        print(f"   ❌ Failed:    {summary['failed']}")
+        if summary['skipped']:
+            print(f"   ⏭️  Skipped:   {summary['skipped']}")
+        for line in lines:
+            if line.status == 'error':
+                print(f"      line {line.number}: {line.text[:50]} — {line.error}")
+        if summary_file:
+            print(f"   📄 Summary written to {summary_file}")
+        print(f"{'='*70}")
+
+    if summary['failed']:
+        sys.exit(1)
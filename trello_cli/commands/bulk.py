@@ -4,14 +4,17 @@ Bulk operations commands for batch processing
 
 import json
 import csv
+import threading
 from ..client import get_client
+from ..executor import run_tasks
 from ..utils import validate_date
 
 
-def cmd_bulk_move_cards(source_list_id, target_list_id, filter_query=""):
+def cmd_bulk_move_cards(source_list_id, target_list_id, filter_query="", concurrency=1):
     """
     Move multiple cards from one list to another.
     Optionally filter by query string.
+    concurrency: Number of cards moved in parallel
     """
     client = get_client()
     source_list = client.get_list(source_list_id)
@@ -39,23 +42,24 @@ def cmd_bulk_move_cards(source_list_id, target_list_id, filter_query=""):
     print(f"{'='*70}\n")
 
     moved_count = 0
-    for card in cards:
-        try:
-            card.change_list(target_list_id)
+    for card, _, error in run_tasks(cards, lambda c: c.change_list(target_list_id), concurrency):
+        if error is None:
             print(f"✅ Moved: {card.name[:60]}")
             moved_count += 1
-        except Exception as e:
-            print(f"❌ Failed to move '{card.name[:60]}': {str(e)}")
+        else:
+            print(f"❌ Failed to move '{card.name[:60]}': {str(error)}")
 
     print(f"\n{'='*70}")
     print(f"✅ Successfully moved {moved_count}/{len(cards)} cards")
+    _print_throttle_summary(client)
     print(f"{'='*70}\n")
 
 
-def cmd_bulk_add_label(card_ids_file, label_color, label_name=""):
+def cmd_bulk_add_label(card_ids_file, label_color, label_name="", concurrency=1):
     """
     Add label to multiple cards.
     card_ids_file: File with one card ID per line
+    concurrency: Number of cards labeled in parallel
     """
     client = get_client()
 
@@ -76,38 +80,36 @@ def cmd_bulk_add_label(card_ids_file, label_color, label_name=""):
     print(f"Label: {label_name} ({label_color})")
     print(f"{'='*70}\n")
 
-    success_count = 0
-    for card_id in card_ids:
-        try:
-            card = client.get_card(card_id)
-            board = client.get_board(card.board_id)
+    cards = client.get_cards_batch(card_ids)
+    labels = _BoardLabels()
 
-            # Find or create label
-            label = None
-            for l in board.get_labels():
-                if l.color == label_color and (not label_name or l.name == label_name):
-                    label = l
-                    break
+    def add_label(card_id):
+        card = cards.get(card_id)
+        if card is None:
+            raise Exception("card not found or not accessible")
+        card.add_label(labels.find_or_create(card.board, label_color, label_name))
+        return card
 
-            if not label:
-                label = board.add_label(label_name, label_color)
-
-            card.add_label(label)
+    success_count = 0
+    for card_id, card, error in run_tasks(card_ids, add_label, concurrency):
+        if error is None:
             print(f"✅ Added label to: {card.name[:50]}")
             success_count += 1
-        except Exception as e:
-            print(f"❌ Failed for card {card_id}: {str(e)}")
+        else:
+            print(f"❌ Failed for card {card_id}: {str(error)}")
 
     print(f"\n{'='*70}")
     print(f"✅ Successfully labeled {success_count}/{len(card_ids)} cards")
+    _print_throttle_summary(client)
     print(f"{'='*70}\n")
 
 
-def cmd_bulk_set_due(card_ids_file, due_date):
+def cmd_bulk_set_due(card_ids_file, due_date, concurrency=1):
     """
     Set due date for multiple cards.
     card_ids_file: File with one card ID per line
     due_date: Date in YYYY-MM-DD format
+    concurrency: Number of cards updated in parallel
     """
     client = get_client()
     dt = validate_date(due_date)
@@ -129,25 +131,34 @@ def cmd_bulk_set_due(card_ids_file, due_date):
     print(f"Due Date: {dt.strftime('%Y-%m-%d %H:%M')}")
     print(f"{'='*70}\n")
 
+    cards = client.get_cards_batch(card_ids)
+
+    def set_due(card_id):
+        card = cards.get(card_id)
+        if card is None:
+            raise Exception("card not found or not accessible")
+        card.set_due(dt)
+        return card
+
     success_count = 0
-    for card_id in card_ids:
-        try:
-            card = client.get_card(card_id)
-            card.set_due(dt)
+    for card_id, card, error in run_tasks(card_ids, set_due, concurrency):
+        if error is None:
             print(f"✅ Set due date for: {card.name[:50]}")
             success_count += 1
-        except Exception as e:
-            print(f"❌ Failed for card {card_id}: {str(e)}")
+        else:
+            print(f"❌ Failed for card {card_id}: {str(error)}")
 
     print(f"\n{'='*70}")
     print(f"✅ Successfully set due date for {success_count}/{len(card_ids)} cards")
+    _print_throttle_summary(client)
     print(f"{'='*70}\n")
 
 
-def cmd_bulk_archive_cards(list_id, filter_query=""):
+def cmd_bulk_archive_cards(list_id, filter_query="", concurrency=1):
     """
     Archive multiple cards in a list.
     Optionally filter by query string.
+    concurrency: Number of cards archived in parallel
     """
     client = get_client()
     lst = client.get_list(list_id)
@@ -180,25 +191,27 @@ def cmd_bulk_archive_cards(list_id, filter_query=""):
         return
 
     archived_count = 0
-    for card in cards:
-        try:
-            card.set_closed(True)
+    for card, _, error in run_tasks(cards, lambda c: c.set_closed(True), concurrency):
+        if error is None:
             print(f"✅ Archived: {card.name[:60]}")
             archived_count += 1
-        except Exception as e:
-            print(f"❌ Failed to archive '{card.name[:60]}': {str(e)}")
+        else:
+            print(f"❌ Failed to archive '{card.name[:60]}': {str(error)}")
 
     print(f"\n{'='*70}")
     print(f"✅ Successfully archived {archived_count}/{len(cards)} cards")
+    _print_throttle_summary(client)
     print(f"{'='*70}\n")
 
 
-def cmd_bulk_create_cards(list_id, input_file):
+def cmd_bulk_create_cards(list_id, input_file, concurrency=1):
     """
     Create multiple cards from CSV or JSON file.
 
     CSV format: title,description,due_date,labels
     JSON format: [{"title": "...", "description": "...", "due_date": "...", "labels": ["color:name", ...]}, ...]
+    concurrency: Number of cards created in parallel (each card's due date
+                 and labels are still applied after it is created)
     """
     client = get_client()
     lst = client.get_list(list_id)
@@ -220,63 +233,89 @@ def cmd_bulk_create_cards(list_id, input_file):
     print(f"BULK CREATE: {len(cards_data)} card(s) in '{lst.name}'")
     print(f"{'='*70}\n")
 
-    created_count = 0
-    for card_data in cards_data:
-        try:
-            title = card_data.get('title', '')
-            description = card_data.get('description', '')
-            due_date = card_data.get('due_date', '')
-            labels = card_data.get('labels', [])
-
-            if not title:
-                print(f"⚠️  Skipping card with no title")
-                continue
-
-            # Create card
-            card = lst.add_card(name=title, desc=description)
-
-            # Set due date if provided
-            if due_date:
-                try:
-                    dt = validate_date(due_date)
-                    card.set_due(dt)
-                except:
-                    print(f"⚠️  Invalid due date for '{title[:40]}': {due_date}")
-
-            # Add labels if provided
-            if labels:
-                board = client.get_board(card.board_id)
-                for label_spec in labels:
-                    try:
-                        if ':' in label_spec:
-                            color, name = label_spec.split(':', 1)
-                        else:
-                            color, name = label_spec, ""
-
-                        # Find or create label
-                        label = None
-                        for l in board.get_labels():
-                            if l.color == color and (not name or l.name == name):
-                                label = l
-                                break
-
-                        if not label:
-                            label = board.add_label(name, color)
-
-                        card.add_label(label)
-                    except Exception as e:
-                        print(f"⚠️  Failed to add label '{label_spec}' to '{title[:40]}': {str(e)}")
+    labels = _BoardLabels()
+
+    def create(card_data):
+        """Create one card, then set its due date and labels; returns warnings"""
+        title = card_data.get('title', '')
+        description = card_data.get('description', '')
+        due_date = card_data.get('due_date', '')
+        label_specs = card_data.get('labels', [])
+        warnings = []
 
+        if not title:
+            return None
+
+        # Create card
+        card = lst.add_card(name=title, desc=description)
+
+        # Set due date if provided
+        if due_date:
+            try:
+                dt = validate_date(due_date)
+                card.set_due(dt)
+            except:
+                warnings.append(f"⚠️  Invalid due date for '{title[:40]}': {due_date}")
+
+        # Add labels if provided
+        for label_spec in label_specs:
+            try:
+                if ':' in label_spec:
+                    color, name = label_spec.split(':', 1)
+                else:
+                    color, name = label_spec, ""
+
+                card.add_label(labels.find_or_create(lst.board, color, name))
+            except Exception as e:
+                warnings.append(f"⚠️  Failed to add label '{label_spec}' to '{title[:40]}': {str(e)}")
+
+        return title, warnings
+
+    created_count = 0
+    for card_data, result, error in run_tasks(cards_data, create, concurrency):
+        if error is not None:
+            print(f"❌ Failed to create card: {str(error)}")
+        elif result is None:
+            print(f"⚠️  Skipping card with no title")
+        else:
+            title, warnings = result
+            for warning in warnings:
+                print(warning)
             print(f"✅ Created: {title[:60]}")
             created_count += 1
-        except Exception as e:
-            print(f"❌ Failed to create card: {str(e)}")
 
     print(f"\n{'='*70}")
     print(f"✅ Successfully created {created_count}/{len(cards_data)} cards")
+    _print_throttle_summary(client)
     print(f"{'='*70}\n")
 
 
+class _BoardLabels:
+    """Thread-safe find-or-create of board labels, fetching each board's labels once"""
+
+    def __init__(self):
+        self._labels = {}
+        self._lock = threading.Lock()
+
+    def find_or_create(self, board, color, name=""):
+        with self._lock:
+            if board.id not in self._labels:
+                self._labels[board.id] = board.get_labels()
+            for label in self._labels[board.id]:
+                if label.color == color and (not name or label.name == name):
+                    return label
+            label = board.add_label(name, color)
+            self._labels[board.id].append(label)
+            return label
+
+
+def _print_throttle_summary(client):
+    """Print how long the run waited on Trello rate limits, if at all"""
+    summary = client.throttle_summary()
+    if summary:
+        print(summary)
+
+
 def _read_json_file(filepath):
     """Read cards data from JSON file"""
     try:
@@ -307,7 +346,7 @@ def _read_csv_file(filepath):
         return []
 
 
-def cmd_bulk_relabel(board_id, from_label, to_label, dry_run=False):
+def cmd_bulk_relabel(board_id, from_label, to_label, dry_run=False, concurrency=1):
     """
     Re-assign all cards from one label to another.
     Useful for recovering from accidental label deletions.
@@ -317,12 +356,13 @@ def cmd_bulk_relabel(board_id, from_label, to_label, dry_run=False):
         from_label: Source label (name, color, or ID) - cards currently with this label
         to_label: Target label (name, color, or ID) - label to apply instead
         dry_run: If True, only show what would be done without making changes
+        concurrency: Number of cards relabeled in parallel
     """
     client = get_client()
-    board = client.get_board(board_id)
+    board = client.get_board_snapshot(board_id, card_filter='all')
 
     # Find source and target labels
-    board_labels = board.get_labels()
+    board_labels = board.labels
     source_label = None
     target_label = None
 
@@ -346,7 +386,7 @@ def cmd_bulk_relabel(board_id, from_label, to_label, dry_run=False):
     target_name = target_label.name or f"[{target_label.color}]"
 
     # Get all cards on board and filter by source label
-    all_cards = board.all_cards()
+    all_cards = board.cards
     cards_with_label = [card for card in all_cards
                        if any(l.id == source_label.id for l in card.labels)]
 
@@ -380,19 +420,23 @@ def cmd_bulk_relabel(board_id, from_label, to_label, dry_run=False):
         print("❌ Operation cancelled")
         return
 
+    def relabel(card):
+        # Remove old label and add new label
+        ref = client.card_ref(card)
+        ref.remove_label(source_label)
+        ref.add_label(target_label)
+
     success_count = 0
-    for card in cards_with_label:
-        try:
-            # Remove old label and add new label
-            card.remove_label(source_label)
-            card.add_label(target_label)
+    for card, _, error in run_tasks(cards_with_label, relabel, concurrency):
+        if error is None:
             print(f"✅ Relabeled: {card.name[:60]}")
             success_count += 1
-        except Exception as e:
-            print(f"❌ Failed for '{card.name[:60]}': {str(e)}")
+        else:
+            print(f"❌ Failed for '{card.name[:60]}': {str(error)}")
 
     print(f"\n{'='*80}")
     print(f"✅ Successfully relabeled {success_count}/{len(cards_with_label)} cards")
+    _print_throttle_summary(client)
     print(f"{'='*80}\n")
 
 
@@ -406,7 +450,7 @@ def cmd_label_backup(board_id, output_file="label_backup.json"):
         output_file: Output JSON file path
     """
     client = get_client()
-    board = client.get_board(board_id)
+    board = client.get_board_snapshot(board_id, card_filter='all')
 
     print(f"\n{'='*80}")
     print(f"📦 LABEL BACKUP")
@@ -415,14 +459,14 @@ def cmd_label_backup(board_id, output_file="label_backup.json"):
     print(f"{'='*80}\n")
 
     # Get all labels
-    board_labels = board.get_labels()
+    board_labels = board.labels
     labels_map = {label.id: {'name': label.name, 'color': label.color}
                   for label in board_labels}
 
     print(f"📊 Found {len(board_labels)} label(s) on board")
 
     # Get all cards and their labels
-    all_cards = board.all_cards()
+    all_cards = board.cards
     backup_data = {
         'board_id': board_id,
         'board_name': board.name,
@@ -514,10 +558,14 @@ def cmd_label_restore(board_id, backup_file):
 
     print(f"\n📋 Restoring labels to {len(card_labels_data)} card(s)...\n")
 
+    cards = client.get_cards_batch(list(card_labels_data))
+
     success_count = 0
     for card_id, card_data in card_labels_data.items():
         try:
-            card = client.get_card(card_id)
+            card = cards.get(card_id)
+            if card is None:
+                raise Exception("card not found or not accessible")
 
             for label_info in card_data.get('labels', []):
                 if label_info['id'] in label_map:
@@ -531,4 +579,5 @@ def cmd_label_restore(board_id, backup_file):
 
     print(f"\n{'='*80}")
     print(f"✅ Successfully restored labels for {success_count}/{len(card_labels_data)} cards")
+    _print_throttle_summary(client)
     print(f"{'='*80}\n")
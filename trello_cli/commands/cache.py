@@ -0,0 +1,32 @@
+"""
+Response cache commands
+"""
+
+from ..cache import ResponseCache, RESOURCE_TTLS, DEFAULT_TTL
+
+
+def cmd_cache_status():
+    """Show response cache location, size and TTLs"""
+    stats = ResponseCache().stats()
+
+    print("\n💾 RESPONSE CACHE")
+    print("=" * 70)
+    print(f"Location: {stats['path']}")
+    print(f"Entries:  {stats['entries']}")
+    print(f"Size:     {stats['bytes'] / 1024:.1f} KB of {stats['max_bytes'] / (1024 * 1024):.0f} MB")
+    print()
+    print("TTL per resource (seconds):")
+    for resource, ttl in sorted(RESOURCE_TTLS.items()):
+        print(f"  {resource:<15} {ttl}")
+    print(f"  {'(other)':<15} {DEFAULT_TTL}")
+    print()
+    print("Board responses past their TTL are revalidated against the board's")
+    print("last activity date. Use --refresh or --no-cache to bypass the cache.")
+
+
+def cmd_cache_clear():
+    """Delete all cached responses"""
+    cache = ResponseCache()
+    entries = cache.stats()['entries']
+    cache.clear()
+    print(f"✅ Cleared {entries} cached response(s)")
@@ -3,25 +3,41 @@ Card-related commands
 """
 
 from ..client import get_client
+from ..fields import REQUIRED_CARD_FIELDS, card_fields_for, parse_fields
 from ..utils import format_table, format_card_details, validate_date
 from ..validators import (
-    card_creation_validator,
-    card_movement_validator,
+    get_card_creation_validator,
+    get_card_movement_validator,
     ValidationError,
     get_config
 )
 
 
-def cmd_cards(list_id):
-    """List all cards in a list"""
+def cmd_cards(list_id, fields=None):
+    """
+    List all cards in a list
+
+    Args:
+        fields: Optional --fields override ("id,name,due"); shown as columns
+    """
     client = get_client()
-    lst = client.get_list(list_id)
-    cards = lst.list_cards()
+    card_fields = card_fields_for('cards', fields)
+    lst, cards = client.get_list_cards(list_id, card_fields)
 
     if not cards:
         print(f"No cards found in list {lst.name}")
         return
 
+    if fields and card_fields:
+        # Show the requested fields, not the extra ones fetched for the default view
+        shown = list(dict.fromkeys(list(REQUIRED_CARD_FIELDS) + parse_fields(fields)))
+        format_table(
+            cards,
+            columns=[(f, lambda c, f=f: c.field(f)) for f in shown],
+            widths={f: 25 if f.startswith('id') else 40 for f in shown}
+        )
+        return
+
     format_table(
         cards,
         columns=[("ID", "id"), ("Name", "name")],
@@ -35,7 +51,7 @@ def cmd_add_card(list_id, title, description=""):
     config = get_config()
     if config.is_enabled():
         try:
-            card_creation_validator.validate(
+            get_card_creation_validator().validate(
                 title=title,
                 description=description
             )
@@ -80,7 +96,7 @@ def cmd_move_card(card_id, list_id, explicit_done=False):
     config = get_config()
     if config.is_enabled():
         try:
-            card_movement_validator.validate(
+            get_card_movement_validator().validate(
                 card=card,
                 target_list=target_list,
                 explicit_done=explicit_done
@@ -2,18 +2,29 @@
 Discovery and overview commands for exploring Trello boards
 """
 
+import json
+import sys
+import time
+
 from ..client import get_client
+from ..async_client import get_board_snapshot_concurrently
+from ..fields import card_fields_for
 from ..utils import format_table
 
 
-def cmd_board_overview(board_id):
+def cmd_board_overview(board_id, use_async=False, fields=None):
     """
     Get a complete overview of a board including all lists and card counts.
     This is useful for understanding board structure at a glance.
+    use_async: Fetch lists, cards and labels as concurrent requests
+    fields: Optional --fields override for the card fields fetched
     """
-    client = get_client()
-    board = client.get_board(board_id)
-    lists = board.list_lists()
+    card_fields = card_fields_for('board-overview', fields)
+    if use_async:
+        board = get_board_snapshot_concurrently(board_id, card_fields=card_fields)
+    else:
+        board = get_client().get_board_snapshot(board_id, card_fields=card_fields)
+    lists = board.lists
 
     print(f"\n{'='*70}")
     print(f"BOARD OVERVIEW: {board.name}")
@@ -29,7 +40,7 @@ def cmd_board_overview(board_id):
     # Prepare data for table with card counts
     list_data = []
     for lst in lists:
-        cards = lst.list_cards()
+        cards = board.cards_in(lst.id)
         card_count = len(cards)
         list_data.append({
             'id': lst.id,
@@ -60,14 +71,15 @@ def cmd_board_overview(board_id):
     print(f"{'='*70}\n")
 
 
-def cmd_board_ids(board_id):
+def cmd_board_ids(board_id, fields=None):
     """
     Get a quick reference guide of all useful IDs in a board.
     Shows board ID, list IDs, and recent card IDs for easy copying.
+    fields: Optional --fields override for the card fields fetched
     """
     client = get_client()
-    board = client.get_board(board_id)
-    lists = board.list_lists()
+    board = client.get_board_snapshot(board_id, card_fields=card_fields_for('board-ids', fields))
+    lists = board.lists
 
     print(f"\n{'='*70}")
     print(f"ID QUICK REFERENCE: {board.name}")
@@ -87,7 +99,7 @@ def cmd_board_ids(board_id):
         print(f"  ID: {lst.id}")
 
         # Get cards in this list
-        cards = lst.list_cards()
+        cards = board.cards_in(lst.id)
         if cards:
             print(f"  Cards ({len(cards)}):")
             # Show first 5 cards as a quick reference
@@ -107,14 +119,22 @@ def cmd_board_ids(board_id):
     print(f"{'='*70}\n")
 
 
-def cmd_search_cards(board_id, query):
+def cmd_search_cards(board_id, query, fields=None):
     """
     Search for cards across all lists in a board by title or description.
     Shows which list each card belongs to.
+    fields: Optional --fields override for the card fields fetched
+
+    Boards in the local mirror (trello sync) are synced incrementally and
+    searched through its full-text index instead, which also covers
+    comments and checklist items and ranks the results.
     """
     client = get_client()
-    board = client.get_board(board_id)
-    lists = board.list_lists()
+    if client.is_mirrored(board_id):
+        return _search_mirrored_board(client, board_id, query)
+
+    board = client.get_board_snapshot(board_id, card_fields=card_fields_for('search-cards', fields))
+    lists = board.lists
 
     query_lower = query.lower()
     results = []
@@ -128,7 +148,7 @@ def cmd_search_cards(board_id, query):
         if lst.closed:  # Skip archived lists
             continue
 
-        cards = lst.list_cards()
+        cards = board.cards_in(lst.id)
         for card in cards:
             # Search in card name and description
             if (query_lower in card.name.lower() or
@@ -158,3 +178,113 @@ def cmd_search_cards(board_id, query):
     print(f"{'─'*70}")
     print(f"\n💡 TIP: Use 'trello show-card <card_id>' for full card details")
     print(f"{'='*70}\n")
+
+
+def _print_match(result, indent='  '):
+    """The indexed text that matched, when it isn't just the card name"""
+    snippet = ' '.join(result['snippet'].split())
+    if snippet.replace('[', '').replace(']', '') != result['name']:
+        print(f"{indent}Match: {snippet}")
+
+
+def _search_mirrored_board(client, board_id, query):
+    """search-cards through the mirror's full-text index"""
+    from .sync import fresh_client
+    from ..mirror import sync_board
+
+    mirror = client.mirror()
+    if not client.offline:
+        try:
+            with fresh_client() as fresh:
+                sync_board(fresh, mirror, board_id)
+        except Exception as e:
+            print(f"⚠️  Could not sync the board, searching the local copy: {str(e)}")
+
+    start = time.perf_counter()
+    # Every word matches as a prefix, close to the substring match used
+    # for boards that are not mirrored
+    results = mirror.search(query, [board_id], limit=None, prefix=True)
+    elapsed = time.perf_counter() - start
+
+    print(f"\n{'='*70}")
+    print(f"SEARCHING FOR: '{query}' in board '{mirror.board_json(board_id)['name']}'")
+    print(f"{'='*70}\n")
+
+    if not results:
+        print(f"No cards found matching '{query}'")
+        print(f"\n{'='*70}\n")
+        return
+
+    print(f"Found {len(results)} card(s), best match first ({elapsed * 1000:.1f} ms):\n")
+
+    for result in results:
+        print(f"{'─'*70}")
+        print(f"Card: {result['name']}")
+        print(f"  ID: {result['id']}")
+        print(f"  List: {result['list_name']} (ID: {result['list_id']})")
+        print(f"  URL: {result['url']}")
+        _print_match(result)
+
+    print(f"{'─'*70}")
+    print(f"\n💡 TIP: Use 'trello show-card <card_id>' for full card details")
+    print(f"{'='*70}\n")
+
+
+def cmd_search(query, board_id=None, limit=20, as_json=False):
+    """
+    Ranked full-text search across every board in the local mirror
+
+    Matches card names, descriptions, comments and checklist items. Words
+    match whole tokens (end one with * for a prefix), "quoted text"
+    matches a phrase, and OR / NOT combine terms. Reads only the mirror:
+    run `trello sync` to bring it up to date.
+
+    Args:
+        query: Search string
+        board_id: Only search this board
+        limit: Maximum number of results
+        as_json: Print the results as JSON
+    """
+    try:
+        limit = int(limit)
+    except ValueError:
+        raise ValueError(f"Invalid --limit: {limit}. Use a positive integer")
+
+    client = get_client()
+    if board_id and not client.is_mirrored(board_id):
+        print(f"❌ Board {board_id} is not in the local mirror")
+        print(f"   Run: trello sync {board_id}")
+        sys.exit(1)
+    if not board_id and not client.mirror().boards():
+        print("❌ No boards in the local mirror yet")
+        print("   Run: trello sync <board_id> [<board_id>...]")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    results = client.mirror().search(query, [board_id] if board_id else None, limit=limit)
+    elapsed = time.perf_counter() - start
+
+    if as_json:
+        print(json.dumps({'query': query, 'seconds': round(elapsed, 6), 'results': results},
+                         indent=2, ensure_ascii=False))
+        return
+
+    print(f"\n{'='*70}")
+    print(f"🔎 SEARCH: '{query}'" + (f" in board {board_id}" if board_id else " in all synced boards"))
+    print(f"{'='*70}\n")
+
+    if not results:
+        print(f"No cards found matching '{query}'")
+        print(f"\n{'='*70}\n")
+        return
+
+    for rank, result in enumerate(results, 1):
+        print(f"{rank:>3}. {result['name']}")
+        print(f"     Board: {result['board_name']} | List: {result['list_name']}")
+        print(f"     ID: {result['id']} | {result['url']}")
+        _print_match(result, indent='     ')
+
+    print(f"\n{'='*70}")
+    print(f"{len(results)} card(s) in {elapsed * 1000:.1f} ms"
+          + (f" (showing the best {limit}; use --limit N for more)" if len(results) == limit else ""))
+    print(f"{'='*70}\n")
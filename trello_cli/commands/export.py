@@ -6,9 +6,10 @@ import csv
 import json
 from datetime import datetime
 from ..client import get_client
+from ..async_client import get_board_snapshot_concurrently
 
 
-def cmd_export_board(board_id, format_type='json', output_file=None):
+def cmd_export_board(board_id, format_type='json', output_file=None, use_async=False):
     """
     Export board to various formats
 
@@ -16,10 +17,13 @@ def cmd_export_board(board_id, format_type='json', output_file=None):
         board_id: Board ID
         format_type: Export format (json, csv, md)
         output_file: Output file path (optional, prints to stdout if not provided)
+        use_async: Fetch lists, cards, checklists and members as concurrent requests
     """
-    client = get_client()
-    board = client.get_board(board_id)
-    lists = board.list_lists()
+    if use_async:
+        board = get_board_snapshot_concurrently(board_id)
+    else:
+        board = get_client().get_board_snapshot(board_id)
+    lists = board.lists
 
     # Collect all data
     board_data = {
@@ -41,7 +45,7 @@ def cmd_export_board(board_id, format_type='json', output_file=None):
             'cards': []
         }
 
-        cards = lst.list_cards()
+        cards = board.cards_in(lst.id)
         total_cards += len(cards)
 
         for card in cards:
@@ -58,7 +62,7 @@ def cmd_export_board(board_id, format_type='json', output_file=None):
             labels = [{'name': l.name, 'color': l.color} for l in card.labels]
 
             # Get members
-            members = [{'name': m.full_name, 'username': m.username} for m in card.get_members()] if hasattr(card, 'get_members') else []
+            members = [{'name': m.full_name, 'username': m.username} for m in board.members_of(card)]
 
             # Get checklists
             checklists = []
@@ -84,7 +88,7 @@ def cmd_export_board(board_id, format_type='json', output_file=None):
                 'url': card.url,
                 'labels': labels,
                 'members': members,
-                'due_date': card.due.isoformat() if card.due else None,
+                'due_date': card.due_date.isoformat() if card.due else None,
                 'created_date': created_date.isoformat() if created_date else None,
                 'age_days': age_days,
                 'checklists': checklists,
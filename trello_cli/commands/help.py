@@ -77,9 +77,10 @@ def cmd_help_json():
             },
             "cards": {
                 "description": "List all cards in a list",
-                "usage": "trello cards <list_id>",
+                "usage": "trello cards <list_id> [--fields id,name,due]",
                 "args": [
-                    {"name": "list_id", "type": "string", "required": True}
+                    {"name": "list_id", "type": "string", "required": True},
+                    {"name": "--fields", "type": "string", "required": False, "description": "Comma-separated card fields to fetch and show as columns, or 'all'"}
                 ]
             },
             "search-cards": {
@@ -91,6 +92,17 @@ def cmd_help_json():
                 ],
                 "output": "Cards matching query with their list names"
             },
+            "search": {
+                "description": "Ranked full-text search of card names, descriptions, comments and checklist items across every board in the local mirror (trello sync)",
+                "usage": "trello search \"query\" [--board <board_id>] [--limit N] [--json]",
+                "args": [
+                    {"name": "query", "type": "string", "required": True, "description": "Words (end one with * for a prefix), \"quoted phrases\", OR and NOT"},
+                    {"name": "--board", "type": "string", "required": False, "description": "Only search this board"},
+                    {"name": "--limit", "type": "integer", "required": False, "description": "Maximum number of results (default 20)"},
+                    {"name": "--json", "type": "flag", "required": False, "description": "Print the results as JSON"}
+                ],
+                "output": "Cards ranked by relevance with board, list and the matching text"
+            },
             "add-card": {
                 "description": "Add a new card to a list",
                 "usage": "trello add-card <list_id> \"title\" [\"description\"]",
@@ -180,6 +192,16 @@ def cmd_help_json():
                     {"name": "pattern", "type": "string", "required": False, "description": "Regex pattern for card naming validation (e.g., 'PF-[A-Z]+-\\d+')"}
                 ]
             },
+            "board-audit --all": {
+                "description": "board-audit every open board (or an organization's) concurrently under one rate limiter; writes a combined JSON report and prints boards ranked by health score. A failing board is reported without stopping the run",
+                "usage": "trello board-audit --all [\"pattern\"] [--org ID] [--jobs N] [--output FILE]",
+                "args": [
+                    {"name": "pattern", "type": "string", "required": False, "description": "Regex pattern for card naming validation"},
+                    {"name": "--org", "type": "string", "required": False, "description": "Organization ID or name whose boards to audit"},
+                    {"name": "--jobs", "type": "integer", "required": False, "description": "Boards audited at the same time (default: 1, max: 16)"},
+                    {"name": "--output", "type": "string", "required": False, "description": "Combined JSON report path (default: board-audit-YYYYMMDD.json)"}
+                ]
+            },
             "list-audit": {
                 "description": "Detailed audit of a specific list with pattern validation",
                 "usage": "trello list-audit <list_id> [\"pattern\"]",
@@ -219,6 +241,17 @@ def cmd_help_json():
                     {"name": "board_id", "type": "string", "required": True}
                 ]
             },
+            "audit-all": {
+                "description": "Run board-audit, board-health, scrum-check, sprint-audit and label-audit from a single walk of the board, then summarize their scores",
+                "usage": "trello audit-all <board_id> [\"pattern\"] [--sprint-label LABEL] [--only audit1,audit2] [--json] [--async]",
+                "args": [
+                    {"name": "board_id", "type": "string", "required": True},
+                    {"name": "pattern", "type": "string", "required": False, "description": "Regex pattern for board-audit's naming check"},
+                    {"name": "--sprint-label", "type": "string", "required": False, "description": "Sprint label for sprint-audit (auto-detected if not provided)"},
+                    {"name": "--only", "type": "string", "required": False, "description": "Comma-separated audits to run instead of all five"},
+                    {"name": "--json", "type": "flag", "required": False, "description": "Print each audit's finding counts and score as JSON"}
+                ]
+            },
             "remove-label": {
                 "description": "Remove a label from a card (label stays on board)",
                 "usage": "trello remove-label <card_id> \"label_name|color|id\"",
@@ -244,6 +277,117 @@ def cmd_help_json():
                     {"name": "new_name", "type": "string", "required": True}
                 ]
             },
+            "cache-status": {
+                "description": "Show response cache location, size and per-resource TTLs",
+                "usage": "trello cache-status",
+                "args": []
+            },
+            "cache-clear": {
+                "description": "Delete all cached API responses",
+                "usage": "trello cache-clear",
+                "args": []
+            },
+            "stats": {
+                "description": "Latency percentiles (p50/p95/p99), error and throttle rates and cache hit ratio recorded by previous invocations",
+                "usage": "trello stats [--since 24h] [--command NAME] [--json]",
+                "args": [
+                    {"name": "--since", "type": "string", "required": False, "description": "Time window, e.g. 90m, 24h, 7d (default 24h)"},
+                    {"name": "--command", "type": "string", "required": False, "description": "Only show this command"},
+                    {"name": "--json", "type": "boolean", "required": False, "description": "Print the report as JSON"}
+                ]
+            },
+            "batch": {
+                "description": "Run many commands (one per line, same syntax as the command line) in one process sharing the API client and caches; reports per-line status",
+                "usage": "trello batch <file|-> [--concurrency N] [--json] [--summary FILE] [--stop-on-error]",
+                "args": [
+                    {"name": "file", "type": "string", "required": True, "description": "Batch file, or - for stdin"},
+                    {"name": "--concurrency", "type": "string", "required": False, "description": "Run up to N lines on different cards/lists in parallel (default 1)"},
+                    {"name": "--json", "type": "boolean", "required": False, "description": "Print a JSON summary with each line's status, exit code, error and output"},
+                    {"name": "--summary", "type": "string", "required": False, "description": "Also write the JSON summary to this file"},
+                    {"name": "--stop-on-error", "type": "boolean", "required": False, "description": "Skip remaining lines after the first failure"}
+                ],
+                "output": "Per-line status and a summary; exits 1 if any line failed"
+            },
+            "shell": {
+                "description": "Interactive session that loads a board once and keeps it in memory; runs any command without the leading trello, accepts card/list names (or #idShort) for IDs with Tab completion, and refetches only changed cards between commands",
+                "usage": "trello shell [board_id]",
+                "args": [
+                    {"name": "board_id", "type": "string", "required": False, "description": "Board to load (ID or name); switch with `use <board>` inside the shell"}
+                ]
+            },
+            "sync": {
+                "description": "Copy boards (lists, cards, labels, checklists, members) into a local SQLite mirror; after the first sync only the board actions since the last sync are fetched and applied",
+                "usage": "trello sync [<board_id>...] [--full] [--concurrency N]",
+                "args": [
+                    {"name": "board_id", "type": "string", "required": False, "description": "Boards to sync (several allowed); none re-syncs every mirrored board"},
+                    {"name": "--full", "type": "boolean", "required": False, "description": "Fetch the whole board again instead of applying actions"},
+                    {"name": "--concurrency", "type": "string", "required": False, "description": "Sync up to N boards in parallel (default 1)"}
+                ],
+                "output": "Per-board sync result; read commands then accept the global --offline flag"
+            },
+            "mirror-status": {
+                "description": "Show the local mirror's location, size and boards with their last sync time",
+                "usage": "trello mirror-status",
+                "args": []
+            },
+            "webhook-serve": {
+                "description": "Local HTTP receiver for Trello webhooks: each delivery drops the cached responses that mention the cards and lists it changed and patches the board in the local mirror",
+                "usage": "trello webhook serve [--port N] [--host ADDR] (--secret S --callback-url URL | --no-verify)",
+                "args": [
+                    {"name": "--port", "type": "integer", "required": False, "description": "Port to listen on (default 8787)"},
+                    {"name": "--host", "type": "string", "required": False, "description": "Interface to bind (default 127.0.0.1)"},
+                    {"name": "--secret", "type": "string", "required": False, "description": "Trello app secret to verify delivery signatures (or TRELLO_WEBHOOK_SECRET); required unless --no-verify"},
+                    {"name": "--callback-url", "type": "string", "required": False, "description": "Public URL the webhook was registered with; needed with --secret"},
+                    {"name": "--no-verify", "type": "flag", "required": False, "description": "Accept unsigned deliveries (only behind a trusted proxy)"}
+                ],
+                "output": "One line per delivery until interrupted"
+            },
+            "webhook-register": {
+                "description": "Register a webhook for a board (the receiver must already answer at the callback URL)",
+                "usage": "trello webhook register <board_id> <callback_url> [\"description\"]",
+                "args": [
+                    {"name": "board_id", "type": "string", "required": True},
+                    {"name": "callback_url", "type": "string", "required": True},
+                    {"name": "description", "type": "string", "required": False}
+                ]
+            },
+            "webhook-list": {
+                "description": "List the webhooks registered with this token",
+                "usage": "trello webhook list",
+                "args": []
+            },
+            "webhook-unregister": {
+                "description": "Unregister webhooks",
+                "usage": "trello webhook unregister <webhook_id> [<webhook_id>...]",
+                "args": [
+                    {"name": "webhook_id", "type": "string", "required": True}
+                ]
+            },
+            "webhook-replay": {
+                "description": "Apply saved webhook payloads (JSON files with one payload or a list) to the cache and mirror, without a server or the network",
+                "usage": "trello webhook replay <payload.json> [<payload.json>...]",
+                "args": [
+                    {"name": "payload.json", "type": "string", "required": True}
+                ]
+            },
+            "daemon-start": {
+                "description": "Start a background process that keeps the API client, connection pool and caches warm; while it runs, every trello command is forwarded to it over a Unix socket",
+                "usage": "trello daemon start [--foreground] [--idle-timeout SECONDS]",
+                "args": [
+                    {"name": "--foreground", "type": "boolean", "required": False, "description": "Serve in this terminal instead of detaching"},
+                    {"name": "--idle-timeout", "type": "string", "required": False, "description": "Stop after this many idle seconds (default 1800, 0 = never)"}
+                ]
+            },
+            "daemon-stop": {
+                "description": "Stop the running daemon",
+                "usage": "trello daemon stop",
+                "args": []
+            },
+            "daemon-status": {
+                "description": "Show the daemon's pid, uptime and number of commands served",
+                "usage": "trello daemon status",
+                "args": []
+            },
             "plugin-list": {
                 "description": "List all available plugins",
                 "usage": "trello plugin list [--plugin-dir DIR]",
@@ -280,7 +424,10 @@ def cmd_help_json():
             "Use 'trello help-json' to get command information in JSON format for programmatic use",
             "Use 'trello board-overview <board_id>' to see all lists and their card counts",
             "Use 'trello board-ids <board_id>' to get a quick reference of all IDs in a board",
-            "Use 'trello search-cards <board_id> \"query\"' to find cards across all lists"
+            "Use 'trello search-cards <board_id> \"query\"' to find cards across all lists",
+            "GET responses are cached under ~/.trellocli/cache; pass --refresh to refetch or --no-cache to bypass",
+            "Pass --trace to see every API request a command makes (--trace-format json|chrome, --trace-out FILE)",
+            "Arguments after -- are never read as flags: trello add-comment <card_id> -- \"--offline\""
         ]
     }
 
@@ -297,6 +444,8 @@ DISCOVERY COMMANDS (useful for Claude Code):
   board-overview <board_id>         Complete board overview with lists and counts
   board-ids <board_id>              Quick reference of all IDs in a board
   search-cards <board_id> "query"   Search cards across board
+  search "query" [--board <board_id>]
+                                    Ranked search across synced boards
 
 BOARD COMMANDS:
   boards                            List all boards
@@ -330,13 +479,36 @@ LABEL MANAGEMENT (BOARD-LEVEL):
 
 AUDIT & ANALYSIS COMMANDS:
   board-audit <board_id> ["pattern"]     Comprehensive board audit
+  board-audit --all [--org ID] [--jobs N]
+                                         Audit every board, ranked by score
   list-audit <list_id> ["pattern"]       Detailed list audit
   list-snapshot <list_id> ["file.json"]  Export list to JSON
   sprint-audit <board_id> ["sprint"]     Sprint audit (dates, overdue)
   label-audit <board_id>                 Label audit (duplicates, unused)
+  audit-all <board_id> ["pattern"]       All board audits in one pass
 
 CONFIGURATION:
   config                            Configure API credentials
+  cache-status                      Show response cache size and TTLs
+  cache-clear                       Delete all cached responses
+  stats [--since 24h] [--command X] Latency percentiles, error/throttle rates
+  batch <file|-> [--concurrency N]  Run one command per line in a single process
+  shell [board_id]                  Interactive session on a board kept in memory
+  sync [<board_id>...] [--full]     Mirror boards locally (then use --offline)
+  mirror-status                     Show mirrored boards
+  webhook serve [--port N]          Receive webhooks to keep the cache and mirror current
+  webhook register|list|unregister  Manage the webhooks that feed it
+  daemon start|stop|status          Warm background process for fast repeated commands
+
+GLOBAL OPTIONS:
+  --no-cache                        Bypass the response cache
+  --refresh                         Refetch instead of using cached responses
+  --offline                         Read synced boards from the local mirror
+  --trace                           Show every API request (latency, size, retries)
+  --trace-format FMT                text, json or chrome
+  --trace-out FILE                  Write the trace to FILE
+  --debug                           Show tracebacks and metrics recording errors
+  --                                Pass the arguments after it as they are
 
 Valid label colors: yellow, purple, blue, red, green, orange, black, sky, pink, lime
 
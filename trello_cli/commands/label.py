@@ -2,10 +2,15 @@
 Label-related commands
 """
 
+import threading
+
 from ..client import get_client
 from ..utils import validate_color
 
 
+_label_lock = threading.Lock()
+
+
 def cmd_add_label(card_id, color, name=""):
     """Add a label to a card"""
     client = get_client()
@@ -14,17 +19,19 @@ def cmd_add_label(card_id, color, name=""):
     # Validate color
     validate_color(color)
 
-    # Get board and find or create label
+    # Get board and find or create label (one line at a time, so concurrent
+    # batch lines never create the same label twice)
     board = card.board
     label = None
 
-    for l in board.get_labels():
-        if l.name == name and l.color == color:
-            label = l
-            break
+    with _label_lock:
+        for l in board.get_labels():
+            if l.name == name and l.color == color:
+                label = l
+                break
 
-    if not label:
-        label = board.add_label(name, color)
+        if not label:
+            label = board.add_label(name, color)
 
     card.add_label(label)
     print(f"✅ Label '{name}' ({color}) added to card {card.name}")
@@ -31,7 +31,6 @@ def cmd_assign_card(card_id, member_identifier):
     """
     client = get_client()
     card = client.get_card(card_id)
-    board = card.board
 
     # Handle 'me' shortcut
     if member_identifier.lower() == 'me':
@@ -42,17 +41,14 @@ def cmd_assign_card(card_id, member_identifier):
             return
         member_identifier = user_id
 
-    # Get board members
-    board_members = board.get_members()
-
-    # Find the member
-    member_to_assign = None
-    for member in board_members:
-        if (member.id == member_identifier or
-            member.username == member_identifier or
-            member.full_name == member_identifier):
-            member_to_assign = member
-            break
+    # Find the member in the board's member directory (refetched once
+    # in case they joined the board after it was cached)
+    directory = client.get_member_directory(card.board.id)
+    member_to_assign = directory.find(member_identifier)
+    if not member_to_assign and directory.from_disk:
+        directory = client.get_member_directory(card.board.id, refresh=True)
+        member_to_assign = directory.find(member_identifier)
+    board_members = directory.members
 
     if not member_to_assign:
         print(f"❌ Member '{member_identifier}' not found on board")
@@ -90,8 +86,11 @@ def cmd_unassign_card(card_id, member_identifier):
             return
         member_identifier = user_id
 
-    # Get card members
-    card_members = card.get_members()
+    # Resolve card members (card.idMembers) through the board's member directory
+    directory = client.get_member_directory(card.board.id)
+    if directory.from_disk and not directory.knows_all(card.idMembers):
+        directory = client.get_member_directory(card.board.id, refresh=True)
+    card_members = directory.members_of(card)
 
     # Find the member
     member_to_remove = None
@@ -137,7 +136,7 @@ def cmd_card_log(card_id, limit=50):
     print(f"{'='*80}\n")
 
     # Get actions
-    actions = card.fetch_actions(action_filter='all', limit=limit)
+    actions = card.fetch_actions(action_filter='all', action_limit=limit)
 
     if not actions:
         print("No actions found for this card")
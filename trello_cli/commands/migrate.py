@@ -65,7 +65,7 @@ def cmd_migrate_board(source_board_id, target_board_id, dry_run=False):
     """
     client = get_client()
 
-    source_board = client.get_board(source_board_id)
+    source_board = client.get_board_snapshot(source_board_id)
     target_board = client.get_board(target_board_id)
 
     print(f"🔄 {'[DRY RUN] ' if dry_run else ''}Migrating cards:")
@@ -73,7 +73,7 @@ def cmd_migrate_board(source_board_id, target_board_id, dry_run=False):
     print(f"   Target: {target_board.name} ({target_board_id})")
     print()
 
-    source_lists = source_board.list_lists()
+    source_lists = source_board.lists
     target_lists = target_board.list_lists()
 
     total_cards = 0
@@ -81,7 +81,7 @@ def cmd_migrate_board(source_board_id, target_board_id, dry_run=False):
     skipped_cards = 0
 
     for source_list in source_lists:
-        cards = source_list.list_cards()
+        cards = source_board.cards_in(source_list.id)
 
         if not cards:
             continue
@@ -104,7 +104,7 @@ def cmd_migrate_board(source_board_id, target_board_id, dry_run=False):
             else:
                 try:
                     # Move card to target board and list
-                    card.change_board(target_board_id, target_list.id)
+                    client.card_ref(card).change_board(target_board_id, target_list.id)
                     print(f"   ✅ Moved: {card.name}")
                     moved_cards += 1
                 except Exception as e:
@@ -126,6 +126,9 @@ def cmd_migrate_board(source_board_id, target_board_id, dry_run=False):
         print(f"   Total cards: {total_cards}")
         print(f"   Moved: {moved_cards}")
         print(f"   Skipped: {skipped_cards}")
+        throttle = client.throttle_summary()
+        if throttle:
+            print(f"   {throttle}")
     print()
 
 
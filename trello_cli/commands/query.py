@@ -1,42 +1,54 @@
 """
 Advanced query commands for filtering and analyzing cards
+
+With --offline, each command answers with SQL over the local mirror
+(trello sync) instead of walking the board's cards.
 """
 
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
 from ..client import get_client
+from ..async_client import get_board_snapshot_concurrently
+from ..fields import card_fields_for
+from ..rules import BoardFrame, BoardHealthRule, board_health_score, evaluate
 
 
-def cmd_cards_by_label(board_id, label_color, label_name=""):
+def cmd_cards_by_label(board_id, label_color, label_name="", fields=None):
     """
     Find all cards in a board with a specific label color/name.
+    fields: Optional --fields override for the card fields fetched
     """
     client = get_client()
-    board = client.get_board(board_id)
-    lists = board.list_lists()
-
-    print(f"\n{'='*70}")
-    print(f"CARDS BY LABEL - {board.name}")
-    print(f"Label: {label_name} ({label_color})" if label_name else f"Label Color: {label_color}")
-    print(f"{'='*70}\n")
+    if client.offline:
+        mirror = client.mirror()
+        board_name = mirror.board_name(board_id)
+        found_cards = mirror.cards_with_label(board_id, label_color, label_name)
+    else:
+        board = client.get_board_snapshot(board_id, card_fields=card_fields_for('cards-by-label', fields))
+        board_name = board.name
+        found_cards = []
 
-    found_cards = []
+        for lst in board.lists:
+            if lst.closed:
+                continue
 
-    for lst in lists:
-        if lst.closed:
-            continue
+            cards = board.cards_in(lst.id)
+            for card in cards:
+                # Check if card has matching label
+                has_label = False
+                for label in card.labels:
+                    if label.color == label_color:
+                        if not label_name or label.name == label_name:
+                            has_label = True
+                            break
 
-        cards = lst.list_cards()
-        for card in cards:
-            # Check if card has matching label
-            has_label = False
-            for label in card.labels:
-                if label.color == label_color:
-                    if not label_name or label.name == label_name:
-                        has_label = True
-                        break
+                if has_label:
+                    found_cards.append((card, lst.name))
 
-            if has_label:
-                found_cards.append((card, lst.name))
+    print(f"\n{'='*70}")
+    print(f"CARDS BY LABEL - {board_name}")
+    print(f"Label: {label_name} ({label_color})" if label_name else f"Label Color: {label_color}")
+    print(f"{'='*70}\n")
 
     if not found_cards:
         print(f"No cards found with label: {label_name} ({label_color})")
@@ -64,44 +76,52 @@ def cmd_cards_by_label(board_id, label_color, label_name=""):
     print(f"{'='*70}\n")
 
 
-def cmd_cards_due_soon(board_id, days=7):
+def cmd_cards_due_soon(board_id, days=7, fields=None):
     """
     Find cards with due dates in the next N days (default: 7).
+    fields: Optional --fields override for the card fields fetched
     """
     client = get_client()
-    board = client.get_board(board_id)
-    lists = board.list_lists()
+    # Due dates are UTC, so "now" has to be an aware datetime to compare with them
+    now = datetime.now(timezone.utc)
+    cutoff_date = now + timedelta(days=days)
+
+    if client.offline:
+        mirror = client.mirror()
+        board_name = mirror.board_name(board_id)
+        cards_with_due = [(card, list_name, card.due_date, (card.due_date - now).days)
+                          for card, list_name in mirror.cards_due(board_id, now, cutoff_date)]
+    else:
+        board = client.get_board_snapshot(board_id, card_fields=card_fields_for('cards-due-soon', fields))
+        board_name = board.name
+        cards_with_due = []
+
+        for lst in board.lists:
+            if lst.closed:
+                continue
 
-    cutoff_date = datetime.now() + timedelta(days=days)
+            cards = board.cards_in(lst.id)
+            for card in cards:
+                if card.due:
+                    # Parse due date
+                    try:
+                        if isinstance(card.due, str):
+                            due_date = datetime.fromisoformat(card.due.replace('Z', '+00:00'))
+                        else:
+                            due_date = card.due
+
+                        # Check if within timeframe
+                        if now <= due_date <= cutoff_date:
+                            days_until = (due_date - now).days
+                            cards_with_due.append((card, lst.name, due_date, days_until))
+                    except:
+                        pass
 
     print(f"\n{'='*70}")
-    print(f"CARDS DUE SOON - {board.name}")
+    print(f"CARDS DUE SOON - {board_name}")
     print(f"Due within: {days} day(s) (before {cutoff_date.strftime('%Y-%m-%d')})")
     print(f"{'='*70}\n")
 
-    cards_with_due = []
-
-    for lst in lists:
-        if lst.closed:
-            continue
-
-        cards = lst.list_cards()
-        for card in cards:
-            if card.due:
-                # Parse due date
-                try:
-                    if isinstance(card.due, str):
-                        due_date = datetime.fromisoformat(card.due.replace('Z', '+00:00'))
-                    else:
-                        due_date = card.due
-
-                    # Check if within timeframe
-                    if datetime.now() <= due_date <= cutoff_date:
-                        days_until = (due_date - datetime.now()).days
-                        cards_with_due.append((card, lst.name, due_date, days_until))
-                except:
-                    pass
-
     if not cards_with_due:
         print(f"No cards due within {days} day(s)")
         return
@@ -128,38 +148,46 @@ def cmd_cards_due_soon(board_id, days=7):
     print(f"{'='*70}\n")
 
 
-def cmd_cards_overdue(board_id):
+def cmd_cards_overdue(board_id, fields=None):
     """
     Find all cards with overdue due dates.
+    fields: Optional --fields override for the card fields fetched
     """
     client = get_client()
-    board = client.get_board(board_id)
-    lists = board.list_lists()
+    now = datetime.now(timezone.utc)
 
-    print(f"\n{'='*70}")
-    print(f"OVERDUE CARDS - {board.name}")
-    print(f"{'='*70}\n")
+    if client.offline:
+        mirror = client.mirror()
+        board_name = mirror.board_name(board_id)
+        overdue_cards = [(card, list_name, card.due_date, (now - card.due_date).days)
+                         for card, list_name in mirror.cards_due(board_id, end=now)]
+    else:
+        board = client.get_board_snapshot(board_id, card_fields=card_fields_for('cards-overdue', fields))
+        board_name = board.name
+        overdue_cards = []
 
-    overdue_cards = []
+        for lst in board.lists:
+            if lst.closed:
+                continue
 
-    for lst in lists:
-        if lst.closed:
-            continue
+            cards = board.cards_in(lst.id)
+            for card in cards:
+                if card.due:
+                    try:
+                        if isinstance(card.due, str):
+                            due_date = datetime.fromisoformat(card.due.replace('Z', '+00:00'))
+                        else:
+                            due_date = card.due
+
+                        if due_date < now:
+                            days_overdue = (now - due_date).days
+                            overdue_cards.append((card, lst.name, due_date, days_overdue))
+                    except:
+                        pass
 
-        cards = lst.list_cards()
-        for card in cards:
-            if card.due:
-                try:
-                    if isinstance(card.due, str):
-                        due_date = datetime.fromisoformat(card.due.replace('Z', '+00:00'))
-                    else:
-                        due_date = card.due
-
-                    if due_date < datetime.now():
-                        days_overdue = (datetime.now() - due_date).days
-                        overdue_cards.append((card, lst.name, due_date, days_overdue))
-                except:
-                    pass
+    print(f"\n{'='*70}")
+    print(f"OVERDUE CARDS - {board_name}")
+    print(f"{'='*70}\n")
 
     if not overdue_cards:
         print("✅ No overdue cards")
@@ -188,58 +216,38 @@ def cmd_list_metrics(list_id):
     - Label distribution
     - Cards with/without due dates
     """
-    from datetime import datetime
-
     client = get_client()
-    lst = client.get_list(list_id)
-    cards = lst.list_cards()
+    if client.offline:
+        metrics = client.mirror().list_metrics(list_id, time.time())
+    else:
+        metrics = _list_metrics(client.get_list(list_id))
 
-    if not cards:
-        print(f"No cards found in list '{lst.name}'")
+    if not metrics['cards']:
+        print(f"No cards found in list '{metrics['name']}'")
         return
 
     print(f"\n{'='*70}")
-    print(f"LIST METRICS - {lst.name}")
+    print(f"LIST METRICS - {metrics['name']}")
     print(f"{'='*70}\n")
 
-    # Calculate ages
-    ages = []
-    for card in cards:
-        try:
-            timestamp = int(card.id[:8], 16)
-            created_date = datetime.fromtimestamp(timestamp)
-            age_days = (datetime.now() - created_date).days
-            ages.append(age_days)
-        except:
-            pass
-
-    # Label distribution
-    from collections import Counter
-    label_counts = Counter()
-    for card in cards:
-        for label in card.labels:
-            label_name = label.name or label.color
-            label_counts[label_name] += 1
-
     # Due date stats
-    cards_with_due = sum(1 for c in cards if c.due)
-    cards_without_due = len(cards) - cards_with_due
+    cards_with_due = metrics['with_due']
+    cards_without_due = metrics['cards'] - cards_with_due
 
     # Print metrics
-    print(f"📊 Card Count: {len(cards)}")
+    print(f"📊 Card Count: {metrics['cards']}")
     print()
 
-    if ages:
-        avg_age = sum(ages) / len(ages)
+    if metrics['average_age'] is not None:
         print(f"⏱️  Age Metrics:")
-        print(f"   Average: {avg_age:.1f} days")
-        print(f"   Oldest:  {max(ages)} days")
-        print(f"   Newest:  {min(ages)} days")
+        print(f"   Average: {metrics['average_age']:.1f} days")
+        print(f"   Oldest:  {metrics['oldest']} days")
+        print(f"   Newest:  {metrics['newest']} days")
         print()
 
-    if label_counts:
+    if metrics['labels']:
         print(f"🏷️  Label Distribution:")
-        for label_name, count in label_counts.most_common():
+        for label_name, count in metrics['labels']:
             bar = '█' * min(20, count)
             print(f"   {label_name:<20} │ {count:3} │ {bar}")
         print()
@@ -252,94 +260,92 @@ def cmd_list_metrics(list_id):
     print(f"{'='*70}\n")
 
 
-def cmd_board_health(board_id):
+def _list_metrics(lst):
+    """list-metrics for a py-trello List, in the shape Mirror.list_metrics returns"""
+    cards = lst.list_cards()
+
+    # Calculate ages
+    ages = []
+    for card in cards:
+        try:
+            timestamp = int(card.id[:8], 16)
+            created_date = datetime.fromtimestamp(timestamp)
+            age_days = (datetime.now() - created_date).days
+            ages.append(age_days)
+        except:
+            pass
+
+    # Label distribution
+    from collections import Counter
+    label_counts = Counter()
+    for card in cards:
+        for label in card.labels:
+            label_name = label.name or label.color
+            label_counts[label_name] += 1
+
+    return {
+        'name': lst.name,
+        'cards': len(cards),
+        'average_age': sum(ages) / len(ages) if ages else None,
+        'oldest': max(ages, default=None),
+        'newest': min(ages, default=None),
+        'labels': label_counts.most_common(),
+        'with_due': sum(1 for c in cards if c.due),
+    }
+
+
+def cmd_board_health(board_id, use_async=False):
     """
     Board health check:
     - Stale cards (older than 30 days in non-Done lists)
     - Blocked cards (no activity in 14+ days)
     - Overdue cards
     - Lists with too many cards
-    """
-    from datetime import datetime
 
+    use_async: Fetch lists, cards and labels as concurrent requests
+    """
     client = get_client()
-    board = client.get_board(board_id)
-    lists = board.list_lists()
-
-    print(f"\n{'='*70}")
-    print(f"BOARD HEALTH CHECK - {board.name}")
-    print(f"{'='*70}\n")
-
-    stale_cards = []
-    overdue_cards = []
-    congested_lists = []
-
-    for lst in lists:
-        if lst.closed:
-            continue
-
-        cards = lst.list_cards()
+    if client.offline:
+        mirror = client.mirror()
+        board_name = mirror.board_name(board_id)
+        health = mirror.board_health(board_id, datetime.now(timezone.utc))
+    else:
+        board = get_board_snapshot_concurrently(board_id) if use_async else client.get_board_snapshot(board_id)
+        board_name = board.name
+        health = evaluate(BoardFrame(board), [BoardHealthRule()])['board-health']
+    _print_board_health(board_name, health)
 
-        # Check for congestion (>10 cards not in Done)
-        if len(cards) > 10 and 'done' not in lst.name.lower():
-            congested_lists.append((lst.name, len(cards)))
 
-        # Check each card
-        for card in cards:
-            # Skip Done lists
-            if 'done' in lst.name.lower():
-                continue
+def _print_board_health(board_name, health):
+    """Print board-health findings ({'stale', 'overdue', 'congested'})"""
+    stale_cards, overdue_cards, congested_lists = health['stale'], health['overdue'], health['congested']
 
-            # Check card age
-            try:
-                timestamp = int(card.id[:8], 16)
-                created_date = datetime.fromtimestamp(timestamp)
-                age_days = (datetime.now() - created_date).days
-
-                if age_days > 30:
-                    stale_cards.append((card, lst.name, age_days))
-            except:
-                pass
-
-            # Check overdue
-            if card.due:
-                try:
-                    if isinstance(card.due, str):
-                        due_date = datetime.fromisoformat(card.due.replace('Z', '+00:00'))
-                    else:
-                        due_date = card.due
-
-                    if due_date < datetime.now():
-                        days_overdue = (datetime.now() - due_date).days
-                        overdue_cards.append((card, lst.name, days_overdue))
-                except:
-                    pass
+    print(f"\n{'='*70}")
+    print(f"BOARD HEALTH CHECK - {board_name}")
+    print(f"{'='*70}\n")
 
     # Print health report
-    health_score = 100
+    health_score = board_health_score(health)
 
     print(f"🩺 HEALTH ISSUES:\n")
 
     if stale_cards:
-        health_score -= min(30, len(stale_cards) * 5)
         print(f"⚠️  STALE CARDS: {len(stale_cards)} card(s) older than 30 days")
-        for card, list_name, age in sorted(stale_cards, key=lambda x: x[2], reverse=True)[:5]:
-            print(f"   • {age} days: {card.name[:40]} (in {list_name})")
+        for card_name, list_name, age in sorted(stale_cards, key=lambda x: x[2], reverse=True)[:5]:
+            print(f"   • {age} days: {card_name[:40]} (in {list_name})")
         if len(stale_cards) > 5:
             print(f"   ... and {len(stale_cards) - 5} more")
         print()
 
     if overdue_cards:
-        health_score -= min(30, len(overdue_cards) * 10)
         print(f"🔴 OVERDUE: {len(overdue_cards)} card(s) past due date")
-        for card, list_name, days_overdue in sorted(overdue_cards, key=lambda x: x[2], reverse=True)[:5]:
-            print(f"   • {days_overdue} days overdue: {card.name[:40]}")
+        for card_name, list_name, days_overdue in sorted(overdue_cards, key=lambda x: x[2], reverse=True)[:5]:
+            print(f"   • {days_overdue} days overdue: {card_name[:40]}")
         if len(overdue_cards) > 5:
             print(f"   ... and {len(overdue_cards) - 5} more")
         print()
 
     if congested_lists:
-        health_score -= min(20, len(congested_lists) * 10)
         print(f"🚦 CONGESTED LISTS: {len(congested_lists)} list(s) with >10 cards")
         for list_name, count in sorted(congested_lists, key=lambda x: x[1], reverse=True):
             print(f"   • {list_name}: {count} cards")
@@ -349,6 +355,17 @@ def cmd_board_health(board_id):
         print("✅ No major health issues detected!")
         print()
 
+    ages = health['ages']
+    if ages['cards']:
+        print(f"⏱️  CARD AGE: {ages['cards']} card(s) outside Done lists")
+        print(f"   Median: {ages['median']:.0f} days | Average: {ages['average']:.1f} days | "
+              f"Oldest: {ages['oldest']} days")
+        widest = max(count for _, count in ages['buckets'])
+        for bucket, count in ages['buckets']:
+            bar = '█' * round(20 * count / widest)
+            print(f"   {bucket:<12} │ {count:5} │ {bar}")
+        print()
+
     # Health score
     print(f"{'='*70}")
     if health_score >= 90:
@@ -362,3 +379,4 @@ def cmd_board_health(board_id):
 
     print(f"Board Health Score: {health_score}/100 - {status}")
     print(f"{'='*70}\n")
+
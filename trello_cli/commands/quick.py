@@ -2,6 +2,10 @@
 Quick commands for common workflows - shortcuts for frequent operations
 """
 
+import time
+from datetime import datetime
+from itertools import groupby
+
 from ..client import get_client
 
 
@@ -113,34 +117,43 @@ def cmd_my_cards(board_id, member_name=""):
     If member_name is empty, shows all assigned cards.
     """
     client = get_client()
-    board = client.get_board(board_id)
-    lists = board.list_lists()
+    if client.offline:
+        mirror = client.mirror()
+        board_name = mirror.board_name(board_id)
+        # Already in list order: one group per list
+        cards_by_list = [(list_name, [card for card, _ in group]) for (_, list_name), group in groupby(
+            mirror.member_cards(board_id, member_name), key=lambda row: (row[0].idList, row[1]))]
+    else:
+        board = client.get_board_snapshot(board_id)
+        board_name = board.name
+        cards_by_list = []
+        for lst in board.lists:
+            if lst.closed:
+                continue
+
+            cards = board.cards_in(lst.id)
+            # Filter by member if specified
+            if member_name:
+                cards = [c for c in cards if any(member_name.lower() in m.full_name.lower()
+                                                for m in board.members_of(c))]
+            cards_by_list.append((lst.name, cards))
 
     print(f"\n{'='*70}")
-    print(f"MY CARDS: {board.name}")
+    print(f"MY CARDS: {board_name}")
     if member_name:
         print(f"Member: {member_name}")
     print(f"{'='*70}\n")
 
     total_cards = 0
-    for lst in lists:
-        if lst.closed:
-            continue
-
-        cards = lst.list_cards()
-        # Filter by member if specified
-        if member_name:
-            cards = [c for c in cards if any(member_name.lower() in m.full_name.lower()
-                                            for m in c.member_ids)]
-
+    for list_name, cards in cards_by_list:
         if not cards:
             continue
 
-        print(f"\n📋 {lst.name} ({len(cards)} card(s))")
+        print(f"\n📋 {list_name} ({len(cards)} card(s))")
         print(f"{'─'*70}")
 
         for card in cards:
-            due_str = f" [Due: {card.due.strftime('%Y-%m-%d')}]" if card.due else ""
+            due_str = f" [Due: {card.due_date.strftime('%Y-%m-%d')}]" if card.due else ""
             labels_str = f" [{', '.join([l.name or l.color for l in card.labels])}]" if card.labels else ""
             print(f"  • {card.name}{due_str}{labels_str}")
             print(f"    ID: {card.id}")
@@ -156,36 +169,26 @@ def cmd_card_age(list_id):
     Show how long cards have been in a specific list.
     Useful for identifying stale cards or bottlenecks.
     """
-    from datetime import datetime
-
     client = get_client()
-    lst = client.get_list(list_id)
-    cards = lst.list_cards()
-
-    if not cards:
-        print(f"No cards found in list '{lst.name}'")
+    if client.offline:
+        # Ages and the oldest-first order come from SQL
+        list_name, rows = client.mirror().card_ages(list_id, time.time())
+        card_ages = [(card_id, name, age_days, datetime.fromtimestamp(created) if created is not None else None)
+                     for card_id, name, age_days, created in rows]
+    else:
+        lst = client.get_list(list_id)
+        list_name = lst.name
+        card_ages = _card_ages(lst.list_cards())
+
+    if not card_ages:
+        print(f"No cards found in list '{list_name}'")
         return
 
     print(f"\n{'='*70}")
-    print(f"CARD AGE REPORT: {lst.name}")
+    print(f"CARD AGE REPORT: {list_name}")
     print(f"{'='*70}\n")
 
-    # Calculate age for each card (using card ID timestamp)
-    card_ages = []
-    for card in cards:
-        # Trello card IDs contain a timestamp (first 8 hex chars)
-        try:
-            timestamp = int(card.id[:8], 16)
-            created_date = datetime.fromtimestamp(timestamp)
-            age_days = (datetime.now() - created_date).days
-            card_ages.append((card, age_days, created_date))
-        except:
-            card_ages.append((card, None, None))
-
-    # Sort by age (oldest first)
-    card_ages.sort(key=lambda x: x[1] if x[1] is not None else 0, reverse=True)
-
-    for card, age_days, created_date in card_ages:
+    for card_id, card_name, age_days, created_date in card_ages:
         if age_days is not None:
             age_str = f"{age_days} day(s) old"
             if age_days > 30:
@@ -196,15 +199,15 @@ def cmd_card_age(list_id):
                 age_icon = "🟢"  # Fresh
 
             created_str = created_date.strftime('%Y-%m-%d')
-            print(f"{age_icon} {age_str:15} | Created: {created_str} | {card.name[:40]}")
-            print(f"   ID: {card.id}")
+            print(f"{age_icon} {age_str:15} | Created: {created_str} | {card_name[:40]}")
+            print(f"   ID: {card_id}")
         else:
-            print(f"⚪ Unknown age     | {card.name[:40]}")
-            print(f"   ID: {card.id}")
+            print(f"⚪ Unknown age     | {card_name[:40]}")
+            print(f"   ID: {card_id}")
 
     # Show statistics
     if card_ages:
-        valid_ages = [age for _, age, _ in card_ages if age is not None]
+        valid_ages = [age for _, _, age, _ in card_ages if age is not None]
         if valid_ages:
             avg_age = sum(valid_ages) / len(valid_ages)
             oldest = max(valid_ages)
@@ -213,8 +216,26 @@ def cmd_card_age(list_id):
             print(f"\n{'='*70}")
             print(f"STATISTICS")
             print(f"{'='*70}")
-            print(f"Total Cards: {len(cards)}")
+            print(f"Total Cards: {len(card_ages)}")
             print(f"Average Age: {avg_age:.1f} days")
             print(f"Oldest Card: {oldest} days")
             print(f"Newest Card: {newest} days")
             print(f"{'='*70}\n")
+
+
+def _card_ages(cards):
+    """(card id, name, age in days, created) per card, oldest first, as Mirror.card_ages orders them"""
+    card_ages = []
+    for card in cards:
+        # Trello card IDs contain a timestamp (first 8 hex chars)
+        try:
+            timestamp = int(card.id[:8], 16)
+            created_date = datetime.fromtimestamp(timestamp)
+            age_days = (datetime.now() - created_date).days
+            card_ages.append((card.id, card.name, age_days, created_date))
+        except:
+            card_ages.append((card.id, card.name, None, None))
+
+    # Sort by age (oldest first)
+    card_ages.sort(key=lambda x: x[2] if x[2] is not None else 0, reverse=True)
+    return card_ages
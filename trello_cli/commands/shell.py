@@ -0,0 +1,369 @@
+"""
+Interactive shell with a warm board context
+"""
+
+import cmd
+import re
+import shlex
+import time
+
+from ..client import get_client
+from ..config import CLIENT_OPTIONS, configure_client
+from ..registry import COMMANDS, ALIASES
+
+
+# Commands that make no sense inside the shell
+NOT_IN_SHELL = ('shell', 'daemon', 'config', 'webhook')
+
+TRELLO_ID = re.compile(r'^[0-9a-fA-F]{24}$')
+
+SHELL_HELP = """
+Every trello command works here, without the leading `trello`:
+
+  board-overview                  <board_id> defaults to the loaded board
+  show-card "Fix login"           Card, list, label and member arguments take
+  move-card #12 Done              names (or a unique prefix, or #idShort)
+                                  as well as IDs; press Tab to complete them
+
+Shell commands:
+  use <board>                     Load another board (ID or name)
+  refresh                         Reload the board, bypassing the cache
+  help all                        Full trello command list
+  exit | quit | Ctrl+D            Leave the shell
+
+The board is loaded once and kept in memory. Before each command, only
+the cards changed since (by you or anyone else) are fetched again.
+"""
+
+
+def usage_arguments(usage):
+    """Argument names of a usage string: '<card_id> "color" ["name"]' -> card_id, color, name"""
+    return [angle or quoted for angle, quoted in re.findall(r'<([^>]+)>|"([^"]+)"', usage)]
+
+
+def argument_kind(name):
+    """What a usage argument refers to: card, list, board, label, color, member or None"""
+    for suffix in ('card_id', 'list_id', 'board_id'):
+        if name.endswith(suffix):
+            return suffix[:-3]
+    if 'label' in name:
+        return 'label'
+    if name == 'color':
+        return 'color'
+    if 'member' in name:
+        return 'member'
+    return None
+
+
+def positional_indexes(entry, argv):
+    """Indexes of the positional arguments in argv (options, their values and flags skipped)"""
+    takes_value = set(entry.options)
+    if entry.concurrency:
+        takes_value.add('--concurrency')
+    indexes = []
+    i = 0
+    while i < len(argv):
+        if argv[i] in takes_value:
+            i += 2
+            continue
+        if not argv[i].startswith('--'):
+            indexes.append(i)
+        i += 1
+    return indexes
+
+
+def match_name(items, text, name=lambda item: item.name):
+    """
+    Items whose name is `text` (case-insensitive), or else start with it
+
+    Returns:
+        List of matches; exact matches win over prefix matches
+    """
+    wanted = text.lower()
+    exact = [item for item in items if name(item).lower() == wanted]
+    if exact:
+        return exact
+    return [item for item in items if name(item).lower().startswith(wanted)]
+
+
+class TrelloShell(cmd.Cmd):
+    """Runs CLI commands against a board held in memory between commands"""
+
+    intro = "🐚 Trello shell. Type 'help' for shell commands, 'exit' to leave."
+    prompt = 'trello> '
+
+    def __init__(self, stdin=None, stdout=None):
+        super().__init__(stdin=stdin, stdout=stdout)
+        self.snapshot = None
+        self._boards = None
+
+    # ------------------------------------------------------------------
+    # Board context
+    # ------------------------------------------------------------------
+
+    def boards(self):
+        """(id, name) of the user's boards, fetched once per session"""
+        if self._boards is None:
+            self._boards = [(board.id, board.name) for board in get_client().list_boards()]
+        return self._boards
+
+    def load_board(self, board_ref):
+        """Load a board by ID or name and keep it in memory"""
+        if not TRELLO_ID.match(board_ref):
+            matches = match_name(self.boards(), board_ref, name=lambda board: board[1])
+            if len(matches) != 1:
+                found = 'No board' if not matches else f"{len(matches)} boards"
+                raise Exception(f"{found} named '{board_ref}'")
+            board_ref = matches[0][0]
+
+        client = get_client()
+        if self.snapshot is not None:
+            client.unpin_snapshot(self.snapshot.id)
+        start = time.perf_counter()
+        self.snapshot = client.get_board_snapshot(board_ref)
+        client.pin_snapshot(self.snapshot)
+        self.prompt = f"trello [{self.snapshot.name[:30]}]> "
+        print(f"📋 {self.snapshot.name}: {len(self.snapshot.open_lists())} lists, "
+              f"{len(self.snapshot.cards)} cards (loaded in {time.perf_counter() - start:.2f}s)")
+
+    def refresh(self):
+        """Apply the board's changes since the last command"""
+        client = get_client()
+        if self.snapshot is None or client.offline:
+            return
+        try:
+            snapshot, changes = client.update_board_snapshot(self.snapshot)
+        except Exception as e:
+            print(f"⚠️  Could not refresh the board: {str(e)}")
+            return
+        if snapshot is not self.snapshot:
+            self.snapshot = snapshot
+            client.pin_snapshot(snapshot)
+        if changes:
+            print(f"🔄 {changes} change(s) since the last command")
+
+    def candidates(self, kind):
+        """Names offered for an argument of this kind"""
+        board = self.snapshot
+        if kind == 'board':
+            return [name for _, name in self.boards()]
+        if board is None:
+            return []
+        if kind == 'card':
+            return [card.name for card in board.cards]
+        if kind == 'list':
+            return [lst.name for lst in board.open_lists()]
+        if kind == 'label':
+            return sorted({label.name for label in board.labels if label.name})
+        if kind == 'color':
+            return sorted({label.color for label in board.labels if label.color})
+        if kind == 'member':
+            return sorted(member.username for member in board.members if member.username)
+        return []
+
+    def resolve(self, kind, text):
+        """ID for a card, list or board name argument (text unchanged if not a unique name)"""
+        if TRELLO_ID.match(text) or self.snapshot is None and kind != 'board':
+            return text
+        if kind == 'card':
+            if text.startswith('#') and text[1:].isdigit():
+                matches = [card for card in self.snapshot.cards if str(card.idShort) == text[1:]]
+            else:
+                matches = match_name(self.snapshot.cards, text)
+        elif kind == 'list':
+            matches = match_name(self.snapshot.open_lists(), text)
+        elif kind == 'board':
+            matches = [board_id for board_id, _ in match_name(self.boards(), text, name=lambda b: b[1])]
+            return matches[0] if len(matches) == 1 else text
+        else:
+            return text
+
+        if len(matches) > 1:
+            print(f"⚠️  '{text}' matches {len(matches)} {kind}s; pass the ID to pick one")
+        return matches[0].id if len(matches) == 1 else text
+
+    def resolve_arguments(self, entry, argv):
+        """Fill in the loaded board and replace card/list/board names with IDs"""
+        names = usage_arguments(entry.usage)
+        indexes = positional_indexes(entry, argv)
+        if (self.snapshot is not None and names and names[0] == 'board_id'
+                and (not indexes or not TRELLO_ID.match(argv[indexes[0]]))):
+            argv = [self.snapshot.id] + argv
+            indexes = [0] + [i + 1 for i in indexes]
+
+        argv = list(argv)
+        for name, index in zip(names, indexes):
+            kind = argument_kind(name)
+            if kind in ('card', 'list') or kind == 'board' and index != 0:
+                argv[index] = self.resolve(kind, argv[index])
+        return argv
+
+    # ------------------------------------------------------------------
+    # Command loop
+    # ------------------------------------------------------------------
+
+    def default(self, line):
+        """Run a trello command"""
+        try:
+            argv = shlex.split(line)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return
+        name = ALIASES.get(argv[0], argv[0])
+        entry = COMMANDS.get(name)
+        if entry is None:
+            print(f"❌ Unknown command: {name} (type 'help' for help)")
+            return
+        if name in NOT_IN_SHELL:
+            print(f"❌ '{name}' cannot run inside the shell")
+            return
+
+        self.refresh()
+        try:
+            entry.run(name, self.resolve_arguments(entry, argv[1:]))
+        except SystemExit:
+            # Usage errors and validation failures print their own message
+            pass
+        except KeyboardInterrupt:
+            print("\n⚠️  Operation cancelled by user")
+        except Exception as e:
+            print(f"❌ Error: {str(e)}")
+
+    def emptyline(self):
+        pass
+
+    def do_use(self, arg):
+        """use <board>: load another board by ID or name"""
+        if not arg.strip():
+            print("❌ Usage: use <board_id|board name>")
+            return
+        try:
+            # Board names may contain spaces, quoted or not
+            self.load_board(' '.join(shlex.split(arg)))
+        except Exception as e:
+            print(f"❌ Error: {str(e)}")
+
+    def do_refresh(self, arg):
+        """refresh: reload the whole board, bypassing the response cache"""
+        if self.snapshot is None:
+            print("❌ No board loaded (use <board>)")
+            return
+        previous = CLIENT_OPTIONS['refresh_cache']
+        configure_client(refresh_cache=True)
+        try:
+            self.load_board(self.snapshot.id)
+        except Exception as e:
+            print(f"❌ Error: {str(e)}")
+        finally:
+            configure_client(refresh_cache=previous)
+
+    def do_help(self, arg):
+        if arg.strip() == 'all':
+            COMMANDS['help'].run('help', [])
+        else:
+            print(SHELL_HELP)
+
+    def do_exit(self, arg):
+        """Leave the shell"""
+        return True
+
+    do_quit = do_exit
+
+    def do_EOF(self, arg):
+        print()
+        return True
+
+    # ------------------------------------------------------------------
+    # Tab completion
+    # ------------------------------------------------------------------
+
+    def completenames(self, text, *ignored):
+        names = list(COMMANDS) + ['use', 'refresh', 'help', 'exit', 'quit']
+        return sorted(name + ' ' for name in names if name.startswith(text))
+
+    def complete_use(self, text, line, begidx, endidx):
+        return self._complete(self.candidates('board'), line, begidx, endidx)
+
+    def completedefault(self, text, line, begidx, endidx):
+        head = line[:begidx]
+        quote = _open_quote(head)
+        try:
+            words = shlex.split(head if quote is None else head[:quote])
+        except ValueError:
+            return []
+        if not words:
+            return []
+        entry = COMMANDS.get(ALIASES.get(words[0], words[0]))
+        if entry is None:
+            return []
+        if text.startswith('--'):
+            options = list(entry.options) + list(entry.flags) + (['--concurrency'] if entry.concurrency else [])
+            return [option for option in options if option.startswith(text)]
+
+        args = words[1:]
+        names = usage_arguments(entry.usage)
+        indexes = positional_indexes(entry, args)
+        if (self.snapshot is not None and names and names[0] == 'board_id'
+                and (not indexes or not TRELLO_ID.match(args[indexes[0]]))):
+            names = names[1:]
+        position = len(indexes)
+        if position >= len(names):
+            return []
+        return self._complete(self.candidates(argument_kind(names[position])), line, begidx, endidx)
+
+    @staticmethod
+    def _complete(candidates, line, begidx, endidx):
+        """
+        Completions for the word being typed. Readline replaces only the
+        text after the last space, so inside an open quote the part typed
+        before that space is trimmed from each match.
+        """
+        quote = _open_quote(line[:begidx])
+        if quote is None:
+            typed = line[begidx:endidx]
+            if typed[:1] in ('"', "'"):
+                typed = typed[1:]
+            matches = [name for name in candidates if name.lower().startswith(typed.lower())]
+            return [f'"{name}" ' if ' ' in name or line[begidx:begidx + 1] in ('"', "'") else name + ' '
+                    for name in matches]
+
+        typed = line[quote + 1:endidx]
+        before_word = begidx - (quote + 1)
+        quote_char = line[quote]
+        return [name[before_word:] + quote_char + ' ' for name in candidates
+                if name.lower().startswith(typed.lower())]
+
+
+def _open_quote(text):
+    """Index of a quote that is still open at the end of text, or None"""
+    quote = None
+    for i, char in enumerate(text):
+        if quote is None and char in ('"', "'"):
+            quote = i
+        elif quote is not None and char == text[quote]:
+            quote = None
+    return quote
+
+
+def cmd_shell(board_id=None):
+    """
+    Interactive shell that keeps a board in memory
+
+    Args:
+        board_id: Board to load first (ID or name); `use <board>` switches
+    """
+    shell = TrelloShell()
+    try:
+        import readline
+        # Complete whole names: only whitespace separates words
+        readline.set_completer_delims(' \t\n')
+    except ImportError:
+        pass
+
+    if board_id:
+        shell.load_board(board_id)
+    try:
+        shell.cmdloop()
+    finally:
+        if shell.snapshot is not None:
+            get_client().unpin_snapshot(shell.snapshot.id)
@@ -12,8 +12,8 @@ def cmd_sprint_start(board_id, sprint_list_name="To Do (Sprint)", ready_list_nam
     Interactive selection of cards to include.
     """
     client = get_client()
-    board = client.get_board(board_id)
-    lists = board.list_lists()
+    board = client.get_board_snapshot(board_id)
+    lists = board.lists
 
     # Find Ready and Sprint lists
     ready_list = _find_list(lists, ready_list_name, ['ready', 'backlog prioritizado'])
@@ -28,7 +28,7 @@ def cmd_sprint_start(board_id, sprint_list_name="To Do (Sprint)", ready_list_nam
         return
 
     # Get cards from Ready list
-    cards = ready_list.list_cards()
+    cards = board.cards_in(ready_list.id)
     if not cards:
         print(f"No cards found in '{ready_list.name}'")
         return
@@ -68,8 +68,9 @@ def cmd_sprint_start(board_id, sprint_list_name="To Do (Sprint)", ready_list_nam
     moved_count = 0
     for card in selected_cards:
         try:
-            card.change_list(sprint_list.id)
-            card.comment("Moved to sprint")
+            ref = client.card_ref(card)
+            ref.change_list(sprint_list.id)
+            ref.comment("Moved to sprint")
             print(f"✅ {card.name[:60]}")
             moved_count += 1
         except Exception as e:
@@ -86,8 +87,8 @@ def cmd_sprint_status(board_id):
     Shows: Ready, To Do, In Progress, Testing, Done
     """
     client = get_client()
-    board = client.get_board(board_id)
-    lists = board.list_lists()
+    board = client.get_board_snapshot(board_id)
+    lists = board.lists
 
     # Define sprint workflow stages
     stages = {
@@ -108,7 +109,7 @@ def cmd_sprint_status(board_id):
     for stage_name, keywords in stages.items():
         lst = _find_list(lists, stage_name, keywords)
         if lst:
-            cards = lst.list_cards()
+            cards = board.cards_in(lst.id)
             card_count = len(cards)
             total_cards += card_count
 
@@ -155,8 +156,8 @@ def cmd_sprint_close(board_id, sprint_list_name="To Do (Sprint)", backlog_list_n
     Close sprint: Move unfinished cards back to backlog and generate report.
     """
     client = get_client()
-    board = client.get_board(board_id)
-    lists = board.list_lists()
+    board = client.get_board_snapshot(board_id)
+    lists = board.lists
 
     # Find sprint workflow lists
     sprint_list = _find_list(lists, sprint_list_name, ['to do', 'sprint', 'todo'])
@@ -170,16 +171,16 @@ def cmd_sprint_close(board_id, sprint_list_name="To Do (Sprint)", backlog_list_n
         return
 
     # Count completed cards
-    completed_count = len(done_list.list_cards()) if done_list else 0
+    completed_count = len(board.cards_in(done_list.id)) if done_list else 0
 
     # Get unfinished cards
     unfinished_cards = []
     if sprint_list:
-        unfinished_cards.extend(sprint_list.list_cards())
+        unfinished_cards.extend(board.cards_in(sprint_list.id))
     if in_progress_list:
-        unfinished_cards.extend(in_progress_list.list_cards())
+        unfinished_cards.extend(board.cards_in(in_progress_list.id))
     if testing_list:
-        unfinished_cards.extend(testing_list.list_cards())
+        unfinished_cards.extend(board.cards_in(testing_list.id))
 
     print(f"\n{'='*70}")
     print(f"SPRINT CLOSE - {board.name}")
@@ -202,8 +203,9 @@ def cmd_sprint_close(board_id, sprint_list_name="To Do (Sprint)", backlog_list_n
         moved_count = 0
         for card in unfinished_cards:
             try:
-                card.change_list(backlog_list.id)
-                card.comment("Moved back to backlog - not completed in sprint")
+                ref = client.card_ref(card)
+                ref.change_list(backlog_list.id)
+                ref.comment("Moved back to backlog - not completed in sprint")
                 moved_count += 1
             except Exception as e:
                 print(f"❌ Failed to move: {card.name[:60]}")
@@ -223,8 +225,8 @@ def cmd_sprint_velocity(board_id, num_sprints=3):
     Note: This is a simple estimate based on card count in Done list.
     """
     client = get_client()
-    board = client.get_board(board_id)
-    lists = board.list_lists()
+    board = client.get_board_snapshot(board_id)
+    lists = board.lists
 
     done_list = _find_list(lists, 'Done', ['done', 'completed', 'hecho'])
 
@@ -232,7 +234,7 @@ def cmd_sprint_velocity(board_id, num_sprints=3):
         print("❌ Could not find 'Done' list")
         return
 
-    cards = done_list.list_cards()
+    cards = board.cards_in(done_list.id)
 
     if not cards:
         print("No completed cards found")
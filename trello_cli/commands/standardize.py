@@ -1,8 +1,9 @@
 """
 Board standardization and Agile/Scrum conformity commands
-"""
 
-from ..client import get_client
+The API client is imported inside the commands that use it, so
+list-templates starts without loading requests and py-trello.
+"""
 
 
 # Standard Agile/Scrum list structure
@@ -31,9 +32,10 @@ def cmd_standardize_lists(board_id, template="agile", dry_run=False):
     - kanban: Simple Kanban (To Do, In Progress, Done)
     - basic: Basic workflow (Backlog, To Do, In Progress, Done)
     """
+    from ..client import get_client
     client = get_client()
-    board = client.get_board(board_id)
-    current_lists = board.list_lists()
+    board = client.get_board_snapshot(board_id)
+    current_lists = board.lists
 
     # Get template
     if template == "agile":
@@ -84,7 +86,7 @@ def cmd_standardize_lists(board_id, template="agile", dry_run=False):
     if extra_lists:
         print(f"⚠️  EXTRA LISTS (not in template):")
         for lst in extra_lists:
-            cards_count = len(lst.list_cards())
+            cards_count = len(board.cards_in(lst.id))
             print(f"   • {lst.name} ({cards_count} cards)")
         print()
 
@@ -109,7 +111,7 @@ def cmd_standardize_lists(board_id, template="agile", dry_run=False):
     created_count = 0
     for lst in missing_lists:
         try:
-            board.add_list(lst["name"])
+            board.board.add_list(lst["name"])
             print(f"✅ Created: {lst['name']}")
             created_count += 1
         except Exception as e:
@@ -134,122 +136,34 @@ def cmd_scrum_check(board_id):
     - Card distribution
     - Workflow health
     """
-    client = get_client()
-    board = client.get_board(board_id)
-    lists = board.list_lists()
+    from ..client import get_client
+    from ..rules import BoardFrame, ScrumCheckRule, evaluate
+    board = get_client().get_board_snapshot(board_id)
+    report = evaluate(BoardFrame(board), [ScrumCheckRule()])['scrum-check']
+    _print_scrum_check(board, report)
+
+
+def _print_scrum_check(board, report):
+    """Print a ScrumCheckRule report"""
+    board_id = board.id
+    issues = report['issues']
+    score = report['score']
 
     print(f"\n{'='*70}")
     print(f"AGILE/SCRUM CONFORMITY CHECK - {board.name}")
     print(f"{'='*70}\n")
 
-    issues = []
-    score = 100
-
-    # Required lists check
-    required_keywords = {
-        "Backlog": ["backlog", "📋"],
-        "Ready": ["ready", "listo", "✅"],
-        "Sprint/To Do": ["sprint", "to do", "todo", "📝"],
-        "In Progress": ["in progress", "doing", "wip", "⚙️"],
-        "Testing": ["testing", "test", "qa", "🧪"],
-        "Done": ["done", "completed", "✅"],
-    }
-
-    print("📋 REQUIRED LISTS CHECK:\n")
-    for list_type, keywords in required_keywords.items():
-        found = False
-        for lst in lists:
-            if any(keyword in lst.name.lower() for keyword in keywords):
-                found = True
-                cards_count = len(lst.list_cards())
-                print(f"✅ {list_type}: '{lst.name}' ({cards_count} cards)")
-                break
-
-        if not found:
-            print(f"❌ {list_type}: MISSING")
-            issues.append(f"Missing required list: {list_type}")
-            score -= 15
-
-    # WIP limit check (In Progress should have ≤3-5 cards)
-    print(f"\n⚙️  WIP LIMITS CHECK:\n")
-    for lst in lists:
-        if any(keyword in lst.name.lower() for keyword in ["in progress", "doing", "wip"]):
-            cards = lst.list_cards()
-            card_count = len(cards)
-
-            if card_count == 0:
-                print(f"⚠️  {lst.name}: No cards (consider pulling work)")
-            elif card_count <= 3:
-                print(f"✅ {lst.name}: {card_count} cards (GOOD - within WIP limit)")
-            elif card_count <= 5:
-                print(f"🟡 {lst.name}: {card_count} cards (WARNING - near WIP limit)")
-                issues.append(f"WIP near limit in '{lst.name}': {card_count}/5")
-                score -= 5
-            else:
-                print(f"🔴 {lst.name}: {card_count} cards (CRITICAL - exceeds WIP limit)")
-                issues.append(f"WIP exceeded in '{lst.name}': {card_count} (recommended: ≤5)")
-                score -= 15
-
-    # Sprint size check (Sprint/To Do should have 5-15 cards)
-    print(f"\n📝 SPRINT SIZE CHECK:\n")
-    for lst in lists:
-        if any(keyword in lst.name.lower() for keyword in ["sprint", "to do"]) and \
-           any(keyword in lst.name.lower() for keyword in ["sprint", "doing"]):
-            cards = lst.list_cards()
-            card_count = len(cards)
-
-            if card_count == 0:
-                print(f"⚠️  {lst.name}: Empty sprint")
-            elif 5 <= card_count <= 15:
-                print(f"✅ {lst.name}: {card_count} cards (GOOD sprint size)")
-            elif card_count < 5:
-                print(f"🟡 {lst.name}: {card_count} cards (Small sprint)")
-                issues.append(f"Sprint too small: {card_count} cards (recommended: 5-15)")
-                score -= 5
-            else:
-                print(f"🔴 {lst.name}: {card_count} cards (Overloaded sprint)")
-                issues.append(f"Sprint too large: {card_count} cards (recommended: 5-15)")
-                score -= 10
-
-    # Testing queue check
-    print(f"\n🧪 TESTING QUEUE CHECK:\n")
-    for lst in lists:
-        if any(keyword in lst.name.lower() for keyword in ["testing", "test", "qa", "review"]):
-            cards = lst.list_cards()
-            card_count = len(cards)
-
-            if card_count == 0:
-                print(f"✅ {lst.name}: No bottleneck")
-            elif card_count <= 3:
-                print(f"✅ {lst.name}: {card_count} cards (Healthy)")
-            elif card_count <= 5:
-                print(f"🟡 {lst.name}: {card_count} cards (Building up)")
-                issues.append(f"Testing queue building: {card_count} cards")
-                score -= 5
-            else:
-                print(f"🔴 {lst.name}: {card_count} cards (BOTTLENECK)")
-                issues.append(f"Testing bottleneck: {card_count} cards")
-                score -= 15
-
-    # Backlog health check
-    print(f"\n📋 BACKLOG HEALTH:\n")
-    for lst in lists:
-        if "backlog" in lst.name.lower():
-            cards = lst.list_cards()
-            card_count = len(cards)
-
-            if card_count == 0:
-                print(f"⚠️  {lst.name}: Empty backlog (no future work)")
-                issues.append("Empty backlog")
-                score -= 10
-            elif card_count < 10:
-                print(f"🟡 {lst.name}: {card_count} cards (Low - needs grooming)")
-                issues.append(f"Low backlog: {card_count} cards")
-                score -= 5
-            elif card_count <= 50:
-                print(f"✅ {lst.name}: {card_count} cards (Healthy)")
-            else:
-                print(f"🟡 {lst.name}: {card_count} cards (Large - consider prioritization)")
+    sections = (
+        ('required', "📋 REQUIRED LISTS CHECK:\n"),
+        ('wip', "\n⚙️  WIP LIMITS CHECK:\n"),
+        ('sprint', "\n📝 SPRINT SIZE CHECK:\n"),
+        ('testing', "\n🧪 TESTING QUEUE CHECK:\n"),
+        ('backlog', "\n📋 BACKLOG HEALTH:\n"),
+    )
+    for section, title in sections:
+        print(title)
+        for line in report['lines'][section]:
+            print(line)
 
     # Summary
     print(f"\n{'='*70}")
@@ -289,6 +203,7 @@ def cmd_migrate_cards(source_list_id, target_board_id, target_list_name=""):
     Migrate cards from one list to another board.
     Useful for reorganizing boards or splitting projects.
     """
+    from ..client import get_client
     client = get_client()
     source_list = client.get_list(source_list_id)
     target_board = client.get_board(target_board_id)
@@ -343,6 +258,9 @@ def cmd_migrate_cards(source_list_id, target_board_id, target_list_name=""):
 
     print(f"\n{'='*70}")
     print(f"✅ Migration complete: {migrated_count}/{len(cards)} cards")
+    throttle = client.throttle_summary()
+    if throttle:
+        print(throttle)
     print(f"{'='*70}\n")
 
 
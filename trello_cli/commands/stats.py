@@ -0,0 +1,83 @@
+"""
+Latency statistics command
+"""
+
+import json
+
+from ..metrics import MetricsStore, parse_window
+
+
+def _ms(seconds):
+    return f"{seconds * 1000:.0f}" if seconds is not None else '-'
+
+
+def _pct(part, whole):
+    return f"{100.0 * part / whole:.1f}%" if whole else '-'
+
+
+def cmd_stats(window='24h', command=None, as_json=False):
+    """
+    Show latency percentiles, error/throttle rates and cache hit ratios
+    recorded by previous invocations
+
+    Args:
+        window: Time window such as 90m, 24h or 7d (rounded out to whole hours)
+        command: Only show this command (e.g. board-audit)
+        as_json: Print the report as JSON
+    """
+    window_seconds = parse_window(window)
+    store = MetricsStore()
+    try:
+        store.ingest()
+        report = store.report(window_seconds, command)
+    finally:
+        store.close()
+
+    if as_json:
+        print(json.dumps(report, indent=2))
+        return
+
+    totals = report['totals']
+    print(f"\n{'='*80}")
+    print(f"📊 TRELLO CLI STATS - last {window}" + (f" - {command}" if command else ''))
+    print(f"Source: {store.path}")
+    print(f"{'='*80}")
+
+    if not totals['runs']:
+        print("\nNo invocations recorded in this window")
+        print(f"{'='*80}\n")
+        return
+
+    print(f"\n{'COMMAND':<24} {'RUNS':>6} {'FAIL':>6} {'REQ/RUN':>8} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    print('-' * 80)
+    for entry in report['commands']:
+        print(f"{entry['command'][:24]:<24} {entry['runs']:>6} "
+              f"{_pct(entry['failures'], entry['runs']):>6} "
+              f"{entry['requests'] / entry['runs']:>8.1f} "
+              f"{_ms(entry['p50']):>8} {_ms(entry['p95']):>8} {_ms(entry['p99']):>8}")
+
+    if report['endpoints']:
+        print(f"\n{'ENDPOINT':<34} {'REQS':>6} {'ERR':>6} {'429':>6} {'CACHE':>6} "
+              f"{'p50':>6} {'p95':>6} {'p99':>6}")
+        print('-' * 80)
+        for entry in report['endpoints']:
+            print(f"{entry['endpoint'][:34]:<34} {entry['requests']:>6} "
+                  f"{_pct(entry['errors'], entry['requests']):>6} "
+                  f"{_pct(entry['throttled'], entry['requests']):>6} "
+                  f"{_pct(entry['cache_hits'], entry['requests']):>6} "
+                  f"{_ms(entry['p50']):>6} {_ms(entry['p95']):>6} {_ms(entry['p99']):>6}")
+
+    wall = totals['seconds']
+    print(f"\n{'='*80}")
+    print(f"Runs:      {totals['runs']} ({_pct(totals['failures'], totals['runs'])} failed)")
+    if report['endpoints']:
+        print(f"Requests:  {totals['requests']} ({_pct(totals['errors'], totals['requests'])} errors, "
+              f"{_pct(totals['throttled'], totals['requests'])} throttled, "
+              f"{_pct(totals['cache_hits'], totals['requests'])} cache hits)")
+    else:
+        print(f"Requests:  {totals['requests']}")
+    print(f"Time:      {_pct(totals['http_seconds'], wall)} Trello + network, "
+          f"{_pct(totals['throttled_seconds'], wall)} rate-limit waits, "
+          f"{_pct(totals['cli_seconds'], wall)} CLI")
+    print(f"{'='*80}\n")
@@ -0,0 +1,101 @@
+"""
+Local mirror commands: trello sync and mirror-status
+"""
+
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from ..client import get_client
+from ..config import CLIENT_OPTIONS, configure_client
+from ..executor import run_tasks
+from ..mirror import sync_board
+
+
+@contextmanager
+def fresh_client():
+    """
+    The client with cached responses bypassed. Whatever goes into the
+    mirror must be fresh: a cached board or action list would leave
+    changes out until the card changes again.
+    """
+    previous = CLIENT_OPTIONS['refresh_cache']
+    configure_client(refresh_cache=True)
+    try:
+        yield get_client()
+    finally:
+        configure_client(refresh_cache=previous)
+
+
+def cmd_sync(board_ids=(), full=False, concurrency=1):
+    """
+    Copy boards into the local SQLite mirror, or bring them up to date
+
+    The first sync of a board stores all of it; later syncs fetch only the
+    board's actions since the previous sync and refetch what they changed.
+    Read commands run against the mirror with --offline.
+
+    Args:
+        board_ids: Boards to sync; none re-syncs every mirrored board
+        full: Fetch every board in full instead of incrementally
+        concurrency: Number of boards synced in parallel
+    """
+    with fresh_client() as client:
+        mirror = client.mirror()
+        board_ids = list(dict.fromkeys(board_ids)) or [board['id'] for board in mirror.boards()]
+        if not board_ids:
+            print("No boards in the local mirror yet")
+            print("   Run: trello sync <board_id> [<board_id>...]")
+            return
+
+        start = time.perf_counter()
+        failures = 0
+        print(f"\n🔄 Syncing {len(board_ids)} board(s) into {mirror.path}")
+        print(f"{'='*70}")
+        for board_id, result, error in run_tasks(
+                board_ids, lambda board_id: sync_board(client, mirror, board_id, full=full), concurrency):
+            if error is not None:
+                failures += 1
+                print(f"❌ {board_id}: {error}")
+                continue
+            if result['mode'] == 'full':
+                detail = f"full copy, {result['cards']} card(s)"
+            elif result['actions']:
+                detail = (f"{result['actions']} new action(s), {result['cards']} card(s) updated"
+                          + (f", {result['deleted']} removed" if result['deleted'] else ""))
+            else:
+                detail = "up to date"
+            print(f"✅ {result['name'][:35]:<35} {detail}  ({result['seconds']:.2f}s)")
+        print(f"{'='*70}")
+        print(f"Synced {len(board_ids) - failures}/{len(board_ids)} board(s) in "
+              f"{time.perf_counter() - start:.2f}s")
+        print("💡 Read them without the network: trello --offline <command>")
+
+    if failures:
+        raise Exception(f"Failed to sync {failures} board(s)")
+
+
+def cmd_mirror_status():
+    """Show the boards in the local mirror and when each was last synced"""
+    mirror = get_client().mirror()
+    stats = mirror.stats()
+    boards = mirror.boards()
+
+    print("\n🪞 LOCAL MIRROR")
+    print("=" * 70)
+    print(f"Location: {mirror.path}")
+    print(f"Size:     {stats['bytes'] / 1024:.1f} KB")
+    print(f"Rows:     {stats['cards']} cards, {stats['lists']} lists, {stats['labels']} labels, "
+          f"{stats['checklists']} checklists, {stats['members']} members, {stats['comments']} comments")
+    print()
+    if not boards:
+        print("No boards synced yet. Run: trello sync <board_id>")
+        return
+
+    print(f"{'ID':<26}{'Name':<30}{'Cards':>7}  Last synced")
+    print("-" * 70)
+    for board in boards:
+        synced = datetime.fromtimestamp(board['synced_at']).strftime('%Y-%m-%d %H:%M')
+        print(f"{board['id']:<26}{board['name'][:28]:<30}{board['cards']:>7}  {synced}")
+    print()
+    print("Run `trello sync` to update every mirrored board.")
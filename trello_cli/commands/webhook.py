@@ -0,0 +1,127 @@
+"""
+Webhook commands: a local receiver, webhook registration and payload replay
+"""
+
+import json
+import sys
+from datetime import datetime
+
+from ..cache import ResponseCache
+from ..client import get_client
+from ..config import CLIENT_OPTIONS
+from ..mirror import Mirror, MIRROR_DB
+from ..webhooks import DEFAULT_PORT, WebhookReceiver, WebhookServer
+
+
+def _receiver(secret=None, callback_url=None):
+    """Receiver for the response cache (unless --no-cache) and the mirror (if there is one)"""
+    cache = ResponseCache() if CLIENT_OPTIONS['cache'] else None
+    mirror = Mirror() if MIRROR_DB.exists() else None
+    return WebhookReceiver(cache=cache, mirror=mirror, secret=secret, callback_url=callback_url)
+
+
+def _print_result(result):
+    print(f"{datetime.now():%H:%M:%S} 🔔 {result['type']:<24} board {result['board_id']}: "
+          f"{result['invalidated']} cached response(s) dropped, mirror {result['mirror']}")
+    sys.stdout.flush()
+
+
+def _print_totals(receiver):
+    stats = receiver.stats()
+    print(f"{stats['received']} payload(s): {stats['invalidated']} cached response(s) dropped, "
+          f"{stats['mirrored']} applied to the mirror")
+    if stats['pending']:
+        print(f"💡 {stats['pending']} action(s) need a sync to reach the mirror: trello sync")
+
+
+def cmd_webhook_serve(port=DEFAULT_PORT, host='127.0.0.1', secret=None, callback_url=None, verify=True):
+    """
+    Receive Trello webhooks and keep the response cache and mirror current
+
+    Each delivery drops the cached responses that mention the cards and
+    lists it changed and patches the board in the local mirror. Expose the
+    port through a tunnel or reverse proxy, then register the public URL
+    with `trello webhook register`. Anyone who can reach the port can
+    drop cached responses or write to the mirror, so deliveries must be
+    signed unless verify is turned off explicitly.
+
+    Args:
+        port: Port to listen on
+        host: Interface to bind
+        secret: Trello app secret; deliveries without a valid signature are refused
+        callback_url: Public URL the webhook was registered with (signatures cover it)
+        verify: Refuse to start without a secret (False accepts unsigned deliveries)
+    """
+    if verify and not secret:
+        raise ValueError("Serving webhooks needs the Trello app secret (or verify=False)")
+    receiver = _receiver(secret, callback_url)
+    server = WebhookServer(receiver, host, port, on_result=_print_result)
+
+    print(f"\n🔔 Listening for Trello webhooks on {server.url}")
+    print(f"{'='*70}")
+    print(f"Response cache: {receiver.cache.path if receiver.cache else 'off (--no-cache)'}")
+    print(f"Local mirror:   {receiver.mirror.path if receiver.mirror else 'none (trello sync <board_id>)'}")
+    print(f"Signatures:     {'verified' if secret else 'NOT checked (--no-verify)'}")
+    print(f"{'='*70}")
+    print("Press Ctrl+C to stop\n")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print()
+    _print_totals(receiver)
+
+
+def cmd_webhook_replay(paths):
+    """
+    Apply saved webhook payloads, as the receiver would
+
+    Args:
+        paths: JSON files, each holding one payload or a list of payloads
+    """
+    receiver = _receiver()
+    for path in paths:
+        try:
+            with open(path, encoding='utf-8') as f:
+                payloads = json.load(f)
+        except (OSError, ValueError) as e:
+            raise Exception(f"Failed to read webhook payloads from {path}: {str(e)}")
+        for payload in payloads if isinstance(payloads, list) else [payloads]:
+            _print_result(receiver.apply(payload))
+    _print_totals(receiver)
+
+
+def cmd_webhook_register(board_id, callback_url, description='trello-cli'):
+    """
+    Register a webhook for a board
+
+    Trello checks the callback URL with a HEAD request first, so the
+    receiver must already be reachable there.
+    """
+    webhook = get_client().create_webhook(board_id, callback_url, description)
+    print(f"✅ Webhook {webhook['id']} registered")
+    print(f"   Board:    {board_id}")
+    print(f"   Callback: {callback_url}")
+    print(f"💡 Remove it with: trello webhook unregister {webhook['id']}")
+
+
+def cmd_webhook_list():
+    """List the webhooks registered with this token"""
+    webhooks = get_client().list_webhooks()
+    if not webhooks:
+        print("No webhooks registered. Add one: trello webhook register <board_id> <callback_url>")
+        return
+
+    print(f"\n{'ID':<26}{'Model':<26}{'Active':<8}Callback URL")
+    print("-" * 90)
+    for webhook in webhooks:
+        active = 'yes' if webhook.get('active', True) else 'no'
+        print(f"{webhook['id']:<26}{webhook.get('idModel', ''):<26}{active:<8}{webhook.get('callbackURL', '')}")
+    print()
+
+
+def cmd_webhook_unregister(webhook_ids):
+    """Unregister webhooks by ID"""
+    client = get_client()
+    for webhook_id in webhook_ids:
+        client.delete_webhook(webhook_id)
+        print(f"✅ Webhook {webhook_id} unregistered")
@@ -3,11 +3,59 @@ Configuration management for Trello CLI
 """
 
 import json
+import os
 import sys
 from pathlib import Path
 
 CONFIG_FILE = Path.home() / '.trello_config.json'
 
+API_BASE_URL = 'https://api.trello.com/1'
+
+
+def get_base_url():
+    """
+    Trello API base URL. Set TRELLO_BASE_URL to point the CLI at another
+    server, such as the local mock (python -m trello_cli.mock).
+    """
+    return os.environ.get('TRELLO_BASE_URL', API_BASE_URL).rstrip('/')
+
+
+# API client transport options, set once from global CLI flags before the
+# first request. Kept here rather than in client.py so the CLI can set them
+# without importing requests and py-trello.
+CLIENT_OPTIONS = {
+    'cache': True,
+    'refresh_cache': False,
+    'tracer': None,
+    'offline': False,
+}
+
+
+def configure_client(**options):
+    """
+    Set client transport options (call before get_client())
+
+    Args:
+        cache: Serve GET responses from the on-disk cache
+        refresh_cache: Skip cached responses but store fresh ones
+        tracer: trace.Tracer that records every request (--trace)
+        offline: Read synced boards from the local mirror and send no
+                 requests (--offline / --mirror)
+    """
+    unknown = set(options) - set(CLIENT_OPTIONS)
+    if unknown:
+        raise ValueError(f"Unknown client option(s): {', '.join(sorted(unknown))}")
+    CLIENT_OPTIONS.update(options)
+
+
+# Set to 0/off/false to stop recording invocation metrics (trello stats)
+METRICS_ENV = 'TRELLO_CLI_METRICS'
+
+
+def metrics_enabled():
+    """Whether invocations should be recorded in ~/.trellocli/metrics"""
+    return os.environ.get(METRICS_ENV, '1').strip().lower() not in ('0', 'off', 'false', 'no')
+
 
 def load_config():
     """Load Trello API credentials from config file"""
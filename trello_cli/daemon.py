@@ -0,0 +1,545 @@
+"""
+Warm daemon mode for repeated invocations
+
+`trello daemon start` runs a long-lived process that keeps the imported
+command modules, the TrelloClient singleton, its keep-alive connection
+pool, the rate limiter and the member/validation caches in memory. While it
+runs, `trello <command>` sends its argv, working directory and TRELLO_*
+environment over a Unix domain socket and streams back stdout, stderr and
+the exit code, so a command costs one socket round trip instead of an
+interpreter start, imports and a TLS handshake.
+
+Protocol: one connection per command, newline-delimited JSON both ways.
+
+    client -> daemon   {"argv": [...], "cwd": "...", "env": {...}, "tty": {...}}
+                       {"control": "status" | "stop"}
+    daemon -> client   {"out": "text"} / {"err": "text"}   (streamed)
+                       {"read": "line" | "all"}            (command reads stdin)
+                       {"exit": 0}                         (last message)
+                       {"status": {...}}                   (control replies)
+    client -> daemon   {"stdin": "text"}                   (reply to "read")
+
+Commands run one at a time: they share sys.argv, sys.stdout and the client
+options. The shim half of this module imports only what forward() needs,
+so it adds next to nothing to CLI startup when no daemon is running.
+"""
+
+import io
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+
+DAEMON_DIR = Path.home() / '.trellocli'
+
+# Override the socket location (the pid and log files sit next to it)
+SOCKET_ENV = 'TRELLO_DAEMON_SOCKET'
+# Set to 1 to run commands in-process even while a daemon is running
+NO_DAEMON_ENV = 'TRELLO_NO_DAEMON'
+
+# Stop after this many seconds without a command (0 = never)
+IDLE_TIMEOUT = 1800
+# Seconds `daemon start` waits for the background process to listen
+START_TIMEOUT = 10
+
+# Commands that always run in the invoking process: the daemon's own
+# commands, the interactive credential wizard, the shell (it needs
+# readline on the real terminal), plugins (their subprocesses write
+# straight to the terminal) and the webhook receiver (it serves until
+# interrupted, which would block every other command)
+LOCAL_COMMANDS = frozenset(('daemon', 'config', 'plugin', 'shell', 'webhook'))
+
+# Set while this process is the daemon, so commands it runs never forward
+_serving = False
+
+
+def socket_path():
+    """Path of the daemon's Unix socket"""
+    return Path(os.environ.get(SOCKET_ENV) or DAEMON_DIR / 'daemon.sock')
+
+
+def _sibling(path, suffix):
+    return Path(path).with_suffix(suffix)
+
+
+class _Channel:
+    """Newline-delimited JSON messages over a connected socket"""
+
+    def __init__(self, sock):
+        self.sock = sock
+        self.rfile = sock.makefile('rb')
+        self._lock = threading.Lock()
+
+    def send(self, message):
+        data = (json.dumps(message) + '\n').encode('utf-8')
+        with self._lock:
+            self.sock.sendall(data)
+
+    def receive(self):
+        """Next message, or None once the other side has hung up"""
+        line = self.rfile.readline()
+        return json.loads(line) if line else None
+
+    def close(self):
+        self.rfile.close()
+        self.sock.close()
+
+
+def _connect(path):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        raise
+    return _Channel(sock)
+
+
+def _isatty(stream):
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+def forward(argv, path=None, stdin=None, stdout=None, stderr=None):
+    """
+    Run a command in the daemon, relaying its output and stdin
+
+    Args:
+        argv: Arguments after `trello`
+        path: Daemon socket (default socket_path())
+
+    Returns:
+        The command's exit code, or None if no daemon is listening (the
+        caller then runs the command itself)
+    """
+    if _serving or not hasattr(socket, 'AF_UNIX'):
+        return None
+    if os.environ.get(NO_DAEMON_ENV, '').strip().lower() in ('1', 'true', 'yes', 'on'):
+        return None
+    path = path or socket_path()
+    if not os.path.exists(path):
+        return None
+    try:
+        channel = _connect(path)
+    except OSError:
+        # Stale socket from a daemon that did not shut down cleanly
+        return None
+
+    stdin = stdin or sys.stdin
+    streams = {'out': stdout or sys.stdout, 'err': stderr or sys.stderr}
+    request = {
+        'argv': list(argv),
+        'cwd': os.getcwd(),
+        'env': {name: value for name, value in os.environ.items() if name.startswith('TRELLO_')},
+        'tty': {'stdin': _isatty(stdin), 'out': _isatty(streams['out']), 'err': _isatty(streams['err'])},
+    }
+    try:
+        channel.send(request)
+        while True:
+            message = channel.receive()
+            if message is None:
+                print("❌ Lost connection to the Trello daemon", file=streams['err'])
+                return 1
+            if 'exit' in message:
+                return message['exit']
+            if 'read' in message:
+                data = stdin.readline() if message['read'] == 'line' else stdin.read()
+                channel.send({'stdin': data})
+                continue
+            for name, text in message.items():
+                streams[name].write(text)
+                streams[name].flush()
+    except KeyboardInterrupt:
+        print("\n⚠️  Operation cancelled by user", file=streams['out'])
+        return 130
+    except OSError as e:
+        print(f"❌ Lost connection to the Trello daemon: {e}", file=streams['err'])
+        return 1
+    finally:
+        channel.close()
+
+
+class _StreamWriter:
+    """sys.stdout/sys.stderr stand-in that sends each line to the client"""
+
+    encoding = 'utf-8'
+    errors = 'strict'
+
+    def __init__(self, channel, name, tty):
+        self.channel = channel
+        self.name = name
+        self.tty = tty
+        self._buffer = []
+        # Concurrent bulk workers print from several threads
+        self._lock = threading.Lock()
+
+    def write(self, text):
+        with self._lock:
+            self._buffer.append(text)
+            if '\n' in text:
+                self._flush()
+        return len(text)
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if self._buffer:
+            text = ''.join(self._buffer)
+            self._buffer = []
+            self.channel.send({self.name: text})
+
+    def isatty(self):
+        return self.tty
+
+    def writable(self):
+        return True
+
+
+class _StdinProxy(io.TextIOBase):
+    """sys.stdin stand-in that asks the client for input (input(), stdin files)"""
+
+    def __init__(self, channel, stdout, tty):
+        self.channel = channel
+        self.stdout = stdout
+        self.tty = tty
+
+    def _request(self, mode):
+        # Show the prompt before blocking on the answer
+        self.stdout.flush()
+        self.channel.send({'read': mode})
+        message = self.channel.receive()
+        return (message or {}).get('stdin', '')
+
+    def readline(self, size=-1):
+        return self._request('line')
+
+    def read(self, size=-1):
+        return self._request('all')
+
+    def readable(self):
+        return True
+
+    def isatty(self):
+        return self.tty
+
+
+def _reset_client():
+    client = sys.modules.get('trello_cli.client')
+    if client is not None:
+        client.TrelloClient._instance = None
+
+
+def _reset_transport():
+    # Rebuild the HTTP wrappers on the next get_client(): per-run state such
+    # as the cache's board activity probes must not outlive the command
+    client = sys.modules.get('trello_cli.client')
+    if client is not None and client.TrelloClient._instance is not None:
+        client.TrelloClient._instance._transport = None
+
+
+def _reload_validation_rules():
+    validators = sys.modules.get('trello_cli.validators')
+    if validators is not None:
+        validators.reload_config()
+
+
+class DaemonServer:
+    """Runs forwarded commands in this process, one at a time"""
+
+    def __init__(self, path=None, idle_timeout=IDLE_TIMEOUT):
+        self.path = Path(path or socket_path())
+        self.idle_timeout = idle_timeout
+        self.started = None
+        self.commands = 0
+        self.failures = 0
+        self._mtimes = {}
+        self._client_defaults = None
+
+    def _watched_files(self):
+        """Files whose changes invalidate what the daemon holds in memory"""
+        from .config import CONFIG_FILE
+        return {
+            CONFIG_FILE: _reset_client,
+            Path.home() / '.trello_validation_rules.json': _reload_validation_rules,
+        }
+
+    def _refresh_changed(self):
+        """Drop the client or validation rules if their files changed on disk"""
+        for path, reset in self._watched_files().items():
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                mtime = None
+            if path in self._mtimes and self._mtimes[path] != mtime:
+                reset()
+            self._mtimes[path] = mtime
+
+    def _preload(self):
+        """Import every command module up front so the first command is warm too"""
+        from . import commands, client  # noqa: F401
+        for name in commands.__all__:
+            getattr(commands, name)
+        self._refresh_changed()
+
+    def _listen(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists():
+            try:
+                _connect(self.path).close()
+            except OSError:
+                self.path.unlink()
+            else:
+                raise Exception(f"Daemon already running on {self.path}")
+
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # Only this user may connect: commands run with their Trello token
+        umask = os.umask(0o177)
+        try:
+            listener.bind(str(self.path))
+        finally:
+            os.umask(umask)
+        listener.listen(16)
+        listener.settimeout(self.idle_timeout or None)
+        return listener
+
+    def status(self):
+        client = sys.modules.get('trello_cli.client')
+        return {
+            'pid': os.getpid(),
+            'socket': str(self.path),
+            'started': self.started,
+            'uptime': time.time() - self.started,
+            'commands': self.commands,
+            'failures': self.failures,
+            'idle_timeout': self.idle_timeout,
+            'client': bool(client and client.TrelloClient._instance is not None),
+        }
+
+    def serve(self):
+        """Accept commands until stopped or idle for idle_timeout seconds"""
+        global _serving
+        import traceback
+        from .config import CLIENT_OPTIONS
+
+        listener = self._listen()
+        pid_file = _sibling(self.path, '.pid')
+        pid_file.write_text(str(os.getpid()))
+        self.started = time.time()
+        # Global flags given to `daemon start` apply to every command; its tracer does not
+        self._client_defaults = dict(CLIENT_OPTIONS, tracer=None)
+        _serving = True
+        try:
+            self._preload()
+            while True:
+                try:
+                    conn, _ = listener.accept()
+                except socket.timeout:
+                    break
+                channel = _Channel(conn)
+                try:
+                    if not self._handle(channel):
+                        break
+                except Exception:
+                    # Client went away mid-command; keep serving
+                    traceback.print_exc()
+                finally:
+                    channel.close()
+        finally:
+            _serving = False
+            listener.close()
+            for path in (self.path, pid_file):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def _handle(self, channel):
+        """Serve one connection; returns False to stop the daemon"""
+        request = channel.receive()
+        if request is None:
+            return True
+        control = request.get('control')
+        if control is not None:
+            channel.send({'status': self.status()})
+            return control != 'stop'
+
+        exit_code = self._run(channel, request)
+        self.commands += 1
+        if exit_code:
+            self.failures += 1
+        channel.send({'exit': exit_code})
+        return True
+
+    def _run(self, channel, request):
+        """Run one command with the client's argv, cwd, environment and streams"""
+        import traceback
+        from .cli import main
+        from .config import CLIENT_OPTIONS
+
+        self._refresh_changed()
+        tty = request.get('tty', {})
+        stdout = _StreamWriter(channel, 'out', tty.get('out', False))
+        stderr = _StreamWriter(channel, 'err', tty.get('err', False))
+        saved_streams = sys.argv, sys.stdin, sys.stdout, sys.stderr
+        saved_env = {name: value for name, value in os.environ.items() if name.startswith('TRELLO_')}
+        saved_cwd = os.getcwd()
+        try:
+            os.chdir(request['cwd'])
+            _replace_trello_env(request.get('env', {}))
+            # Options from the previous command's global flags must not leak
+            CLIENT_OPTIONS.clear()
+            CLIENT_OPTIONS.update(self._client_defaults)
+            _reset_transport()
+            sys.argv = ['trello'] + list(request['argv'])
+            sys.stdin = _StdinProxy(channel, stdout, tty.get('stdin', False))
+            sys.stdout, sys.stderr = stdout, stderr
+            try:
+                main()
+                return 0
+            except SystemExit as e:
+                if e.code is None or isinstance(e.code, int):
+                    return e.code or 0
+                print(e.code, file=sys.stderr)
+                return 1
+            except Exception:
+                traceback.print_exc()
+                return 1
+        finally:
+            try:
+                stdout.flush()
+                stderr.flush()
+            finally:
+                sys.argv, sys.stdin, sys.stdout, sys.stderr = saved_streams
+                _replace_trello_env(saved_env)
+                os.chdir(saved_cwd)
+
+
+def _replace_trello_env(env):
+    """Make the TRELLO_* environment variables exactly `env`"""
+    for name in [name for name in os.environ if name.startswith('TRELLO_')]:
+        if name not in env:
+            del os.environ[name]
+    os.environ.update(env)
+
+
+def _control(action, path=None):
+    """Send a control request; returns the daemon's status or None if none runs"""
+    path = path or socket_path()
+    if not hasattr(socket, 'AF_UNIX') or not os.path.exists(path):
+        return None
+    try:
+        channel = _connect(path)
+    except OSError:
+        return None
+    try:
+        channel.send({'control': action})
+        message = channel.receive()
+    finally:
+        channel.close()
+    return (message or {}).get('status')
+
+
+def _format_duration(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h {minutes}m"
+    if minutes:
+        return f"{minutes}m {seconds}s"
+    return f"{seconds}s"
+
+
+def cmd_daemon_start(foreground=False, idle_timeout=IDLE_TIMEOUT):
+    """
+    Start the daemon
+
+    Args:
+        foreground: Serve in this process instead of detaching
+        idle_timeout: Stop after this many seconds without a command (0 = never)
+    """
+    import signal
+    import subprocess
+
+    if not hasattr(socket, 'AF_UNIX'):
+        raise Exception("Daemon mode needs Unix domain sockets, which this platform lacks")
+
+    status = _control('status')
+    if status is not None:
+        print(f"⚠️  Daemon already running (pid {status['pid']}) on {status['socket']}")
+        return
+
+    path = socket_path()
+    idle = f"after {_format_duration(idle_timeout)} idle" if idle_timeout else "only when stopped"
+    if foreground:
+        print(f"🚀 Trello daemon listening on {path} (pid {os.getpid()}); exits {idle}")
+        print("   Press Ctrl+C to stop")
+        sys.stdout.flush()
+        # `kill` stops the daemon as cleanly as Ctrl+C (the socket is removed)
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        try:
+            DaemonServer(path, idle_timeout).serve()
+        except KeyboardInterrupt:
+            pass
+        print("👋 Daemon stopped")
+        return
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    log_file = _sibling(path, '.log')
+    command = [sys.executable, '-m', 'trello_cli.cli', 'daemon', 'start', '--foreground',
+               '--idle-timeout', str(idle_timeout)]
+    with open(log_file, 'ab') as log:
+        process = subprocess.Popen(command, stdin=subprocess.DEVNULL, stdout=log,
+                                   stderr=subprocess.STDOUT, start_new_session=True)
+
+    deadline = time.monotonic() + START_TIMEOUT
+    while status is None:
+        if process.poll() is not None or time.monotonic() > deadline:
+            raise Exception(f"Failed to start daemon, see {log_file}")
+        time.sleep(0.05)
+        status = _control('status')
+
+    print(f"✅ Daemon started (pid {status['pid']})")
+    print(f"   Socket: {status['socket']}")
+    print(f"   Log:    {log_file}")
+    print(f"   Stops {idle}; `trello daemon stop` stops it now")
+
+
+def cmd_daemon_stop():
+    """Stop the daemon"""
+    status = _control('stop')
+    if status is None:
+        print("ℹ️  No daemon running")
+        return
+
+    path = Path(status['socket'])
+    deadline = time.monotonic() + START_TIMEOUT
+    while path.exists() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    print(f"✅ Daemon stopped (pid {status['pid']}, served {status['commands']} command(s) "
+          f"in {_format_duration(status['uptime'])})")
+
+
+def cmd_daemon_status():
+    """Show whether the daemon is running and what it has served"""
+    status = _control('status')
+    if status is None:
+        print("ℹ️  No daemon running (start one with `trello daemon start`)")
+        return
+
+    print(f"\n{'='*70}")
+    print("🟢 TRELLO DAEMON")
+    print(f"{'='*70}")
+    print(f"   PID:           {status['pid']}")
+    print(f"   Socket:        {status['socket']}")
+    print(f"   Uptime:        {_format_duration(status['uptime'])}")
+    print(f"   Commands:      {status['commands']} ({status['failures']} failed)")
+    print(f"   API client:    {'connected' if status['client'] else 'not created yet'}")
+    idle_timeout = status['idle_timeout']
+    print(f"   Idle timeout:  {_format_duration(idle_timeout) if idle_timeout else 'none'}")
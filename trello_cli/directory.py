@@ -0,0 +1,89 @@
+"""
+Per-board member directory cached on disk
+"""
+
+import json
+import time
+from pathlib import Path
+
+from trello import Member
+
+
+DIRECTORY_DIR = Path.home() / '.trellocli' / 'members'
+
+# Board membership changes rarely; a card referencing an unknown member ID
+# forces a refresh before the TTL runs out
+DIRECTORY_TTL = 24 * 60 * 60
+
+MEMBER_FIELDS = 'fullName,username'
+
+
+class MemberDirectory:
+    """
+    Board members indexed by ID (id -> username / full name).
+
+    Card member resolution is an in-memory join over card.idMembers.
+    """
+
+    def __init__(self, board_id, members_json, fetched_at=None, trello_client=None):
+        self.board_id = board_id
+        self.fetched_at = fetched_at if fetched_at is not None else time.time()
+        self.from_disk = False
+        self._json = list(members_json)
+        self.members = [Member.from_json(trello_client, obj) for obj in self._json]
+        self.members_by_id = {member.id: member for member in self.members}
+
+    @staticmethod
+    def path_for(board_id, directory=None):
+        return Path(directory or DIRECTORY_DIR) / f"{board_id}.json"
+
+    @classmethod
+    def fetch(cls, trello_client, board_id):
+        """Fetch a board's members from the API"""
+        members_json = trello_client.fetch_json(
+            '/boards/' + board_id + '/members', query_params={'fields': MEMBER_FIELDS})
+        return cls(board_id, members_json, trello_client=trello_client)
+
+    @classmethod
+    def load(cls, board_id, trello_client=None, ttl=DIRECTORY_TTL, directory=None):
+        """Load a directory from disk, or None if missing, unreadable or expired"""
+        path = cls.path_for(board_id, directory)
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        fetched_at = data.get('fetched_at', 0)
+        if time.time() - fetched_at > ttl:
+            return None
+        loaded = cls(board_id, data.get('members', []), fetched_at, trello_client)
+        loaded.from_disk = True
+        return loaded
+
+    def save(self, directory=None):
+        """Write the directory to disk (errors are ignored: it is only a cache)"""
+        path = self.path_for(self.board_id, directory)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w') as f:
+                json.dump({'board_id': self.board_id, 'fetched_at': self.fetched_at,
+                           'members': self._json}, f)
+        except OSError:
+            pass
+
+    def knows_all(self, member_ids):
+        """Whether every member ID is in the directory"""
+        return all(member_id in self.members_by_id for member_id in member_ids)
+
+    def members_of(self, card):
+        """Members assigned to a card"""
+        return [self.members_by_id[member_id] for member_id in card.idMembers
+                if member_id in self.members_by_id]
+
+    def find(self, identifier):
+        """Find a member by ID, username or full name"""
+        for member in self.members:
+            if identifier in (member.id, member.username, member.full_name):
+                return member
+        return None
@@ -0,0 +1,48 @@
+"""
+Concurrent executor for bulk card operations
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Upper bound for --concurrency; the client's connection pool is sized to match
+MAX_CONCURRENCY = 16
+
+
+def parse_concurrency(value):
+    """Validate a --concurrency value and clamp it to 1..MAX_CONCURRENCY"""
+    try:
+        concurrency = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid concurrency: {value}. Use a positive integer")
+    if concurrency < 1:
+        raise ValueError(f"Invalid concurrency: {value}. Use a positive integer")
+    return min(concurrency, MAX_CONCURRENCY)
+
+
+def run_tasks(items, task, concurrency=1):
+    """
+    Run task(item) for every item, up to `concurrency` at a time.
+
+    All steps for one item run in the same worker, in order, so per-card
+    sequences like create -> set due -> label are preserved. Requests still
+    go through the client's shared rate limiter.
+
+    Yields:
+        (item, result, error) tuples in input order; error is None on success
+    """
+    if concurrency <= 1:
+        for item in items:
+            try:
+                yield item, task(item), None
+            except Exception as e:
+                yield item, None, e
+        return
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, MAX_CONCURRENCY)) as pool:
+        futures = [(item, pool.submit(task, item)) for item in items]
+        for item, future in futures:
+            try:
+                yield item, future.result(), None
+            except Exception as e:
+                yield item, None, e
@@ -0,0 +1,52 @@
+"""
+Per-command card field sets for lean API fetches
+"""
+
+# Card fields every projected fetch includes (needed to index and group cards)
+REQUIRED_CARD_FIELDS = ('id', 'idList')
+
+# Card fields each read command actually uses. Fetching only these skips
+# descriptions, badges and other large attributes. Commands not listed here
+# fetch full card payloads. A --fields override adds to these, never removes
+# them: the command would otherwise silently miss cards (no due, no overdue).
+COMMAND_CARD_FIELDS = {
+    'cards': ('id', 'name'),
+    'board-overview': ('id', 'idList'),
+    'board-ids': ('id', 'name', 'idList'),
+    'search-cards': ('id', 'name', 'desc', 'url', 'idList'),
+    'cards-by-label': ('id', 'name', 'idList', 'labels'),
+    'cards-due-soon': ('id', 'name', 'due', 'idList'),
+    'cards-overdue': ('id', 'name', 'due', 'idList'),
+}
+
+
+def parse_fields(value):
+    """Split a --fields value ("id,name,due") into a list of field names"""
+    fields = [f.strip() for f in value.split(',') if f.strip()]
+    if not fields:
+        raise ValueError("--fields requires a comma-separated list of card fields, or 'all'")
+    return fields
+
+
+def card_fields_for(command, override=None):
+    """
+    Card fields to request for a command
+
+    Args:
+        command: CLI command name (key of COMMAND_CARD_FIELDS)
+        override: Optional --fields value, fetched on top of the command's
+                  own fields; 'all' requests full card payloads
+
+    Returns:
+        List of field names, or None for full card payloads
+    """
+    if override:
+        if override.strip() == 'all':
+            return None
+        fields = parse_fields(override) + list(COMMAND_CARD_FIELDS.get(command, ()))
+    elif command in COMMAND_CARD_FIELDS:
+        fields = list(COMMAND_CARD_FIELDS[command])
+    else:
+        return None
+
+    return list(dict.fromkeys(list(REQUIRED_CARD_FIELDS) + fields))
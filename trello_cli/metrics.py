@@ -0,0 +1,356 @@
+"""
+Persistent latency statistics for `trello stats`
+"""
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends are not locked
+    fcntl = None
+
+
+METRICS_DIR = Path.home() / '.trellocli' / 'metrics'
+METRICS_DB = METRICS_DIR / 'metrics.db'
+
+# Each invocation appends one JSON line to this file next to the database;
+# `trello stats` (or a run that finds it over MAX_PENDING_BYTES) folds the
+# lines into the database in one transaction
+PENDING_LOG = 'pending.jsonl'
+MAX_PENDING_BYTES = 256 * 1024
+
+# Rows are aggregated per hour; older rows are dropped after RETENTION_DAYS
+SLOT_SECONDS = 3600
+RETENTION_DAYS = 30
+
+# Log-linear histogram: 2**SUB_BUCKET_BITS buckets per power of two of
+# microseconds, i.e. every bucket is within ~3% of the values in it
+SUB_BUCKET_BITS = 5
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+
+
+def bucket_index(micros):
+    """Histogram bucket for a value in microseconds"""
+    micros = max(0, int(micros))
+    if micros < SUB_BUCKETS:
+        return micros
+    shift = micros.bit_length() - SUB_BUCKET_BITS - 1
+    return (shift + 1) * SUB_BUCKETS + (micros >> shift) - SUB_BUCKETS
+
+
+def bucket_bounds(index):
+    """(lower, upper) microseconds covered by a bucket; upper is exclusive"""
+    if index < SUB_BUCKETS:
+        return index, index + 1
+    shift = index // SUB_BUCKETS - 1
+    lower = (index % SUB_BUCKETS + SUB_BUCKETS) << shift
+    return lower, lower + (1 << shift)
+
+
+class Histogram:
+    """HDR-style latency histogram stored as {bucket index: count}"""
+
+    def __init__(self, counts=None):
+        self.counts = dict(counts or {})
+
+    def record(self, seconds, count=1):
+        index = bucket_index(seconds * 1e6)
+        self.counts[index] = self.counts.get(index, 0) + count
+
+    def merge(self, other):
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        return self
+
+    @property
+    def total(self):
+        return sum(self.counts.values())
+
+    def percentile(self, q):
+        """Value (seconds) at percentile q (0-100), or None when empty"""
+        total = self.total
+        if not total:
+            return None
+        rank = max(1, -(-total * q // 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                lower, upper = bucket_bounds(index)
+                return (lower + upper) / 2 / 1e6
+        return None
+
+    def to_json(self):
+        return json.dumps({str(k): v for k, v in sorted(self.counts.items())}, separators=(',', ':'))
+
+    @classmethod
+    def from_json(cls, text):
+        return cls({int(k): v for k, v in json.loads(text or '{}').items()})
+
+
+def parse_window(value):
+    """'24h', '7d', '90m' or a number of hours -> seconds"""
+    value = str(value).strip().lower()
+    units = {'m': 60, 'h': 3600, 'd': 86400, 'w': 7 * 86400}
+    try:
+        if value and value[-1] in units:
+            seconds = float(value[:-1]) * units[value[-1]]
+        else:
+            seconds = float(value) * 3600
+    except ValueError:
+        raise ValueError(f"Invalid time window: {value}. Use e.g. 90m, 24h, 7d")
+    if seconds <= 0:
+        raise ValueError(f"Invalid time window: {value}. Use e.g. 90m, 24h, 7d")
+    return seconds
+
+
+def _lock(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+
+def run_record(command, tracer, failed=False, throttled_seconds=0.0, now=None):
+    """
+    One CLI invocation's numbers, aggregated per endpoint, as a JSON-ready dict
+
+    Args:
+        command: Command name (e.g. 'board-audit')
+        tracer: trace.Tracer holding the invocation's requests
+        failed: Whether the command exited with an error
+        throttled_seconds: Time spent waiting on the client rate limiter
+    """
+    now = now or time.time()
+
+    endpoints = {}
+    for span in tracer.spans:
+        counters, histogram = endpoints.setdefault(span.endpoint, ({
+            'requests': 0, 'errors': 0, 'throttled': 0, 'cache_hits': 0,
+            'bytes': 0, 'seconds': 0.0,
+        }, Histogram()))
+        counters['requests'] += 1
+        counters['errors'] += span.error is not None or (span.status or 0) >= 400
+        counters['throttled'] += any(status == 429 for _, status in span.attempts)
+        counters['cache_hits'] += span.cache_hit
+        counters['bytes'] += span.size
+        counters['seconds'] += span.duration
+        histogram.record(span.duration)
+
+    command_histogram = Histogram()
+    command_histogram.record(tracer.wall)
+    return {
+        'time': now,
+        'command': command,
+        'counters': {
+            'runs': 1,
+            'failures': int(bool(failed)),
+            'requests': len(tracer.spans),
+            'seconds': tracer.wall,
+            'http_seconds': sum(span.duration for span in tracer.spans),
+            'throttled_seconds': throttled_seconds,
+        },
+        'histogram': command_histogram.counts,
+        'endpoints': {endpoint: [counters, histogram.counts]
+                      for endpoint, (counters, histogram) in endpoints.items()},
+    }
+
+
+def log_run(command, tracer, failed=False, throttled_seconds=0.0, path=None, now=None):
+    """
+    Record one CLI invocation by appending it to the pending log next to
+    the metrics database (path, by default METRICS_DB). The log is folded
+    into the database once it grows past MAX_PENDING_BYTES.
+    """
+    store_path = Path(path) if path else METRICS_DB
+    log_path = store_path.with_name(PENDING_LOG)
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    line = json.dumps(run_record(command, tracer, failed, throttled_seconds, now), separators=(',', ':'))
+    with open(log_path, 'a', encoding='utf-8') as f:
+        _lock(f)
+        f.write(line + '\n')
+        size = f.tell()
+
+    if size > MAX_PENDING_BYTES:
+        store = MetricsStore(store_path)
+        try:
+            store.ingest()
+        finally:
+            store.close()
+
+
+class MetricsStore:
+    """
+    SQLite-backed per-hour aggregates: one latency histogram per endpoint
+    and per command, plus error, throttle and cache hit counters.
+
+    CLI invocations append to the pending log (log_run) rather than write
+    here; ingest() adds the logged runs in one short transaction, so
+    concurrent invocations can share the file.
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else METRICS_DB
+        self.log_path = self.path.with_name(PENDING_LOG)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), timeout=5)
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS endpoint_stats (
+                slot INTEGER NOT NULL,
+                endpoint TEXT NOT NULL,
+                requests INTEGER NOT NULL DEFAULT 0,
+                errors INTEGER NOT NULL DEFAULT 0,
+                throttled INTEGER NOT NULL DEFAULT 0,
+                cache_hits INTEGER NOT NULL DEFAULT 0,
+                bytes INTEGER NOT NULL DEFAULT 0,
+                seconds REAL NOT NULL DEFAULT 0,
+                histogram TEXT NOT NULL DEFAULT '{}',
+                PRIMARY KEY (slot, endpoint)
+            );
+            CREATE TABLE IF NOT EXISTS command_stats (
+                slot INTEGER NOT NULL,
+                command TEXT NOT NULL,
+                runs INTEGER NOT NULL DEFAULT 0,
+                failures INTEGER NOT NULL DEFAULT 0,
+                requests INTEGER NOT NULL DEFAULT 0,
+                seconds REAL NOT NULL DEFAULT 0,
+                http_seconds REAL NOT NULL DEFAULT 0,
+                throttled_seconds REAL NOT NULL DEFAULT 0,
+                histogram TEXT NOT NULL DEFAULT '{}',
+                PRIMARY KEY (slot, command)
+            );
+        """)
+
+    def close(self):
+        self._db.close()
+
+    def _add(self, table, key_column, slot, key, counters, histogram):
+        row = self._db.execute(
+            f"SELECT histogram FROM {table} WHERE slot = ? AND {key_column} = ?", (slot, key)
+        ).fetchone()
+        merged = Histogram.from_json(row[0] if row else None).merge(histogram)
+        if row is None:
+            columns = ', '.join(counters)
+            placeholders = ', '.join('?' for _ in counters)
+            self._db.execute(
+                f"INSERT INTO {table} (slot, {key_column}, {columns}, histogram) "
+                f"VALUES (?, ?, {placeholders}, ?)",
+                (slot, key, *counters.values(), merged.to_json()))
+        else:
+            updates = ', '.join(f"{column} = {column} + ?" for column in counters)
+            self._db.execute(
+                f"UPDATE {table} SET {updates}, histogram = ? WHERE slot = ? AND {key_column} = ?",
+                (*counters.values(), merged.to_json(), slot, key))
+
+    def record_run(self, command, tracer, failed=False, throttled_seconds=0.0, now=None):
+        """Add one CLI invocation (see run_record) right away"""
+        self._add_records([run_record(command, tracer, failed, throttled_seconds, now)])
+
+    def ingest(self):
+        """
+        Add the runs waiting in the pending log and empty it
+
+        Returns:
+            Number of runs added (lines that aren't valid JSON are dropped)
+        """
+        try:
+            f = open(self.log_path, 'r+', encoding='utf-8')
+        except FileNotFoundError:
+            return 0
+        with f:
+            _lock(f)
+            records = []
+            for line in f.read().splitlines():
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+            if records:
+                self._add_records(records)
+            f.seek(0)
+            f.truncate()
+        return len(records)
+
+    def _add_records(self, records):
+        with self._db:
+            self._db.execute("BEGIN IMMEDIATE")
+            for record in records:
+                slot = int(record['time'] // SLOT_SECONDS) * SLOT_SECONDS
+                for endpoint, (counters, counts) in record['endpoints'].items():
+                    self._add('endpoint_stats', 'endpoint', slot, endpoint, counters,
+                              Histogram({int(k): v for k, v in counts.items()}))
+                self._add('command_stats', 'command', slot, record['command'], record['counters'],
+                          Histogram({int(k): v for k, v in record['histogram'].items()}))
+            cutoff = max(record['time'] for record in records) - RETENTION_DAYS * 86400
+            self._db.execute("DELETE FROM endpoint_stats WHERE slot < ?", (cutoff,))
+            self._db.execute("DELETE FROM command_stats WHERE slot < ?", (cutoff,))
+
+    def _aggregate(self, table, key_column, counter_columns, since, name=None):
+        query = (f"SELECT {key_column}, {', '.join(counter_columns)}, histogram "
+                 f"FROM {table} WHERE slot >= ?")
+        params = [int(since // SLOT_SECONDS) * SLOT_SECONDS]
+        if name:
+            query += f" AND {key_column} = ?"
+            params.append(name)
+
+        results = {}
+        for row in self._db.execute(query, params):
+            key, values, histogram = row[0], row[1:-1], Histogram.from_json(row[-1])
+            entry = results.setdefault(key, dict({key_column: key, 'histogram': Histogram()},
+                                                 **{column: 0 for column in counter_columns}))
+            for column, value in zip(counter_columns, values):
+                entry[column] += value
+            entry['histogram'].merge(histogram)
+        return list(results.values())
+
+    def report(self, window_seconds=86400, command=None, now=None):
+        """
+        Aggregate the last `window_seconds` (rounded out to whole hours)
+
+        Returns:
+            Dict with 'commands' and 'endpoints' lists (busiest first) and
+            overall 'totals'
+        """
+        now = now or time.time()
+        since = now - window_seconds
+
+        commands = self._aggregate(
+            'command_stats', 'command',
+            ('runs', 'failures', 'requests', 'seconds', 'http_seconds', 'throttled_seconds'),
+            since, command)
+        endpoints = self._aggregate(
+            'endpoint_stats', 'endpoint',
+            ('requests', 'errors', 'throttled', 'cache_hits', 'bytes', 'seconds'),
+            since) if not command else []
+
+        for entry in commands + endpoints:
+            histogram = entry.pop('histogram')
+            entry.update(p50=histogram.percentile(50), p95=histogram.percentile(95),
+                         p99=histogram.percentile(99))
+
+        runs = sum(c['runs'] for c in commands)
+        wall = sum(c['seconds'] for c in commands)
+        http = sum(c['http_seconds'] for c in commands)
+        throttled = sum(c['throttled_seconds'] for c in commands)
+        requests = sum(c['requests'] for c in commands)
+        totals = {
+            'runs': runs,
+            'failures': sum(c['failures'] for c in commands),
+            'requests': requests,
+            'errors': sum(e['errors'] for e in endpoints),
+            'throttled': sum(e['throttled'] for e in endpoints),
+            'cache_hits': sum(e['cache_hits'] for e in endpoints),
+            'seconds': wall,
+            # Rate-limit waits happen inside HTTP calls; split them out
+            'throttled_seconds': throttled,
+            'http_seconds': max(0.0, http - throttled),
+            'cli_seconds': max(0.0, wall - http),
+        }
+        return {
+            'window_seconds': window_seconds,
+            'since': since,
+            'commands': sorted(commands, key=lambda c: c['runs'], reverse=True),
+            'endpoints': sorted(endpoints, key=lambda e: e['requests'], reverse=True),
+            'totals': totals,
+        }
@@ -0,0 +1,925 @@
+"""
+Local SQLite mirror of synced boards for `trello sync` and --offline
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from datetime import timezone
+from pathlib import Path
+
+from .columns import age_distribution, card_created
+from .records import CardRecord, ListRecord
+from .rules import CONGESTED_LIST_SIZE, STALE_DAYS
+from .snapshot import BoardSnapshot, SNAPSHOT_PARAMS, card_records
+
+
+MIRROR_DIR = Path.home() / '.trellocli' / 'mirror'
+MIRROR_DB = MIRROR_DIR / 'mirror.db'
+
+# GET /boards/{id} parameters for the initial (or --full) sync: everything
+# a snapshot holds, archived cards included, plus the board's members
+FULL_SYNC_PARAMS = dict(SNAPSHOT_PARAMS, cards='all', members='all', member_fields='fullName,username')
+
+# Trello returns at most this many actions per request; a board with more
+# changes than that since the last sync is fetched again in full
+ACTIONS_LIMIT = 1000
+
+# Action types that change board-level resources rather than cards
+LIST_ACTIONS = ('createList', 'updateList', 'moveListToBoard', 'moveListFromBoard')
+LABEL_ACTIONS = ('createLabel', 'updateLabel', 'deleteLabel')
+MEMBER_ACTIONS = ('addMemberToBoard', 'removeMemberFromBoard', 'makeAdminOfBoard',
+                  'makeNormalMemberOfBoard', 'makeObserverOfBoard')
+BOARD_RESOURCES = ('board', 'lists', 'labels', 'members')
+COMMENT_ACTIONS = ('commentCard', 'updateComment', 'deleteComment')
+
+# Card actions Mirror.apply_action can apply from the action alone
+CARD_CREATE_ACTIONS = ('createCard', 'copyCard', 'convertToCardFromCheckItem', 'emailCard')
+CARD_REMOVE_ACTIONS = ('deleteCard', 'moveCardFromBoard')
+CARD_EDIT_ACTIONS = ('updateCard', 'addLabelToCard', 'removeLabelFromCard',
+                     'addMemberToCard', 'removeMemberFromCard')
+
+# bm25 weights of the search index columns: name, desc, comments, checklists
+SEARCH_WEIGHTS = (10.0, 4.0, 1.0, 2.0)
+
+_FTS_OPERATORS = ('AND', 'OR', 'NOT')
+
+# Bumped when derived columns or tables change; older mirrors are
+# backfilled from the stored card JSON when opened
+SCHEMA_VERSION = 2
+
+
+def classify_actions(actions):
+    """
+    What a run of board actions changed
+
+    Returns:
+        (card IDs, set of board resources) where resources are names from
+        BOARD_RESOURCES; an action that is not understood marks them all
+    """
+    card_ids = set()
+    resources = set()
+    for action in actions:
+        data = action.get('data') or {}
+        action_type = action.get('type')
+        if action_type in LIST_ACTIONS:
+            resources.add('lists')
+        elif 'card' in data:
+            card_ids.add(data['card']['id'])
+        elif action_type in LABEL_ACTIONS:
+            resources.add('labels')
+        elif action_type in MEMBER_ACTIONS:
+            resources.add('members')
+        elif action_type == 'updateBoard':
+            resources.add('board')
+        else:
+            resources.update(BOARD_RESOURCES)
+    return card_ids, resources
+
+
+def fts_query(text, prefix=False):
+    """
+    Turn a search string into an FTS5 query
+
+    Words are matched as whole tokens (word* for a prefix, or every word
+    with prefix=True), "quoted text" as a phrase, and AND/OR/NOT pass
+    through; everything else is quoted so punctuation such as PF-WEB-1
+    can't break the query syntax.
+    """
+    terms = []
+    for phrase, word in re.findall(r'"([^"]*)"?|(\S+)', text):
+        if phrase.strip():
+            terms.append('"' + phrase.replace('"', '""') + '"')
+        elif word in _FTS_OPERATORS:
+            terms.append(word)
+        elif word.rstrip('*'):
+            star = '*' if word.endswith('*') or prefix else ''
+            terms.append('"' + word.rstrip('*').replace('"', '""') + '"' + star)
+    while terms and terms[0] in _FTS_OPERATORS:
+        terms.pop(0)
+    while terms and terms[-1] in _FTS_OPERATORS:
+        terms.pop()
+    return ' '.join(terms)
+
+
+def iso_timestamp(dt):
+    """Trello-style UTC timestamp (2025-01-01T12:00:00.000Z), comparable with stored dates"""
+    dt = dt.astimezone(timezone.utc)
+    return dt.strftime('%Y-%m-%dT%H:%M:%S.') + f"{dt.microsecond // 1000:03d}Z"
+
+
+class Mirror:
+    """
+    SQLite copy of boards with their lists, cards, labels, checklists and
+    members.
+
+    Every row keeps the API JSON it came from (so snapshots rebuilt from
+    the mirror are identical to fetched ones) next to indexed columns for
+    the fields queries filter on. Card names, descriptions, comments and
+    checklist items are kept in an FTS5 index that every write updates for
+    the cards it touches. Safe to share between threads.
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else MIRROR_DB
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), timeout=5, check_same_thread=False)
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS boards (
+                id TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                closed INTEGER NOT NULL DEFAULT 0,
+                date_last_activity TEXT,
+                last_action_date TEXT,
+                synced_at REAL NOT NULL,
+                json TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS lists (
+                id TEXT PRIMARY KEY,
+                board_id TEXT NOT NULL,
+                name TEXT NOT NULL,
+                closed INTEGER NOT NULL DEFAULT 0,
+                pos REAL,
+                json TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS lists_board ON lists (board_id);
+            CREATE TABLE IF NOT EXISTS cards (
+                id TEXT PRIMARY KEY,
+                board_id TEXT NOT NULL,
+                list_id TEXT,
+                name TEXT NOT NULL,
+                desc TEXT NOT NULL DEFAULT '',
+                closed INTEGER NOT NULL DEFAULT 0,
+                due TEXT,
+                due_complete INTEGER NOT NULL DEFAULT 0,
+                pos REAL,
+                id_short INTEGER,
+                date_last_activity TEXT,
+                created INTEGER,
+                json TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS cards_board ON cards (board_id, closed);
+            CREATE INDEX IF NOT EXISTS cards_list ON cards (list_id, closed);
+            CREATE INDEX IF NOT EXISTS cards_due ON cards (board_id, due);
+            CREATE TABLE IF NOT EXISTS card_labels (
+                card_id TEXT NOT NULL,
+                label_id TEXT NOT NULL,
+                board_id TEXT NOT NULL,
+                name TEXT,
+                color TEXT,
+                PRIMARY KEY (card_id, label_id)
+            );
+            CREATE INDEX IF NOT EXISTS card_labels_color ON card_labels (board_id, color);
+            CREATE TABLE IF NOT EXISTS card_members (
+                card_id TEXT NOT NULL,
+                member_id TEXT NOT NULL,
+                board_id TEXT NOT NULL,
+                PRIMARY KEY (card_id, member_id)
+            );
+            CREATE INDEX IF NOT EXISTS card_members_member ON card_members (board_id, member_id);
+            CREATE TABLE IF NOT EXISTS labels (
+                id TEXT PRIMARY KEY,
+                board_id TEXT NOT NULL,
+                name TEXT,
+                color TEXT,
+                json TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS labels_board ON labels (board_id);
+            CREATE TABLE IF NOT EXISTS checklists (
+                id TEXT PRIMARY KEY,
+                card_id TEXT NOT NULL,
+                board_id TEXT NOT NULL,
+                json TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS checklists_card ON checklists (card_id);
+            CREATE INDEX IF NOT EXISTS checklists_board ON checklists (board_id);
+            CREATE TABLE IF NOT EXISTS members (
+                board_id TEXT NOT NULL,
+                id TEXT NOT NULL,
+                username TEXT,
+                full_name TEXT,
+                json TEXT NOT NULL,
+                PRIMARY KEY (board_id, id)
+            );
+            CREATE TABLE IF NOT EXISTS comments (
+                id TEXT PRIMARY KEY,
+                card_id TEXT NOT NULL,
+                board_id TEXT NOT NULL,
+                date TEXT,
+                member_id TEXT,
+                text TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS comments_card ON comments (card_id);
+            CREATE INDEX IF NOT EXISTS comments_board ON comments (board_id);
+            CREATE TABLE IF NOT EXISTS search_docs (
+                rowid INTEGER PRIMARY KEY,
+                card_id TEXT NOT NULL UNIQUE,
+                board_id TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS search_docs_board ON search_docs (board_id);
+            CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5 (
+                name, desc, comments, checklists,
+                tokenize = 'unicode61 remove_diacritics 2',
+                prefix = '2 3'
+            );
+        """)
+        with self._db:
+            version = self._db.execute("PRAGMA user_version").fetchone()[0]
+            if version < SCHEMA_VERSION:
+                self._upgrade(version)
+
+    def close(self):
+        self._db.close()
+
+    def _upgrade(self, version):
+        """Backfill what a mirror from an older schema version lacks (runs once per mirror)"""
+        if version < 1:
+            # Derived card columns and tables
+            columns = {row[1] for row in self._db.execute("PRAGMA table_info(cards)")}
+            if 'created' not in columns:
+                self._db.execute("ALTER TABLE cards ADD COLUMN created INTEGER")
+            for board_id, text in self._db.execute("SELECT board_id, json FROM cards").fetchall():
+                card = json.loads(text)
+                self._db.execute("UPDATE cards SET created = ? WHERE id = ?",
+                                 (card_created(card['id']), card['id']))
+                self._put_card_links(board_id, [card])
+        if version < 2:
+            # Cards synced before the search index existed
+            unindexed = self._db.execute(
+                "SELECT DISTINCT board_id FROM cards WHERE id NOT IN (SELECT card_id FROM search_docs)"
+            ).fetchall()
+            for (board_id,) in unindexed:
+                self._index_cards(board_id)
+        self._db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    # ------------------------------------------------------------------
+    # Writes (each runs in one transaction)
+    # ------------------------------------------------------------------
+
+    def _put_board(self, board_json, last_action_date=None):
+        board = {key: value for key, value in board_json.items()
+                 if key not in ('lists', 'cards', 'checklists', 'labels', 'members')}
+        row = self._db.execute("SELECT last_action_date FROM boards WHERE id = ?",
+                               (board['id'],)).fetchone()
+        if last_action_date is None:
+            last_action_date = row[0] if row else board.get('dateLastActivity')
+        self._db.execute(
+            "INSERT OR REPLACE INTO boards (id, name, closed, date_last_activity, last_action_date, "
+            "synced_at, json) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (board['id'], board.get('name', ''), int(bool(board.get('closed'))),
+             board.get('dateLastActivity'), last_action_date, time.time(), json.dumps(board)))
+
+    def _put_lists(self, board_id, lists_json):
+        self._db.execute("DELETE FROM lists WHERE board_id = ?", (board_id,))
+        self._db.executemany(
+            "INSERT OR REPLACE INTO lists (id, board_id, name, closed, pos, json) VALUES (?, ?, ?, ?, ?, ?)",
+            [(obj['id'], board_id, obj.get('name', ''), int(bool(obj.get('closed'))), obj.get('pos'),
+              json.dumps(obj)) for obj in lists_json])
+
+    def _put_labels(self, board_id, labels_json):
+        self._db.execute("DELETE FROM labels WHERE board_id = ?", (board_id,))
+        self._db.executemany(
+            "INSERT OR REPLACE INTO labels (id, board_id, name, color, json) VALUES (?, ?, ?, ?, ?)",
+            [(obj['id'], board_id, obj.get('name'), obj.get('color'), json.dumps(obj))
+             for obj in labels_json])
+
+    def _put_members(self, board_id, members_json):
+        self._db.execute("DELETE FROM members WHERE board_id = ?", (board_id,))
+        self._db.executemany(
+            "INSERT OR REPLACE INTO members (board_id, id, username, full_name, json) VALUES (?, ?, ?, ?, ?)",
+            [(board_id, obj['id'], obj.get('username'), obj.get('fullName'), json.dumps(obj))
+             for obj in members_json])
+
+    def _put_cards(self, board_id, cards_json, checklists_json):
+        card_ids = [(obj['id'],) for obj in cards_json]
+        self._db.executemany("DELETE FROM checklists WHERE card_id = ?", card_ids)
+        self._db.executemany(
+            "INSERT OR REPLACE INTO cards (id, board_id, list_id, name, desc, closed, due, due_complete, "
+            "pos, id_short, date_last_activity, created, json) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(obj['id'], board_id, obj.get('idList'), obj.get('name', ''), obj.get('desc', ''),
+              int(bool(obj.get('closed'))), obj.get('due'), int(bool(obj.get('dueComplete'))),
+              obj.get('pos'), obj.get('idShort'), obj.get('dateLastActivity'), card_created(obj['id']),
+              json.dumps({key: value for key, value in obj.items() if key != 'checklists'}))
+             for obj in cards_json])
+        self._db.executemany(
+            "INSERT OR REPLACE INTO checklists (id, card_id, board_id, json) VALUES (?, ?, ?, ?)",
+            [(obj['id'], obj.get('idCard'), board_id, json.dumps(obj)) for obj in checklists_json])
+        self._put_card_links(board_id, cards_json)
+
+    def _put_card_links(self, board_id, cards_json):
+        """Replace the label and member rows of these cards"""
+        card_ids = [(obj['id'],) for obj in cards_json]
+        self._db.executemany("DELETE FROM card_labels WHERE card_id = ?", card_ids)
+        self._db.executemany("DELETE FROM card_members WHERE card_id = ?", card_ids)
+        self._db.executemany(
+            "INSERT OR REPLACE INTO card_labels (card_id, label_id, board_id, name, color) VALUES (?, ?, ?, ?, ?)",
+            [(obj['id'], label['id'], board_id, label.get('name'), label.get('color'))
+             for obj in cards_json for label in obj.get('labels', ())])
+        self._db.executemany(
+            "INSERT OR REPLACE INTO card_members (card_id, member_id, board_id) VALUES (?, ?, ?)",
+            [(obj['id'], member_id, board_id) for obj in cards_json for member_id in obj.get('idMembers', ())])
+
+    def _put_comments(self, board_id, actions):
+        """Apply commentCard / updateComment / deleteComment actions"""
+        for action in actions:
+            data = action.get('data') or {}
+            if action['type'] == 'commentCard':
+                self._db.execute(
+                    "INSERT OR REPLACE INTO comments (id, card_id, board_id, date, member_id, text) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (action['id'], data['card']['id'], board_id, action.get('date'),
+                     action.get('idMemberCreator'), data.get('text', '')))
+            elif action['type'] == 'updateComment':
+                self._db.execute("UPDATE comments SET text = ? WHERE id = ?",
+                                 (data['action'].get('text', ''), data['action']['id']))
+            elif action['type'] == 'deleteComment':
+                self._db.execute("DELETE FROM comments WHERE id = ?", (data['action']['id'],))
+
+    def _index_cards(self, board_id, card_ids=None):
+        """
+        Rebuild the search index entries of a board's cards (all of them,
+        or just card_ids); cards no longer in the mirror leave the index
+        """
+        only = "" if card_ids is None else " AND card_id IN (SELECT value FROM json_each(?))"
+        params = (board_id,) if card_ids is None else (board_id, json.dumps(sorted(card_ids)))
+        self._db.execute(f"DELETE FROM search_index WHERE rowid IN "
+                         f"(SELECT rowid FROM search_docs WHERE board_id = ?{only})", params)
+        self._db.execute(f"DELETE FROM search_docs WHERE board_id = ?{only}", params)
+        if card_ids is not None:
+            # Cards moved to another board
+            self._db.execute("DELETE FROM search_index WHERE rowid IN (SELECT rowid FROM search_docs "
+                             "WHERE card_id IN (SELECT value FROM json_each(?)))", params[1:])
+            self._db.execute("DELETE FROM search_docs WHERE card_id IN (SELECT value FROM json_each(?))",
+                             params[1:])
+
+        checklists, comments = {}, {}
+        for card_id, text in self._db.execute(
+                f"SELECT card_id, json FROM checklists WHERE board_id = ?{only}", params):
+            checklist = json.loads(text)
+            checklists.setdefault(card_id, []).extend(
+                [checklist.get('name', '')] + [item.get('name', '') for item in checklist.get('checkItems', [])])
+        for card_id, text in self._db.execute(
+                f"SELECT card_id, text FROM comments WHERE board_id = ?{only} ORDER BY date", params):
+            comments.setdefault(card_id, []).append(text)
+
+        only = only.replace('card_id', 'id')
+        for card_id, name, desc in self._db.execute(
+                f"SELECT id, name, desc FROM cards WHERE board_id = ?{only}", params).fetchall():
+            rowid = self._db.execute("INSERT INTO search_docs (card_id, board_id) VALUES (?, ?)",
+                                     (card_id, board_id)).lastrowid
+            self._db.execute(
+                "INSERT INTO search_index (rowid, name, desc, comments, checklists) VALUES (?, ?, ?, ?, ?)",
+                (rowid, name, desc, '\n'.join(comments.get(card_id, ())),
+                 '\n'.join(checklists.get(card_id, ()))))
+
+    def replace_board(self, board_json, last_action_date=None, comment_actions=None):
+        """
+        Store a whole board fetched with FULL_SYNC_PARAMS, replacing any
+        earlier copy
+
+        Args:
+            comment_actions: The board's commentCard actions, replacing the
+                             stored comments (None keeps them)
+        """
+        board_id = board_json['id']
+        with self._lock, self._db:
+            for table in ('cards', 'checklists', 'card_labels', 'card_members'):
+                self._db.execute(f"DELETE FROM {table} WHERE board_id = ?", (board_id,))
+            self._put_board(board_json, last_action_date)
+            self._put_lists(board_id, board_json.get('lists', []))
+            self._put_labels(board_id, board_json.get('labels', []))
+            self._put_members(board_id, board_json.get('members', []))
+            self._put_cards(board_id, board_json.get('cards', []), board_json.get('checklists', []))
+            if comment_actions is not None:
+                self._db.execute("DELETE FROM comments WHERE board_id = ?", (board_id,))
+                # Oldest first, so edits and deletions apply in order
+                self._put_comments(board_id, sorted(comment_actions, key=lambda a: a['date']))
+            self._index_cards(board_id)
+
+    def apply_changes(self, board_id, last_action_date, cards=(), deleted_card_ids=(), board=None,
+                      lists=None, labels=None, members=None, comment_actions=()):
+        """
+        Apply an incremental sync: upsert refetched cards (with nested
+        checklists), drop deleted ones, apply comment actions, replace any
+        refetched board-level resources, and move the sync position to
+        last_action_date
+        """
+        with self._lock, self._db:
+            if board is not None:
+                self._put_board(board, last_action_date)
+            self._db.execute("UPDATE boards SET last_action_date = ?, synced_at = ? WHERE id = ?",
+                             (last_action_date, time.time(), board_id))
+            if lists is not None:
+                self._put_lists(board_id, lists)
+            if labels is not None:
+                self._put_labels(board_id, labels)
+            if members is not None:
+                self._put_members(board_id, members)
+            for card_id in deleted_card_ids:
+                for table, column in (('cards', 'id'), ('checklists', 'card_id'),
+                                      ('card_labels', 'card_id'), ('card_members', 'card_id')):
+                    self._db.execute(f"DELETE FROM {table} WHERE {column} = ?", (card_id,))
+            checklists = [cl for obj in cards for cl in obj.get('checklists', [])]
+            self._put_cards(board_id, list(cards), checklists)
+            self._put_comments(board_id, sorted(comment_actions, key=lambda a: a['date']))
+
+            touched = {obj['id'] for obj in cards} | set(deleted_card_ids)
+            touched.update((action.get('data') or {}).get('card', {}).get('id') for action in comment_actions)
+            touched.discard(None)
+            if touched:
+                self._index_cards(board_id, touched)
+
+    def remove_board(self, board_id):
+        """Forget a board and everything on it"""
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM search_index WHERE rowid IN "
+                             "(SELECT rowid FROM search_docs WHERE board_id = ?)", (board_id,))
+            for table, column in (('boards', 'id'), ('lists', 'board_id'), ('cards', 'board_id'),
+                                  ('labels', 'board_id'), ('checklists', 'board_id'),
+                                  ('members', 'board_id'), ('comments', 'board_id'),
+                                  ('card_labels', 'board_id'), ('card_members', 'board_id'),
+                                  ('search_docs', 'board_id')):
+                self._db.execute(f"DELETE FROM {table} WHERE {column} = ?", (board_id,))
+
+    def apply_action(self, board_id, action):
+        """
+        Apply one action (a webhook delivery) to a mirrored board without
+        fetching anything
+
+        Card field changes and moves, card creation and deletion, labels
+        and members on cards, comments, list changes and board renames are
+        patched in place. The sync position does not move, so the next
+        `trello sync` still refetches whatever the action touched.
+
+        Returns:
+            True if the action was applied, False if only a sync can apply
+            it (checklists, attachments, label edits, ...)
+        """
+        data = action.get('data') or {}
+        action_type = action.get('type')
+        with self._lock, self._db:
+            if action_type in COMMENT_ACTIONS and 'card' in data:
+                self._put_comments(board_id, [action])
+                if not self._apply_card_action(board_id, action):
+                    self._index_cards(board_id, {data['card']['id']})
+                return True
+            if 'card' in data:
+                return self._apply_card_action(board_id, action)
+            if action_type in ('createList', 'updateList') and 'list' in data:
+                row = self._db.execute("SELECT json FROM lists WHERE id = ?", (data['list']['id'],)).fetchone()
+                lst = json.loads(row[0]) if row else {'closed': False, 'idBoard': board_id}
+                lst.update(data['list'])
+                self._db.execute(
+                    "INSERT OR REPLACE INTO lists (id, board_id, name, closed, pos, json) VALUES (?, ?, ?, ?, ?, ?)",
+                    (lst['id'], board_id, lst.get('name', ''), int(bool(lst.get('closed'))), lst.get('pos'),
+                     json.dumps(lst)))
+                return True
+            if action_type == 'updateBoard' and 'board' in data:
+                row = self._db.execute("SELECT json FROM boards WHERE id = ?", (board_id,)).fetchone()
+                if row is None:
+                    return False
+                self._put_board(dict(json.loads(row[0]), **data['board']))
+                return True
+        return False
+
+    def _apply_card_action(self, board_id, action):
+        action_type = action['type']
+        data = action['data']
+        card_id = data['card']['id']
+        if action_type in CARD_REMOVE_ACTIONS:
+            for table, column in (('cards', 'id'), ('checklists', 'card_id'),
+                                  ('card_labels', 'card_id'), ('card_members', 'card_id')):
+                self._db.execute(f"DELETE FROM {table} WHERE {column} = ?", (card_id,))
+            self._index_cards(board_id, {card_id})
+            return True
+
+        row = self._db.execute("SELECT json FROM cards WHERE id = ?", (card_id,)).fetchone()
+        if row is None and action_type in CARD_CREATE_ACTIONS:
+            card = {'id': card_id, 'name': '', 'desc': '', 'closed': False, 'idBoard': board_id,
+                    'idList': (data.get('list') or {}).get('id'), 'due': None, 'dueComplete': False,
+                    'idMembers': [], 'idLabels': [], 'labels': [], 'badges': {}}
+        elif row is None or action_type not in CARD_EDIT_ACTIONS + COMMENT_ACTIONS:
+            return False
+        else:
+            card = json.loads(row[0])
+
+        if action_type == 'addLabelToCard':
+            label = dict(data['label'], idBoard=board_id)
+            if label['id'] not in card['idLabels']:
+                card['idLabels'].append(label['id'])
+                card['labels'].append(label)
+        elif action_type == 'removeLabelFromCard':
+            label_id = data['label']['id']
+            card['idLabels'] = [i for i in card['idLabels'] if i != label_id]
+            card['labels'] = [label for label in card['labels'] if label['id'] != label_id]
+        elif action_type in COMMENT_ACTIONS:
+            badges = card.setdefault('badges', {})
+            step = {'commentCard': 1, 'deleteComment': -1}.get(action_type, 0)
+            badges['comments'] = max(0, (badges.get('comments') or 0) + step)
+        elif action_type in ('addMemberToCard', 'removeMemberFromCard'):
+            member_id = data.get('idMember') or (data.get('member') or {}).get('id')
+            card['idMembers'] = [i for i in card['idMembers'] if i != member_id]
+            if action_type == 'addMemberToCard':
+                card['idMembers'].append(member_id)
+        else:
+            # data.card holds the card's current value of every changed field
+            card.update(data['card'])
+            if 'listAfter' in data:
+                card['idList'] = data['listAfter']['id']
+        if card.get('shortLink') and not card.get('url'):
+            card['url'] = f"https://trello.com/c/{card['shortLink']}"
+        card['dateLastActivity'] = action.get('date') or card.get('dateLastActivity')
+
+        checklists = [json.loads(text) for (text,) in self._db.execute(
+            "SELECT json FROM checklists WHERE card_id = ?", (card_id,))]
+        self._put_cards(board_id, [card], checklists)
+        self._index_cards(board_id, {card_id})
+        return True
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
+
+    def boards(self):
+        """Mirrored boards as dicts (id, name, closed, last_action_date, synced_at, cards), by name"""
+        rows = self._query("""
+            SELECT b.id, b.name, b.closed, b.last_action_date, b.synced_at,
+                   (SELECT COUNT(*) FROM cards c WHERE c.board_id = b.id AND c.closed = 0)
+            FROM boards b ORDER BY b.name COLLATE NOCASE
+        """)
+        return [{'id': row[0], 'name': row[1], 'closed': bool(row[2]), 'last_action_date': row[3],
+                 'synced_at': row[4], 'cards': row[5]} for row in rows]
+
+    def board_json(self, board_id):
+        """The board's own JSON (no nested resources), or None if not mirrored"""
+        rows = self._query("SELECT json FROM boards WHERE id = ?", (board_id,))
+        return json.loads(rows[0][0]) if rows else None
+
+    def sync_position(self, board_id):
+        """Date of the newest action applied to the board, or None if not mirrored"""
+        rows = self._query("SELECT last_action_date FROM boards WHERE id = ?", (board_id,))
+        return rows[0][0] if rows else None
+
+    def members_json(self, board_id):
+        """Member JSON (id, username, fullName) of a mirrored board"""
+        return [json.loads(row[0]) for row in self._query(
+            "SELECT json FROM members WHERE board_id = ?", (board_id,))]
+
+    def _require_board(self, board_id):
+        board = self.board_json(board_id)
+        if board is None:
+            raise Exception(f"Board {board_id} is not in the local mirror (run: trello sync {board_id})")
+        return board
+
+    @staticmethod
+    def _card_filter_sql(card_filter):
+        return {'open': ' AND closed = 0', 'closed': ' AND closed = 1'}.get(card_filter, '')
+
+    def snapshot_json(self, board_id, card_filter='open'):
+        """Nested board JSON as GET /boards/{id} returns it with SNAPSHOT_PARAMS"""
+        board = self._require_board(board_id)
+        closed = self._card_filter_sql(card_filter)
+        board['lists'] = [json.loads(row[0]) for row in self._query(
+            "SELECT json FROM lists WHERE board_id = ? ORDER BY pos", (board_id,))]
+        board['labels'] = [json.loads(row[0]) for row in self._query(
+            "SELECT json FROM labels WHERE board_id = ?", (board_id,))]
+        board['members'] = self.members_json(board_id)
+        board['cards'] = [json.loads(row[0]) for row in self._query(
+            f"SELECT json FROM cards WHERE board_id = ?{closed} ORDER BY pos", (board_id,))]
+        board['checklists'] = [json.loads(row[0]) for row in self._query(
+            f"SELECT json FROM checklists WHERE card_id IN "
+            f"(SELECT id FROM cards WHERE board_id = ?{closed})", (board_id,))]
+        return board
+
+    def load_snapshot(self, board_id, card_filter='open', trello_client=None):
+        """BoardSnapshot of a mirrored board, members included"""
+        return BoardSnapshot.from_json(trello_client, self.snapshot_json(board_id, card_filter))
+
+    def list_cards(self, list_id, card_filter='open'):
+        """(ListRecord, [CardRecord]) for a mirrored list"""
+        rows = self._query("SELECT json, board_id FROM lists WHERE id = ?", (list_id,))
+        if not rows:
+            raise Exception(f"List {list_id} is not in the local mirror")
+        lst = ListRecord.from_json(json.loads(rows[0][0]), rows[0][1])
+        closed = self._card_filter_sql(card_filter)
+        cards = self._query(f"SELECT json FROM cards WHERE list_id = ?{closed} ORDER BY pos", (list_id,))
+        checklists = self._query(
+            f"SELECT json FROM checklists WHERE card_id IN (SELECT id FROM cards WHERE list_id = ?{closed})",
+            (list_id,))
+        return lst, card_records([json.loads(row[0]) for row in cards],
+                                 [json.loads(row[0]) for row in checklists], lst.idBoard)
+
+    def card_json(self, card_id):
+        """
+        Card JSON with nested checklists, list and board, as GET /cards/{id}
+        returns it with list=true&board=true&checklists=all
+        """
+        rows = self._query("""
+            SELECT c.json, l.json, b.json FROM cards c
+            JOIN boards b ON b.id = c.board_id
+            LEFT JOIN lists l ON l.id = c.list_id
+            WHERE c.id = ?
+        """, (card_id,))
+        if not rows:
+            raise Exception(f"Card {card_id} is not in the local mirror")
+        card = json.loads(rows[0][0])
+        card['list'] = json.loads(rows[0][1]) if rows[0][1] else {'id': card.get('idList'), 'name': ''}
+        card['board'] = json.loads(rows[0][2])
+        card['checklists'] = [json.loads(row[0]) for row in self._query(
+            "SELECT json FROM checklists WHERE card_id = ?", (card_id,))]
+        return card
+
+    def search(self, query, board_ids=None, limit=20, prefix=False):
+        """
+        Ranked full-text search over open cards on open lists
+
+        Args:
+            query: Search string (see fts_query)
+            board_ids: Only search these boards; None searches every board
+            limit: Maximum number of results (None for all)
+            prefix: Match every word as a prefix
+
+        Returns:
+            List of dicts (id, name, url, board_id, board_name, list_id,
+            list_name, score, snippet), best match first
+        """
+        match = fts_query(query, prefix)
+        if not match:
+            return []
+        sql = """
+            SELECT c.id, c.name, json_extract(c.json, '$.url'), c.board_id, b.name, c.list_id, l.name,
+                   bm25(search_index, ?, ?, ?, ?) AS score,
+                   snippet(search_index, -1, '[', ']', '…', 10)
+            FROM search_index
+            JOIN search_docs d ON d.rowid = search_index.rowid
+            JOIN cards c ON c.id = d.card_id
+            JOIN boards b ON b.id = c.board_id
+            LEFT JOIN lists l ON l.id = c.list_id
+            WHERE search_index MATCH ? AND c.closed = 0 AND COALESCE(l.closed, 0) = 0
+        """
+        params = [*SEARCH_WEIGHTS, match]
+        if board_ids is not None:
+            sql += " AND d.board_id IN (SELECT value FROM json_each(?))"
+            params.append(json.dumps(list(board_ids)))
+        sql += " ORDER BY score LIMIT ?"
+        params.append(-1 if limit is None else limit)
+        try:
+            rows = self._query(sql, params)
+        except sqlite3.OperationalError as e:
+            raise Exception(f"Invalid search query '{query}': {str(e)}")
+        return [{'id': row[0], 'name': row[1], 'url': row[2], 'board_id': row[3], 'board_name': row[4],
+                 'list_id': row[5], 'list_name': row[6], 'score': -row[7], 'snippet': row[8]}
+                for row in rows]
+
+    # ------------------------------------------------------------------
+    # Offline queries: the answers of the query commands, computed in SQL
+    # ------------------------------------------------------------------
+
+    def board_name(self, board_id):
+        """Name of a mirrored board (raises if it isn't mirrored)"""
+        return self._require_board(board_id)['name']
+
+    def _open_cards(self, board_id, where='', params=(), order='l.pos, c.pos'):
+        """(CardRecord, list name) of the open cards on open lists matching `where`"""
+        self._require_board(board_id)
+        rows = self._query(f"""
+            SELECT c.json, l.name FROM cards c
+            JOIN lists l ON l.id = c.list_id
+            WHERE c.board_id = ? AND c.closed = 0 AND l.closed = 0{where}
+            ORDER BY {order}
+        """, (board_id, *params))
+        return [(CardRecord.from_json(json.loads(text), board_id), list_name) for text, list_name in rows]
+
+    def cards_with_label(self, board_id, color, name=''):
+        """(CardRecord, list name) of open cards with a label of this color (and name)"""
+        where = " AND c.id IN (SELECT card_id FROM card_labels WHERE board_id = ? AND color = ?"
+        params = [board_id, color]
+        if name:
+            where += " AND name = ?"
+            params.append(name)
+        return self._open_cards(board_id, where + ")", params)
+
+    def cards_due(self, board_id, start=None, end=None):
+        """
+        (CardRecord, list name) of open cards due in [start, end), in list
+        order; either bound (an aware datetime) may be left open
+        """
+        where, params = " AND c.due IS NOT NULL", []
+        if start is not None:
+            where += " AND c.due >= ?"
+            params.append(iso_timestamp(start))
+        if end is not None:
+            where += " AND c.due < ?"
+            params.append(iso_timestamp(end))
+        return self._open_cards(board_id, where, params)
+
+    def member_cards(self, board_id, member_name=''):
+        """
+        (CardRecord, list name) of open cards, in list order; with
+        member_name, only cards with a member whose full name contains it
+        """
+        if not member_name:
+            return self._open_cards(board_id)
+        return self._open_cards(board_id, """ AND c.id IN (
+            SELECT cm.card_id FROM card_members cm
+            JOIN members m ON m.board_id = cm.board_id AND m.id = cm.member_id
+            WHERE cm.board_id = ? AND instr(lower(m.full_name), lower(?)) > 0)""", (board_id, member_name))
+
+    def _require_list(self, list_id):
+        rows = self._query("SELECT name FROM lists WHERE id = ?", (list_id,))
+        if not rows:
+            raise Exception(f"List {list_id} is not in the local mirror")
+        return rows[0][0]
+
+    def card_ages(self, list_id, now):
+        """
+        (list name, [(card id, name, age in days, created)]) for the open
+        cards of a list, oldest first (by whole days, then position); now
+        and created are Unix seconds
+        """
+        list_name = self._require_list(list_id)
+        rows = self._query("""
+            SELECT id, name, CAST((? - created) / 86400 AS INTEGER) AS age, created FROM cards
+            WHERE list_id = ? AND closed = 0
+            ORDER BY COALESCE(age, 0) DESC, pos
+        """, (now, list_id))
+        return list_name, [tuple(row) for row in rows]
+
+    def list_metrics(self, list_id, now):
+        """
+        Card count, age statistics, label counts and due-date coverage of
+        the open cards of a list, as a dict
+        """
+        list_name = self._require_list(list_id)
+        count, average, oldest, newest, with_due = self._query("""
+            SELECT COUNT(*), AVG(age), MAX(age), MIN(age), COUNT(due) FROM (
+                SELECT CAST((? - created) / 86400 AS INTEGER) AS age, due FROM cards
+                WHERE list_id = ? AND closed = 0)
+        """, (now, list_id))[0]
+        labels = self._query("""
+            SELECT COALESCE(NULLIF(cl.name, ''), cl.color) AS label, COUNT(*) AS n FROM card_labels cl
+            JOIN cards c ON c.id = cl.card_id
+            WHERE c.list_id = ? AND c.closed = 0
+            GROUP BY label ORDER BY n DESC, MIN(c.pos)
+        """, (list_id,))
+        return {'name': list_name, 'cards': count, 'average_age': average, 'oldest': oldest,
+                'newest': newest, 'labels': [tuple(row) for row in labels], 'with_due': with_due}
+
+    def board_health(self, board_id, now):
+        """
+        The problems board-health reports, for an aware datetime `now`
+
+        Returns:
+            Dict of 'stale' [(card name, list name, age in days)], 'overdue'
+            [(card name, list name, days overdue)] and 'ages' (the
+            columns.age_distribution) for cards outside Done lists, and
+            'congested' [(list name, open cards)]
+        """
+        self._require_board(board_id)
+        not_done = "c.board_id = ? AND c.closed = 0 AND l.closed = 0 AND instr(lower(l.name), 'done') = 0"
+        stale = self._query(f"""
+            SELECT c.name, l.name, CAST((? - c.created) / 86400 AS INTEGER) AS age FROM cards c
+            JOIN lists l ON l.id = c.list_id
+            WHERE {not_done} AND age > ?
+            ORDER BY l.pos, c.pos
+        """, (now.timestamp(), board_id, STALE_DAYS))
+        overdue = self._query(f"""
+            SELECT c.name, l.name, CAST(julianday(?) - julianday(c.due) AS INTEGER) FROM cards c
+            JOIN lists l ON l.id = c.list_id
+            WHERE {not_done} AND c.due IS NOT NULL AND c.due < ?
+            ORDER BY l.pos, c.pos
+        """, (iso_timestamp(now), board_id, iso_timestamp(now)))
+        congested = self._query("""
+            SELECT l.name, COUNT(*) FROM lists l
+            JOIN cards c ON c.list_id = l.id AND c.closed = 0
+            WHERE l.board_id = ? AND l.closed = 0 AND instr(lower(l.name), 'done') = 0
+            GROUP BY l.id HAVING COUNT(*) > ?
+            ORDER BY l.pos
+        """, (board_id, CONGESTED_LIST_SIZE))
+        created = self._query(f"""
+            SELECT c.created FROM cards c
+            JOIN lists l ON l.id = c.list_id
+            WHERE {not_done} AND c.created IS NOT NULL
+        """, (board_id,))
+        # Ages floor like the board walk's, also for IDs dated after `now`
+        ages = [int((now.timestamp() - row[0]) // 86400) for row in created]
+        return {'stale': [tuple(row) for row in stale], 'overdue': [tuple(row) for row in overdue],
+                'congested': [tuple(row) for row in congested], 'ages': age_distribution(ages)}
+
+    def stats(self):
+        """Row counts per table and the database size in bytes"""
+        counts = {table: self._query(f"SELECT COUNT(*) FROM {table}")[0][0]
+                  for table in ('boards', 'lists', 'cards', 'labels', 'checklists', 'members',
+                                'comments')}
+        try:
+            size = self.path.stat().st_size
+        except OSError:
+            size = 0
+        return dict(counts, bytes=size)
+
+
+def _fetch_comments(fetch_json, board_id):
+    """Every commentCard action of a board, ACTIONS_LIMIT per request"""
+    comments = []
+    params = {'filter': 'commentCard', 'limit': ACTIONS_LIMIT, 'fields': 'type,date,data,idMemberCreator'}
+    while True:
+        page = fetch_json(f'/boards/{board_id}/actions', query_params=dict(params))
+        comments.extend(page)
+        if len(page) < ACTIONS_LIMIT:
+            return comments
+        # Newest first: continue before the oldest one on this page
+        params['before'] = page[-1]['date']
+
+
+def sync_board(client, mirror, board_id, full=False):
+    """
+    Bring one board's mirror up to date
+
+    The first sync (or full=True) stores the whole board from one request
+    plus its comments (one request per ACTIONS_LIMIT comments).
+    Later syncs read only GET /boards/{id}/actions?since=<last action> and
+    refetch what those actions touched: changed cards through /batch,
+    and lists, labels, members or board fields only when an action
+    changed them.
+
+    Args:
+        client: TrelloClient
+        mirror: Mirror to update
+
+    Returns:
+        Dict with board, name, mode ('full' or 'incremental'), actions,
+        cards (cards written), deleted and seconds
+    """
+    start = time.perf_counter()
+    fetch_json = client.client.fetch_json
+    since = None if full else mirror.sync_position(board_id)
+
+    actions = []
+    if since is not None:
+        try:
+            actions = fetch_json(f'/boards/{board_id}/actions',
+                                 query_params={'since': since, 'limit': ACTIONS_LIMIT,
+                                               'fields': 'type,date,data,idMemberCreator'})
+        except Exception as e:
+            raise Exception(f"Failed to get actions of board {board_id}: {str(e)}")
+        actions = [action for action in actions if action['date'] > since]
+
+    if since is None or len(actions) >= ACTIONS_LIMIT:
+        try:
+            board_json = fetch_json('/boards/' + board_id, query_params=dict(FULL_SYNC_PARAMS))
+            comments = _fetch_comments(fetch_json, board_id)
+        except Exception as e:
+            raise Exception(f"Failed to get board {board_id}: {str(e)}")
+        mirror.replace_board(board_json, board_json.get('dateLastActivity'), comments)
+        return {'board': board_id, 'name': board_json.get('name', ''), 'mode': 'full',
+                'actions': len(actions), 'cards': len(board_json.get('cards', [])), 'deleted': 0,
+                'seconds': time.perf_counter() - start}
+
+    name = (mirror.board_json(board_id) or {}).get('name', '')
+    if not actions:
+        mirror.apply_changes(board_id, since)
+        return {'board': board_id, 'name': name, 'mode': 'incremental', 'actions': 0,
+                'cards': 0, 'deleted': 0, 'seconds': time.perf_counter() - start}
+
+    card_ids, resources = classify_actions(actions)
+    fetched = {}
+    try:
+        if 'board' in resources:
+            fetched['board'] = fetch_json('/boards/' + board_id,
+                                          query_params={'fields': SNAPSHOT_PARAMS['fields']})
+        if 'lists' in resources:
+            fetched['lists'] = fetch_json(f'/boards/{board_id}/lists', query_params={'filter': 'all'})
+        if 'labels' in resources:
+            fetched['labels'] = fetch_json(f'/boards/{board_id}/labels',
+                                           query_params={'limit': SNAPSHOT_PARAMS['labels_limit']})
+        if 'members' in resources:
+            fetched['members'] = fetch_json(f'/boards/{board_id}/members',
+                                            query_params={'fields': FULL_SYNC_PARAMS['member_fields']})
+    except Exception as e:
+        raise Exception(f"Failed to get board {board_id}: {str(e)}")
+
+    ordered_ids = sorted(card_ids)
+    results = client.batch_get([f'/cards/{card_id}?checklists=all' for card_id in ordered_ids])
+    cards, deleted = [], []
+    for card_id, (status, body) in zip(ordered_ids, results):
+        if status == 200 and isinstance(body, dict) and body.get('idBoard') == board_id:
+            cards.append(body)
+        elif status == 200 or str(status) == '404':
+            # Moved to another board, or deleted
+            deleted.append(card_id)
+        else:
+            raise Exception(f"Failed to get card {card_id}: {status} {body}")
+
+    last_action_date = max(action['date'] for action in actions)
+    comments = [action for action in actions if action['type'] in COMMENT_ACTIONS]
+    mirror.apply_changes(board_id, last_action_date, cards, deleted, comment_actions=comments, **fetched)
+    name = fetched.get('board', {}).get('name', name)
+    return {'board': board_id, 'name': name, 'mode': 'incremental', 'actions': len(actions),
+            'cards': len(cards), 'deleted': len(deleted), 'seconds': time.perf_counter() - start}
@@ -0,0 +1,8 @@
+"""
+Local mock Trello API and synthetic board generator for offline profiling
+"""
+
+from .generator import generate_board, MAX_CARDS
+from .server import MockTrello, MockTrelloServer, MockError, Latency
+
+__all__ = ['generate_board', 'MAX_CARDS', 'MockTrello', 'MockTrelloServer', 'MockError', 'Latency']
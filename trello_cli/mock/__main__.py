@@ -0,0 +1,63 @@
+"""
+Run the mock Trello server with synthetic boards
+
+    python -m trello_cli.mock --cards 20000 --latency-ms 80
+    export TRELLO_BASE_URL=http://127.0.0.1:8765/1
+"""
+
+import argparse
+import sys
+
+from .generator import generate_board, MAX_CARDS
+from .server import MockTrello, MockTrelloServer, Latency
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m trello_cli.mock',
+                                     description='Local mock Trello API with synthetic boards')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--boards', type=int, default=1, help='number of boards (default 1)')
+    parser.add_argument('--cards', type=int, default=1000, help=f'cards per board (max {MAX_CARDS})')
+    parser.add_argument('--lists', type=int, default=8)
+    parser.add_argument('--labels', type=int, default=12)
+    parser.add_argument('--members', type=int, default=10)
+    parser.add_argument('--checklists', type=float, default=0.5, help='average checklists per card')
+    parser.add_argument('--items', type=float, default=4, help='average items per checklist')
+    parser.add_argument('--org', help='put every board in this organization ID')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--latency-ms', type=float, default=0, help='base response latency')
+    parser.add_argument('--jitter', type=float, default=0.25, help='log-normal latency jitter (sigma)')
+    parser.add_argument('--per-kb-ms', type=float, default=0, help='extra latency per KB of response')
+    parser.add_argument('--rate-limit', action='store_true',
+                        help="enforce Trello's 300/10s per key and 100/10s per token limits")
+    parser.add_argument('--verbose', action='store_true', help='log every request')
+    args = parser.parse_args(argv)
+
+    store = MockTrello()
+    print(f"Generating {args.boards} board(s) with {args.cards} cards each...", file=sys.stderr)
+    for i in range(args.boards):
+        data = generate_board(cards=args.cards, lists=args.lists, labels=args.labels,
+                              members=args.members, checklists=args.checklists, items=args.items,
+                              seed=args.seed + i, name=f"Synthetic {args.cards} #{i + 1}")
+        board_id = store.add_board(data, organization_id=args.org)
+        print(f"  {board_id}  {data['board']['name']}", file=sys.stderr)
+
+    server = MockTrelloServer(store, host=args.host, port=args.port,
+                              latency=Latency(args.latency_ms, args.jitter, args.per_kb_ms, seed=args.seed),
+                              rate_limit=args.rate_limit, verbose=args.verbose)
+    print(f"\nMock Trello API listening on {server.base_url}", file=sys.stderr)
+    print(f"  export TRELLO_BASE_URL={server.base_url}", file=sys.stderr)
+    print("Any API key and token are accepted. Ctrl+C to stop.", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stats = server.stats()
+        print(f"\n{stats['requests']} requests, {stats['bytes']} bytes sent", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
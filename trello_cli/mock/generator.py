@@ -0,0 +1,211 @@
+"""
+Synthetic board generator for the mock Trello server
+"""
+
+import math
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+
+# Workflow lists in board order; names hit the keyword groups the audit
+# commands classify (done / active / execution / critical)
+LIST_NAMES = [
+    'Backlog', 'Ready', 'To Do (Sprint)', 'In Progress', 'Testing',
+    'Review', 'Done', 'Archive',
+]
+
+# Relative share of cards per list, in LIST_NAMES order
+LIST_WEIGHTS = (4, 2, 2, 1, 1, 1, 5, 2)
+
+LABEL_COLORS = ['green', 'yellow', 'orange', 'red', 'purple', 'blue',
+                'sky', 'lime', 'pink', 'black']
+
+LABEL_NAMES = ['bug', 'feature', 'chore', 'P0', 'P1', 'P2', 'backend',
+               'frontend', 'docs', 'infra', 'security', 'tech-debt']
+
+WORDS = ['sync', 'export', 'login', 'cache', 'report', 'billing', 'search',
+         'upload', 'webhook', 'profile', 'invoice', 'dashboard', 'import',
+         'settings', 'alerts', 'audit', 'onboarding', 'checkout', 'api', 'mobile']
+
+VERBS = ['Fix', 'Add', 'Refactor', 'Document', 'Test', 'Speed up', 'Remove', 'Migrate']
+
+# Maximum board size the generator is meant for
+MAX_CARDS = 100_000
+
+
+def object_id(rng, created=None):
+    """
+    24-hex Trello-style ID; like real IDs, the first 8 hex digits are the
+    creation timestamp (commands derive card age from them)
+    """
+    created = int(created if created is not None else time.time())
+    return f"{created:08x}{rng.getrandbits(64):016x}"
+
+
+def iso_timestamp(dt):
+    """Trello-style UTC timestamp, e.g. 2025-01-01T12:00:00.000Z"""
+    return dt.strftime('%Y-%m-%dT%H:%M:%S.') + f"{dt.microsecond // 1000:03d}Z"
+
+
+def generate_board(cards=1000, lists=len(LIST_NAMES), labels=len(LABEL_NAMES), members=10,
+                   checklists=0.5, items=4, seed=0, name=None, now=None):
+    """
+    Build a synthetic board as plain API JSON
+
+    Args:
+        cards: Number of open cards (up to MAX_CARDS)
+        lists: Number of lists (workflow names first, then "List N")
+        labels: Number of board labels
+        members: Number of board members
+        checklists: Average checklists per card (0.5 = every other card)
+        items: Average checklist items per checklist
+        seed: Random seed; the same arguments and `now` build the same board
+        name: Board name (default "Synthetic <cards>")
+        now: Reference time as a datetime (default: current UTC time)
+
+    Returns:
+        Dict with 'board', 'lists', 'cards', 'checklists', 'labels' and
+        'members' JSON, shaped like the Trello API responses
+    """
+    if cards > MAX_CARDS:
+        raise ValueError(f"At most {MAX_CARDS} cards per board")
+
+    rng = random.Random(seed)
+    now = now or datetime.now(timezone.utc)
+    epoch = now.timestamp()
+
+    board_id = object_id(rng, epoch - 400 * 86400)
+    board = {
+        'id': board_id,
+        'name': name or f"Synthetic {cards}",
+        'desc': f"Generated board (seed {seed})",
+        'closed': False,
+        'url': f"https://trello.com/b/{board_id[-8:]}",
+        'shortUrl': f"https://trello.com/b/{board_id[-8:]}",
+        'idOrganization': None,
+        'dateLastActivity': iso_timestamp(now),
+    }
+
+    list_json = []
+    for i in range(lists):
+        list_name = LIST_NAMES[i] if i < len(LIST_NAMES) else f"List {i + 1}"
+        list_json.append({
+            'id': object_id(rng, epoch - 400 * 86400),
+            'name': list_name,
+            'closed': False,
+            'pos': (i + 1) * 16384,
+            'idBoard': board_id,
+            'subscribed': False,
+        })
+
+    label_json = []
+    for i in range(labels):
+        label_name = LABEL_NAMES[i] if i < len(LABEL_NAMES) else f"label-{i + 1}"
+        label_json.append({
+            'id': object_id(rng, epoch - 400 * 86400),
+            'idBoard': board_id,
+            'name': label_name,
+            'color': LABEL_COLORS[i % len(LABEL_COLORS)],
+        })
+
+    member_json = []
+    for i in range(members):
+        member_json.append({
+            'id': object_id(rng, epoch - 400 * 86400),
+            'username': f"user{i + 1}",
+            'fullName': f"User {i + 1}",
+        })
+
+    if cards and not list_json:
+        raise ValueError("A board with cards needs at least one list")
+
+    # Skew cards towards the backlog and done lists, like real boards
+    list_weights = [LIST_WEIGHTS[i % len(LIST_WEIGHTS)] for i in range(lists)]
+
+    card_json = []
+    checklist_json = []
+    per_list = {}
+    for i in range(cards):
+        lst = rng.choices(list_json, list_weights)[0]
+        position = per_list.get(lst['id'], 0) + 1
+        per_list[lst['id']] = position
+
+        created = epoch - rng.uniform(0, 365) * 86400
+        card_id = object_id(rng, created)
+        is_done = lst['name'] in ('Done', 'Archive')
+
+        due = None
+        if rng.random() < 0.6:
+            due = iso_timestamp(datetime.fromtimestamp(created, timezone.utc)
+                       + timedelta(days=rng.randint(1, 60)))
+
+        card_labels = rng.sample(label_json, min(len(label_json), rng.choice((0, 1, 1, 2, 3))))
+        card_members = rng.sample(member_json, min(len(member_json), rng.choice((0, 1, 1, 2))))
+
+        prefix = f"PF-{rng.choice(('API', 'WEB', 'OPS'))}-{i + 1} " if rng.random() < 0.7 else ''
+        card_name = f"{prefix}{rng.choice(VERBS)} {rng.choice(WORDS)} {rng.choice(WORDS)}"
+
+        card_checklists = []
+        for _ in range(_poisson(rng, checklists)):
+            checklist_id = object_id(rng, created)
+            check_items = []
+            for k in range(_poisson(rng, items)):
+                complete = is_done or rng.random() < 0.4
+                check_items.append({
+                    'id': object_id(rng, created),
+                    'idChecklist': checklist_id,
+                    'name': f"{rng.choice(VERBS)} {rng.choice(WORDS)}",
+                    'state': 'complete' if complete else 'incomplete',
+                    'pos': (k + 1) * 16384,
+                })
+            checklist_json.append({
+                'id': checklist_id,
+                'idBoard': board_id,
+                'idCard': card_id,
+                'name': 'Definition of Done' if not card_checklists else f"Checklist {len(card_checklists) + 1}",
+                'pos': (len(card_checklists) + 1) * 16384,
+                'checkItems': check_items,
+            })
+            card_checklists.append(checklist_id)
+
+        card_json.append({
+            'id': card_id,
+            'name': card_name,
+            'desc': '' if rng.random() < 0.3 else f"Synthetic card {i + 1}. " * rng.randint(1, 6),
+            'due': due,
+            'dueComplete': bool(due) and is_done,
+            'closed': False,
+            'url': f"https://trello.com/c/{card_id[-8:]}",
+            'shortUrl': f"https://trello.com/c/{card_id[-8:]}",
+            'pos': position * 16384,
+            'idShort': i + 1,
+            'idBoard': board_id,
+            'idList': lst['id'],
+            'idMembers': [m['id'] for m in card_members],
+            'idLabels': [l['id'] for l in card_labels],
+            'idChecklists': card_checklists,
+            'dateLastActivity': iso_timestamp(datetime.fromtimestamp(
+                created + rng.uniform(0, epoch - created), timezone.utc)),
+        })
+
+    return {
+        'board': board,
+        'lists': list_json,
+        'cards': card_json,
+        'checklists': checklist_json,
+        'labels': label_json,
+        'members': member_json,
+    }
+
+
+def _poisson(rng, mean):
+    """Small Poisson sample (Knuth); 0 for mean <= 0"""
+    if mean <= 0:
+        return 0
+    limit = math.exp(-mean)
+    k, p = 0, rng.random()
+    while p > limit:
+        k += 1
+        p *= rng.random()
+    return k
@@ -0,0 +1,1008 @@
+"""
+Local stand-in for the Trello REST API
+
+Implements the subset of endpoints the CLI (through py-trello and
+TrelloClient) and plugins/board-audit.py call, over in-memory boards built
+by generator.generate_board(). Point the CLI at it with TRELLO_BASE_URL.
+"""
+
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qsl
+
+from .generator import object_id, iso_timestamp
+
+
+# (method, template, compiled pattern, handler name) in match order
+ROUTES = []
+
+
+def route(method, template):
+    """Register a MockTrello method as the handler for METHOD /template"""
+    pattern = re.compile('^' + re.sub(r'\{(\w+)\}', r'(?P<\1>[^/]+)', template) + '/?$')
+
+    def register(func):
+        ROUTES.append((method, template, pattern, func.__name__))
+        return func
+    return register
+
+
+class MockError(Exception):
+    """Error response (Trello answers most errors with a plain-text body)"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _not_found():
+    return MockError(404, 'The requested resource was not found.')
+
+
+def _fields(value):
+    """Parse a fields/card_fields parameter; None means every field"""
+    if not value or value == 'all':
+        return None
+    return [f for f in str(value).split(',') if f]
+
+
+def _project(obj, fields):
+    if fields is None:
+        return dict(obj)
+    projected = {'id': obj['id']}
+    for field in fields:
+        if field in obj:
+            projected[field] = obj[field]
+    return projected
+
+
+def _filter_closed(objs, filter_value, default='open'):
+    filter_value = filter_value or default
+    if filter_value == 'open' or filter_value == 'visible':
+        return [obj for obj in objs if not obj.get('closed')]
+    if filter_value == 'closed':
+        return [obj for obj in objs if obj.get('closed')]
+    return list(objs)
+
+
+def _oauth_credentials(authorization):
+    """(consumer key, token) from an OAuth 1 Authorization header, as py-trello sends"""
+    values = dict(re.findall(r'(oauth_\w+)="([^"]*)"', authorization or ''))
+    return values.get('oauth_consumer_key'), values.get('oauth_token')
+
+
+def _truthy(value):
+    return value is True or str(value).lower() in ('true', '1', 'yes')
+
+
+class MockTrello:
+    """
+    In-memory Trello data served through dispatch(method, path, params)
+
+    Every write is recorded as a board action (GET /boards/{id}/actions)
+    and bumps the board's dateLastActivity, so cache revalidation and
+    incremental sync behave as against the real API.
+    """
+
+    def __init__(self):
+        self.boards = {}
+        self.lists = {}
+        self.cards = {}
+        self.checklists = {}
+        self.labels = {}
+        self.members = {}
+        self.organizations = {}
+        self.webhooks = {}
+        self.board_members = defaultdict(list)
+        self.board_cards = defaultdict(list)
+        self.actions = defaultdict(list)
+        self._lock = threading.RLock()
+        self._rng = random.Random()
+        self.me = {'id': object_id(self._rng), 'username': 'me', 'fullName': 'Mock User'}
+        self.members[self.me['id']] = self.me
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def add_board(self, data, organization_id=None):
+        """
+        Load a generated board (generator.generate_board() output)
+
+        Returns:
+            The board ID
+        """
+        with self._lock:
+            board = dict(data['board'])
+            if organization_id:
+                board['idOrganization'] = organization_id
+                if organization_id not in self.organizations:
+                    self.add_organization(organization_id)
+            board_id = board['id']
+            self.boards[board_id] = board
+            for obj in data.get('lists', []):
+                self.lists[obj['id']] = dict(obj)
+            for obj in data.get('labels', []):
+                self.labels[obj['id']] = dict(obj)
+            for obj in data.get('checklists', []):
+                self.checklists[obj['id']] = dict(obj, checkItems=[dict(i) for i in obj['checkItems']])
+            for obj in data.get('cards', []):
+                self.cards[obj['id']] = dict(obj)
+                self.board_cards[board_id].append(obj['id'])
+            for obj in data.get('members', []):
+                self.members[obj['id']] = dict(obj)
+                self.board_members[board_id].append(obj['id'])
+            self.board_members[board_id].append(self.me['id'])
+            return board_id
+
+    def add_organization(self, organization_id, name=None):
+        with self._lock:
+            self.organizations[organization_id] = {
+                'id': organization_id, 'name': name or organization_id,
+                'displayName': name or organization_id}
+
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+
+    def dispatch(self, method, path, params=None):
+        """
+        Serve one API call
+
+        Args:
+            path: Path below the API root, e.g. "/boards/<id>/cards"
+            params: Query string and JSON body parameters, merged
+
+        Returns:
+            (route template, JSON payload); raises MockError for errors
+        """
+        params = params or {}
+        for route_method, template, pattern, name in ROUTES:
+            if route_method != method:
+                continue
+            match = pattern.match(path)
+            if match:
+                with self._lock:
+                    return template, getattr(self, name)(params, **match.groupdict())
+        raise _not_found()
+
+    # ------------------------------------------------------------------
+    # Lookups and rendering
+    # ------------------------------------------------------------------
+
+    def _get(self, collection, object_id_):
+        obj = collection.get(object_id_)
+        if obj is None:
+            raise MockError(400, 'invalid id') if len(object_id_) != 24 else _not_found()
+        return obj
+
+    def _member(self, member_id):
+        if member_id == 'me':
+            return self.me
+        for member in self.members.values():
+            if member_id in (member['id'], member['username']):
+                return member
+        raise _not_found()
+
+    def _card_json(self, card, fields=None):
+        keys = list(card) + ['labels', 'badges'] if fields is None else fields
+        rendered = {'id': card['id']}
+        for key in keys:
+            if key == 'labels':
+                rendered['labels'] = [self.labels[label_id] for label_id in card['idLabels']
+                                      if label_id in self.labels]
+            elif key == 'badges':
+                rendered['badges'] = self._badges(card)
+            elif key in card and not key.startswith('_'):
+                rendered[key] = card[key]
+        return rendered
+
+    def _badges(self, card):
+        items = [item for checklist_id in card.get('idChecklists', [])
+                 for item in self.checklists.get(checklist_id, {}).get('checkItems', [])]
+        return {
+            'checkItems': len(items),
+            'checkItemsChecked': sum(1 for item in items if item['state'] == 'complete'),
+            'comments': card.get('_comments', 0),
+            'attachments': 0,
+            'due': card.get('due'),
+            'dueComplete': card.get('dueComplete', False),
+        }
+
+    def _board_cards(self, board_id, card_filter='open'):
+        cards = [self.cards[card_id] for card_id in self.board_cards[board_id] if card_id in self.cards]
+        return sorted(_filter_closed(cards, card_filter), key=lambda c: (c['idList'], c['pos']))
+
+    def _board_lists(self, board_id, list_filter='open'):
+        lists = [lst for lst in self.lists.values() if lst['idBoard'] == board_id]
+        return sorted(_filter_closed(lists, list_filter), key=lambda l: l['pos'])
+
+    def _board_labels(self, board_id):
+        return [label for label in self.labels.values() if label['idBoard'] == board_id]
+
+    def _card_checklists(self, card):
+        return [self.checklists[cl_id] for cl_id in card.get('idChecklists', [])
+                if cl_id in self.checklists]
+
+    # ------------------------------------------------------------------
+    # Actions (write log)
+    # ------------------------------------------------------------------
+
+    def _record(self, action_type, board_id, card=None, lst=None, old=None, **extra):
+        now = iso_timestamp(datetime.now(timezone.utc))
+        board = self.boards.get(board_id)
+        if board is None:
+            return
+        data = {'board': {'id': board_id, 'name': board['name']}}
+        if card is not None:
+            data['card'] = {'id': card['id'], 'name': card['name'], 'idShort': card.get('idShort'),
+                            'idList': card.get('idList')}
+            card['dateLastActivity'] = now
+        if lst is not None:
+            data['list'] = {'id': lst['id'], 'name': lst['name']}
+        if old:
+            # Like Trello: the new value of each changed field next to the old one
+            data['old'] = old
+            changed, target = (card, data['card']) if card is not None else (lst, data.get('list'))
+            if target is not None:
+                target.update({key: changed.get(key) for key in old})
+            if card is not None and 'idList' in old:
+                data['listBefore'] = {'id': old['idList']}
+                data['listAfter'] = {'id': card['idList']}
+        data.update(extra)
+        self.actions[board_id].append({
+            'id': object_id(self._rng),
+            'type': action_type,
+            'date': now,
+            'idMemberCreator': self.me['id'],
+            'memberCreator': dict(self.me),
+            'data': data,
+        })
+        board['dateLastActivity'] = now
+
+    # ------------------------------------------------------------------
+    # Boards
+    # ------------------------------------------------------------------
+
+    @route('GET', '/boards/{board_id}')
+    def get_board(self, params, board_id):
+        board = self._get(self.boards, board_id)
+        result = _project(board, _fields(params.get('fields')))
+
+        if params.get('lists') in ('all', 'open', 'closed'):
+            result['lists'] = self._board_lists(board_id, params['lists'])
+        if params.get('cards') in ('all', 'open', 'closed', 'visible'):
+            card_fields = _fields(params.get('card_fields'))
+            result['cards'] = [self._card_json(card, card_fields)
+                               for card in self._board_cards(board_id, params['cards'])]
+        if params.get('checklists') == 'all':
+            result['checklists'] = [cl for card in self._board_cards(board_id, params.get('cards', 'open'))
+                                    for cl in self._card_checklists(card)]
+        if params.get('labels') == 'all':
+            limit = int(params.get('labels_limit', 50))
+            result['labels'] = self._board_labels(board_id)[:limit]
+        if params.get('members') in ('all', 'normal', 'admins'):
+            result['members'] = [self.members[m] for m in self.board_members[board_id]]
+        return result
+
+    @route('GET', '/boards/{board_id}/lists')
+    def get_board_lists(self, params, board_id):
+        self._get(self.boards, board_id)
+        return [_project(lst, _fields(params.get('fields')))
+                for lst in self._board_lists(board_id, params.get('filter'))]
+
+    @route('GET', '/boards/{board_id}/cards')
+    def get_board_cards(self, params, board_id):
+        return self.get_board_cards_filtered(params, board_id, params.get('filter', 'open'))
+
+    @route('GET', '/boards/{board_id}/cards/{card_filter}')
+    def get_board_cards_filtered(self, params, board_id, card_filter):
+        self._get(self.boards, board_id)
+        fields = _fields(params.get('fields'))
+        return [self._card_json(card, fields) for card in self._board_cards(board_id, card_filter)]
+
+    @route('GET', '/boards/{board_id}/checklists')
+    def get_board_checklists(self, params, board_id):
+        self._get(self.boards, board_id)
+        return [cl for card in self._board_cards(board_id, 'all') for cl in self._card_checklists(card)]
+
+    @route('GET', '/boards/{board_id}/labels')
+    def get_board_labels(self, params, board_id):
+        self._get(self.boards, board_id)
+        limit = int(params.get('limit', 50))
+        return [_project(label, _fields(params.get('fields')))
+                for label in self._board_labels(board_id)[:limit]]
+
+    @route('GET', '/boards/{board_id}/members')
+    def get_board_members(self, params, board_id):
+        self._get(self.boards, board_id)
+        return [_project(self.members[m], _fields(params.get('fields')))
+                for m in self.board_members[board_id]]
+
+    @route('GET', '/boards/{board_id}/actions')
+    def get_board_actions(self, params, board_id):
+        self._get(self.boards, board_id)
+        actions = self.actions[board_id]
+        if params.get('since'):
+            actions = [a for a in actions if a['date'] > params['since'] or a['id'] == params['since']]
+        if params.get('before'):
+            actions = [a for a in actions if a['date'] < params['before']]
+        if params.get('filter') and params['filter'] != 'all':
+            types = set(params['filter'].split(','))
+            actions = [a for a in actions if a['type'] in types]
+        limit = min(int(params.get('limit', 50)), 1000)
+        return list(reversed(actions))[:limit]
+
+    @route('POST', '/boards')
+    def create_board(self, params):
+        board_id = object_id(self._rng)
+        board = {
+            'id': board_id, 'name': params.get('name', ''), 'desc': params.get('desc', ''),
+            'closed': False, 'url': f"https://trello.com/b/{board_id[-8:]}",
+            'shortUrl': f"https://trello.com/b/{board_id[-8:]}",
+            'idOrganization': params.get('idOrganization'),
+            'dateLastActivity': iso_timestamp(datetime.now(timezone.utc)),
+        }
+        self.boards[board_id] = board
+        self.board_members[board_id].append(self.me['id'])
+        if _truthy(params.get('defaultLists', True)):
+            for pos, name in enumerate(('To Do', 'Doing', 'Done'), 1):
+                self.create_list({'name': name, 'idBoard': board_id, 'pos': pos * 16384})
+        self._record('createBoard', board_id)
+        return board
+
+    @route('PUT', '/boards/{board_id}/{attribute}')
+    def update_board_attribute(self, params, board_id, attribute):
+        board = self._get(self.boards, board_id)
+        if attribute not in ('name', 'desc', 'closed'):
+            raise _not_found()
+        value = params.get('value')
+        board[attribute] = _truthy(value) if attribute == 'closed' else value
+        self._record('updateBoard', board_id)
+        return board
+
+    @route('DELETE', '/boards/{board_id}')
+    def delete_board(self, params, board_id):
+        self._get(self.boards, board_id)
+        del self.boards[board_id]
+        return {'_value': None}
+
+    # ------------------------------------------------------------------
+    # Members and organizations
+    # ------------------------------------------------------------------
+
+    @route('GET', '/members/{member_id}')
+    def get_member(self, params, member_id):
+        return _project(self._member(member_id), _fields(params.get('fields')))
+
+    @route('GET', '/members/{member_id}/boards')
+    def get_member_boards(self, params, member_id):
+        member = self._member(member_id)
+        boards = [board for board_id, board in self.boards.items()
+                  if member['id'] in self.board_members[board_id]]
+        board_filter = params.get('filter', 'all')
+        boards = _filter_closed(boards, board_filter, default='all')
+        return [_project(board, _fields(params.get('fields'))) for board in boards]
+
+    @route('GET', '/members/{member_id}/organizations')
+    def get_member_organizations(self, params, member_id):
+        self._member(member_id)
+        return list(self.organizations.values())
+
+    @route('GET', '/organizations/{organization_id}')
+    def get_organization(self, params, organization_id):
+        return self._get(self.organizations, organization_id)
+
+    @route('GET', '/organizations/{organization_id}/boards')
+    def get_organization_boards(self, params, organization_id):
+        self._get(self.organizations, organization_id)
+        boards = [board for board in self.boards.values()
+                  if board.get('idOrganization') == organization_id]
+        boards = _filter_closed(boards, params.get('filter'), default='all')
+        return [_project(board, _fields(params.get('fields'))) for board in boards]
+
+    # ------------------------------------------------------------------
+    # Lists
+    # ------------------------------------------------------------------
+
+    @route('GET', '/lists/{list_id}')
+    def get_list(self, params, list_id):
+        return _project(self._get(self.lists, list_id), _fields(params.get('fields')))
+
+    @route('GET', '/lists/{list_id}/cards')
+    def get_list_cards(self, params, list_id):
+        lst = self._get(self.lists, list_id)
+        fields = _fields(params.get('fields'))
+        cards = [card for card in self._board_cards(lst['idBoard'], params.get('filter', 'open'))
+                 if card['idList'] == list_id]
+        result = []
+        for card in cards:
+            card_json = self._card_json(card, fields)
+            if params.get('checklists') == 'all':
+                card_json['checklists'] = self._card_checklists(card)
+            result.append(card_json)
+        return result
+
+    @route('GET', '/lists/{list_id}/actions')
+    def get_list_actions(self, params, list_id):
+        lst = self._get(self.lists, list_id)
+        return [a for a in reversed(self.actions[lst['idBoard']])
+                if a['data'].get('list', {}).get('id') == list_id
+                or a['data'].get('card', {}).get('idList') == list_id]
+
+    @route('POST', '/lists')
+    def create_list(self, params):
+        board_id = params.get('idBoard')
+        self._get(self.boards, board_id or '')
+        existing = self._board_lists(board_id, 'all')
+        lst = {
+            'id': object_id(self._rng), 'name': params.get('name', ''), 'closed': False,
+            'pos': params.get('pos') or (existing[-1]['pos'] + 16384 if existing else 16384),
+            'idBoard': board_id, 'subscribed': False,
+        }
+        if lst['pos'] in ('top', 'bottom'):
+            lst['pos'] = 0 if lst['pos'] == 'top' else (existing[-1]['pos'] + 16384 if existing else 16384)
+        self.lists[lst['id']] = lst
+        self._record('createList', board_id, lst=lst)
+        return lst
+
+    @route('PUT', '/lists/{list_id}/{attribute}')
+    def update_list_attribute(self, params, list_id, attribute):
+        lst = self._get(self.lists, list_id)
+        if attribute not in ('name', 'closed', 'pos', 'idBoard', 'subscribed'):
+            raise _not_found()
+        value = params.get('value')
+        old = {attribute: lst.get(attribute)}
+        lst[attribute] = _truthy(value) if attribute in ('closed', 'subscribed') else value
+        self._record('updateList', lst['idBoard'], lst=lst, old=old)
+        return lst
+
+    @route('POST', '/lists/{list_id}/archiveAllCards')
+    def archive_all_cards(self, params, list_id):
+        lst = self._get(self.lists, list_id)
+        for card in self._board_cards(lst['idBoard']):
+            if card['idList'] == list_id:
+                card['closed'] = True
+                self._record('updateCard', lst['idBoard'], card=card, old={'closed': False})
+        return {}
+
+    @route('POST', '/lists/{list_id}/moveAllCards')
+    def move_all_cards(self, params, list_id):
+        lst = self._get(self.lists, list_id)
+        for card in self._board_cards(lst['idBoard']):
+            if card['idList'] == list_id:
+                self._move_card(card, params.get('idBoard', lst['idBoard']), params.get('idList'))
+        return []
+
+    # ------------------------------------------------------------------
+    # Cards
+    # ------------------------------------------------------------------
+
+    @route('GET', '/cards/{card_id}')
+    def get_card(self, params, card_id):
+        card = self._get(self.cards, card_id)
+        result = self._card_json(card, _fields(params.get('fields')))
+        if params.get('checklists') == 'all':
+            result['checklists'] = self._card_checklists(card)
+        if _truthy(params.get('list', False)):
+            result['list'] = self.lists[card['idList']]
+        if _truthy(params.get('board', False)):
+            result['board'] = _project(self.boards[card['idBoard']], _fields(params.get('board_fields')))
+        if _truthy(params.get('customFieldItems', False)):
+            result['customFieldItems'] = []
+        if params.get('members') in ('true', True):
+            result['members'] = [self.members[m] for m in card['idMembers'] if m in self.members]
+        return result
+
+    @route('GET', '/cards/{card_id}/checklists')
+    def get_card_checklists(self, params, card_id):
+        return self._card_checklists(self._get(self.cards, card_id))
+
+    @route('GET', '/cards/{card_id}/actions')
+    def get_card_actions(self, params, card_id):
+        card = self._get(self.cards, card_id)
+        actions = [a for a in reversed(self.actions[card['idBoard']])
+                   if a['data'].get('card', {}).get('id') == card_id]
+        if params.get('filter') and params['filter'] != 'all':
+            types = set(params['filter'].split(','))
+            actions = [a for a in actions if a['type'] in types]
+        return actions[:int(params.get('limit', 50))]
+
+    @route('GET', '/cards/{card_id}/attachments')
+    def get_card_attachments(self, params, card_id):
+        self._get(self.cards, card_id)
+        return []
+
+    @route('GET', '/cards/{card_id}/pluginData')
+    def get_card_plugin_data(self, params, card_id):
+        self._get(self.cards, card_id)
+        return []
+
+    @route('POST', '/cards')
+    def create_card(self, params):
+        lst = self._get(self.lists, params.get('idList') or '')
+        board_id = lst['idBoard']
+        siblings = [c for c in self._board_cards(board_id) if c['idList'] == lst['id']]
+        id_labels = params.get('idLabels') or []
+        if isinstance(id_labels, str):
+            id_labels = [label_id for label_id in id_labels.split(',') if label_id]
+        id_members = params.get('idMembers') or []
+        if isinstance(id_members, str):
+            id_members = [member_id for member_id in id_members.split(',') if member_id]
+        card_id = object_id(self._rng)
+        due = params.get('due')
+        card = {
+            'id': card_id, 'name': params.get('name', ''), 'desc': params.get('desc') or '',
+            'due': None if due in (None, '', 'null') else due, 'dueComplete': False,
+            'closed': False, 'url': f"https://trello.com/c/{card_id[-8:]}",
+            'shortUrl': f"https://trello.com/c/{card_id[-8:]}",
+            'pos': (siblings[-1]['pos'] + 16384) if siblings else 16384,
+            'idShort': len(self.board_cards[board_id]) + 1, 'idBoard': board_id,
+            'idList': lst['id'], 'idMembers': list(id_members), 'idLabels': list(id_labels),
+            'idChecklists': [], 'dateLastActivity': iso_timestamp(datetime.now(timezone.utc)),
+        }
+        self.cards[card_id] = card
+        self.board_cards[board_id].append(card_id)
+        self._record('createCard', board_id, card=card, lst=lst)
+        return self._card_json(card)
+
+    @route('PUT', '/cards/{card_id}')
+    def update_card(self, params, card_id):
+        card = self._get(self.cards, card_id)
+        for attribute, value in params.items():
+            if attribute in ('name', 'desc', 'due', 'dueComplete', 'closed', 'pos', 'idList', 'idBoard'):
+                self._set_card_attribute(card, attribute, value, params)
+        return self._card_json(card)
+
+    @route('PUT', '/cards/{card_id}/{attribute}')
+    def update_card_attribute(self, params, card_id, attribute):
+        card = self._get(self.cards, card_id)
+        if attribute not in ('name', 'desc', 'due', 'dueComplete', 'closed', 'pos',
+                             'idList', 'idBoard', 'subscribed'):
+            raise _not_found()
+        self._set_card_attribute(card, attribute, params.get('value'), params)
+        return self._card_json(card)
+
+    def _set_card_attribute(self, card, attribute, value, params):
+        if attribute == 'idBoard':
+            self._move_card(card, value, params.get('idList'))
+            return
+        if attribute == 'idList':
+            lst = self._get(self.lists, value or '')
+            if lst['idBoard'] != card['idBoard']:
+                self._move_card(card, lst['idBoard'], value)
+                return
+        if attribute in ('closed', 'dueComplete', 'subscribed'):
+            value = _truthy(value)
+        if attribute == 'due' and value in ('', 'null'):
+            value = None
+        old = {attribute: card.get(attribute)}
+        card[attribute] = value
+        lst = self.lists.get(card['idList'])
+        self._record('updateCard', card['idBoard'], card=card, lst=lst, old=old)
+
+    def _move_card(self, card, board_id, list_id=None):
+        self._get(self.boards, board_id or '')
+        if list_id is None:
+            lists = self._board_lists(board_id)
+            if not lists:
+                raise MockError(400, 'invalid value for idList')
+            list_id = lists[0]['id']
+        old_board = card['idBoard']
+        if old_board != board_id:
+            self._record('moveCardFromBoard', old_board, card=card, boardTarget={'id': board_id})
+            self.board_cards[old_board].remove(card['id'])
+            self.board_cards[board_id].append(card['id'])
+            # Labels are board-scoped; Trello copies them, the mock drops them
+            card['idLabels'] = []
+        old = {'idList': card['idList']}
+        card['idBoard'] = board_id
+        card['idList'] = list_id
+        action_type = 'moveCardToBoard' if old_board != board_id else 'updateCard'
+        self._record(action_type, board_id, card=card, lst=self.lists.get(list_id), old=old,
+                     listBefore={'id': old['idList']}, listAfter={'id': list_id})
+
+    @route('DELETE', '/cards/{card_id}')
+    def delete_card(self, params, card_id):
+        card = self._get(self.cards, card_id)
+        self._record('deleteCard', card['idBoard'], card=card)
+        del self.cards[card_id]
+        self.board_cards[card['idBoard']].remove(card_id)
+        return {'limits': {}}
+
+    @route('POST', '/cards/{card_id}/idLabels')
+    def add_card_label(self, params, card_id):
+        card = self._get(self.cards, card_id)
+        label = self._get(self.labels, params.get('value') or '')
+        if label['id'] in card['idLabels']:
+            raise MockError(400, 'that label is already on the card')
+        card['idLabels'].append(label['id'])
+        self._record('addLabelToCard', card['idBoard'], card=card, label=label)
+        return list(card['idLabels'])
+
+    @route('DELETE', '/cards/{card_id}/idLabels/{label_id}')
+    def remove_card_label(self, params, card_id, label_id):
+        card = self._get(self.cards, card_id)
+        if label_id not in card['idLabels']:
+            raise MockError(400, 'that label is not on the card')
+        card['idLabels'].remove(label_id)
+        self._record('removeLabelFromCard', card['idBoard'], card=card, label={'id': label_id})
+        return {'_value': None}
+
+    @route('POST', '/cards/{card_id}/idMembers')
+    def add_card_member(self, params, card_id):
+        card = self._get(self.cards, card_id)
+        member = self._member(params.get('value') or '')
+        if member['id'] in card['idMembers']:
+            raise MockError(400, 'member is already on the card')
+        card['idMembers'].append(member['id'])
+        self._record('addMemberToCard', card['idBoard'], card=card, idMember=member['id'])
+        return [self.members[m] for m in card['idMembers'] if m in self.members]
+
+    @route('POST', '/cards/{card_id}/members')
+    def assign_card_member(self, params, card_id):
+        return self.add_card_member(params, card_id)
+
+    @route('DELETE', '/cards/{card_id}/idMembers/{member_id}')
+    def remove_card_member(self, params, card_id, member_id):
+        card = self._get(self.cards, card_id)
+        if member_id not in card['idMembers']:
+            raise MockError(400, 'member is not on the card')
+        card['idMembers'].remove(member_id)
+        self._record('removeMemberFromCard', card['idBoard'], card=card, idMember=member_id)
+        return [self.members[m] for m in card['idMembers'] if m in self.members]
+
+    @route('POST', '/cards/{card_id}/actions/comments')
+    def comment_card(self, params, card_id):
+        card = self._get(self.cards, card_id)
+        card['_comments'] = card.get('_comments', 0) + 1
+        self._record('commentCard', card['idBoard'], card=card, text=params.get('text', ''))
+        return self.actions[card['idBoard']][-1]
+
+    @route('POST', '/cards/{card_id}/checklists')
+    def add_card_checklist(self, params, card_id):
+        return self.create_checklist(dict(params, idCard=card_id))
+
+    @route('PUT', '/cards/{card_id}/checkItem/{item_id}')
+    def update_check_item(self, params, card_id, item_id):
+        card = self._get(self.cards, card_id)
+        for checklist in self._card_checklists(card):
+            for item in checklist['checkItems']:
+                if item['id'] == item_id:
+                    for attribute in ('name', 'state', 'pos'):
+                        if attribute in params:
+                            item[attribute] = params[attribute]
+                    self._record('updateCheckItemStateOnCard', card['idBoard'], card=card,
+                                 checkItem={'id': item_id, 'state': item['state']})
+                    return item
+        raise _not_found()
+
+    # ------------------------------------------------------------------
+    # Checklists and labels
+    # ------------------------------------------------------------------
+
+    @route('POST', '/checklists')
+    def create_checklist(self, params):
+        card = self._get(self.cards, params.get('idCard') or '')
+        checklist = {
+            'id': object_id(self._rng), 'idBoard': card['idBoard'], 'idCard': card['id'],
+            'name': params.get('name', ''), 'pos': (len(card['idChecklists']) + 1) * 16384,
+            'checkItems': [],
+        }
+        self.checklists[checklist['id']] = checklist
+        card['idChecklists'].append(checklist['id'])
+        self._record('addChecklistToCard', card['idBoard'], card=card,
+                     checklist={'id': checklist['id'], 'name': checklist['name']})
+        return checklist
+
+    @route('POST', '/checklists/{checklist_id}/checkItems')
+    def add_check_item(self, params, checklist_id):
+        checklist = self._get(self.checklists, checklist_id)
+        item = {
+            'id': object_id(self._rng), 'idChecklist': checklist_id, 'name': params.get('name', ''),
+            'state': 'complete' if _truthy(params.get('checked', False)) else 'incomplete',
+            'pos': (len(checklist['checkItems']) + 1) * 16384,
+        }
+        checklist['checkItems'].append(item)
+        card = self.cards.get(checklist['idCard'])
+        self._record('updateChecklist', checklist['idBoard'], card=card)
+        return item
+
+    @route('DELETE', '/checklists/{checklist_id}')
+    def delete_checklist(self, params, checklist_id):
+        checklist = self._get(self.checklists, checklist_id)
+        card = self.cards.get(checklist['idCard'])
+        if card is not None:
+            card['idChecklists'].remove(checklist_id)
+        del self.checklists[checklist_id]
+        self._record('removeChecklistFromCard', checklist['idBoard'], card=card)
+        return {'_value': None}
+
+    @route('GET', '/labels/{label_id}')
+    def get_label(self, params, label_id):
+        return self._get(self.labels, label_id)
+
+    @route('POST', '/labels')
+    def create_label(self, params):
+        board_id = params.get('idBoard') or ''
+        self._get(self.boards, board_id)
+        label = {'id': object_id(self._rng), 'idBoard': board_id,
+                 'name': params.get('name', ''), 'color': params.get('color')}
+        self.labels[label['id']] = label
+        self._record('createLabel', board_id, label=label)
+        return label
+
+    @route('PUT', '/labels/{label_id}')
+    def update_label(self, params, label_id):
+        label = self._get(self.labels, label_id)
+        for attribute in ('name', 'color'):
+            if attribute in params:
+                label[attribute] = params[attribute]
+        self._record('updateLabel', label['idBoard'], label=label)
+        return label
+
+    @route('PUT', '/labels/{label_id}/{attribute}')
+    def update_label_attribute(self, params, label_id, attribute):
+        if attribute not in ('name', 'color'):
+            raise _not_found()
+        return self.update_label({attribute: params.get('value')}, label_id)
+
+    @route('DELETE', '/labels/{label_id}')
+    def delete_label(self, params, label_id):
+        label = self._get(self.labels, label_id)
+        del self.labels[label_id]
+        for card_id in self.board_cards[label['idBoard']]:
+            card = self.cards.get(card_id)
+            if card and label_id in card['idLabels']:
+                card['idLabels'].remove(label_id)
+        self._record('deleteLabel', label['idBoard'], label={'id': label_id})
+        return {}
+
+    # ------------------------------------------------------------------
+    # Webhooks and batch
+    # ------------------------------------------------------------------
+
+    @route('POST', '/webhooks')
+    def create_webhook(self, params):
+        webhook = {'id': object_id(self._rng), 'description': params.get('description', ''),
+                   'idModel': params.get('idModel'), 'callbackURL': params.get('callbackURL'),
+                   'active': True}
+        self.webhooks[webhook['id']] = webhook
+        return webhook
+
+    @route('GET', '/tokens/{token}/webhooks')
+    def get_token_webhooks(self, params, token):
+        return list(self.webhooks.values())
+
+    @route('DELETE', '/webhooks/{webhook_id}')
+    def delete_webhook(self, params, webhook_id):
+        self._get(self.webhooks, webhook_id)
+        del self.webhooks[webhook_id]
+        return {'_value': None}
+
+    @route('GET', '/batch')
+    def batch(self, params):
+        urls = [url for url in params.get('urls', '').split(',') if url]
+        if len(urls) > 10:
+            raise MockError(400, 'Too many urls (max 10)')
+        responses = []
+        for url in urls:
+            parts = urlsplit(url)
+            path = parts.path[2:] if parts.path.startswith('/1/') else parts.path
+            try:
+                _, body = self.dispatch('GET', path, dict(parse_qsl(parts.query)))
+                responses.append({'200': body})
+            except MockError as e:
+                responses.append({'name': 'Error', 'message': e.message, 'statusCode': e.status})
+        return responses
+
+
+class Latency:
+    """
+    Injected response delay: a base round trip with log-normal jitter plus
+    transfer time for the response size
+    """
+
+    def __init__(self, base_ms=0.0, jitter=0.25, per_kb_ms=0.0, seed=None):
+        self.base_ms = base_ms
+        self.jitter = jitter
+        self.per_kb_ms = per_kb_ms
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def delay(self, size_bytes):
+        """Seconds to wait before sending a response of size_bytes"""
+        if not self.base_ms and not self.per_kb_ms:
+            return 0.0
+        with self._lock:
+            factor = self._rng.lognormvariate(0, self.jitter) if self.jitter else 1.0
+        return (self.base_ms * factor + self.per_kb_ms * size_bytes / 1024) / 1000
+
+
+class RateLimitWindow:
+    """Sliding-window request limit per credential, like Trello's 10s windows"""
+
+    def __init__(self, limit, period=10.0):
+        self.limit = limit
+        self.period = period
+        self._hits = defaultdict(deque)
+        self._lock = threading.Lock()
+
+    def hit(self, ident):
+        """Record a request; returns remaining requests (negative when over the limit)"""
+        now = time.monotonic()
+        with self._lock:
+            hits = self._hits[ident]
+            while hits and now - hits[0] > self.period:
+                hits.popleft()
+            hits.append(now)
+            return self.limit - len(hits)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    server_version = 'MockTrello/1.0'
+
+    def do_GET(self):
+        self._serve('GET')
+
+    def do_POST(self):
+        self._serve('POST')
+
+    def do_PUT(self):
+        self._serve('PUT')
+
+    def do_DELETE(self):
+        self._serve('DELETE')
+
+    def log_message(self, format, *args):
+        if self.server.mock.verbose:
+            super().log_message(format, *args)
+
+    def _serve(self, method):
+        mock = self.server.mock
+        parts = urlsplit(self.path)
+        params = dict(parse_qsl(parts.query))
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            try:
+                body = json.loads(self.rfile.read(length) or b'{}')
+                if isinstance(body, dict):
+                    params.update(body)
+            except ValueError:
+                pass
+
+        path = parts.path
+        if path.startswith(mock.prefix):
+            path = path[len(mock.prefix):] or '/'
+        status, payload, headers, template = mock.handle(method, path, params,
+                                                         self.headers.get('Authorization'))
+
+        data = payload if isinstance(payload, bytes) else json.dumps(payload).encode('utf-8')
+        content_type = 'text/plain' if isinstance(payload, bytes) else 'application/json'
+        delay = mock.latency.delay(len(data))
+        if delay > 0:
+            time.sleep(delay)
+
+        self.send_response(status)
+        self.send_header('Content-Type', f"{content_type}; charset=utf-8")
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+        mock.count(method, template, status, len(data))
+
+
+class MockTrelloServer:
+    """
+    HTTP server for a MockTrello store, on a background thread
+
+        with MockTrelloServer(store, latency=Latency(80)) as server:
+            os.environ['TRELLO_BASE_URL'] = server.base_url
+
+    Counts requests and response bytes per endpoint (see stats()).
+    """
+
+    def __init__(self, store=None, host='127.0.0.1', port=0, latency=None,
+                 rate_limit=False, verbose=False):
+        self.store = store or MockTrello()
+        self.latency = latency or Latency()
+        self.verbose = verbose
+        self.prefix = '/1'
+        self.key_window = RateLimitWindow(300) if rate_limit else None
+        self.token_window = RateLimitWindow(100) if rate_limit else None
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.mock = self
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{self.prefix}"
+
+    def handle(self, method, path, params, authorization=None):
+        """Authenticate (key/token params or OAuth header), rate-limit and dispatch one request"""
+        key, token = params.pop('key', None), params.pop('token', None)
+        if not (key and token):
+            key, token = _oauth_credentials(authorization)
+        headers = {}
+        if not key or not token:
+            return 401, b'invalid key', headers, None
+
+        if self.token_window is not None:
+            key_remaining = self.key_window.hit(key)
+            token_remaining = self.token_window.hit(token)
+            headers = {
+                'X-Rate-Limit-Api-Key-Interval-Ms': '10000',
+                'X-Rate-Limit-Api-Key-Max': str(self.key_window.limit),
+                'X-Rate-Limit-Api-Key-Remaining': str(max(0, key_remaining)),
+                'X-Rate-Limit-Api-Token-Interval-Ms': '10000',
+                'X-Rate-Limit-Api-Token-Max': str(self.token_window.limit),
+                'X-Rate-Limit-Api-Token-Remaining': str(max(0, token_remaining)),
+            }
+            if key_remaining < 0 or token_remaining < 0:
+                scope = 'TOKEN' if token_remaining < 0 else 'KEY'
+                return 429, {'error': f'API_{scope}_LIMIT_EXCEEDED',
+                             'message': 'Rate limit exceeded'}, headers, None
+
+        try:
+            template, payload = self.store.dispatch(method, path, params)
+            return 200, payload, headers, template
+        except MockError as e:
+            return e.status, e.message.encode('utf-8'), headers, None
+        except Exception as e:
+            return 500, f"mock server error: {e!r}".encode('utf-8'), headers, None
+
+    def count(self, method, template, status, size):
+        with self._stats_lock:
+            self.requests += 1
+            self.bytes_sent += size
+            self.endpoints[f"{method} {template or '?'}"] += 1
+            if status != 200:
+                self.errors[status] += 1
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self.requests = 0
+            self.bytes_sent = 0
+            self.endpoints = Counter()
+            self.errors = Counter()
+
+    def stats(self):
+        """Request count, response bytes and per-endpoint counts since the last reset"""
+        with self._stats_lock:
+            return {'requests': self.requests, 'bytes': self.bytes_sent,
+                    'endpoints': dict(self.endpoints), 'errors': dict(self.errors)}
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._httpd.serve_forever()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
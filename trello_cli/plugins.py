@@ -9,6 +9,8 @@ import json
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from .config import get_base_url
+
 
 PLUGIN_DIR = Path.home() / '.trellocli' / 'plugins'
 CONFIG_FILE = Path.home() / '.trello_config.json'
@@ -174,7 +176,7 @@ def get_plugin_env(custom_env: Optional[Dict] = None) -> Dict[str, str]:
     # Set additional variables
     env['TRELLO_CONFIG_DIR'] = str(Path.home() / '.trellocli')
     env['TRELLO_CLI_VERSION'] = __version__
-    env['TRELLO_BASE_URL'] = 'https://api.trello.com/1'
+    env['TRELLO_BASE_URL'] = get_base_url()
     env['TRELLO_PLUGIN_DIR'] = str(PLUGIN_DIR)
 
     # Add custom env if provided
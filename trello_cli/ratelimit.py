@@ -0,0 +1,163 @@
+"""
+Client-side rate limiting and retries for the Trello API
+"""
+
+import random
+import threading
+import time
+
+
+# Documented Trello limits: (requests, window in seconds)
+KEY_LIMIT = (300, 10)
+TOKEN_LIMIT = (100, 10)
+
+# Statuses worth retrying. 5xx is only retried for idempotent methods so a
+# POST that reached the server is never replayed.
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+IDEMPOTENT_METHODS = ('GET', 'PUT', 'DELETE', 'HEAD', 'OPTIONS')
+MAX_RETRIES = 6
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30.0
+
+_HEADER_PREFIX = 'x-rate-limit-api-'
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at capacity/period"""
+
+    def __init__(self, capacity, period):
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + max(0.0, now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """Take one token, sleeping until one is available. Returns seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def sync(self, remaining):
+        """Lower the local estimate to what the server reports as remaining"""
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.tokens, float(remaining))
+
+    def drain(self):
+        """Empty the bucket (after a 429 the server window is exhausted)"""
+        with self._lock:
+            self._refill()
+            self.tokens = 0.0
+
+
+# Buckets are shared by every client using the same key/token in this process
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+
+def _shared_bucket(scope, ident, limit):
+    with _buckets_lock:
+        if (scope, ident) not in _buckets:
+            _buckets[(scope, ident)] = TokenBucket(*limit)
+        return _buckets[(scope, ident)]
+
+
+class RateLimiter:
+    """
+    Schedules requests against the per-key and per-token buckets and keeps
+    track of how much time was spent waiting.
+    """
+
+    def __init__(self, api_key=None, token=None):
+        self.key_bucket = _shared_bucket('key', api_key, KEY_LIMIT)
+        self.token_bucket = _shared_bucket('token', token, TOKEN_LIMIT)
+        self.requests = 0
+        self.retries = 0
+        self.throttled_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        waited = self.key_bucket.acquire() + self.token_bucket.acquire()
+        with self._lock:
+            self.requests += 1
+            self.throttled_seconds += waited
+
+    def backoff(self, attempt, retry_after=None):
+        """Sleep before retry number `attempt` (0-based), full jitter"""
+        if retry_after is not None:
+            delay = retry_after
+        else:
+            delay = random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * (2 ** attempt)))
+        time.sleep(delay)
+        with self._lock:
+            self.retries += 1
+            self.throttled_seconds += delay
+
+    def observe(self, headers):
+        """Sync buckets with X-Rate-Limit-Api-*-Remaining response headers"""
+        for scope, bucket in (('key', self.key_bucket), ('token', self.token_bucket)):
+            remaining = headers.get(f'{_HEADER_PREFIX}{scope}-remaining')
+            if remaining is not None:
+                try:
+                    bucket.sync(int(remaining))
+                except ValueError:
+                    pass
+
+    def summary(self):
+        """One-line throttle report, or None if nothing was throttled"""
+        if not self.retries and self.throttled_seconds < 0.05:
+            return None
+        return (f"⏱️  Throttled {self.throttled_seconds:.1f}s across {self.requests} request(s)"
+                f" ({self.retries} retr{'y' if self.retries == 1 else 'ies'}) to respect Trello rate limits")
+
+
+def _retry_after(headers):
+    value = headers.get('Retry-After')
+    if value is None:
+        return None
+    try:
+        return min(BACKOFF_CAP, max(0.0, float(value)))
+    except ValueError:
+        return None
+
+
+class RateLimitedHTTPService:
+    """
+    Wraps a requests-style HTTP service: every request waits for a token,
+    and 429/5xx responses are retried with jittered exponential backoff.
+    """
+
+    def __init__(self, inner, limiter):
+        self.inner = inner
+        self.limiter = limiter
+
+    def request(self, method, url, **kwargs):
+        attempt = 0
+        while True:
+            self.limiter.acquire()
+            response = self.inner.request(method, url, **kwargs)
+            headers = getattr(response, 'headers', None) or {}
+            self.limiter.observe(headers)
+
+            status = response.status_code
+            retryable = status == 429 or (status in RETRY_STATUSES and method in IDEMPOTENT_METHODS)
+            if not retryable or attempt >= MAX_RETRIES:
+                return response
+
+            if status == 429:
+                self.limiter.token_bucket.drain()
+            self.limiter.backoff(attempt, _retry_after(headers))
+            attempt += 1
@@ -0,0 +1,171 @@
+"""
+Compact read-only records for cards, lists, labels and checklists
+"""
+
+from datetime import datetime
+
+
+class _Record:
+    """
+    Immutable record decoded straight from API JSON.
+
+    Records use __slots__ and hold no client reference, so a board with
+    tens of thousands of cards costs a fraction of the memory of py-trello
+    objects. Use TrelloClient.card_ref() to write to a card.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, **values):
+        for name in self.__slots__:
+            object.__setattr__(self, name, values.get(name))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __eq__(self, other):
+        return type(self) is type(other) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __hash__(self):
+        return hash((type(self).__name__, self.id))
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.id} {self.name!r}>"
+
+
+class LabelRecord(_Record):
+    """Board label"""
+
+    __slots__ = ('id', 'name', 'color')
+
+    @classmethod
+    def from_json(cls, json_obj):
+        return cls(id=json_obj['id'], name=json_obj.get('name', ''), color=json_obj.get('color'))
+
+
+class ListRecord(_Record):
+    """Board list"""
+
+    __slots__ = ('id', 'name', 'closed', 'pos', 'idBoard')
+
+    @classmethod
+    def from_json(cls, json_obj, board_id=None):
+        return cls(id=json_obj['id'], name=json_obj.get('name', ''),
+                   closed=json_obj.get('closed', False), pos=json_obj.get('pos', 0),
+                   idBoard=json_obj.get('idBoard', board_id))
+
+    @property
+    def board_id(self):
+        return self.idBoard
+
+
+class ChecklistRecord(_Record):
+    """
+    Card checklist. Items stay as their JSON dicts (sorted by position,
+    with 'checked' set from 'state'), as with py-trello's Checklist.
+    """
+
+    __slots__ = ('id', 'name', 'idCard', 'items')
+
+    @classmethod
+    def from_json(cls, json_obj):
+        items = sorted(json_obj.get('checkItems', []), key=lambda item: item.get('pos', 0))
+        for item in items:
+            item['checked'] = item.get('state') == 'complete'
+        return cls(id=json_obj['id'], name=json_obj.get('name', ''),
+                   idCard=json_obj.get('idCard'), items=items)
+
+
+# JSON card field -> CardRecord attribute, where they differ
+CARD_FIELD_ATTRS = {'dueComplete': 'is_due_complete'}
+
+
+class CardRecord(_Record):
+    """
+    Card with its labels and checklists. Attribute names follow py-trello's
+    Card (idList, idMembers, is_due_complete, member_id, ...) so read code
+    works with either. Fields missing from a projected fetch get defaults.
+    """
+
+    __slots__ = ('id', 'name', 'desc', 'due', 'is_due_complete', 'closed', 'url',
+                 'shortUrl', 'pos', 'idShort', 'idBoard', 'idList', 'idMembers',
+                 'idLabels', 'labels', 'badges', 'dateLastActivity', 'checklists')
+
+    @classmethod
+    def from_json(cls, json_obj, board_id=None, labels_by_id=None, checklists=()):
+        """
+        Decode card JSON
+
+        Args:
+            board_id: Board ID for cards fetched without idBoard
+            labels_by_id: Board LabelRecords to share instead of decoding
+                          each card's label copies
+            checklists: The card's ChecklistRecords
+        """
+        labels_by_id = labels_by_id or {}
+        labels = tuple(labels_by_id.get(obj['id']) or LabelRecord.from_json(obj)
+                       for obj in json_obj.get('labels', ()))
+        return cls(
+            id=json_obj['id'],
+            name=json_obj.get('name', ''),
+            desc=json_obj.get('desc', ''),
+            due=json_obj.get('due'),
+            is_due_complete=json_obj.get('dueComplete', False),
+            closed=json_obj.get('closed', False),
+            url=json_obj.get('url', ''),
+            shortUrl=json_obj.get('shortUrl', ''),
+            pos=json_obj.get('pos', 0),
+            idShort=json_obj.get('idShort', 0),
+            idBoard=json_obj.get('idBoard', board_id),
+            idList=json_obj.get('idList'),
+            idMembers=tuple(json_obj.get('idMembers', ())),
+            idLabels=tuple(json_obj.get('idLabels', ())),
+            labels=labels,
+            badges=json_obj.get('badges', {}),
+            dateLastActivity=json_obj.get('dateLastActivity'),
+            checklists=tuple(checklists),
+        )
+
+    @property
+    def member_id(self):
+        return self.idMembers
+
+    @property
+    def member_ids(self):
+        return self.idMembers
+
+    @property
+    def list_id(self):
+        return self.idList
+
+    @property
+    def board_id(self):
+        return self.idBoard
+
+    @property
+    def description(self):
+        return self.desc
+
+    @property
+    def short_url(self):
+        return self.shortUrl
+
+    @property
+    def due_date(self):
+        """Due date as an aware datetime ('' when unset, like py-trello)"""
+        return datetime.fromisoformat(self.due.replace('Z', '+00:00')) if self.due else ''
+
+    @property
+    def date_last_activity(self):
+        if not self.dateLastActivity:
+            return None
+        return datetime.fromisoformat(self.dateLastActivity.replace('Z', '+00:00'))
+
+    def field(self, name, default=''):
+        """Value of a JSON card field by its API name (e.g. for --fields columns)"""
+        value = getattr(self, CARD_FIELD_ATTRS.get(name, name), default)
+        return default if value is None else value
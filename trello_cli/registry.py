@@ -0,0 +1,479 @@
+"""
+Command registry: how each CLI command maps argv onto a cmd_* function
+
+Nothing here imports a command module; the function is looked up in
+trello_cli.commands (which imports its module on demand) only when the
+command actually runs.
+"""
+
+import os
+import sys
+
+from . import __version__
+
+
+# Arguments after this one are never read as flags or options, so text such
+# as a comment of "--offline" can be passed as `trello add-comment ID -- --offline`
+END_OF_OPTIONS = '--'
+
+
+def _options_end(argv):
+    return argv.index(END_OF_OPTIONS) if END_OF_OPTIONS in argv else len(argv)
+
+
+def pop_flag(argv, *flags):
+    """Remove boolean flags (before any --) from argv, returning whether any was present"""
+    found = False
+    for flag in flags:
+        while flag in argv[:_options_end(argv)]:
+            argv.remove(flag)
+            found = True
+    return found
+
+
+def pop_option(argv, option):
+    """Extract `option VALUE` (before any --) from argv, returning VALUE (or None)"""
+    if option not in argv[:_options_end(argv)]:
+        return None
+    idx = argv.index(option)
+    if idx + 1 >= len(argv):
+        raise ValueError(f"{option} requires a value")
+    value = argv[idx + 1]
+    # Remove the option and its value from argv
+    argv.pop(idx)
+    argv.pop(idx)
+    return value
+
+
+class UsageError(Exception):
+    """Missing or malformed arguments; the message is the usage line"""
+
+
+class Command:
+    """
+    One CLI command
+
+    Args:
+        function: Name of the cmd_* function in trello_cli.commands
+        usage: Argument synopsis shown on usage errors
+        required: Number of required positional arguments
+        optional: Converters (str, int) for optional positional arguments
+        options: {'--option': kwarg} options that take a value
+        flags: {'--flag': kwarg} boolean flags (several flags may share a kwarg)
+        concurrency: Accept --concurrency N (passed as concurrency=)
+        details: Extra lines printed after the usage line
+        handler: Custom handler(argv) for commands that don't fit the above
+    """
+
+    __slots__ = ('function', 'usage', 'required', 'optional', 'options', 'flags',
+                 'concurrency', 'details', 'handler')
+
+    def __init__(self, function=None, usage='', required=0, optional=(), options=None,
+                 flags=None, concurrency=False, details=None, handler=None):
+        self.function = function
+        self.usage = usage
+        self.required = required
+        self.optional = optional
+        self.options = options or {}
+        self.flags = flags or {}
+        self.concurrency = concurrency
+        self.details = details
+        self.handler = handler
+
+    def parse(self, argv):
+        """
+        Split the arguments after the command name into (args, kwargs)
+
+        Raises:
+            UsageError: Too few positional arguments
+            ValueError: Bad option or argument value
+        """
+        argv = list(argv)
+        kwargs = {}
+        for option, kwarg in self.options.items():
+            value = pop_option(argv, option)
+            if value is not None:
+                kwargs[kwarg] = value
+        for flag, kwarg in self.flags.items():
+            if pop_flag(argv, flag):
+                kwargs[kwarg] = True
+        if self.concurrency:
+            from .executor import parse_concurrency
+            value = pop_option(argv, '--concurrency')
+            if value is not None:
+                kwargs['concurrency'] = parse_concurrency(value)
+        if END_OF_OPTIONS in argv:
+            argv.remove(END_OF_OPTIONS)
+
+        if len(argv) < self.required:
+            raise UsageError(self.usage)
+        args = argv[:self.required]
+        for convert, value in zip(self.optional, argv[self.required:]):
+            args.append(convert(value))
+        return args, kwargs
+
+    def run(self, name, argv):
+        """Run the command with the arguments that followed its name"""
+        if self.handler is not None:
+            return self.handler(argv)
+        return self.call(name, argv)
+
+    def call(self, name, argv):
+        """Parse the arguments and call the cmd_* function, ignoring any handler"""
+        from . import commands
+        try:
+            args, kwargs = self.parse(argv)
+        except UsageError:
+            print(f"❌ Usage: trello {name} {self.usage}".rstrip())
+            if self.details:
+                print(self.details)
+            sys.exit(1)
+        return getattr(commands, self.function)(*args, **kwargs)
+
+
+# Custom handlers
+
+def _config(argv):
+    from .config import configure_interactive
+    configure_interactive()
+
+
+def _version(argv):
+    print(f"Trello CLI v{__version__}")
+
+
+def _update_card(argv):
+    from .commands import cmd_update_card
+    if len(argv) < 2:
+        print("❌ Usage: trello update-card <card_id> [--description] \"description\"")
+        sys.exit(1)
+
+    # Support both positional and --description flag
+    if argv[1] in ('--description', END_OF_OPTIONS) and len(argv) > 2:
+        description = argv[2]
+    else:
+        # Legacy support: positional description argument
+        description = argv[1]
+    cmd_update_card(argv[0], description)
+
+
+def _board_audit(argv):
+    if pop_flag(argv, '--all'):
+        return BOARD_AUDIT_ALL.run('board-audit', argv)
+    return COMMANDS['board-audit'].call('board-audit', argv)
+
+
+def _plugin(argv):
+    from .plugins import cmd_plugin_list, cmd_plugin_info, cmd_plugin_run
+    if not argv:
+        print("❌ Usage: trello plugin <list|info|run> [args]")
+        print("\n  plugin list                    - List all plugins")
+        print("  plugin info <name>             - Show plugin details")
+        print("  plugin run <name> [args]       - Execute a plugin")
+        print("\n  Optional: --plugin-dir <path>  - Use custom plugin directory")
+        sys.exit(1)
+
+    subcommand = argv[0]
+    argv = argv[1:]
+
+    # Extract --plugin-dir if present
+    plugin_dir = None
+    if '--plugin-dir' in argv:
+        idx = argv.index('--plugin-dir')
+        if idx + 1 < len(argv):
+            plugin_dir = argv[idx + 1]
+            del argv[idx:idx + 2]
+
+    if subcommand == 'list':
+        cmd_plugin_list(plugin_dir)
+
+    elif subcommand == 'info':
+        if not argv:
+            print("❌ Usage: trello plugin info <name>")
+            sys.exit(1)
+        cmd_plugin_info(argv[0], plugin_dir)
+
+    elif subcommand == 'run':
+        if not argv:
+            print("❌ Usage: trello plugin run <name> [args]")
+            sys.exit(1)
+        cmd_plugin_run(argv[0], argv[1:], plugin_dir)
+
+    else:
+        print(f"❌ Unknown plugin subcommand: {subcommand}")
+        print("   Valid subcommands: list, info, run")
+        sys.exit(1)
+
+
+def _sync(argv):
+    from .commands import cmd_sync
+    from .executor import parse_concurrency
+    full = pop_flag(argv, '--full')
+    concurrency = pop_option(argv, '--concurrency')
+    concurrency = 1 if concurrency is None else parse_concurrency(concurrency)
+    options = [arg for arg in argv if arg.startswith('--')]
+    if options:
+        print(f"❌ Unknown option: {options[0]}")
+        print("❌ Usage: trello sync [<board_id>...] [--full] [--concurrency N]")
+        sys.exit(1)
+    cmd_sync(argv, full=full, concurrency=concurrency)
+
+
+def _daemon(argv):
+    from .daemon import cmd_daemon_start, cmd_daemon_stop, cmd_daemon_status, IDLE_TIMEOUT
+    subcommand = argv[0] if argv else None
+    argv = argv[1:]
+
+    if subcommand == 'start':
+        foreground = pop_flag(argv, '--foreground')
+        idle_timeout = pop_option(argv, '--idle-timeout')
+        try:
+            idle_timeout = IDLE_TIMEOUT if idle_timeout is None else int(idle_timeout)
+        except ValueError:
+            print(f"❌ Invalid --idle-timeout: {idle_timeout} (expected seconds)")
+            sys.exit(1)
+        cmd_daemon_start(foreground=foreground, idle_timeout=idle_timeout)
+
+    elif subcommand == 'stop':
+        cmd_daemon_stop()
+
+    elif subcommand == 'status':
+        cmd_daemon_status()
+
+    else:
+        print("❌ Usage: trello daemon <start|stop|status>")
+        print("\n  daemon start [--foreground] [--idle-timeout SECONDS]")
+        print("  daemon stop")
+        print("  daemon status")
+        sys.exit(1)
+
+
+def _webhook(argv):
+    from .commands import (cmd_webhook_serve, cmd_webhook_replay, cmd_webhook_register,
+                           cmd_webhook_list, cmd_webhook_unregister)
+    from .webhooks import DEFAULT_PORT
+    subcommand = argv[0] if argv else None
+    argv = argv[1:]
+
+    if subcommand == 'serve':
+        port = pop_option(argv, '--port')
+        host = pop_option(argv, '--host') or '127.0.0.1'
+        secret = pop_option(argv, '--secret') or os.environ.get('TRELLO_WEBHOOK_SECRET')
+        callback_url = pop_option(argv, '--callback-url')
+        no_verify = pop_flag(argv, '--no-verify')
+        try:
+            port = DEFAULT_PORT if port is None else int(port)
+        except ValueError:
+            print(f"❌ Invalid --port: {port}")
+            sys.exit(1)
+        if secret and not callback_url:
+            print("❌ --secret needs --callback-url (Trello signs the body plus the callback URL)")
+            sys.exit(1)
+        if secret and no_verify:
+            print("❌ --no-verify conflicts with --secret (or TRELLO_WEBHOOK_SECRET)")
+            sys.exit(1)
+        if not secret and not no_verify:
+            print("❌ webhook serve needs --secret S --callback-url URL: unsigned deliveries could "
+                  "wipe the cache or forge mirror data")
+            print("   Pass --no-verify to accept them anyway (only behind a trusted proxy)")
+            sys.exit(1)
+        cmd_webhook_serve(port=port, host=host, secret=secret, callback_url=callback_url,
+                          verify=not no_verify)
+
+    elif subcommand == 'register' and len(argv) >= 2:
+        cmd_webhook_register(*argv[:3])
+
+    elif subcommand == 'list':
+        cmd_webhook_list()
+
+    elif subcommand == 'unregister' and argv:
+        cmd_webhook_unregister(argv)
+
+    elif subcommand == 'replay' and argv:
+        cmd_webhook_replay(argv)
+
+    else:
+        print("❌ Usage: trello webhook <serve|register|list|unregister|replay>")
+        print("\n  webhook serve [--port N] [--host ADDR] (--secret S --callback-url URL | --no-verify)")
+        print("  webhook register <board_id> <callback_url> [\"description\"]")
+        print("  webhook list")
+        print("  webhook unregister <webhook_id> [<webhook_id>...]")
+        print("  webhook replay <payload.json> [<payload.json>...]")
+        sys.exit(1)
+
+
+FIELDS = {'--fields': 'fields'}
+ASYNC = {'--async': 'use_async'}
+DRY_RUN = {'--dry-run': 'dry_run'}
+
+# `trello board-audit --all ...` (see _board_audit)
+BOARD_AUDIT_ALL = Command('cmd_board_audit_all', '--all ["pattern"] [--org ID] [--jobs N] [--output FILE]', 0, (str,),
+                          options={'--org': 'org_id', '--jobs': 'jobs', '--output': 'output_file'})
+
+
+COMMANDS = {
+    # Help & configuration
+    'config': Command(handler=_config),
+    'help': Command('cmd_help'),
+    'help-json': Command('cmd_help_json'),
+    'version': Command(handler=_version),
+
+    # Discovery
+    'board-overview': Command('cmd_board_overview', '<board_id> [--async] [--fields f1,f2]', 1,
+                              options=FIELDS, flags=ASYNC),
+    'board-ids': Command('cmd_board_ids', '<board_id> [--fields f1,f2]', 1, options=FIELDS),
+    'search-cards': Command('cmd_search_cards', '<board_id> "query" [--fields f1,f2]', 2, options=FIELDS),
+    'search': Command('cmd_search', '"query" [--board <board_id>] [--limit N] [--json]', 1,
+                      options={'--board': 'board_id', '--limit': 'limit'}, flags={'--json': 'as_json'}),
+
+    # Boards, lists and cards
+    'boards': Command('cmd_boards'),
+    'create-board': Command('cmd_create_board', '"name"', 1),
+    'lists': Command('cmd_lists', '<board_id>', 1),
+    'create-list': Command('cmd_create_list', '<board_id> "name"', 2),
+    'archive-list': Command('cmd_archive_list', '<list_id>', 1),
+    'cards': Command('cmd_cards', '<list_id> [--fields f1,f2]', 1, options=FIELDS),
+    # Description may be positional (legacy) or --description "..."
+    'add-card': Command('cmd_add_card', '<list_id> "title" [--description "description"]', 2, (str,),
+                        options={'--description': 'description'}),
+    'show-card': Command('cmd_show_card', '<card_id>', 1),
+    'update-card': Command(usage='<card_id> [--description] "description"', handler=_update_card),
+    'rename-card': Command('cmd_rename_card', '<card_id> "new_title"', 2),
+    'move-card': Command('cmd_move_card', '<card_id> <list_id> [--done]', 2,
+                         flags={'--done': 'explicit_done'}),
+    'add-label': Command('cmd_add_label', '<card_id> "color" ["name"]', 2, (str,)),
+    'remove-label': Command('cmd_remove_label', '<card_id> "label_name|color|id"', 2),
+    'delete-label': Command('cmd_delete_label', '<board_id> "label_name|color|id"', 2),
+    'rename-label': Command('cmd_rename_label', '<board_id> "current_label" "new_name"', 3),
+    'add-checklist': Command('cmd_add_checklist', '<card_id> "name"', 2),
+    'add-checkitem': Command('cmd_add_checkitem', '<card_id> "checklist" "item"', 3),
+    'set-due': Command('cmd_set_due', '<card_id> "YYYY-MM-DD"', 2),
+    'add-comment': Command('cmd_add_comment', '<card_id> "comment"', 2),
+    'delete-card': Command('cmd_delete_card', '<card_id>', 1),
+
+    # Quick commands
+    'quick-start': Command('cmd_quick_start', '<card_id> ["comment"]', 1, (str,)),
+    'quick-test': Command('cmd_quick_test', '<card_id> ["comment"]', 1, (str,)),
+    'quick-done': Command('cmd_quick_done', '<card_id> ["comment"]', 1, (str,)),
+    'my-cards': Command('cmd_my_cards', '<board_id> ["member_name"]', 1, (str,)),
+    'card-age': Command('cmd_card_age', '<list_id>', 1),
+
+    # Sprint planning
+    'sprint-start': Command('cmd_sprint_start', '<board_id>', 1),
+    'sprint-status': Command('cmd_sprint_status', '<board_id>', 1),
+    'sprint-close': Command('cmd_sprint_close', '<board_id>', 1),
+    'sprint-velocity': Command('cmd_sprint_velocity', '<board_id> [num_sprints]', 1, (int,)),
+
+    # Bulk operations
+    'bulk-move-cards': Command('cmd_bulk_move_cards', '<source_list_id> <target_list_id> ["filter"]',
+                               2, (str,), concurrency=True),
+    'bulk-add-label': Command('cmd_bulk_add_label', '<card_ids_file> <color> ["name"]',
+                              2, (str,), concurrency=True),
+    'bulk-set-due': Command('cmd_bulk_set_due', '<card_ids_file> <date>', 2, concurrency=True),
+    'bulk-archive-cards': Command('cmd_bulk_archive_cards', '<list_id> ["filter"]',
+                                  1, (str,), concurrency=True),
+    'bulk-create-cards': Command('cmd_bulk_create_cards', '<list_id> <csv/json_file>', 2, concurrency=True),
+    'bulk-relabel': Command('cmd_bulk_relabel', '<board_id> <from_label> <to_label> [--dry-run]', 3,
+                            flags=DRY_RUN, concurrency=True),
+    'label-backup': Command('cmd_label_backup', '<board_id> [output_file]', 1, (str,)),
+    'label-restore': Command('cmd_label_restore', '<board_id> <backup_file>', 2),
+
+    # Advanced queries
+    'cards-by-label': Command('cmd_cards_by_label', '<board_id> <color> ["name"] [--fields f1,f2]',
+                              2, (str,), options=FIELDS),
+    'cards-due-soon': Command('cmd_cards_due_soon', '<board_id> [days] [--fields f1,f2]',
+                              1, (int,), options=FIELDS),
+    'cards-overdue': Command('cmd_cards_overdue', '<board_id> [--fields f1,f2]', 1, options=FIELDS),
+    'list-metrics': Command('cmd_list_metrics', '<list_id>', 1),
+    'board-health': Command('cmd_board_health', '<board_id> [--async]', 1, flags=ASYNC),
+
+    # Board standardization
+    'list-templates': Command('cmd_list_templates'),
+    'standardize-lists': Command('cmd_standardize_lists', '<board_id> [template] [--dry-run]', 1, (str,),
+                                 flags={'--dry-run': 'dry_run', '-n': 'dry_run'}),
+    'scrum-check': Command('cmd_scrum_check', '<board_id>', 1),
+    'migrate-cards': Command('cmd_migrate_cards', '<source_list_id> <target_board_id> ["target_list"]',
+                             2, (str,)),
+    'migrate-board': Command('cmd_migrate_board', '<source_board_id> <target_board_id> [--dry-run]', 2,
+                             flags=DRY_RUN),
+    'archive-board': Command('cmd_archive_board', '<board_id>', 1),
+
+    # Audits
+    'board-audit': Command('cmd_board_audit', '<board_id> ["pattern"] [--report-json] [--fix-labels]', 1, (str,),
+                           flags={'--report-json': 'report_json', '--fix-labels': 'fix_labels'},
+                           details="\nFlags:\n"
+                                   "  --report-json    Output audit results in JSON format\n"
+                                   "  --fix-labels     Automatically fix duplicate labels\n"
+                                   "\nEvery board: trello board-audit --all [\"pattern\"] [--org ID] [--jobs N] "
+                                   "[--output FILE]",
+                           handler=_board_audit),
+    'list-audit': Command('cmd_list_audit', '<list_id> ["pattern"]', 1, (str,)),
+    'list-snapshot': Command('cmd_list_snapshot', '<list_id> ["output_file.json"]', 1, (str,)),
+    'sprint-audit': Command('cmd_sprint_audit', '<board_id> ["sprint_label"]', 1, (str,)),
+    'label-audit': Command('cmd_label_audit', '<board_id> [--async]', 1, flags=ASYNC),
+    'audit-all': Command('cmd_audit_all',
+                         '<board_id> ["pattern"] [--sprint-label L] [--only a,b] [--json] [--async]', 1, (str,),
+                         options={'--sprint-label': 'sprint_label', '--only': 'only'},
+                         flags={'--json': 'as_json', **ASYNC}),
+
+    # Members
+    'assign-card': Command('cmd_assign_card', "<card_id> <member_username|name|'me'>", 2),
+    'unassign-card': Command('cmd_unassign_card', "<card_id> <member_username|name|'me'>", 2),
+    'card-log': Command('cmd_card_log', '<card_id> [limit]', 1, (int,)),
+
+    # Export
+    'export-board': Command('cmd_export_board', '<board_id> <json|csv|md> ["output_file"] [--async]', 2,
+                            (str,), flags=ASYNC),
+
+    # Validation
+    'validation-status': Command('cmd_validation_status'),
+    'validation-enable': Command('cmd_validation_enable'),
+    'validation-disable': Command('cmd_validation_disable'),
+    'validation-config': Command('cmd_validation_config'),
+    'validation-reload': Command('cmd_validation_reload'),
+    'validation-reset': Command('cmd_validation_reset'),
+
+    # Plugins
+    'plugin': Command(handler=_plugin),
+
+    # Batch and daemon
+    'batch': Command('cmd_batch', '<file|-> [--concurrency N] [--json] [--summary FILE] [--stop-on-error]', 1,
+                     options={'--summary': 'summary_file'},
+                     flags={'--json': 'as_json', '--stop-on-error': 'stop_on_error'}, concurrency=True),
+    'daemon': Command(handler=_daemon),
+    'shell': Command('cmd_shell', '[board_id]', 0, (str,)),
+
+    # Local mirror
+    'sync': Command(handler=_sync),
+    'mirror-status': Command('cmd_mirror_status'),
+    'webhook': Command(handler=_webhook),
+
+    # Cache and statistics
+    'cache-status': Command('cmd_cache_status'),
+    'cache-clear': Command('cmd_cache_clear'),
+    'stats': Command('cmd_stats', '[--since 24h] [--command NAME] [--json]',
+                     options={'--since': 'window', '--command': 'command'}, flags={'--json': 'as_json'}),
+}
+
+ALIASES = {
+    '-h': 'help',
+    '--help': 'help',
+    '-v': 'version',
+    '--version': 'version',
+}
+
+# Commands that skip the "Run 'trello help'" reminder
+QUIET_COMMANDS = ('help', 'help-json', 'version', 'shell')
+
+# Commands that never call the Trello API: they start no tracer and add
+# nothing to ~/.trellocli/metrics (unless --trace asks for a trace)
+UNMETERED_COMMANDS = frozenset((
+    'help', 'help-json', 'version', 'config', 'stats', 'daemon', 'list-templates',
+    'validation-status', 'validation-enable', 'validation-disable', 'validation-config',
+    'validation-reload', 'validation-reset', 'mirror-status', 'cache-status', 'cache-clear',
+))
+
+
+def get_command(name):
+    """Registry entry for a command name or alias, or None"""
+    return COMMANDS.get(ALIASES.get(name, name))
@@ -0,0 +1,660 @@
+"""
+Board audit rules, evaluated together over one precomputed card frame
+
+BoardFrame decodes what the audits look at once per card, as columns:
+its age (from the timestamp in the card ID), due date, checklist totals
+and member count, next to the roles of its list. A Rule sees every list
+and every card row of the frame and reports its findings; evaluate() runs any number of
+rules in the same pass, so `trello audit-all` walks a board once however
+many audits it prints.
+
+A new audit is a Rule subclass registered in RULES:
+
+    class UnassignedRule(Rule):
+        name = 'unassigned'
+
+        def __init__(self):
+            self.cards = []
+
+        def visit_card(self, frame, i):
+            if not frame.members[i]:
+                self.cards.append(frame.cards[i])
+
+        def report(self):
+            return {'cards': self.cards, 'score': max(0, 100 - len(self.cards))}
+"""
+
+import re
+from collections import defaultdict
+from datetime import datetime, timezone
+from functools import cached_property
+from operator import itemgetter
+
+from .columns import DAY, card_columns, card_created
+
+
+# Cards older than this many days outside Done lists are stale, and open
+# lists with more cards than CONGESTED_LIST_SIZE are congested (the
+# thresholds of board-health, also used by the mirror's SQL version)
+STALE_DAYS = 30
+CONGESTED_LIST_SIZE = 10
+
+# Keywords (matched in the lowercased list name) that give a list each role
+LIST_ROLES = {
+    'done': ('done', 'completed', 'finished', 'closed', 'archive'),
+    'active': ('sprint', 'doing', 'in progress', 'testing', 'ready', 'wip', 'development'),
+    'execution': ('sprint', 'doing', 'in progress', 'testing', 'development'),
+    'critical': ('sprint', 'testing', 'in progress', 'doing', 'review'),
+    'sprint': ('sprint', 'doing', 'in progress', 'testing', 'ready'),
+    'wip': ('in progress', 'doing', 'wip'),
+    'testing': ('testing', 'test', 'qa', 'review'),
+    'backlog': ('backlog',),
+}
+
+# Lists every Scrum board should have, with the keywords that identify them
+SCRUM_LISTS = {
+    "Backlog": ["backlog", "📋"],
+    "Ready": ["ready", "listo", "✅"],
+    "Sprint/To Do": ["sprint", "to do", "todo", "📝"],
+    "In Progress": ["in progress", "doing", "wip", "⚙️"],
+    "Testing": ["testing", "test", "qa", "🧪"],
+    "Done": ["done", "completed", "✅"],
+}
+
+_SPRINT_LABEL = re.compile(r's\d+')
+
+# Checklist items carry 'checked' (set from 'state' by ChecklistRecord and py-trello)
+_CHECKED = itemgetter('checked')
+
+
+def parse_due(due):
+    """A card's due date as an aware datetime, or None if unset or unreadable"""
+    if not due:
+        return None
+    if isinstance(due, datetime):
+        return due if due.tzinfo else due.replace(tzinfo=timezone.utc)
+    try:
+        return datetime.fromisoformat(due.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return None
+
+
+def score_status(score):
+    """Traffic-light status of a 0-100 audit score"""
+    if score >= 90:
+        return "🟢 EXCELLENT"
+    if score >= 70:
+        return "🟡 GOOD"
+    if score >= 50:
+        return "🟠 NEEDS ATTENTION"
+    return "🔴 CRITICAL"
+
+
+class ListFacts:
+    """
+    A list of the frame: its roles, card count and, if it is open, the
+    frame rows of its cards (range(start, stop))
+    """
+
+    __slots__ = ('list', 'id', 'name', 'lower', 'closed', 'roles', 'size', 'start', 'stop')
+
+    def __init__(self, lst, size, start):
+        self.list = lst
+        self.id = lst.id
+        self.name = lst.name
+        self.lower = lst.name.lower()
+        self.closed = lst.closed
+        self.roles = frozenset(role for role, keywords in LIST_ROLES.items()
+                               if any(keyword in self.lower for keyword in keywords))
+        self.size = size
+        self.start = self.stop = start
+
+    @property
+    def rows(self):
+        return range(self.start, self.stop)
+
+
+class BoardFrame:
+    """
+    The facts of a BoardSnapshot, all relative to one `now` (the current
+    UTC time unless given)
+
+    The cards of open lists are the frame's rows, in board order:
+    cards[i] is the CardRecord and card_lists[i] the ListFacts of row i.
+    Every other fact is a column with one value per row, computed the
+    first time a rule reads it, so no per-card objects are built.
+
+    Columns:
+        age: Days since the card was created (None if the ID has no timestamp)
+        due: Due date as an aware datetime, or None
+        due_ts: The due date as a Unix timestamp, or None
+        due_days: Whole days until the due date (negative once past), or None
+        overdue_days: Whole days past the due date, or None if not overdue
+        items, completed: Checklist items in total and checked
+        empty_checklist: Whether some checklist has no items
+        members: Number of assigned members
+
+    `columns` holds the same rows as numeric columns (see columns.py), for
+    rules that compute whole-board metrics at once; use_numpy picks their
+    backend (NumPy when installed, by default).
+    """
+
+    def __init__(self, board, now=None, use_numpy=None):
+        self.board = board
+        self.use_numpy = use_numpy
+        self.now = now or datetime.now(timezone.utc)
+        self.timestamp = self.now.timestamp()
+        self.labels = board.labels
+        self.lists = []
+        self.cards = []
+        self.card_lists = []
+        for lst in board.lists:
+            records = board.cards_in(lst.id)
+            facts = ListFacts(lst, len(records), len(self.cards))
+            if not facts.closed:
+                self.cards.extend(records)
+                self.card_lists.extend([facts] * len(records))
+                facts.stop = len(self.cards)
+            self.lists.append(facts)
+
+    def __len__(self):
+        return len(self.cards)
+
+    # Day counts floor like timedelta.days
+
+    @cached_property
+    def age(self):
+        now = self.timestamp
+        return [None if created is None else int((now - created) // DAY)
+                for created in map(card_created, [card.id for card in self.cards])]
+
+    @cached_property
+    def due(self):
+        return [parse_due(card.due) if card.due else None for card in self.cards]
+
+    @cached_property
+    def due_ts(self):
+        return [None if due is None else due.timestamp() for due in self.due]
+
+    @cached_property
+    def due_days(self):
+        now = self.timestamp
+        return [None if due is None else int((due - now) // DAY) for due in self.due_ts]
+
+    @cached_property
+    def overdue_days(self):
+        now = self.timestamp
+        return [None if due is None or due >= now else int((now - due) // DAY) for due in self.due_ts]
+
+    @cached_property
+    def _checklist_totals(self):
+        items, completed, empty = [], [], []
+        for card in self.cards:
+            total = checked = 0
+            has_empty = False
+            for checklist in card.checklists:
+                if not checklist.items:
+                    has_empty = True
+                total += len(checklist.items)
+                checked += sum(map(_CHECKED, checklist.items))
+            items.append(total)
+            completed.append(checked)
+            empty.append(has_empty)
+        return items, completed, empty
+
+    @property
+    def items(self):
+        return self._checklist_totals[0]
+
+    @property
+    def completed(self):
+        return self._checklist_totals[1]
+
+    @property
+    def empty_checklist(self):
+        return self._checklist_totals[2]
+
+    @cached_property
+    def members(self):
+        return [len(card.idMembers or ()) for card in self.cards]
+
+    @cached_property
+    def columns(self):
+        return card_columns(self, self.use_numpy)
+
+
+class Rule:
+    """
+    One audit. evaluate() calls start() with the frame, visit_list() for
+    every list (archived ones too) in board order, visit_card() with each
+    row of an open list right after its list, then report(). A rule that
+    only needs frame.columns can leave visit_card() out and compute its
+    findings in report(); evaluate() skips the cards when no rule visits
+    them.
+    """
+
+    name = None
+
+    def start(self, frame):
+        pass
+
+    def visit_list(self, lst):
+        pass
+
+    def visit_card(self, frame, i):
+        pass
+
+    def report(self):
+        """Findings as a dict, with the 0-100 'score'"""
+        raise NotImplementedError
+
+    def summary(self, report):
+        """Finding counts of a report, for JSON output"""
+        return {'score': report['score']}
+
+
+def evaluate(frame, rules):
+    """
+    Run rules over a BoardFrame in a single pass
+
+    Returns:
+        {rule.name: report} in the order of rules
+    """
+    for rule in rules:
+        rule.start(frame)
+    list_visitors = [rule.visit_list for rule in rules if type(rule).visit_list is not Rule.visit_list]
+    card_visitors = [rule.visit_card for rule in rules if type(rule).visit_card is not Rule.visit_card]
+    for lst in frame.lists:
+        for visit in list_visitors:
+            visit(lst)
+        if not card_visitors:
+            continue
+        for i in lst.rows:
+            for visit in card_visitors:
+                visit(frame, i)
+    return {rule.name: rule.report() for rule in rules}
+
+
+class BoardAuditRule(Rule):
+    """Workflow and traceability problems of board-audit"""
+
+    name = 'board-audit'
+
+    FINDINGS = ('done_no_due', 'done_incomplete_checklist', 'active_no_due', 'overdue',
+                'execution_no_members', 'empty_checklists', 'pattern_violations',
+                'critical_no_description')
+
+    def __init__(self, pattern=None):
+        self.pattern = pattern
+        self.id_pattern = re.compile(pattern) if pattern else None
+        self.lists = 0
+        self.cards = 0
+        self.findings = {key: [] for key in self.FINDINGS}
+
+    def start(self, frame):
+        self.frame = frame
+
+    def visit_list(self, lst):
+        if not lst.closed:
+            self.lists += 1
+            self.cards += lst.size
+
+    def visit_card(self, frame, i):
+        card, lst, found = frame.cards[i], frame.card_lists[i], self.findings
+        roles = lst.roles
+        if 'done' in roles and not card.due:
+            found['done_no_due'].append({'card': card, 'list': lst.name, 'age': frame.age[i]})
+        if 'active' in roles and not card.due:
+            found['active_no_due'].append({'card': card, 'list': lst.name})
+        if frame.overdue_days[i] is not None and 'done' not in roles:
+            found['overdue'].append({'card': card, 'list': lst.name, 'due_date': frame.due[i],
+                                     'days_overdue': frame.overdue_days[i]})
+        if 'execution' in roles and not frame.members[i]:
+            found['execution_no_members'].append({'card': card, 'list': lst.name})
+        if frame.empty_checklist[i]:
+            found['empty_checklists'].append({'card': card, 'list': lst.name})
+        if self.id_pattern and not self.id_pattern.search(card.name):
+            found['pattern_violations'].append({'card': card, 'list': lst.name})
+        if 'critical' in roles and not (card.desc or '').strip():
+            found['critical_no_description'].append({'card': card, 'list': lst.name})
+
+    def report(self):
+        frame, found = self.frame, self.findings
+        rows, items, completed = frame.columns.incomplete_checklists(['done' in lst.roles for lst in frame.lists])
+        found['done_incomplete_checklist'] = [
+            {'card': frame.cards[i], 'list': frame.card_lists[i].name, 'total': total, 'completed': checked}
+            for i, total, checked in zip(rows, items, completed)]
+        critical = sum(1 for key in ('done_no_due', 'done_incomplete_checklist', 'overdue') if found[key])
+        high = sum(1 for key in ('active_no_due', 'execution_no_members') if found[key])
+        medium = sum(1 for key in ('empty_checklists', 'pattern_violations', 'critical_no_description')
+                     if found[key])
+        return dict(found, pattern=self.pattern, lists=self.lists, cards=self.cards,
+                    critical=critical, high=high, medium=medium, total=critical + high + medium,
+                    score=max(0, 100 - critical * 20 - high * 10 - medium * 5))
+
+    def summary(self, report):
+        return dict({key: len(report[key]) for key in self.FINDINGS},
+                    critical=report['critical'], high=report['high'], medium=report['medium'],
+                    score=report['score'])
+
+
+def board_health_score(health):
+    """board-health score of {'stale', 'overdue', 'congested'} findings"""
+    return (100 - min(30, len(health['stale']) * 5) - min(30, len(health['overdue']) * 10)
+            - min(20, len(health['congested']) * 10))
+
+
+class BoardHealthRule(Rule):
+    """
+    Stale and overdue cards outside Done lists, congested lists and the
+    age distribution of the cards outside Done lists, in the shapes
+    Mirror.board_health returns. Computed on frame.columns.
+    """
+
+    name = 'board-health'
+
+    def start(self, frame):
+        self.frame = frame
+
+    def report(self):
+        frame = self.frame
+        columns = frame.columns
+        outside_done = [not lst.closed and 'done' not in lst.lower for lst in frame.lists]
+        rows, ages = columns.stale(outside_done, STALE_DAYS)
+        stale = [(frame.cards[i].name, frame.card_lists[i].name, age) for i, age in zip(rows, ages)]
+        rows, days = columns.overdue(outside_done)
+        overdue = [(frame.cards[i].name, frame.card_lists[i].name, late) for i, late in zip(rows, days)]
+        congested = [(lst.name, size) for lst, size, selected in zip(frame.lists, columns.list_sizes(), outside_done)
+                     if selected and size > CONGESTED_LIST_SIZE]
+        health = {'stale': stale, 'overdue': overdue, 'congested': congested,
+                  'ages': columns.age_distribution(outside_done)}
+        return dict(health, score=board_health_score(health))
+
+    def summary(self, report):
+        return {'stale': len(report['stale']), 'overdue': len(report['overdue']),
+                'congested': len(report['congested']), 'median_age': report['ages']['median'],
+                'score': report['score']}
+
+
+class ScrumCheckRule(Rule):
+    """
+    Agile/Scrum conformity of the board's lists: required lists, WIP
+    limits, sprint size, testing queue and backlog. Each check adds a
+    printable line to its section.
+    """
+
+    name = 'scrum-check'
+
+    SECTIONS = ('required', 'wip', 'sprint', 'testing', 'backlog')
+
+    def __init__(self):
+        self.lists = []
+
+    def visit_list(self, lst):
+        self.lists.append(lst)
+
+    def report(self):
+        lines = {section: [] for section in self.SECTIONS}
+        issues = {section: [] for section in self.SECTIONS}
+        score = 100
+
+        for list_type, keywords in SCRUM_LISTS.items():
+            match = next((lst for lst in self.lists if any(keyword in lst.lower for keyword in keywords)), None)
+            if match is not None:
+                lines['required'].append(f"✅ {list_type}: '{match.name}' ({match.size} cards)")
+            else:
+                lines['required'].append(f"❌ {list_type}: MISSING")
+                issues['required'].append(f"Missing required list: {list_type}")
+                score -= 15
+
+        for lst in self.lists:
+            name, count = lst.name, lst.size
+            if 'wip' in lst.roles:
+                if count == 0:
+                    lines['wip'].append(f"⚠️  {name}: No cards (consider pulling work)")
+                elif count <= 3:
+                    lines['wip'].append(f"✅ {name}: {count} cards (GOOD - within WIP limit)")
+                elif count <= 5:
+                    lines['wip'].append(f"🟡 {name}: {count} cards (WARNING - near WIP limit)")
+                    issues['wip'].append(f"WIP near limit in '{name}': {count}/5")
+                    score -= 5
+                else:
+                    lines['wip'].append(f"🔴 {name}: {count} cards (CRITICAL - exceeds WIP limit)")
+                    issues['wip'].append(f"WIP exceeded in '{name}': {count} (recommended: ≤5)")
+                    score -= 15
+
+            if any(keyword in lst.lower for keyword in ("sprint", "to do")) and \
+               any(keyword in lst.lower for keyword in ("sprint", "doing")):
+                if count == 0:
+                    lines['sprint'].append(f"⚠️  {name}: Empty sprint")
+                elif 5 <= count <= 15:
+                    lines['sprint'].append(f"✅ {name}: {count} cards (GOOD sprint size)")
+                elif count < 5:
+                    lines['sprint'].append(f"🟡 {name}: {count} cards (Small sprint)")
+                    issues['sprint'].append(f"Sprint too small: {count} cards (recommended: 5-15)")
+                    score -= 5
+                else:
+                    lines['sprint'].append(f"🔴 {name}: {count} cards (Overloaded sprint)")
+                    issues['sprint'].append(f"Sprint too large: {count} cards (recommended: 5-15)")
+                    score -= 10
+
+            if 'testing' in lst.roles:
+                if count == 0:
+                    lines['testing'].append(f"✅ {name}: No bottleneck")
+                elif count <= 3:
+                    lines['testing'].append(f"✅ {name}: {count} cards (Healthy)")
+                elif count <= 5:
+                    lines['testing'].append(f"🟡 {name}: {count} cards (Building up)")
+                    issues['testing'].append(f"Testing queue building: {count} cards")
+                    score -= 5
+                else:
+                    lines['testing'].append(f"🔴 {name}: {count} cards (BOTTLENECK)")
+                    issues['testing'].append(f"Testing bottleneck: {count} cards")
+                    score -= 15
+
+            if 'backlog' in lst.roles:
+                if count == 0:
+                    lines['backlog'].append(f"⚠️  {name}: Empty backlog (no future work)")
+                    issues['backlog'].append("Empty backlog")
+                    score -= 10
+                elif count < 10:
+                    lines['backlog'].append(f"🟡 {name}: {count} cards (Low - needs grooming)")
+                    issues['backlog'].append(f"Low backlog: {count} cards")
+                    score -= 5
+                elif count <= 50:
+                    lines['backlog'].append(f"✅ {name}: {count} cards (Healthy)")
+                else:
+                    lines['backlog'].append(f"🟡 {name}: {count} cards (Large - consider prioritization)")
+
+        issues = [issue for section in self.SECTIONS for issue in issues[section]]
+        return {'lines': lines, 'issues': issues, 'score': score}
+
+    def summary(self, report):
+        return {'issues': len(report['issues']), 'score': report['score']}
+
+
+class SprintAuditRule(Rule):
+    """
+    Sprint labels and their cards: missing and past due dates, and cards
+    in sprint lists without a sprint label. Labels containing sprint_label,
+    or else 'sprint' or S<n>, are sprint labels.
+    """
+
+    name = 'sprint-audit'
+
+    def __init__(self, sprint_label=None):
+        self.sprint_label = sprint_label
+        self.cards = []
+        self.without_dates = []
+        self.overdue = []
+        self.unlabeled = []
+        self.by_sprint = defaultdict(list)
+        self._sprint_names = {}
+
+    def _sprint_name(self, label):
+        """The label's name (or color) if it is a sprint label, else None"""
+        name = (label.name or "").lower()
+        if self.sprint_label:
+            is_sprint = self.sprint_label.lower() in name
+        else:
+            is_sprint = 'sprint' in name or bool(_SPRINT_LABEL.match(name))
+        return (label.name or label.color) if is_sprint else None
+
+    def start(self, frame):
+        self.frame = frame
+
+    def visit_card(self, frame, i):
+        card, lst = frame.cards[i], frame.card_lists[i]
+        sprints = []
+        for label in card.labels:
+            # Cards share the board's labels; classify each label once
+            if label.id not in self._sprint_names:
+                self._sprint_names[label.id] = self._sprint_name(label)
+            if self._sprint_names[label.id] is not None:
+                sprints.append(self._sprint_names[label.id])
+        if sprints:
+            self.cards.append((card, lst.name, sprints))
+            for sprint in sprints:
+                self.by_sprint[sprint].append(i)
+            if not card.due:
+                self.without_dates.append((card, lst.name, sprints))
+            elif frame.overdue_days[i] is not None:
+                self.overdue.append((card, lst.name, sprints, frame.due[i], frame.overdue_days[i]))
+        elif 'sprint' in lst.roles and 'done' not in lst.lower:
+            self.unlabeled.append((card, lst.name))
+
+    def report(self):
+        frame = self.frame
+        health = {}
+        for sprint, rows in self.by_sprint.items():
+            due = [frame.due_days[i] for i in rows if frame.due[i]]
+            health[sprint] = {
+                'total': len(rows),
+                'with_dates': sum(1 for i in rows if frame.cards[i].due),
+                'overdue': sum(1 for days in due if days < 0),
+                'due_soon': sum(1 for days in due if 0 <= days <= 3),
+                'on_track': sum(1 for days in due if days > 3),
+            }
+        issues = sum(1 for found in (self.without_dates, self.overdue, self.unlabeled) if found)
+        return {
+            'sprint_label': self.sprint_label,
+            'cards': self.cards,
+            'by_sprint': {sprint: [(frame.cards[i], frame.card_lists[i].name) for i in rows]
+                          for sprint, rows in self.by_sprint.items()},
+            'without_dates': self.without_dates,
+            'overdue': sorted(self.overdue, key=lambda x: x[4], reverse=True),
+            'unlabeled': self.unlabeled,
+            'health': health,
+            'issues': issues,
+            'score': max(0, 100 - issues * 25 - len(self.overdue) * 2),
+        }
+
+    def summary(self, report):
+        return {'sprints': len(report['by_sprint']), 'sprint_cards': len(report['cards']),
+                'without_dates': len(report['without_dates']), 'overdue': len(report['overdue']),
+                'unlabeled': len(report['unlabeled']), 'score': report['score']}
+
+
+class LabelAuditRule(Rule):
+    """Label usage on open cards, and duplicate, similar, unused and unnamed labels"""
+
+    name = 'label-audit'
+
+    def __init__(self):
+        self.labels = []
+        self.cards = 0
+
+    def start(self, frame):
+        self.frame = frame
+        self.labels = frame.labels
+
+    def visit_list(self, lst):
+        if not lst.closed:
+            self.cards += lst.size
+
+    def report(self):
+        labels = self.labels
+        usage = dict(zip([label.id for label in labels], self.frame.columns.label_usage()))
+
+        by_name = defaultdict(list)
+        for label in labels:
+            name_key = (label.name or "").lower().strip()
+            if name_key:
+                by_name[name_key].append(label)
+        duplicates = {name: group for name, group in by_name.items() if len(group) > 1}
+
+        similar = []
+        named = [(label.name.lower().strip(), label) for label in labels if label.name]
+        for i, (name1, label1) in enumerate(named):
+            words1 = set(name1.split())
+            for name2, label2 in named[i + 1:]:
+                if name1 == name2:
+                    continue
+                # Same words in another order, one inside the other, or mostly shared words
+                words2 = set(name2.split())
+                if (words1.issubset(words2) or words2.issubset(words1) or
+                        len(words1 & words2) >= min(len(words1), len(words2)) * 0.7):
+                    similar.append((label1, label2))
+
+        unused = [label for label in labels if usage[label.id] == 0]
+        unnamed = [label for label in labels if not label.name or label.name.strip() == ""]
+        issues = sum(1 for found in (duplicates, similar, unused, unnamed) if found)
+        return {
+            'labels': labels,
+            'cards': self.cards,
+            'usage': usage,
+            'duplicates': duplicates,
+            'similar': similar,
+            'unused': unused,
+            'unnamed': unnamed,
+            'issues': issues,
+            'score': max(0, 100 - len(duplicates) * 10 - len(unused) * 2
+                         - len(unnamed) * 5 - len(similar) * 5),
+        }
+
+    def summary(self, report):
+        return {'labels': len(report['labels']), 'duplicates': len(report['duplicates']),
+                'similar': len(report['similar']), 'unused': len(report['unused']),
+                'unnamed': len(report['unnamed']), 'score': report['score']}
+
+
+# Audits by name, in the order audit-all prints them
+RULES = {rule.name: rule for rule in (BoardAuditRule, BoardHealthRule, ScrumCheckRule,
+                                      SprintAuditRule, LabelAuditRule)}
+
+
+def make_rules(names=None, **options):
+    """
+    Rule instances for audit names (all of RULES by default)
+
+    Args:
+        options: Rule options by keyword: pattern (board-audit) and
+                 sprint_label (sprint-audit)
+
+    Raises:
+        ValueError: An unknown audit name
+    """
+    names = list(names or RULES)
+    unknown = [name for name in names if name not in RULES]
+    if unknown:
+        raise ValueError(f"Unknown audit(s): {', '.join(unknown)} (choose from {', '.join(RULES)})")
+    rule_options = {'board-audit': {'pattern': options.get('pattern')},
+                    'sprint-audit': {'sprint_label': options.get('sprint_label')}}
+    return [RULES[name](**rule_options.get(name, {})) for name in names]
+
+
+def audit_summary(frame, rules, reports):
+    """
+    JSON-ready summary of rules evaluated over a frame: each audit's
+    finding counts and score, and the board's overall score (their mean)
+    """
+    audits = {rule.name: rule.summary(reports[rule.name]) for rule in rules}
+    scores = [audit['score'] for audit in audits.values()]
+    return {
+        'board_id': frame.board.id,
+        'board_name': frame.board.name,
+        'audited_at': frame.now.isoformat(),
+        'cards': len(frame),
+        'score': round(sum(scores) / len(scores)) if scores else 100,
+        'audits': audits,
+    }
@@ -0,0 +1,153 @@
+"""
+Board snapshot - a whole board fetched with a single API request
+"""
+
+from collections import defaultdict
+
+from trello import Board, Member, Checklist
+
+from .records import CardRecord, ListRecord, LabelRecord, ChecklistRecord
+
+
+# Query parameters for GET /boards/{id} that nest every resource the
+# board-scoped commands read, so one round trip replaces list_lists() plus
+# one list_cards() per list plus lazy per-card checklist fetches. Members
+# come from the on-disk MemberDirectory instead (see TrelloClient).
+SNAPSHOT_PARAMS = {
+    'fields': 'name,desc,closed,url,dateLastActivity',
+    'lists': 'all',
+    'cards': 'open',
+    'card_fields': 'all',
+    'checklists': 'all',
+    'labels': 'all',
+    'labels_limit': '1000',
+    'members': 'none',
+}
+
+
+def group_checklists(trello_client, checklists_json):
+    """Build Checklist objects from checklist JSON, grouped by card ID in position order"""
+    checklists_by_card = defaultdict(list)
+    for obj in sorted(checklists_json, key=lambda cl: cl.get('pos', 0)):
+        checklists_by_card[obj.get('idCard')].append(
+            Checklist(trello_client, obj, trello_card=obj.get('idCard'))
+        )
+    return checklists_by_card
+
+
+def attach_checklists(trello_client, cards, checklists_json):
+    """
+    Join prefetched checklists to py-trello cards in memory, so
+    card.checklists never triggers py-trello's lazy per-card fetch
+
+    Args:
+        cards: Card objects to attach to (cards without checklists get [])
+        checklists_json: Checklist JSON from /boards/{id}/checklists or a
+                         checklists=all query
+    """
+    checklists_by_card = group_checklists(trello_client, checklists_json)
+    for card in cards:
+        card._checklists = checklists_by_card.get(card.id, [])
+
+
+def group_checklist_records(checklists_json):
+    """Build ChecklistRecords from checklist JSON, grouped by card ID in position order"""
+    checklists_by_card = defaultdict(list)
+    for obj in sorted(checklists_json, key=lambda cl: cl.get('pos', 0)):
+        checklists_by_card[obj.get('idCard')].append(ChecklistRecord.from_json(obj))
+    return checklists_by_card
+
+
+def card_records(cards_json, checklists_json=(), board_id=None, labels_by_id=None):
+    """
+    Decode card JSON into CardRecords in position order, with their
+    checklists joined in memory
+    """
+    checklists_by_card = group_checklist_records(checklists_json)
+    return [
+        CardRecord.from_json(obj, board_id, labels_by_id, checklists_by_card.get(obj['id'], ()))
+        for obj in sorted(cards_json, key=lambda c: c.get('pos', 0))
+    ]
+
+
+class BoardSnapshot:
+    """
+    In-memory copy of a board with its lists, cards, checklists, labels
+    and members, indexed by ID.
+
+    Lists, cards, labels and checklists are read-only records (see
+    records.py); the board itself is a py-trello Board. Write to a card
+    through TrelloClient.card_ref(card).
+    """
+
+    def __init__(self, board, lists, cards, labels, members):
+        self.board = board
+        self.lists = lists
+        self.cards = cards
+        self.labels = labels
+        self.members = members
+        self.date_last_activity = None
+
+        self.lists_by_id = {lst.id: lst for lst in lists}
+        self.cards_by_id = {card.id: card for card in cards}
+        self.labels_by_id = {label.id: label for label in labels}
+        self.attach_members(members)
+
+        self._cards_by_list = defaultdict(list)
+        for card in cards:
+            self._cards_by_list[card.idList].append(card)
+
+    @classmethod
+    def from_json(cls, trello_client, json_obj):
+        """
+        Build a snapshot from the nested GET /boards/{id} response
+
+        Args:
+            trello_client: py-trello client the objects should be bound to
+            json_obj: Board JSON requested with SNAPSHOT_PARAMS
+        """
+        board = Board.from_json(trello_client, json_obj=json_obj)
+
+        lists = [ListRecord.from_json(obj, board.id) for obj in json_obj.get('lists', [])]
+        labels = [LabelRecord.from_json(obj) for obj in json_obj.get('labels', [])]
+        cards = card_records(json_obj.get('cards', []), json_obj.get('checklists', []),
+                             board.id, {label.id: label for label in labels})
+        members = [Member.from_json(trello_client, obj) for obj in json_obj.get('members', [])]
+
+        snapshot = cls(board, lists, cards, labels, members)
+        snapshot.date_last_activity = json_obj.get('dateLastActivity')
+        return snapshot
+
+    def attach_members(self, members):
+        """Set the board members used to resolve card.idMembers"""
+        self.members = list(members)
+        self.members_by_id = {member.id: member for member in self.members}
+
+    @property
+    def id(self):
+        return self.board.id
+
+    @property
+    def name(self):
+        return self.board.name
+
+    @property
+    def url(self):
+        return self.board.url
+
+    def open_lists(self):
+        """Lists that are not archived, in board order"""
+        return [lst for lst in self.lists if not lst.closed]
+
+    def cards_in(self, list_id):
+        """Cards in a list, in list order"""
+        return self._cards_by_list.get(list_id, [])
+
+    def list_of(self, card):
+        """List a card belongs to (None if the list is not on this board)"""
+        return self.lists_by_id.get(card.idList)
+
+    def members_of(self, card):
+        """Members assigned to a card, resolved from the board member index"""
+        return [self.members_by_id[member_id] for member_id in card.idMembers
+                if member_id in self.members_by_id]
@@ -0,0 +1,388 @@
+"""
+Request tracing for the --trace flag
+"""
+
+import json
+import re
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+TRACE_FORMATS = ('text', 'json', 'chrome')
+
+# Path segments that are object IDs; collapsed to {id} in per-endpoint totals
+_ID_SEGMENT = re.compile(r'^[0-9a-fA-F]{24}$')
+
+# Modules that only pass requests along; never shown as callers
+_TRANSPORT_MODULES = ('trello_cli.trace', 'trello_cli.cache', 'trello_cli.ratelimit')
+_TRANSPORT_FUNCTIONS = ('BaseURLHTTPService.request',)
+
+
+def endpoint_path(url):
+    """API path of a request URL, without the /1 version prefix"""
+    path = urlsplit(url).path
+    return path[2:] if path.startswith('/1/') else path
+
+
+def endpoint_template(path):
+    """Collapse object IDs in an API path: /cards/abc.../actions -> /cards/{id}/actions"""
+    return '/'.join('{id}' if _ID_SEGMENT.match(part) else part for part in path.split('/'))
+
+
+def _qualname(frame):
+    code = frame.f_code
+    return getattr(code, 'co_qualname', code.co_name)
+
+
+def call_path(frame):
+    """
+    Who issued a request: the trello_cli functions on the stack (outermost
+    first) followed by the py-trello method they entered, e.g.
+    ['commands.members.cmd_card_log', 'trello.Card.fetch_actions']
+    """
+    path = []
+    library_entry = None
+    while frame is not None:
+        module = frame.f_globals.get('__name__', '')
+        name = _qualname(frame)
+        if module == 'trello' or module.startswith('trello.'):
+            # Keep the outermost py-trello frame: the attribute or method the
+            # CLI touched, not TrelloClient.fetch_json underneath it
+            library_entry = f"trello.{name}"
+        elif module.startswith('trello_cli.') and module not in _TRANSPORT_MODULES \
+                and name not in _TRANSPORT_FUNCTIONS:
+            if module == 'trello_cli.cli' and name == 'main':
+                break
+            if library_entry:
+                path.append(library_entry)
+                library_entry = None
+            path.append(f"{module[len('trello_cli.'):]}.{name}")
+        frame = frame.f_back
+    if library_entry:
+        path.append(library_entry)
+    path.reverse()
+    return path
+
+
+class Span:
+    """One HTTP call as seen by py-trello (retries and cache probes included)"""
+
+    __slots__ = ('method', 'path', 'status', 'start', 'end', 'size', 'cache_hit',
+                 'attempts', 'caller', 'thread', 'error')
+
+    def __init__(self, method, path, caller, start):
+        self.method = method
+        self.path = path
+        self.caller = caller
+        self.start = start
+        self.end = start
+        self.status = None
+        self.size = 0
+        self.cache_hit = False
+        self.attempts = []
+        self.thread = threading.get_ident()
+        self.error = None
+
+    @property
+    def duration(self):
+        return self.end - self.start
+
+    @property
+    def endpoint(self):
+        return f"{self.method} {endpoint_template(self.path)}"
+
+    @property
+    def retries(self):
+        """Attempts beyond the first at this span's own URL"""
+        return max(0, sum(1 for path, _ in self.attempts if path == self.path) - 1)
+
+    def to_json(self, origin):
+        return {
+            'method': self.method,
+            'path': self.path,
+            'endpoint': endpoint_template(self.path),
+            'status': self.status,
+            'start_ms': round((self.start - origin) * 1000, 3),
+            'duration_ms': round(self.duration * 1000, 3),
+            'bytes': self.size,
+            'retries': self.retries,
+            'cache_hit': self.cache_hit,
+            'attempts': [{'path': path, 'status': status} for path, status in self.attempts],
+            'caller': self.caller,
+            'error': self.error,
+        }
+
+
+class Tracer:
+    """
+    Collects a Span per HTTP request for one CLI invocation.
+
+    TracingHTTPService (outermost) opens and closes spans; AttemptRecorder
+    (innermost, under the rate limiter) adds each request that actually went
+    out on the wire, so retries and cache hits can be told apart.
+    """
+
+    def __init__(self, command, call_paths=True):
+        self.command = command
+        # Walking the stack for the span tree is only worth it for --trace
+        self.call_paths = call_paths
+        self.start = time.perf_counter()
+        self.end = None
+        self.spans = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def begin(self, method, url, caller):
+        span = Span(method, endpoint_path(url), caller, time.perf_counter())
+        self._local.span = span
+        return span
+
+    def finish_span(self, span, response=None, error=None):
+        span.end = time.perf_counter()
+        self._local.span = None
+        if response is not None:
+            span.status = response.status_code
+            span.size = len(getattr(response, 'content', b'') or b'')
+            headers = getattr(response, 'headers', None) or {}
+            span.cache_hit = headers.get('X-Trello-CLI-Cache') == 'hit'
+        if error is not None:
+            span.error = str(error)
+        with self._lock:
+            self.spans.append(span)
+
+    def record_attempt(self, url, status):
+        span = getattr(self._local, 'span', None)
+        if span is not None:
+            span.attempts.append((endpoint_path(url), status))
+
+    def finish(self):
+        if self.end is None:
+            self.end = time.perf_counter()
+
+    @property
+    def wall(self):
+        return (self.end or time.perf_counter()) - self.start
+
+    def sorted_spans(self):
+        return sorted(self.spans, key=lambda s: s.start)
+
+    def tree(self):
+        """
+        Span tree: requests grouped under the call path that issued them.
+        Consecutive requests from the same path share a node, so an N+1
+        loop shows up as one node with N requests.
+        """
+        root = {'name': self.command, 'start': self.start, 'end': self.wall + self.start,
+                'children': [], 'spans': []}
+        for span in self.sorted_spans():
+            node = root
+            for name in span.caller:
+                last = node['children'][-1] if node['children'] else None
+                if last is None or last.get('name') != name or 'span' in last:
+                    last = {'name': name, 'start': span.start, 'end': span.end,
+                            'children': [], 'spans': []}
+                    node['children'].append(last)
+                last['start'] = min(last['start'], span.start)
+                last['end'] = max(last['end'], span.end)
+                last['spans'].append(span)
+                node = last
+            node['children'].append({'name': span.endpoint, 'span': span})
+        return root
+
+    def endpoint_totals(self):
+        """Per-endpoint counts, latency, bytes, retries and cache hits, slowest first"""
+        totals = {}
+        for span in self.spans:
+            entry = totals.setdefault(span.endpoint, {
+                'endpoint': span.endpoint, 'requests': 0, 'seconds': 0.0, 'max_seconds': 0.0,
+                'bytes': 0, 'retries': 0, 'cache_hits': 0, 'errors': 0,
+            })
+            entry['requests'] += 1
+            entry['seconds'] += span.duration
+            entry['max_seconds'] = max(entry['max_seconds'], span.duration)
+            entry['bytes'] += span.size
+            entry['retries'] += span.retries
+            entry['cache_hits'] += span.cache_hit
+            entry['errors'] += span.error is not None or (span.status or 0) >= 400
+        return sorted(totals.values(), key=lambda e: e['seconds'], reverse=True)
+
+    def totals(self):
+        return {
+            'wall_seconds': self.wall,
+            'requests': len(self.spans),
+            'network_requests': sum(len(s.attempts) for s in self.spans),
+            'http_seconds': sum(s.duration for s in self.spans),
+            'bytes': sum(s.size for s in self.spans),
+            'retries': sum(s.retries for s in self.spans),
+            'cache_hits': sum(s.cache_hit for s in self.spans),
+            'errors': sum(1 for s in self.spans if s.error or (s.status or 0) >= 400),
+        }
+
+    # Output formats
+
+    def to_json(self):
+        def node_json(node):
+            if 'span' in node:
+                return node['span'].to_json(self.start)
+            return {
+                'name': node['name'],
+                'start_ms': round((node['start'] - self.start) * 1000, 3),
+                'duration_ms': round((node['end'] - node['start']) * 1000, 3),
+                'requests': len(node['spans']),
+                'children': [node_json(child) for child in node['children']],
+            }
+
+        tree = self.tree()
+        return {
+            'command': self.command,
+            'totals': self.totals(),
+            'endpoints': self.endpoint_totals(),
+            'tree': [node_json(child) for child in tree['children']],
+        }
+
+    def to_chrome(self):
+        """Chrome trace event format (load in chrome://tracing or Perfetto)"""
+        threads = {}
+        events = []
+
+        def tid(thread):
+            return threads.setdefault(thread, len(threads) + 1)
+
+        def event(name, start, duration, thread, category, args=None):
+            events.append({
+                'name': name, 'cat': category, 'ph': 'X', 'pid': 1, 'tid': tid(thread),
+                'ts': round((start - self.start) * 1e6, 1), 'dur': round(duration * 1e6, 1),
+                'args': args or {},
+            })
+
+        main_thread = threading.main_thread().ident
+        event(self.command, self.start, self.wall, main_thread, 'command', self.totals())
+
+        def walk(node):
+            for child in node['children']:
+                if 'span' in child:
+                    span = child['span']
+                    event(f"{span.method} {span.path}", span.start, span.duration, span.thread,
+                          'http', {'status': span.status, 'bytes': span.size,
+                                   'retries': span.retries, 'cache_hit': span.cache_hit})
+                else:
+                    event(child['name'], child['start'], child['end'] - child['start'],
+                          child['spans'][0].thread, 'call', {'requests': len(child['spans'])})
+                    walk(child)
+
+        walk(self.tree())
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def format_text(self):
+        lines = []
+        totals = self.totals()
+        lines.append(f"\n{'='*80}")
+        lines.append(f"TRACE: {self.command}")
+        lines.append(f"{'='*80}")
+
+        def walk(node, prefix):
+            children = node['children']
+            for i, child in enumerate(children):
+                last = i == len(children) - 1
+                branch = '└─ ' if last else '├─ '
+                if 'span' in child:
+                    lines.append(prefix + branch + _format_span(child['span']))
+                else:
+                    duration = (child['end'] - child['start']) * 1000
+                    count = len(child['spans'])
+                    lines.append(f"{prefix}{branch}{child['name']}  "
+                                 f"({count} request{'s' if count != 1 else ''}, {duration:.1f}ms)")
+                    walk(child, prefix + ('   ' if last else '│  '))
+
+        tree = self.tree()
+        lines.append(f"{self.command}  ({totals['wall_seconds'] * 1000:.1f}ms)")
+        walk(tree, '')
+
+        endpoints = self.endpoint_totals()
+        if endpoints:
+            lines.append(f"\n{'ENDPOINT':<40} {'REQS':>5} {'TOTAL ms':>9} {'MAX ms':>8} "
+                         f"{'KB':>8} {'RETRY':>5} {'CACHED':>6}")
+            lines.append('-' * 80)
+            for entry in endpoints:
+                lines.append(f"{entry['endpoint'][:40]:<40} {entry['requests']:>5} "
+                             f"{entry['seconds'] * 1000:>9.1f} {entry['max_seconds'] * 1000:>8.1f} "
+                             f"{entry['bytes'] / 1024:>8.1f} {entry['retries']:>5} {entry['cache_hits']:>6}")
+
+        lines.append(f"\n{'='*80}")
+        lines.append(f"TOTAL: {totals['requests']} request(s), {totals['network_requests']} sent, "
+                     f"{totals['cache_hits']} cached, {totals['retries']} retried, "
+                     f"{totals['errors']} failed, {totals['bytes'] / 1024:.1f} KB")
+        lines.append(f"       {totals['http_seconds'] * 1000:.1f}ms in HTTP of "
+                     f"{totals['wall_seconds'] * 1000:.1f}ms wall time")
+        lines.append(f"{'='*80}")
+        return '\n'.join(lines)
+
+    def write(self, fmt='text', path=None):
+        """Write the trace in `fmt` to `path` (default: stderr)"""
+        if fmt == 'text':
+            output = self.format_text() + '\n'
+        elif fmt == 'json':
+            output = json.dumps(self.to_json(), indent=2) + '\n'
+        elif fmt == 'chrome':
+            output = json.dumps(self.to_chrome()) + '\n'
+        else:
+            raise ValueError(f"Unknown trace format: {fmt}. Use one of: {', '.join(TRACE_FORMATS)}")
+
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(output)
+        else:
+            sys.stderr.write(output)
+
+
+def _format_span(span):
+    if span.error:
+        status = 'ERR'
+    else:
+        status = str(span.status)
+    notes = []
+    if span.cache_hit:
+        notes.append('cache hit')
+    if span.retries:
+        notes.append(f"{span.retries} retr{'y' if span.retries == 1 else 'ies'}")
+    note = f"  [{', '.join(notes)}]" if notes else ''
+    return (f"{span.method} {span.path}  {status}  {span.duration * 1000:.1f}ms  "
+            f"{span.size / 1024:.1f}KB{note}")
+
+
+class TracingHTTPService:
+    """Outermost HTTP service wrapper: one Span per request py-trello makes"""
+
+    def __init__(self, inner, tracer):
+        self.inner = inner
+        self.tracer = tracer
+
+    def request(self, method, url, **kwargs):
+        caller = call_path(sys._getframe(1)) if self.tracer.call_paths else []
+        span = self.tracer.begin(method, url, caller)
+        try:
+            response = self.inner.request(method, url, **kwargs)
+        except Exception as e:
+            self.tracer.finish_span(span, error=e)
+            raise
+        self.tracer.finish_span(span, response)
+        return response
+
+
+class AttemptRecorder:
+    """Innermost wrapper (around the session): records each request sent"""
+
+    def __init__(self, inner, tracer):
+        self.inner = inner
+        self.tracer = tracer
+
+    def request(self, method, url, **kwargs):
+        try:
+            response = self.inner.request(method, url, **kwargs)
+        except Exception:
+            self.tracer.record_attempt(url, None)
+            raise
+        self.tracer.record_attempt(url, response.status_code)
+        return response
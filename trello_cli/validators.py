@@ -289,7 +289,12 @@ class RequireExplicitDoneRule(ValidationRule):
 
 
 class RequireChecklistCompletionRule(ValidationRule):
-    """Validates that all checklists are complete before moving to Done."""
+    """
+    Validates that all checklists are complete before moving to Done.
+
+    Reads card.checklists, which TrelloClient.get_card() and board
+    snapshots prefetch, so the rule itself makes no API calls.
+    """
 
     def __init__(self):
         super().__init__("require_checklist_completion")
@@ -383,20 +388,44 @@ class ValidationConfig:
         return self.config.get('enabled', True)
 
 
-# Global validators
-_config = ValidationConfig()
-card_creation_validator = CardCreationValidator(_config.config)
-card_movement_validator = CardMovementValidator(_config.config)
+# Global validators, built on first use so importing this module never
+# touches ~/.trello_validation_rules.json
+_config = None
+_card_creation_validator = None
+_card_movement_validator = None
 
 
 def get_config() -> ValidationConfig:
-    """Get the global validation configuration."""
+    """Get the global validation configuration (loaded on first call)."""
+    if _config is None:
+        reload_config()
     return _config
 
 
+def get_card_creation_validator() -> CardCreationValidator:
+    """Get the card creation validator for the current configuration."""
+    get_config()
+    return _card_creation_validator
+
+
+def get_card_movement_validator() -> CardMovementValidator:
+    """Get the card movement validator for the current configuration."""
+    get_config()
+    return _card_movement_validator
+
+
 def reload_config():
     """Reload configuration from file."""
-    global _config, card_creation_validator, card_movement_validator
+    global _config, _card_creation_validator, _card_movement_validator
     _config = ValidationConfig()
-    card_creation_validator = CardCreationValidator(_config.config)
-    card_movement_validator = CardMovementValidator(_config.config)
+    _card_creation_validator = CardCreationValidator(_config.config)
+    _card_movement_validator = CardMovementValidator(_config.config)
+
+
+def __getattr__(name):
+    """Keep `from .validators import card_creation_validator` working (loads on access)"""
+    if name == 'card_creation_validator':
+        return get_card_creation_validator()
+    if name == 'card_movement_validator':
+        return get_card_movement_validator()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,210 @@
+"""
+Webhook receiver that keeps the response cache and the local mirror current
+
+Trello POSTs every action on a watched board to the webhook's callback URL
+as {"action": {...}, "model": {...}}. WebhookReceiver applies one payload:
+it drops the cached responses that mention the cards and lists the action
+touched (and the board's action listings), and patches the board in the
+local mirror when it is mirrored. WebhookServer is the small HTTP server
+for `trello webhook serve`; replaying saved payloads through
+WebhookReceiver.apply (or POSTing them to the server) drives the same
+code without Trello.
+
+Trello signs each delivery with the app secret: the X-Trello-Webhook
+header is base64(HMAC-SHA1(secret, body + callback URL)).
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+DEFAULT_PORT = 8787
+
+SIGNATURE_HEADER = 'X-Trello-Webhook'
+
+# Trello retries deliveries; actions seen among the last this many are skipped
+SEEN_ACTIONS = 1000
+
+# Keys of action data that name the objects the action changed
+_OBJECT_KEYS = ('card', 'list', 'listBefore', 'listAfter', 'checklist', 'checkItem', 'label')
+
+
+def affected_ids(action):
+    """IDs of the cards, lists and other objects an action changed, cards and lists first"""
+    data = action.get('data') or {}
+    ids = [data[key]['id'] for key in _OBJECT_KEYS
+           if isinstance(data.get(key), dict) and data[key].get('id')]
+    card_list = (data.get('card') or {}).get('idList')
+    if card_list:
+        ids.insert(1, card_list)
+    return list(dict.fromkeys(ids))
+
+
+def signature(secret, body, callback_url):
+    """X-Trello-Webhook value for a request body delivered to callback_url"""
+    digest = hmac.new(secret.encode('utf-8'), body + callback_url.encode('utf-8'), hashlib.sha1).digest()
+    return base64.b64encode(digest).decode('ascii')
+
+
+class WebhookReceiver:
+    """
+    Applies webhook payloads to a ResponseCache and a Mirror (either may be
+    None). Payloads are applied one at a time, in arrival order.
+    """
+
+    def __init__(self, cache=None, mirror=None, secret=None, callback_url=None):
+        if secret and not callback_url:
+            raise ValueError("Verifying signatures needs the webhook's callback URL")
+        self.cache = cache
+        self.mirror = mirror
+        self.secret = secret
+        self.callback_url = callback_url
+        self.received = 0
+        self.invalidated = 0
+        self.mirrored = 0
+        self.pending = 0
+        self._seen = deque(maxlen=SEEN_ACTIONS)
+        self._lock = threading.Lock()
+
+    def verify(self, body, header):
+        """Whether a request body carries a valid signature (always, without a secret)"""
+        if not self.secret:
+            return True
+        return bool(header) and hmac.compare_digest(header, signature(self.secret, body, self.callback_url))
+
+    def apply(self, payload):
+        """
+        Apply one webhook payload
+
+        Returns:
+            Dict with the action's 'type', 'board_id', 'objects' (affected
+            IDs), 'invalidated' (cached responses dropped) and 'mirror':
+            'applied', 'pending' (only `trello sync` can apply it), 'not
+            mirrored' or 'duplicate'
+        """
+        action = payload.get('action') if isinstance(payload, dict) else None
+        if not isinstance(action, dict) or 'type' not in action:
+            raise ValueError("Not a Trello webhook payload (no action)")
+        data = action.get('data') or {}
+        board_id = (data.get('board') or {}).get('id') or (payload.get('model') or {}).get('id')
+        objects = affected_ids(action)
+        result = {'type': action['type'], 'board_id': board_id, 'objects': objects,
+                  'invalidated': 0, 'mirror': 'not mirrored'}
+
+        with self._lock:
+            self.received += 1
+            if action.get('id') and action['id'] in self._seen:
+                result['mirror'] = 'duplicate'
+                return result
+            self._seen.append(action.get('id'))
+
+            if self.cache is not None:
+                # Actions that name no card or list (board renames, members,
+                # plugins) may change anything the board's responses hold
+                whole_board = not any(key in data for key in ('card', 'list'))
+                result['invalidated'] = self.cache.invalidate(objects, board_id, whole_board=whole_board)
+                self.invalidated += result['invalidated']
+
+            if self.mirror is not None and board_id and self.mirror.sync_position(board_id) is not None:
+                applied = self.mirror.apply_action(board_id, action)
+                result['mirror'] = 'applied' if applied else 'pending'
+                if applied:
+                    self.mirrored += 1
+                else:
+                    self.pending += 1
+        return result
+
+    def stats(self):
+        return {'received': self.received, 'invalidated': self.invalidated,
+                'mirrored': self.mirrored, 'pending': self.pending}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = 'TrelloCLIWebhook/1.0'
+
+    def do_HEAD(self):
+        # Trello checks the callback URL with a HEAD request when a webhook is created
+        self._reply(200, b'')
+
+    def do_GET(self):
+        self._reply(200, json.dumps(self.server.receiver.stats()).encode('utf-8'))
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        receiver = self.server.receiver
+        if not receiver.verify(body, self.headers.get(SIGNATURE_HEADER)):
+            self._reply(401, b'{"error": "invalid signature"}')
+            return
+        try:
+            result = receiver.apply(json.loads(body))
+        except ValueError as e:
+            self._reply(400, json.dumps({'error': str(e)}).encode('utf-8'))
+            return
+        if self.server.on_result is not None:
+            self.server.on_result(result)
+        self._reply(200, json.dumps(result).encode('utf-8'))
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status, data):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(data)
+
+
+class WebhookServer:
+    """
+    HTTP endpoint for Trello webhooks, feeding a WebhookReceiver
+
+        with WebhookServer(WebhookReceiver(cache=ResponseCache()), port=0) as server:
+            requests.post(server.url, json=payload)
+
+    on_result is called with the result of every applied delivery.
+    """
+
+    def __init__(self, receiver, host='127.0.0.1', port=DEFAULT_PORT, on_result=None):
+        self.receiver = receiver
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.receiver = receiver
+        self._httpd.on_result = on_result
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """Serve in this thread until interrupted, then close the socket"""
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()